@@ -0,0 +1,127 @@
+"""
+Timetable conflict detection.
+
+Timetables are loaded once and bucketed per (dimension, key, day) where the
+dimension is the faculty teaching the section, the room, or the section
+itself. Each bucket is swept in start-time order while a heap keyed on end
+time holds the entries still running, so every overlapping pair is found in
+O(n log n + k) instead of comparing all pairs.
+"""
+import heapq
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from .models import Timetable
+
+
+FACULTY = 'FACULTY'
+ROOM = 'ROOM'
+SECTION = 'SECTION'
+DIMENSIONS = (FACULTY, ROOM, SECTION)
+
+
+def default_dimension_keys(timetable):
+    """Return the (dimension, key) buckets a timetable entry occupies."""
+    keys = []
+    section = timetable.course_section
+    if section is not None:
+        keys.append((FACULTY, section.faculty_id))
+        keys.append((SECTION, section.pk))
+    room = (timetable.room or '').strip().upper()
+    if room:
+        keys.append((ROOM, room))
+    return keys
+
+
+def overlapping_pairs(entries):
+    """Yield every pair of overlapping ``(start, end, item)`` entries.
+
+    Intervals are half-open, so back-to-back classes do not conflict.
+    """
+    active = []
+    ordered = sorted(enumerate(entries), key=lambda e: (e[1][0], e[1][1]))
+    for seq, (start, end, item) in ordered:
+        while active and active[0][0] <= start:
+            heapq.heappop(active)
+        for _, _, other in active:
+            yield other, item
+        heapq.heappush(active, (end, seq, item))
+
+
+@dataclass
+class TimetableConflict:
+    first: Timetable
+    second: Timetable
+    dimensions: set = field(default_factory=set)
+
+    def as_dict(self):
+        return {
+            'timetable1': self.first.pk,
+            'timetable2': self.second.pk,
+            'day_of_week': self.first.day_of_week,
+            'dimensions': sorted(self.dimensions),
+        }
+
+
+class TimetableConflictEngine:
+    """Find overlapping timetable entries per faculty, room and section."""
+
+    def __init__(self, timetables, key_func=default_dimension_keys):
+        self.timetables = list(timetables)
+        self.buckets = defaultdict(list)
+        for timetable in self.timetables:
+            for dimension, key in key_func(timetable):
+                self.buckets[(dimension, key, timetable.day_of_week)].append(
+                    (timetable.start_time, timetable.end_time, timetable)
+                )
+
+    @classmethod
+    def for_term(cls, academic_year, semester, faculty_id=None, room=None, department_id=None):
+        """Load every active timetable for a term in a single query."""
+        queryset = Timetable.objects.filter(
+            is_active=True,
+            course_section__academic_year=academic_year,
+            course_section__semester=semester,
+        ).select_related('course_section', 'course_section__course')
+        if faculty_id:
+            queryset = queryset.filter(course_section__faculty_id=faculty_id)
+        if room:
+            queryset = queryset.filter(room=room)
+        if department_id:
+            queryset = queryset.filter(course_section__course__department_id=department_id)
+        return cls(queryset)
+
+    def conflicts(self, dimensions=DIMENSIONS):
+        """Return de-duplicated conflicts, merging pairs that clash on several dimensions."""
+        found = {}
+        for (dimension, _, _), entries in self.buckets.items():
+            if dimension not in dimensions or len(entries) < 2:
+                continue
+            for a, b in overlapping_pairs(entries):
+                pair = (a.pk, b.pk) if a.pk < b.pk else (b.pk, a.pk)
+                conflict = found.get(pair)
+                if conflict is None:
+                    first, second = (a, b) if a.pk < b.pk else (b, a)
+                    conflict = found[pair] = TimetableConflict(first, second)
+                conflict.dimensions.add(dimension)
+        return sorted(found.values(), key=lambda c: (c.first.pk, c.second.pk))
+
+    def conflicts_involving(self, section_ids, dimensions=DIMENSIONS):
+        """Conflicts between entries of ``section_ids`` and entries of any other section."""
+        section_ids = set(section_ids)
+        return [
+            c for c in self.conflicts(dimensions)
+            if (c.first.course_section_id in section_ids) != (c.second.course_section_id in section_ids)
+        ]
+
+    def summary(self, conflicts=None):
+        conflicts = self.conflicts() if conflicts is None else conflicts
+        by_dimension = {dimension: 0 for dimension in DIMENSIONS}
+        for conflict in conflicts:
+            for dimension in conflict.dimensions:
+                by_dimension[dimension] += 1
+        return {
+            'total_timetables': len(self.timetables),
+            'total_conflicts': len(conflicts),
+            'conflicts_by_dimension': by_dimension,
+        }
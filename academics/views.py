@@ -19,6 +19,7 @@ from .serializers import (
     CourseEnrollmentCreateSerializer, AcademicCalendarSerializer,
     AcademicCalendarCreateSerializer
 )
+from .scheduling import TimetableConflictEngine
 
 
 class CourseViewSet(viewsets.ModelViewSet):
@@ -214,37 +215,67 @@ class TimetableViewSet(viewsets.ModelViewSet):
     
     @action(detail=False, methods=['get'])
     def conflicts(self, request):
-        """Check for timetable conflicts"""
+        """Check for timetable conflicts (faculty, room and section overlaps) within a term"""
         faculty_id = request.query_params.get('faculty_id')
         room = request.query_params.get('room')
         academic_year = request.query_params.get('academic_year')
         semester = request.query_params.get('semester')
         
-        if not all([faculty_id, room, academic_year, semester]):
-            return Response({'error': 'faculty_id, room, academic_year, and semester parameters required'}, status=400)
+        if not all([academic_year, semester]):
+            return Response({'error': 'academic_year and semester parameters required'}, status=400)
         
-        # Find overlapping schedules
-        conflicts = []
-        timetables = Timetable.objects.filter(
-            course_section__faculty_id=faculty_id,
-            room=room,
-            course_section__academic_year=academic_year,
-            course_section__semester=semester,
-            is_active=True
+        engine = TimetableConflictEngine.for_term(
+            academic_year, semester, faculty_id=faculty_id, room=room
         )
-        
-        for i, t1 in enumerate(timetables):
-            for t2 in timetables[i+1:]:
-                if t1.day_of_week == t2.day_of_week:
-                    # Check for time overlap
-                    if (t1.start_time < t2.end_time and t2.start_time < t1.end_time):
-                        conflicts.append({
-                            'conflict_type': 'Time Overlap',
-                            'timetable1': TimetableSerializer(t1).data,
-                            'timetable2': TimetableSerializer(t2).data
-                        })
+        conflicts = []
+        for conflict in engine.conflicts():
+            conflicts.append({
+                'conflict_type': 'Time Overlap',
+                'dimensions': sorted(conflict.dimensions),
+                'timetable1': TimetableSerializer(conflict.first).data,
+                'timetable2': TimetableSerializer(conflict.second).data
+            })
         
         return Response({'conflicts': conflicts, 'total_conflicts': len(conflicts)})
+    
+    @action(detail=False, methods=['get'])
+    def validate_term(self, request):
+        """Validate every active timetable of a term in one pass"""
+        academic_year = request.query_params.get('academic_year')
+        semester = request.query_params.get('semester')
+        department_id = request.query_params.get('department_id')
+        
+        if not all([academic_year, semester]):
+            return Response({'error': 'academic_year and semester parameters required'}, status=400)
+        
+        engine = TimetableConflictEngine.for_term(academic_year, semester, department_id=department_id)
+        conflicts = engine.conflicts()
+        
+        def describe(timetable):
+            section = timetable.course_section
+            return {
+                'id': timetable.pk,
+                'course_section': section.pk,
+                'section': f"{section.course.code}-{section.section_number}",
+                'faculty': section.faculty_id,
+                'room': timetable.room,
+                'start_time': timetable.start_time,
+                'end_time': timetable.end_time,
+            }
+        
+        return Response({
+            **engine.summary(conflicts),
+            'is_valid': not conflicts,
+            'conflicts': [
+                {
+                    'day_of_week': c.first.day_of_week,
+                    'dimensions': sorted(c.dimensions),
+                    'timetable1': describe(c.first),
+                    'timetable2': describe(c.second),
+                }
+                for c in conflicts
+            ],
+        })
 
 
 class CourseEnrollmentViewSet(viewsets.ModelViewSet):
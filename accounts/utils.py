@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from typing import Optional, Tuple
 
-import requests
 import time
 from django_redis import get_redis_connection
 
@@ -17,6 +16,8 @@ def geolocate_ip(ip: Optional[str]) -> Tuple[Optional[dict], Optional[str], Opti
     if not ip:
         return None, None, None, None, None, None
     try:
+        import requests
+
         # Use ipapi.co (no key, rate limited). Swap to paid provider in prod.
         resp = requests.get(f'https://ipapi.co/{ip}/json/', timeout=2)
         if resp.status_code != 200:
@@ -1,10 +1,8 @@
-from datetime import date, timedelta
+from datetime import date
 
 from django.core.management.base import BaseCommand
-from django.db import transaction
 
-from academics.models import Timetable
-from attendance.models import AttendanceSession
+from attendance.sessions import generate_attendance_sessions
 
 
 class Command(BaseCommand):
@@ -24,43 +22,5 @@ class Command(BaseCommand):
             self.stderr.write('End date must be after start date')
             return
 
-        days_map = {
-            'MON': 0,
-            'TUE': 1,
-            'WED': 2,
-            'THU': 3,
-            'FRI': 4,
-            'SAT': 5,
-            'SUN': 6,
-        }
-
-        timetables = Timetable.objects.filter(is_active=True)
-        if section_id:
-            timetables = timetables.filter(course_section_id=section_id)
-
-        by_weekday = {}
-        for t in timetables.select_related('course_section'):
-            by_weekday.setdefault(days_map[t.day_of_week], []).append(t)
-
-        created_count = 0
-        with transaction.atomic():
-            current = start
-            while current <= end:
-                weekday = current.weekday()
-                for t in by_weekday.get(weekday, []):
-                    session, created = AttendanceSession.objects.get_or_create(
-                        course_section=t.course_section,
-                        date=current,
-                        start_time=t.start_time,
-                        defaults={
-                            'end_time': t.end_time,
-                            'room': t.room,
-                            'timetable': t,
-                        }
-                    )
-                    if created:
-                        created_count += 1
-                current += timedelta(days=1)
-
+        created_count = generate_attendance_sessions(start, end, section_id=section_id)
         self.stdout.write(self.style.SUCCESS(f'Created {created_count} attendance sessions.'))
-
@@ -1,3 +1,4 @@
+from django.db.models import Count
 from rest_framework import serializers
 from .models import AttendanceSession, AttendanceRecord
 
@@ -12,14 +13,71 @@ class AttendanceRecordSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at']
 
 
+class AttendanceRosterSerializer(serializers.ModelSerializer):
+    """Flat roster row for the paginated per-session roster endpoint."""
+    roll_number = serializers.CharField(source='student.roll_number', read_only=True)
+    student_name = serializers.CharField(source='student.full_name', read_only=True)
+
+    class Meta:
+        model = AttendanceRecord
+        fields = [
+            'id', 'student', 'roll_number', 'student_name', 'status',
+            'check_in_time', 'remarks', 'updated_at'
+        ]
+        read_only_fields = fields
+
+
 class AttendanceSessionSerializer(serializers.ModelSerializer):
+    """Session serializer with sparse fieldsets and opt-in record expansion.
+
+    Accepts ``fields`` (iterable of field names to keep) and ``expand``
+    (iterable of expandable relations, currently only ``records``). Nested
+    records are dropped unless expanded; ``status_counts`` reads the
+    ``*_count`` annotations added by the viewset.
+    """
+    STATUS_COUNT_ANNOTATIONS = {
+        'PRESENT': 'present_count',
+        'ABSENT': 'absent_count',
+        'LATE': 'late_count',
+        'EXCUSED': 'excused_count',
+    }
+
     records = AttendanceRecordSerializer(many=True, read_only=True)
+    status_counts = serializers.SerializerMethodField()
 
     class Meta:
         model = AttendanceSession
         fields = [
             'id', 'course_section', 'timetable', 'date', 'start_time', 'end_time',
-            'room', 'is_cancelled', 'notes', 'records', 'created_at', 'updated_at'
+            'room', 'is_cancelled', 'notes', 'status_counts', 'records',
+            'created_at', 'updated_at'
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
 
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop('fields', None)
+        expand = set(kwargs.pop('expand', None) or ())
+        super().__init__(*args, **kwargs)
+        if 'records' not in expand:
+            self.fields.pop('records', None)
+        if fields:
+            keep = set(fields) | {'id'}
+            for name in list(self.fields):
+                if name not in keep:
+                    self.fields.pop(name)
+
+    def get_status_counts(self, obj):
+        if hasattr(obj, 'total_records'):
+            counts = {
+                status: getattr(obj, annotation, 0) or 0
+                for status, annotation in self.STATUS_COUNT_ANNOTATIONS.items()
+            }
+            counts['TOTAL'] = obj.total_records or 0
+            return counts
+        # Fallback for instances that were not loaded through the annotated
+        # queryset (e.g. the response of create/update).
+        counts = {status: 0 for status in self.STATUS_COUNT_ANNOTATIONS}
+        for row in obj.records.values('status').annotate(n=Count('id')).order_by():
+            counts[row['status']] = row['n']
+        counts['TOTAL'] = sum(counts.values())
+        return counts
@@ -0,0 +1,66 @@
+"""
+Attendance session generation from the active timetables.
+
+Each day of the range is one transaction: the sessions that already exist
+on that day are read with one query and the missing ones are written with
+one ``bulk_create``, so running the generation twice creates nothing new.
+"""
+from datetime import timedelta
+
+from django.db import transaction
+
+from academics.models import Timetable
+from .models import AttendanceSession
+
+DAYS = {'MON': 0, 'TUE': 1, 'WED': 2, 'THU': 3, 'FRI': 4, 'SAT': 5, 'SUN': 6}
+
+
+def generate_attendance_sessions(start, end, section_id=None, progress=None):
+    """Create the missing sessions between ``start`` and ``end`` (inclusive); returns how many were created.
+
+    ``progress(done, total)`` is called before each day.
+    """
+    if end < start:
+        raise ValueError('End date must be after start date')
+
+    timetables = Timetable.objects.filter(is_active=True)
+    if section_id:
+        timetables = timetables.filter(course_section_id=section_id)
+    by_weekday = {}
+    for timetable in timetables:
+        by_weekday.setdefault(DAYS[timetable.day_of_week], []).append(timetable)
+
+    days = (end - start).days + 1
+    created = 0
+    for offset in range(days):
+        if progress is not None:
+            progress(offset, days)
+        day = start + timedelta(days=offset)
+        scheduled = by_weekday.get(day.weekday(), [])
+        if not scheduled:
+            continue
+        with transaction.atomic():
+            existing = set(
+                AttendanceSession.objects.filter(
+                    date=day, course_section_id__in={t.course_section_id for t in scheduled}
+                ).values_list('course_section_id', 'start_time')
+            )
+            sessions = []
+            for timetable in scheduled:
+                key = (timetable.course_section_id, timetable.start_time)
+                if key in existing:
+                    continue
+                existing.add(key)
+                sessions.append(AttendanceSession(
+                    course_section_id=timetable.course_section_id,
+                    date=day,
+                    start_time=timetable.start_time,
+                    end_time=timetable.end_time,
+                    room=timetable.room,
+                    timetable=timetable,
+                ))
+            AttendanceSession.objects.bulk_create(sessions)
+            created += len(sessions)
+    if progress is not None:
+        progress(days, days)
+    return created
@@ -0,0 +1,13 @@
+"""Background tasks of the attendance app."""
+from datetime import date
+
+from campshub360.jobs import task
+from .sessions import generate_attendance_sessions
+
+
+@task('attendance.generate_sessions')
+def generate_sessions(context, start, end, section_id=None):
+    created = generate_attendance_sessions(
+        date.fromisoformat(start), date.fromisoformat(end), section_id=section_id, progress=context.progress,
+    )
+    return {'created': created}
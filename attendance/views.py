@@ -1,20 +1,110 @@
 from datetime import date
 
-from django.db.models import Prefetch
-from rest_framework import viewsets, status
+from django.db.models import Prefetch, Count, Q
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import viewsets, status, filters
 from rest_framework.decorators import action
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 
 from .models import AttendanceSession, AttendanceRecord
-from .serializers import AttendanceSessionSerializer, AttendanceRecordSerializer
+from .serializers import AttendanceSessionSerializer, AttendanceRecordSerializer, AttendanceRosterSerializer
 from academics.models import Timetable, CourseEnrollment
 
 
+class AttendanceRosterPagination(PageNumberPagination):
+    """Pagination for per-session roster rows"""
+    page_size = 100
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+
+
+def _split_param(value):
+    return {v.strip() for v in (value or '').split(',') if v.strip()}
+
+
 class AttendanceSessionViewSet(viewsets.ModelViewSet):
-    queryset = AttendanceSession.objects.all().select_related('course_section', 'timetable').prefetch_related(
-        Prefetch('records', queryset=AttendanceRecord.objects.select_related('student'))
-    )
+    """Attendance sessions with sparse fieldsets.
+
+    Query parameters:
+    - ``fields``: comma-separated serializer fields to return (``id`` is always included)
+    - ``expand=records``: nest every AttendanceRecord (prefetched in one query)
+
+    By default the list returns per-status record counts computed in SQL;
+    use the ``roster`` action for paginated per-student rows.
+    """
+    queryset = AttendanceSession.objects.all()
     serializer_class = AttendanceSessionSerializer
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
+    filterset_fields = {
+        'course_section': ['exact'],
+        'course_section__course__department': ['exact'],
+        'date': ['exact', 'gte', 'lte'],
+        'is_cancelled': ['exact'],
+    }
+    ordering_fields = ['date', 'start_time']
+    ordering = ['date', 'start_time']
+
+    EXPANDABLE = {'records'}
+
+    def _requested_fields(self):
+        return _split_param(self.request.query_params.get('fields'))
+
+    def _requested_expand(self):
+        return _split_param(self.request.query_params.get('expand')) & self.EXPANDABLE
+
+    def get_queryset(self):
+        queryset = AttendanceSession.objects.all()
+        if self.action == 'roster':
+            return queryset
+
+        fields = self._requested_fields()
+        expand = self._requested_expand()
+
+        if fields:
+            model_fields = {f.name for f in AttendanceSession._meta.concrete_fields}
+            queryset = queryset.only(*({'id'} | (fields & model_fields)))
+        else:
+            queryset = queryset.select_related('course_section', 'timetable')
+
+        if not fields or 'status_counts' in fields:
+            queryset = queryset.annotate(
+                total_records=Count('records'),
+                present_count=Count('records', filter=Q(records__status='PRESENT')),
+                absent_count=Count('records', filter=Q(records__status='ABSENT')),
+                late_count=Count('records', filter=Q(records__status='LATE')),
+                excused_count=Count('records', filter=Q(records__status='EXCUSED')),
+            )
+
+        if 'records' in expand and (not fields or 'records' in fields):
+            queryset = queryset.prefetch_related(
+                Prefetch('records', queryset=AttendanceRecord.objects.select_related('student'))
+            )
+        return queryset
+
+    def get_serializer(self, *args, **kwargs):
+        if self.action != 'roster':
+            kwargs.setdefault('fields', self._requested_fields())
+            kwargs.setdefault('expand', self._requested_expand())
+        return super().get_serializer(*args, **kwargs)
+
+    @action(detail=True, methods=['get'], pagination_class=AttendanceRosterPagination)
+    def roster(self, request, pk=None):
+        """Paginated per-student records for a session (optional ``status`` filter)"""
+        session = self.get_object()
+        records = session.records.select_related('student').only(
+            'id', 'student_id', 'status', 'check_in_time', 'remarks', 'updated_at',
+            'student__roll_number', 'student__first_name', 'student__middle_name', 'student__last_name',
+        ).order_by('student__roll_number')
+        status_filter = request.query_params.get('status')
+        if status_filter:
+            records = records.filter(status=status_filter.upper())
+        page = self.paginate_queryset(records)
+        if page is not None:
+            serializer = AttendanceRosterSerializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        serializer = AttendanceRosterSerializer(records, many=True)
+        return Response(serializer.data)
 
     @action(detail=True, methods=['post'])
     def generate_records(self, request, pk=None):
@@ -33,4 +123,3 @@ class AttendanceSessionViewSet(viewsets.ModelViewSet):
 class AttendanceRecordViewSet(viewsets.ModelViewSet):
     queryset = AttendanceRecord.objects.all().select_related('session', 'student')
     serializer_class = AttendanceRecordSerializer
-
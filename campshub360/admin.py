@@ -0,0 +1,23 @@
+from django.contrib import admin
+
+from .models import BackgroundJob, DocumentSequence
+
+
+@admin.register(DocumentSequence)
+class DocumentSequenceAdmin(admin.ModelAdmin):
+    list_display = ['series', 'last_value', 'updated_at']
+    search_fields = ['series']
+    readonly_fields = ['series', 'last_value', 'updated_at']
+    ordering = ['series']
+
+
+@admin.register(BackgroundJob)
+class BackgroundJobAdmin(admin.ModelAdmin):
+    list_display = ['task', 'label', 'status', 'progress_done', 'progress_total', 'requested_by', 'created_at', 'finished_at']
+    list_filter = ['status', 'task', 'created_at']
+    search_fields = ['task', 'label']
+    readonly_fields = [
+        'task', 'label', 'params', 'status', 'requested_by', 'progress_done', 'progress_total', 'message',
+        'result', 'artifacts', 'error', 'cancel_requested', 'attempts', 'worker', 'heartbeat_at',
+        'created_at', 'started_at', 'finished_at',
+    ]
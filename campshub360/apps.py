@@ -1,4 +1,5 @@
 from django.apps import AppConfig
+from django.utils.module_loading import autodiscover_modules
 
 
 class CoreConfig(AppConfig):
@@ -10,5 +11,7 @@ class CoreConfig(AppConfig):
             import django_prometheus  # noqa: F401
         except Exception:
             pass
+        # Background job tasks are declared in each app's tasks module
+        autodiscover_modules('tasks')
 
 
@@ -0,0 +1,100 @@
+"""
+API for background jobs: list and poll jobs, cancel them and download their
+artifacts. Staff can also submit any registered task directly; everyone
+else submits jobs through the endpoints of the operation itself.
+"""
+import os
+
+from django.core.files.storage import default_storage
+from django.http import FileResponse, Http404
+from django.urls import reverse
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import serializers, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.pagination import CursorPagination
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
+from rest_framework.response import Response
+
+from .jobs import cancel as cancel_job, submit
+from .models import BackgroundJob
+
+
+class BackgroundJobSerializer(serializers.ModelSerializer):
+    progress = serializers.ReadOnlyField()
+    artifacts = serializers.SerializerMethodField()
+
+    class Meta:
+        model = BackgroundJob
+        fields = [
+            'id', 'task', 'label', 'status', 'progress_done', 'progress_total', 'progress', 'message',
+            'result', 'artifacts', 'error', 'cancel_requested', 'attempts', 'created_at', 'started_at',
+            'finished_at',
+        ]
+        read_only_fields = fields
+
+    def get_artifacts(self, job):
+        request = self.context.get('request')
+        artifacts = []
+        for index, path in enumerate(job.artifacts):
+            url = reverse('jobs:job-artifact', kwargs={'pk': job.pk, 'index': index})
+            artifacts.append({
+                'name': os.path.basename(path),
+                'url': request.build_absolute_uri(url) if request is not None else url,
+            })
+        return artifacts
+
+
+class JobSubmitSerializer(serializers.Serializer):
+    task = serializers.CharField(max_length=100)
+    params = serializers.DictField(required=False, default=dict)
+    label = serializers.CharField(max_length=200, required=False, default='')
+
+
+class BackgroundJobPagination(CursorPagination):
+    """Newest jobs first"""
+
+    ordering = '-created_at'
+
+
+class BackgroundJobViewSet(viewsets.ReadOnlyModelViewSet):
+    """Background jobs of the current user (all jobs for staff)"""
+    serializer_class = BackgroundJobSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = BackgroundJobPagination
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = ['status', 'task']
+
+    def get_queryset(self):
+        jobs = BackgroundJob.objects.all()
+        if not self.request.user.is_staff:
+            jobs = jobs.filter(requested_by=self.request.user)
+        return jobs
+
+    def create(self, request):
+        """Queue a registered task (staff only)"""
+        if not IsAdminUser().has_permission(request, self):
+            self.permission_denied(request)
+        serializer = JobSubmitSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        try:
+            job = submit(data['task'], params=data['params'], user=request.user, label=data['label'])
+        except KeyError as exc:
+            return Response({'error': exc.args[0]}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(self.get_serializer(job).data, status=status.HTTP_202_ACCEPTED)
+
+    @action(detail=True, methods=['post'])
+    def cancel(self, request, pk=None):
+        """Cancel a pending job, or stop a running one at its next progress report"""
+        job = cancel_job(self.get_object())
+        return Response(self.get_serializer(job).data)
+
+    @action(detail=True, methods=['get'], url_path=r'artifacts/(?P<index>\d+)')
+    def artifact(self, request, pk=None, index=None):
+        """Download one file produced by the job"""
+        job = self.get_object()
+        try:
+            path = job.artifacts[int(index)]
+        except IndexError:
+            raise Http404("No such artifact")
+        return FileResponse(default_storage.open(path, 'rb'), as_attachment=True, filename=os.path.basename(path))
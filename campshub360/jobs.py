@@ -0,0 +1,273 @@
+"""
+Background jobs.
+
+Long operations such as imports, exports and bulk generation run outside
+the web workers. A view calls ``submit(task, params, user)``, which stores a
+``BackgroundJob`` row and returns at once. A worker process
+(``python manage.py run_jobs``) claims pending rows and runs the registered
+task function.
+
+Claiming is one conditional UPDATE that moves a row from PENDING to RUNNING,
+so any number of workers share the table without row locks, on PostgreSQL
+and SQLite alike. While a job runs, the worker refreshes its heartbeat.
+RUNNING jobs whose heartbeat is older than ``STALE_AFTER`` seconds belonged
+to a worker that died. They are queued again, or failed after
+``MAX_ATTEMPTS`` tries.
+
+A task is a function registered with ``@task('name')``. It takes a
+``JobContext`` and the job params as keyword arguments, and returns a
+JSON-serializable result. The context does three things:
+
+* it records progress;
+* it raises ``JobCancelled`` at the next progress report once cancellation
+  was requested;
+* it saves content or open files as job artifacts in the default storage.
+
+A task may hold a long transaction, e.g. a whole settlement file in one
+``atomic()``. Its context then writes to the job row on a second connection
+of the thread in autocommit mode, so the row is never locked until the
+task commits: the heartbeat and cancel requests do not wait on it, and
+pollers see progress as it happens. SQLite allows a single writer, so there
+the context uses the task's own connection.
+
+Apps declare their tasks in a ``tasks`` module, which is imported when the
+project starts.
+
+With ``BACKGROUND_JOBS_EAGER = True``, a job instead runs in the submitting
+process right after its transaction commits. Tests and local development
+then need no worker.
+"""
+import logging
+import os
+import socket
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files.base import ContentFile, File
+from django.core.files.storage import default_storage
+from django.db import DEFAULT_DB_ALIAS, close_old_connections, connection, connections, transaction
+from django.db.models import F
+from django.db.models.sql import UpdateQuery
+from django.db.models.sql.constants import CURSOR
+from django.utils import timezone
+
+from .models import BackgroundJob
+from .utils import use_primary_reads
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_ROOT = 'jobs'
+POLL_INTERVAL = 2
+HEARTBEAT_INTERVAL = 15
+STALE_AFTER = 120
+MAX_ATTEMPTS = 3
+PROGRESS_INTERVAL = 0.5
+
+_registry = {}
+_report_connections = threading.local()
+
+
+class JobCancelled(Exception):
+    """Raised inside a task once cancellation of its job was requested."""
+
+
+def task(name):
+    """Register the decorated function as the task ``name``."""
+    def register(func):
+        _registry[name] = func
+        return func
+    return register
+
+
+def get_task(name):
+    try:
+        return _registry[name]
+    except KeyError:
+        raise KeyError(f"Unknown background task: {name}") from None
+
+
+def _report_connection():
+    """The connection a task's context writes its job row on (see the module docstring)."""
+    if not connection.in_atomic_block or connection.vendor == 'sqlite':
+        return connection
+    db = getattr(_report_connections, 'connection', None)
+    if db is None:
+        db = _report_connections.connection = connections.create_connection(DEFAULT_DB_ALIAS)
+    db.close_if_unusable_or_obsolete()
+    return db
+
+
+def _update_job(job_id, **changes):
+    query = BackgroundJob.objects.filter(pk=job_id).query.chain(UpdateQuery)
+    query.add_update_values(changes)
+    query.get_compiler(connection=_report_connection()).execute_sql(CURSOR)
+
+
+class JobContext:
+    """What a running task sees of its job."""
+
+    def __init__(self, job):
+        self.job = job
+        self._reported = 0.0
+
+    def progress(self, done, total=None, message=None):
+        """Record progress; raises ``JobCancelled`` if the job was cancelled meanwhile."""
+        # Reports are throttled, except the first one of a phase (with a total) and the last
+        finished = self.job.progress_total and done >= self.job.progress_total
+        if total is None and not finished and time.monotonic() - self._reported < PROGRESS_INTERVAL:
+            return
+        self._reported = time.monotonic()
+        changes = {'progress_done': done, 'heartbeat_at': timezone.now()}
+        if total is not None:
+            changes['progress_total'] = self.job.progress_total = total
+        if message is not None:
+            changes['message'] = message[:255]
+        _update_job(self.job.pk, **changes)
+        self.check_cancelled()
+
+    def check_cancelled(self):
+        query = BackgroundJob.objects.filter(pk=self.job.pk, cancel_requested=True).query.exists()
+        if query.get_compiler(connection=_report_connection()).has_results():
+            raise JobCancelled()
+
+    def save_artifact(self, name, content):
+        """Store ``content`` (bytes, str or an open file) as a file of this job; returns its storage path."""
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        content = ContentFile(content) if isinstance(content, bytes) else File(content)
+        path = default_storage.save(f"{ARTIFACT_ROOT}/{self.job.pk}/{name}", content)
+        self.job.artifacts = [*self.job.artifacts, path]
+        _update_job(self.job.pk, artifacts=self.job.artifacts)
+        return path
+
+
+def submit(task_name, params=None, user=None, label=''):
+    """Queue ``task_name`` with ``params``; returns the new job."""
+    get_task(task_name)
+    job = BackgroundJob.objects.create(
+        task=task_name,
+        params=params or {},
+        requested_by=user if user is not None and user.is_authenticated else None,
+        label=label[:200],
+    )
+    if getattr(settings, 'BACKGROUND_JOBS_EAGER', False):
+        transaction.on_commit(lambda: _run_eagerly(job.pk))
+    return job
+
+
+def _run_eagerly(job_id):
+    job = claim(job_id, worker='eager')
+    if job is not None:
+        run_job(job)
+
+
+def cancel(job):
+    """Cancel a pending job at once, or ask a running one to stop at its next progress report."""
+    cancelled = BackgroundJob.objects.filter(pk=job.pk, status='PENDING').update(
+        status='CANCELLED', cancel_requested=True, finished_at=timezone.now()
+    )
+    if not cancelled:
+        BackgroundJob.objects.filter(pk=job.pk, status='RUNNING').update(cancel_requested=True)
+    job.refresh_from_db()
+    return job
+
+
+def claim(job_id, worker):
+    """Move job ``job_id`` from PENDING to RUNNING for ``worker``; returns it, or None if it was taken."""
+    now = timezone.now()
+    claimed = BackgroundJob.objects.filter(pk=job_id, status='PENDING').update(
+        status='RUNNING', worker=worker[:100], attempts=F('attempts') + 1, started_at=now, heartbeat_at=now,
+    )
+    if not claimed:
+        return None
+    with use_primary_reads():
+        return BackgroundJob.objects.get(pk=job_id)
+
+
+def claim_next(worker):
+    """Claim the oldest pending job, or return None when the queue is empty."""
+    with use_primary_reads():
+        candidates = list(
+            BackgroundJob.objects.filter(status='PENDING').order_by('created_at').values_list('pk', flat=True)[:10]
+        )
+    for job_id in candidates:
+        job = claim(job_id, worker)
+        if job is not None:
+            return job
+    return None
+
+
+def requeue_stale():
+    """Queue again (or fail) RUNNING jobs whose worker stopped sending heartbeats."""
+    stale = BackgroundJob.objects.filter(
+        status='RUNNING', heartbeat_at__lt=timezone.now() - timedelta(seconds=STALE_AFTER)
+    )
+    failed = stale.filter(attempts__gte=MAX_ATTEMPTS).update(
+        status='FAILED', error='Worker stopped responding', finished_at=timezone.now()
+    )
+    requeued = stale.filter(cancel_requested=False).update(status='PENDING', worker='')
+    stale.update(status='CANCELLED', finished_at=timezone.now())
+    return requeued, failed
+
+
+def _heartbeat(job_id, stop):
+    try:
+        while not stop.wait(HEARTBEAT_INTERVAL):
+            BackgroundJob.objects.filter(pk=job_id, status='RUNNING').update(heartbeat_at=timezone.now())
+    finally:
+        connection.close()
+
+
+def run_job(job):
+    """Run a claimed job to completion, recording its outcome on the row."""
+    stop = threading.Event()
+    beat = threading.Thread(target=_heartbeat, args=(job.pk, stop), daemon=True)
+    beat.start()
+    try:
+        result = get_task(job.task)(JobContext(job), **job.params)
+    except JobCancelled:
+        BackgroundJob.objects.filter(pk=job.pk).update(status='CANCELLED', finished_at=timezone.now())
+    except Exception as exc:
+        logger.exception("Background job %s (%s) failed", job.pk, job.task)
+        BackgroundJob.objects.filter(pk=job.pk).update(
+            status='FAILED', error=str(exc), finished_at=timezone.now()
+        )
+    else:
+        BackgroundJob.objects.filter(pk=job.pk).update(
+            status='COMPLETED', result=result if result is not None else {}, finished_at=timezone.now()
+        )
+    finally:
+        stop.set()
+        beat.join()
+
+
+def work(burst=False, poll_interval=POLL_INTERVAL, max_jobs=None, stop=None):
+    """Claim and run jobs until ``stop`` is set (or, with ``burst``, until the queue is empty)."""
+    worker = f"{socket.gethostname()}:{os.getpid()}"
+    stop = stop or threading.Event()
+    processed = 0
+    swept = 0.0
+    while not stop.is_set() and (max_jobs is None or processed < max_jobs):
+        if time.monotonic() - swept > STALE_AFTER:
+            requeue_stale()
+            swept = time.monotonic()
+        job = claim_next(worker)
+        if job is None:
+            if burst:
+                break
+            stop.wait(poll_interval)
+            continue
+        run_job(job)
+        processed += 1
+        close_old_connections()
+    return processed
+
+
+def _after_fork():
+    # The parent's report connection is not ours to use (or close)
+    _report_connections.__dict__.clear()
+
+
+os.register_at_fork(after_in_child=_after_fork)
@@ -0,0 +1,79 @@
+import json
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Libraries only some requests need; none of them may load when a worker starts
+LAZY_MODULES = ['pandas', 'openpyxl', 'reportlab', 'pypdf', 'numpy']
+
+# Run in a fresh interpreter: what a gunicorn worker does before its first request
+WORKER_STARTUP = """
+import json, resource, time
+started = time.perf_counter()
+from django.core.wsgi import get_wsgi_application
+get_wsgi_application()
+from django.urls import get_resolver
+get_resolver().url_patterns
+elapsed = time.perf_counter() - started
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({'seconds': elapsed, 'rss_mb': rss_kb / 1024}))
+"""
+
+
+def _parse_importtime(output):
+    """{module: cumulative microseconds} from ``python -X importtime`` output."""
+    modules = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+class Command(BaseCommand):
+    help = (
+        'Measure cold worker startup (WSGI application plus URLconf) in a fresh interpreter and fail '
+        'if import time or RSS exceed the budget, or a lazily used library is imported at startup.'
+    )
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument('--max-seconds', type=float, default=1.5, help='Budget for the cold import time')
+        parser.add_argument('--max-rss-mb', type=float, default=128, help='Budget for the worker RSS after startup')
+        parser.add_argument('--runs', type=int, default=3, help='Startups to measure; the fastest one counts')
+        parser.add_argument('--top', type=int, default=15, help='Heaviest imports to list')
+
+    def _startup(self):
+        env = {**os.environ, 'DJANGO_SETTINGS_MODULE': os.environ.get('DJANGO_SETTINGS_MODULE', settings.SETTINGS_MODULE)}
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', WORKER_STARTUP],
+            capture_output=True, text=True, env=env, cwd=settings.BASE_DIR,
+        )
+        if proc.returncode:
+            raise CommandError(f"Worker startup failed:\n{proc.stderr[-2000:]}")
+        return json.loads(proc.stdout.strip().splitlines()[-1]), _parse_importtime(proc.stderr)
+
+    def handle(self, *args, **options):
+        runs = [self._startup() for _ in range(max(options['runs'], 1))]
+        result, modules = min(runs, key=lambda run: run[0]['seconds'])
+
+        self.stdout.write(f"Cold startup: {result['seconds']:.3f}s, RSS {result['rss_mb']:.1f} MB")
+        self.stdout.write("Heaviest imports (cumulative):")
+        for name, micros in sorted(modules.items(), key=lambda item: -item[1])[:options['top']]:
+            self.stdout.write(f"  {micros / 1000:8.1f} ms  {name}")
+
+        failures = []
+        if result['seconds'] > options['max_seconds']:
+            failures.append(f"import time {result['seconds']:.3f}s exceeds {options['max_seconds']}s")
+        if result['rss_mb'] > options['max_rss_mb']:
+            failures.append(f"RSS {result['rss_mb']:.1f} MB exceeds {options['max_rss_mb']} MB")
+        loaded = [name for name in LAZY_MODULES if name in modules]
+        if loaded:
+            failures.append(f"imported at startup: {', '.join(loaded)}")
+        if failures:
+            raise CommandError("Startup budget exceeded: " + '; '.join(failures))
+        self.stdout.write(self.style.SUCCESS('Startup within budget.'))
@@ -0,0 +1,28 @@
+import signal
+import threading
+
+from django.core.management.base import BaseCommand
+
+from campshub360.jobs import POLL_INTERVAL, work
+
+
+class Command(BaseCommand):
+    help = 'Run queued background jobs. Stops after the current job on SIGINT/SIGTERM.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--burst', action='store_true', help='Exit once the queue is empty')
+        parser.add_argument('--max-jobs', type=int, help='Exit after running this many jobs')
+        parser.add_argument('--poll-interval', type=float, default=POLL_INTERVAL, help='Seconds between queue polls')
+
+    def handle(self, *args, **options):
+        stop = threading.Event()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *_: stop.set())
+
+        processed = work(
+            burst=options['burst'],
+            poll_interval=options['poll_interval'],
+            max_jobs=options['max_jobs'],
+            stop=stop,
+        )
+        self.stdout.write(self.style.SUCCESS(f'Ran {processed} jobs'))
@@ -0,0 +1,77 @@
+import multiprocessing
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections, transaction
+
+from campshub360.models import DocumentSequence
+from campshub360.numbering import SERIES, allocate_values, reset_pools
+from campshub360.utils import use_primary_reads
+
+
+def _thread_work(series, scope, rounds, batch, atomic):
+    values = []
+    try:
+        for _ in range(rounds):
+            if atomic:
+                with transaction.atomic():
+                    values.extend(allocate_values(series, batch, scope))
+            else:
+                values.extend(allocate_values(series, batch, scope))
+    finally:
+        connection.close()
+    return values
+
+
+def _process_work(series, scope, threads, rounds, batch, atomic):
+    reset_pools()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        futures = [pool.submit(_thread_work, series, scope, rounds, batch, atomic) for _ in range(threads)]
+        return [value for future in futures for value in future.result()]
+
+
+class Command(BaseCommand):
+    help = 'Allocate document numbers from many processes and threads at once and check for duplicates.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--series', type=str, default='receipt', help='Series whose format and mode to use')
+        parser.add_argument('--processes', type=int, default=4)
+        parser.add_argument('--threads', type=int, default=4, help='Threads per process')
+        parser.add_argument('--rounds', type=int, default=250, help='Allocations per thread')
+        parser.add_argument('--batch', type=int, default=1, help='Numbers per allocation')
+        parser.add_argument('--atomic', action='store_true', help='Allocate inside a transaction each round')
+        parser.add_argument('--keep', action='store_true', help='Keep the scratch counter row afterwards')
+
+    def handle(self, *args, **options):
+        series = options['series']
+        if series not in SERIES:
+            raise CommandError(f"Unknown series {series}; choose from {', '.join(SERIES)}")
+        # A scratch scope, so the real counters of the series are never touched
+        scope = f"stress{int(time.time())}"
+        args = (series, scope, options['threads'], options['rounds'], options['batch'], options['atomic'])
+
+        connections.close_all()
+        started = time.perf_counter()
+        with multiprocessing.get_context('fork').Pool(options['processes']) as pool:
+            results = pool.starmap(_process_work, [args] * options['processes'])
+        elapsed = time.perf_counter() - started
+
+        values = [value for result in results for value in result]
+        duplicates = [value for value, seen in Counter(values).items() if seen > 1]
+        expected = options['processes'] * options['threads'] * options['rounds'] * options['batch']
+        with use_primary_reads():
+            counter = DocumentSequence.objects.filter(series=f"{series}:{scope}").values_list(
+                'last_value', flat=True
+            ).first() or 0
+        self.stdout.write(
+            f"{len(values)} numbers (expected {expected}) in {elapsed:.2f}s "
+            f"({len(values) / elapsed:,.0f}/s); counter at {counter}, "
+            f"{counter - len(values)} leased but unused"
+        )
+        if not options['keep']:
+            DocumentSequence.objects.filter(series=f"{series}:{scope}").delete()
+        if duplicates or len(values) != expected:
+            raise CommandError(f"{len(duplicates)} duplicate numbers, e.g. {duplicates[:5]}")
+        self.stdout.write(self.style.SUCCESS('No duplicates'))
@@ -0,0 +1,74 @@
+import uuid
+
+from django.conf import settings
+from django.db import models
+
+
+class DocumentSequence(models.Model):
+    """High-water mark of a document number series (receipts, hall tickets, imports)"""
+    series = models.CharField(max_length=50, unique=True, help_text="Series name and scope, e.g. receipt:2025")
+    last_value = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Document Sequence"
+        verbose_name_plural = "Document Sequences"
+
+    def __str__(self):
+        return f"{self.series} ({self.last_value})"
+
+
+class BackgroundJob(models.Model):
+    """A long-running operation queued for the background worker (see ``campshub360.jobs``)"""
+    STATUS_CHOICES = [
+        ('PENDING', 'Pending'),
+        ('RUNNING', 'Running'),
+        ('COMPLETED', 'Completed'),
+        ('FAILED', 'Failed'),
+        ('CANCELLED', 'Cancelled'),
+    ]
+    FINISHED_STATUSES = ('COMPLETED', 'FAILED', 'CANCELLED')
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    task = models.CharField(max_length=100, help_text="Registered task name, e.g. students.import")
+    label = models.CharField(max_length=200, blank=True)
+    params = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='PENDING')
+    requested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name='background_jobs'
+    )
+    progress_done = models.PositiveIntegerField(default=0)
+    progress_total = models.PositiveIntegerField(default=0)
+    message = models.CharField(max_length=255, blank=True)
+    result = models.JSONField(default=dict, blank=True)
+    artifacts = models.JSONField(default=list, blank=True, help_text="Storage paths of the files the job produced")
+    error = models.TextField(blank=True)
+    cancel_requested = models.BooleanField(default=False)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    worker = models.CharField(max_length=100, blank=True)
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = "Background Job"
+        verbose_name_plural = "Background Jobs"
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+            models.Index(fields=['requested_by', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.label or self.task} - {self.status}"
+
+    @property
+    def progress(self):
+        if not self.progress_total:
+            return 100.0 if self.status == 'COMPLETED' else 0.0
+        return round(self.progress_done * 100 / self.progress_total, 1)
+
+    @property
+    def is_finished(self):
+        return self.status in self.FINISHED_STATUSES
@@ -0,0 +1,186 @@
+"""
+Document number allocation.
+
+Each series (payment receipts, fee receipts, hall tickets, import batches)
+keeps its high-water mark in a ``DocumentSequence`` row, one row per series
+and scope (usually a year), e.g. ``hall_ticket:2024``. Numbers are taken
+with a single ``UPDATE ... RETURNING`` that adds the whole request at once,
+so ``allocate(series, n)`` costs one statement however large ``n`` is.
+
+A series is either
+
+* gap-free: the counter is moved inside the caller's transaction. Its row
+  stays locked until that transaction ends, so a rollback gives the numbers
+  back and concurrent writers of the same series queue behind each other;
+* gap-tolerant (the default): each process leases a block of numbers
+  (``block_size``, 1000 by default) and hands them out from memory, so
+  writers only meet on the counter row once per block. Numbers increase
+  within a process but not across processes, and numbers from a lease that
+  was never used or whose transaction rolled back are skipped.
+
+Leases are reserved outside the caller's transaction. When the caller is
+inside ``atomic()``, the counter is moved on a second connection of the
+process in autocommit mode, which commits at once and releases the row
+lock. A long transaction (a reconciliation run, a bulk import) therefore
+never keeps other workers waiting on the counter row. A block reserved
+this way is never given back, so a rollback only leaves a gap. SQLite
+allows a single writer, so there the lease stays in the caller's
+transaction. The unused rest of the block then joins the process pool only
+after that transaction commits; a rollback undoes the counter update
+together with every number handed out from the block.
+
+Formats and modes can be overridden per series through the
+``DOCUMENT_NUMBER_SERIES`` setting, e.g.
+``{'receipt': {'format': 'RC{scope}-{value:06d}', 'gapless': True}}``.
+"""
+import os
+import threading
+from collections import defaultdict, deque
+from dataclasses import dataclass, replace
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, IntegrityError, connection, connections, transaction
+from django.utils import timezone
+
+from .models import DocumentSequence
+
+
+@dataclass(frozen=True)
+class Series:
+    format: str
+    gapless: bool = False
+    block_size: int = 1000
+
+
+SERIES = {
+    'receipt': Series('RCPT{scope}{value:08d}'),
+    'fee_receipt': Series('FR{scope}{value:08d}'),
+    'hall_ticket': Series('HT{scope}{value:08d}'),
+    'import_batch': Series('IMP{scope}{value:06d}'),
+}
+
+_pools = defaultdict(deque)
+_pool_lock = threading.Lock()
+_lease_connections = threading.local()
+
+
+def get_series(name):
+    series = SERIES.get(name)
+    overrides = getattr(settings, 'DOCUMENT_NUMBER_SERIES', {}).get(name)
+    if series is None and overrides is None:
+        raise KeyError(f"Unknown document number series: {name}")
+    return replace(series or Series('{value}'), **(overrides or {}))
+
+
+def _increment_sql():
+    qn = connection.ops.quote_name
+    table = qn(DocumentSequence._meta.db_table)
+    return (
+        f"UPDATE {table} SET {qn('last_value')} = {qn('last_value')} + %s, {qn('updated_at')} = %s "
+        f"WHERE {qn('series')} = %s RETURNING {qn('last_value')}"
+    )
+
+
+def _insert_sql():
+    qn = connection.ops.quote_name
+    table = qn(DocumentSequence._meta.db_table)
+    return f"INSERT INTO {table} ({qn('series')}, {qn('last_value')}, {qn('updated_at')}) VALUES (%s, %s, %s)"
+
+
+def _reserve(key, count, db=None):
+    """Move the counter of ``key`` by ``count`` on ``db`` (default: the caller's). Returns the last value."""
+    db = db or connection
+    now = timezone.now()
+    with db.cursor() as cursor:
+        cursor.execute(_increment_sql(), [count, now, key])
+        row = cursor.fetchone()
+    if row:
+        return row[0]
+    try:
+        if db is connection:
+            # A savepoint keeps a failed insert from breaking the caller's transaction
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(_insert_sql(), [key, count, now])
+        else:
+            with db.cursor() as cursor:
+                cursor.execute(_insert_sql(), [key, count, now])
+        return count
+    except IntegrityError:
+        # Another worker created the series first
+        with db.cursor() as cursor:
+            cursor.execute(_increment_sql(), [count, now, key])
+            return cursor.fetchone()[0]
+
+
+def _lease_connection():
+    """This thread's own connection for leases; it stays in autocommit mode."""
+    db = getattr(_lease_connections, 'connection', None)
+    if db is None:
+        db = _lease_connections.connection = connections.create_connection(DEFAULT_DB_ALIAS)
+    db.close_if_unusable_or_obsolete()
+    return db
+
+
+def _lease(key, count, block_size):
+    """Take ``count`` numbers for the caller, reserving whole blocks from the counter."""
+    blocks = -(-count // block_size)
+    outside = connection.in_atomic_block and connection.vendor != 'sqlite'
+    last = _reserve(key, blocks * block_size, _lease_connection() if outside else None)
+    values = range(last - blocks * block_size + 1, last + 1)
+    taken, rest = list(values[:count]), values[count:]
+    if rest:
+        if connection.in_atomic_block and not outside:
+            transaction.on_commit(lambda: _return_to_pool(key, rest))
+        else:
+            _return_to_pool(key, rest)
+    return taken
+
+
+def _return_to_pool(key, values):
+    with _pool_lock:
+        _pools[key].extend(values)
+
+
+def allocate_values(name, count, scope=''):
+    """Reserve ``count`` integer values of a series. Values are unique per series and scope."""
+    if count <= 0:
+        return []
+    series = get_series(name)
+    key = f"{name}:{scope}" if scope else name
+    if series.gapless:
+        last = _reserve(key, count)
+        return list(range(last - count + 1, last + 1))
+
+    with _pool_lock:
+        pool = _pools[key]
+        values = [pool.popleft() for _ in range(min(count, len(pool)))]
+    if len(values) < count:
+        values.extend(_lease(key, count - len(values), series.block_size))
+    return values
+
+
+def allocate(name, count, scope=''):
+    """Reserve and format ``count`` document numbers of a series."""
+    series = get_series(name)
+    return [series.format.format(scope=scope, value=value) for value in allocate_values(name, count, scope)]
+
+
+def next_number(name, scope=''):
+    """Reserve and format a single document number."""
+    return allocate(name, 1, scope)[0]
+
+
+def reset_pools():
+    """Forget the numbers leased by this process."""
+    with _pool_lock:
+        _pools.clear()
+
+
+def _after_fork():
+    reset_pools()
+    # The parent's lease connection is not ours to use (or close)
+    _lease_connections.__dict__.clear()
+
+
+# A forked worker must not hand out numbers its parent may also use
+os.register_at_fork(after_in_child=_after_fork)
@@ -24,9 +24,14 @@ from rest_framework_simplejwt.views import (
     TokenRefreshView,
 )
 from accounts.views import RateLimitedTokenView, RateLimitedRefreshView
+from rest_framework.routers import SimpleRouter
+from .job_views import BackgroundJobViewSet
 from .health_views import health_check, detailed_health_check, readiness_check, liveness_check, app_metrics
 # drf-spectacular imports removed
 
+job_router = SimpleRouter()
+job_router.register(r'jobs', BackgroundJobViewSet, basename='job')
+
 urlpatterns = [
     # Health check endpoints
     path('health/', health_check, name='health_check'),
@@ -55,6 +60,7 @@ urlpatterns = [
     path('api/v1/mentoring/', include('mentoring.urls', namespace='mentoring')),
     path('api/v1/feedback/', include('feedback.urls', namespace='feedback')),
     path('api/v1/assignments/', include('assignments.urls', namespace='assignments')),
+    path('api/v1/', include((job_router.urls, 'jobs'))),
     # Prometheus metrics (conditionally added below if installed)
     # Docs and API schema routes removed
     path('facilities/', include('facilities.urls', namespace='facilities_dashboard')),
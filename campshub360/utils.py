@@ -1,9 +1,20 @@
 from contextlib import contextmanager
-from .db_routers import UsePrimaryReads
 
+from rest_framework import serializers
+
+from .db_routers import UsePrimaryReads
 
 @contextmanager
 def use_primary_reads():
     with UsePrimaryReads():
         yield
 
+
+def parse_bool(value, default=False):
+    """Request flag as a bool: JSON booleans and form strings such as 'false' or '0' alike.
+
+    Unrecognised values raise DRF's ``ValidationError`` (a 400 response).
+    """
+    if value is None or value == '':
+        return default
+    return serializers.BooleanField().to_internal_value(value)
@@ -3,4 +3,9 @@ from django.apps import AppConfig
 
 class DashboardConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'dashboard'
\ No newline at end of file
+    name = 'dashboard'
+
+    def ready(self):
+        from . import checks  # noqa: F401
+        from .counters import connect_signals
+        connect_signals()
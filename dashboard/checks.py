@@ -0,0 +1,23 @@
+"""System checks of the dashboard."""
+from django.core.checks import Error, Tags, register
+
+
+@register(Tags.urls)
+def check_lazy_views(app_configs, **kwargs):
+    """Every lazily imported dashboard view must exist (``manage.py check`` imports them all)."""
+    from .lazy import LazyView
+    from .urls import urlpatterns
+
+    errors = []
+    for pattern in urlpatterns:
+        callback = getattr(pattern, 'callback', None)
+        if not isinstance(callback, LazyView):
+            continue
+        try:
+            callback.view
+        except (ImportError, AttributeError) as exc:
+            errors.append(Error(
+                f"Dashboard URL '{pattern.pattern}' refers to {callback.module}.{callback.name}: {exc}",
+                id='dashboard.E001',
+            ))
+    return errors
@@ -0,0 +1,212 @@
+"""
+Dashboard counters.
+
+Every counter of the dashboard home page and ``api_dashboard_stats`` is read
+with one SQL statement: each counter is a scalar ``COUNT`` subquery of a
+single ``SELECT``. Tables listed as huge (audit logs, failed logins) use the
+planner's row estimate from ``pg_class.reltuples`` on PostgreSQL once it
+passes ``ESTIMATE_THRESHOLD`` rows, and are counted exactly below that.
+``table_counts`` does the same for every model table in one statement.
+
+Results are cached for ``COUNTERS_TTL`` seconds. When they expire, one
+process refreshes them (the one that wins ``cache.add`` on the refresh key)
+while the others keep serving the previous values.
+
+Totals without a filter (users, students, faculty, roles and so on) are
+also kept exact between refreshes: creating or deleting a row moves a delta
+counter in the cache once the transaction commits, and readers add the
+delta to the cached value. A refresh resets the deltas. ``bulk_create`` and
+queryset updates send no signals and show up at the next refresh.
+"""
+import time
+from dataclasses import dataclass, field
+
+from django.apps import apps
+from django.core.cache import cache
+from django.db import connections, router, transaction
+from django.db.models import Func, IntegerField, Value
+from django.db.models.signals import post_delete, post_save
+
+COUNTERS_TTL = 60
+STALE_TTL = 3600
+REFRESH_LOCK_TIMEOUT = 30
+ESTIMATE_THRESHOLD = 100_000
+
+CACHE_KEY = 'dashboard:counters'
+TABLES_CACHE_KEY = 'dashboard:table_counts'
+
+
+@dataclass
+class Counter:
+    name: str
+    model: str
+    filters: dict = field(default_factory=dict)
+    estimate: bool = False
+
+    @property
+    def model_class(self):
+        return apps.get_model(self.model)
+
+    @property
+    def tracked(self):
+        """Exact totals are kept current between refreshes by signals."""
+        return not self.filters and not self.estimate
+
+
+COUNTERS = [
+    Counter('total_users', 'accounts.User'),
+    Counter('active_users', 'accounts.User', {'is_active': True}),
+    Counter('staff_users', 'accounts.User', {'is_staff': True}),
+    Counter('verified_users', 'accounts.User', {'is_verified': True}),
+    Counter('total_students', 'students.Student'),
+    Counter('active_students', 'students.Student', {'status': 'ACTIVE'}),
+    Counter('total_faculty', 'faculty.Faculty'),
+    Counter('active_faculty', 'faculty.Faculty', {'status': 'ACTIVE', 'currently_associated': True}),
+    Counter('total_roles', 'accounts.Role'),
+    Counter('total_permissions', 'accounts.Permission'),
+    Counter('auth_identifiers', 'accounts.AuthIdentifier'),
+    Counter('active_sessions', 'accounts.UserSession', {'revoked': False}),
+    Counter('total_custom_fields', 'students.CustomField', {'is_active': True}),
+    Counter('total_faculty_custom_fields', 'faculty.CustomField', {'is_active': True}),
+    Counter('failed_logins', 'accounts.FailedLogin', estimate=True),
+    Counter('audit_logs', 'accounts.AuditLog', estimate=True),
+]
+
+
+def _count_sql(queryset, using):
+    """SQL and params of ``SELECT COUNT(*)`` over ``queryset``."""
+    count = Func(Value(1), function='COUNT', output_field=IntegerField())
+    query = queryset.order_by().annotate(n=count).values('n').query
+    return query.get_compiler(using=using).as_sql()
+
+
+def _counter_sql(model, filters, estimate, using):
+    sql, params = _count_sql(model._default_manager.filter(**filters), using)
+    connection = connections[using]
+    if not estimate or connection.vendor != 'postgresql':
+        return sql, list(params)
+    # The exact count only runs for tables the planner believes are small
+    # (or has never analyzed, where reltuples is -1).
+    table = connection.ops.quote_name(model._meta.db_table)
+    return (
+        f"SELECT CASE WHEN c.reltuples > %s THEN c.reltuples::bigint ELSE ({sql}) END "
+        f"FROM pg_class c WHERE c.oid = %s::regclass",
+        [ESTIMATE_THRESHOLD, *params, table],
+    )
+
+
+def _select_counts(columns, using):
+    """Run ``{name: (sql, params)}`` as one statement of scalar subqueries."""
+    if not columns:
+        return {}
+    qn = connections[using].ops.quote_name
+    selects, params = [], []
+    for name, (sql, column_params) in columns.items():
+        selects.append(f"COALESCE(({sql}), 0) AS {qn(name)}")
+        params.extend(column_params)
+    with connections[using].cursor() as cursor:
+        cursor.execute(f"SELECT {', '.join(selects)}", params)
+        row = cursor.fetchone()
+    return {name: int(value) for name, value in zip(columns, row)}
+
+
+def compute_counters(counters=COUNTERS):
+    """Read ``counters`` from the database, bypassing the cache."""
+    using = router.db_for_read(counters[0].model_class)
+    return _select_counts({
+        counter.name: _counter_sql(counter.model_class, counter.filters, counter.estimate, using)
+        for counter in counters
+    }, using)
+
+
+def compute_table_counts():
+    """Row counts of every managed model table, estimated for huge tables on PostgreSQL."""
+    tables = {}
+    for model in apps.get_models():
+        if model._meta.managed and not model._meta.proxy:
+            tables.setdefault(model._meta.db_table, model)
+    using = router.db_for_read(next(iter(tables.values())))
+    return _select_counts({
+        table: _counter_sql(model, {}, True, using) for table, model in tables.items()
+    }, using)
+
+
+def _delta_key(name):
+    return f"{CACHE_KEY}:delta:{name}"
+
+
+def _cached(key, compute, ttl, on_refresh=None):
+    """Cached ``compute()`` with one refreshing process per expiry; the others serve stale values."""
+    entry = cache.get(key)
+    if entry is not None and entry['expires'] > time.time():
+        return entry['values']
+    lock = f"{key}:refresh"
+    if cache.add(lock, 1, REFRESH_LOCK_TIMEOUT):
+        try:
+            if on_refresh is not None:
+                on_refresh()
+            values = compute()
+            cache.set(key, {'values': values, 'expires': time.time() + ttl}, STALE_TTL)
+        finally:
+            cache.delete(lock)
+        return values
+    if entry is not None:
+        return entry['values']
+    # First read ever, and another process is already counting
+    for _ in range(20):
+        time.sleep(0.05)
+        entry = cache.get(key)
+        if entry is not None:
+            return entry['values']
+    return compute()
+
+
+def _reset_deltas():
+    cache.delete_many([_delta_key(counter.name) for counter in COUNTERS if counter.tracked])
+
+
+def get_counters():
+    """All dashboard counters by name, from the cache where possible."""
+    values = dict(_cached(CACHE_KEY, compute_counters, COUNTERS_TTL, on_refresh=_reset_deltas))
+    tracked = [counter.name for counter in COUNTERS if counter.tracked]
+    deltas = cache.get_many([_delta_key(name) for name in tracked])
+    for name in tracked:
+        values[name] += deltas.get(_delta_key(name), 0)
+    return values
+
+
+def table_counts():
+    """Row counts by table name, cached like the dashboard counters."""
+    return _cached(TABLES_CACHE_KEY, compute_table_counts, COUNTERS_TTL)
+
+
+def _move(names, step):
+    for name in names:
+        key = _delta_key(name)
+        cache.add(key, 0, STALE_TTL)
+        try:
+            cache.incr(key, step)
+        except ValueError:
+            cache.set(key, step, STALE_TTL)
+
+
+def _on_save(sender, instance, created, **kwargs):
+    if created:
+        names = _tracked_names(sender)
+        transaction.on_commit(lambda: _move(names, 1), using=kwargs.get('using'))
+
+
+def _on_delete(sender, instance, **kwargs):
+    names = _tracked_names(sender)
+    transaction.on_commit(lambda: _move(names, -1), using=kwargs.get('using'))
+
+
+def _tracked_names(model):
+    return [counter.name for counter in COUNTERS if counter.tracked and counter.model_class is model]
+
+
+def connect_signals():
+    """Keep the tracked totals current as rows are created and deleted."""
+    for model in {counter.model_class for counter in COUNTERS if counter.tracked}:
+        post_save.connect(_on_save, sender=model, dispatch_uid=f'dashboard_counters_save_{model._meta.label}')
+        post_delete.connect(_on_delete, sender=model, dispatch_uid=f'dashboard_counters_delete_{model._meta.label}')
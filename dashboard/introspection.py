@@ -0,0 +1,279 @@
+"""
+Database schema introspection.
+
+``get_schema()`` describes every table of the database: its columns, primary
+key, indexes and constraints. On PostgreSQL each of the three kinds is read
+with one catalog query for the whole schema, instead of one
+``information_schema`` query per table. Other databases go through Django's
+``connection.introspection``.
+
+The result is cached under a key derived from the applied migrations
+(``django_migrations`` row count and highest id), so it is read again only
+after a migration runs. ``mermaid_er_diagram()`` is built from the same
+metadata and cached under the same state.
+
+The metadata is plain dicts and lists::
+
+    {'vendor': 'postgresql', 'tables': {
+        'students_student': {
+            'columns': [{'name', 'type', 'nullable', 'default', 'max_length'}, ...],
+            'primary_key': ['id'],
+            'indexes': [{'name', 'columns', 'unique', 'definition'}, ...],
+            'constraints': [{'name', 'type', 'columns', 'references', 'definition'}, ...],
+        },
+    }}
+
+``references`` is ``{'table', 'columns'}`` for foreign keys and None otherwise.
+"""
+from django.apps import apps
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.migrations.recorder import MigrationRecorder
+from django.db.models import Count, Max
+
+SCHEMA_TTL = 24 * 3600
+
+CACHE_KEY = 'dashboard:schema'
+
+COLUMNS_SQL = """
+    SELECT c.table_name, c.column_name, c.data_type, c.is_nullable, c.column_default,
+           c.character_maximum_length
+    FROM information_schema.columns c
+    JOIN information_schema.tables t
+      ON t.table_schema = c.table_schema AND t.table_name = c.table_name
+    WHERE c.table_schema = current_schema() AND t.table_type = 'BASE TABLE'
+    ORDER BY c.table_name, c.ordinal_position
+"""
+
+# Column names of an attnum array (indkey, conkey, confkey) in array order
+_ATTNAMES = """
+    ARRAY(SELECT a.attname
+          FROM unnest({keys}::int2[]) WITH ORDINALITY AS k(attnum, seq)
+          JOIN pg_attribute a ON a.attrelid = {relid} AND a.attnum = k.attnum
+          ORDER BY k.seq)
+"""
+
+INDEXES_SQL = f"""
+    SELECT t.relname, i.relname, ix.indisunique,
+           {_ATTNAMES.format(keys='ix.indkey', relid='ix.indrelid')},
+           pg_get_indexdef(ix.indexrelid)
+    FROM pg_index ix
+    JOIN pg_class t ON t.oid = ix.indrelid
+    JOIN pg_class i ON i.oid = ix.indexrelid
+    JOIN pg_namespace n ON n.oid = t.relnamespace
+    WHERE n.nspname = current_schema() AND t.relkind IN ('r', 'p')
+    ORDER BY t.relname, i.relname
+"""
+
+CONSTRAINTS_SQL = f"""
+    SELECT t.relname, con.conname, con.contype,
+           {_ATTNAMES.format(keys='con.conkey', relid='con.conrelid')},
+           f.relname,
+           {_ATTNAMES.format(keys='con.confkey', relid='con.confrelid')},
+           pg_get_constraintdef(con.oid)
+    FROM pg_constraint con
+    JOIN pg_class t ON t.oid = con.conrelid
+    JOIN pg_namespace n ON n.oid = t.relnamespace
+    LEFT JOIN pg_class f ON f.oid = con.confrelid
+    WHERE n.nspname = current_schema() AND t.relkind IN ('r', 'p')
+    ORDER BY t.relname, con.conname
+"""
+
+CONSTRAINT_TYPES = {
+    'p': 'PRIMARY KEY',
+    'u': 'UNIQUE',
+    'f': 'FOREIGN KEY',
+    'c': 'CHECK',
+    'x': 'EXCLUDE',
+}
+
+
+def _table(tables, name):
+    return tables.setdefault(name, {'columns': [], 'primary_key': [], 'indexes': [], 'constraints': []})
+
+
+def _read_postgresql(connection):
+    tables = {}
+    with connection.cursor() as cursor:
+        cursor.execute(COLUMNS_SQL)
+        for table, name, data_type, is_nullable, default, max_length in cursor.fetchall():
+            _table(tables, table)['columns'].append({
+                'name': name,
+                'type': data_type,
+                'nullable': is_nullable == 'YES',
+                'default': default,
+                'max_length': max_length,
+            })
+
+        cursor.execute(INDEXES_SQL)
+        for table, name, unique, columns, definition in cursor.fetchall():
+            if table in tables:
+                tables[table]['indexes'].append({
+                    'name': name, 'columns': list(columns), 'unique': unique, 'definition': definition,
+                })
+
+        cursor.execute(CONSTRAINTS_SQL)
+        for table, name, kind, columns, ref_table, ref_columns, definition in cursor.fetchall():
+            if table not in tables:
+                continue
+            if kind == 'p':
+                tables[table]['primary_key'] = list(columns)
+            tables[table]['constraints'].append({
+                'name': name,
+                'type': CONSTRAINT_TYPES.get(kind, kind),
+                'columns': list(columns),
+                'references': {'table': ref_table, 'columns': list(ref_columns)} if kind == 'f' else None,
+                'definition': definition,
+            })
+    return tables
+
+
+def _read_generic(connection):
+    """Per-table introspection through Django, for databases other than PostgreSQL."""
+    introspection = connection.introspection
+    tables = {}
+    with connection.cursor() as cursor:
+        names = sorted(info.name for info in introspection.get_table_list(cursor) if info.type == 't')
+        for name in names:
+            table = _table(tables, name)
+            for column in introspection.get_table_description(cursor, name):
+                table['columns'].append({
+                    'name': column.name,
+                    'type': str(column.type_code),
+                    'nullable': bool(column.null_ok),
+                    'default': column.default,
+                    'max_length': column.internal_size or column.display_size,
+                })
+            for constraint_name, info in sorted(introspection.get_constraints(cursor, name).items()):
+                columns = [column for column in info['columns'] if column]
+                if info['primary_key']:
+                    table['primary_key'] = columns
+                if info['index'] and not info['primary_key']:
+                    table['indexes'].append({
+                        'name': constraint_name, 'columns': columns, 'unique': bool(info['unique']),
+                        'definition': None,
+                    })
+                kind = (
+                    'PRIMARY KEY' if info['primary_key']
+                    else 'FOREIGN KEY' if info['foreign_key']
+                    else 'CHECK' if info['check']
+                    else 'UNIQUE' if info['unique'] and not info['index']
+                    else None
+                )
+                if kind is None:
+                    continue
+                references = None
+                if info['foreign_key']:
+                    references = {'table': info['foreign_key'][0], 'columns': [info['foreign_key'][1]]}
+                table['constraints'].append({
+                    'name': constraint_name, 'type': kind, 'columns': columns, 'references': references,
+                    'definition': None,
+                })
+    return tables
+
+
+def read_schema(using=DEFAULT_DB_ALIAS):
+    """Introspect the database, bypassing the cache."""
+    connection = connections[using]
+    reader = _read_postgresql if connection.vendor == 'postgresql' else _read_generic
+    return {'vendor': connection.vendor, 'tables': reader(connection)}
+
+
+def schema_state(using=DEFAULT_DB_ALIAS):
+    """Cache key suffix that changes whenever a migration is applied or unapplied."""
+    recorder = MigrationRecorder(connections[using])
+    if not recorder.has_table():
+        return f'{using}:none'
+    state = recorder.migration_qs.aggregate(count=Count('id'), last=Max('id'))
+    return f"{using}:{state['count']}-{state['last']}"
+
+
+def _cached(name, compute, using):
+    key = f"{CACHE_KEY}:{name}:{schema_state(using)}"
+    value = cache.get(key)
+    if value is None:
+        value = compute()
+        cache.set(key, value, SCHEMA_TTL)
+    return value
+
+
+def get_schema(using=DEFAULT_DB_ALIAS):
+    """Metadata of every table, cached until the migration state changes."""
+    return _cached('tables', lambda: read_schema(using), using)
+
+
+def column_rows(schema=None):
+    """``(table, column, type, not_null, default, max_length)`` for every column, table by table."""
+    schema = schema or get_schema()
+    for table, info in sorted(schema['tables'].items()):
+        for column in info['columns']:
+            yield (table, column['name'], column['type'], not column['nullable'], column['default'],
+                   column['max_length'])
+
+
+def _model_names():
+    """``{table: (model name, through model)}`` for the tables of installed models."""
+    names = {}
+    for model in apps.get_models(include_auto_created=True):
+        names.setdefault(model._meta.db_table, (model.__name__, model._meta.auto_created))
+    return names
+
+
+def _unique_sets(info):
+    sets = [tuple(info['primary_key'])]
+    sets += [tuple(constraint['columns']) for constraint in info['constraints'] if constraint['type'] == 'UNIQUE']
+    sets += [tuple(index['columns']) for index in info['indexes'] if index['unique']]
+    return set(sets)
+
+
+def _build_mermaid(schema):
+    models = _model_names()
+    tables = schema['tables']
+    label = {table: models.get(table, (table, False))[0] for table in tables}
+    through = {table for table in tables if table in models and models[table][1]}
+
+    lines = ["erDiagram"]
+    for table, info in sorted(tables.items()):
+        if table in through:
+            continue
+        foreign = {
+            column for constraint in info['constraints'] if constraint['type'] == 'FOREIGN KEY'
+            for column in constraint['columns']
+        }
+        lines.append(f"    {label[table]} {{")
+        for column in info['columns']:
+            keys = []
+            if column['name'] in info['primary_key']:
+                keys.append('PK')
+            if column['name'] in foreign:
+                keys.append('FK')
+            # Mermaid attribute types are single words
+            column_type = column['type'].replace(' ', '_').replace('(', '_').replace(')', '').replace(',', '_')
+            suffix = f" {', '.join(keys)}" if keys else ""
+            lines.append(f"        {column_type} {column['name']}{suffix}")
+        lines.append("    }")
+
+    for table, info in sorted(tables.items()):
+        foreign_keys = [
+            constraint for constraint in info['constraints']
+            if constraint['type'] == 'FOREIGN KEY' and constraint['references']['table'] in tables
+        ]
+        if table in through:
+            # Auto-created many-to-many tables join the two models they reference
+            if len(foreign_keys) == 2:
+                a, b = (label[constraint['references']['table']] for constraint in foreign_keys)
+                lines.append(f"    {a} }}o--o{{ {b} : many_to_many")
+            continue
+        unique = _unique_sets(info)
+        for constraint in foreign_keys:
+            one_to_one = tuple(constraint['columns']) in unique
+            connector = "||--||" if one_to_one else "||--o{"
+            name = constraint['columns'][0].removesuffix('_id') if constraint['columns'] else 'fk'
+            lines.append(f"    {label[constraint['references']['table']]} {connector} {label[table]} : {name}")
+
+    return "\n".join(lines)
+
+
+def mermaid_er_diagram(using=DEFAULT_DB_ALIAS):
+    """Mermaid ER diagram of the database, cached like ``get_schema``."""
+    return _cached('mermaid', lambda: _build_mermaid(get_schema(using)), using)
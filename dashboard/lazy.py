@@ -0,0 +1,60 @@
+"""
+Lazily imported views for the dashboard URLconf.
+
+``views.fees.fees_dashboard`` is a ``LazyView`` that imports
+``dashboard.views.fees`` on the first request it serves. Gunicorn workers
+therefore start without loading every dashboard module and the libraries
+they use.
+"""
+from functools import cached_property
+from importlib import import_module
+
+VIEWS_PACKAGE = 'dashboard.views'
+
+
+class LazyView:
+    """A view callable that imports ``module.name`` on first use."""
+
+    def __init__(self, module, name):
+        self.module = module
+        self.name = name
+        self.__name__ = name
+        self.__qualname__ = name
+        self.__module__ = module
+
+    @cached_property
+    def view(self):
+        return getattr(import_module(self.module), self.name)
+
+    def __call__(self, request, *args, **kwargs):
+        return self.view(request, *args, **kwargs)
+
+    @property
+    def csrf_exempt(self):
+        # Read by CsrfViewMiddleware before the view runs (DRF views are exempt)
+        return getattr(self.view, 'csrf_exempt', False)
+
+    def __repr__(self):
+        return f"<LazyView {self.module}.{self.name}>"
+
+
+class LazyModule:
+    """Attribute access returns a ``LazyView`` of that name in ``module``."""
+
+    def __init__(self, module):
+        self.module = module
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return LazyView(self.module, name)
+
+
+class _Views:
+    def __getattr__(self, area):
+        if area.startswith('__'):
+            raise AttributeError(area)
+        return LazyModule(f'{VIEWS_PACKAGE}.{area}')
+
+
+views = _Views()
@@ -0,0 +1,163 @@
+"""
+Table browser for the dashboard.
+
+``browse(table, columns, cursor, limit)`` reads one page of any table. Table
+and column names are checked against the cached introspection metadata
+(``dashboard.introspection``) before they are quoted into SQL, so a request
+can only name what exists. Tables and columns that hold credentials
+(password hashes, sessions, tokens, secrets) are never served. Pages are keyset paginated on the primary key:
+each page is ``WHERE pk > last seen pk ORDER BY pk LIMIT n``, which is an
+index range scan however deep the page. The position travels as an opaque
+``cursor`` token.
+
+Responses are bounded in three ways. A page holds at most ``MAX_PAGE_SIZE``
+rows. Long values are cut to ``MAX_VALUE_LENGTH`` characters. A page stops
+early once its values pass ``MAX_PAGE_BYTES``, and the next cursor resumes
+right after the last row returned. Pages larger than ``SERVER_SIDE_THRESHOLD``
+rows are read through a server-side cursor on PostgreSQL, so the database
+driver never buffers more than ``FETCH_SIZE`` rows at a time.
+"""
+import base64
+import binascii
+import json
+
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+from .introspection import get_schema
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+MAX_VALUE_LENGTH = 500
+MAX_PAGE_BYTES = 1024 * 1024
+SERVER_SIDE_THRESHOLD = 200
+FETCH_SIZE = 200
+
+# Credentials: whole tables, exact column names, and parts of column names
+DENIED_TABLES = {
+    'django_session',
+    'token_blacklist_outstandingtoken',
+    'token_blacklist_blacklistedtoken',
+}
+DENIED_COLUMNS = {'password', 'session_key', 'session_data'}
+DENIED_COLUMN_PARTS = ('token', 'secret')
+
+
+class TableBrowserError(ValueError):
+    """A request the browser refuses: unknown table or column, or a bad cursor."""
+
+
+def encode_cursor(values):
+    # str() keeps full precision of datetimes, decimals and UUIDs; the database casts them back
+    payload = json.dumps(values, default=str, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(token, size):
+    try:
+        values = json.loads(base64.urlsafe_b64decode(token.encode('ascii')))
+    except (binascii.Error, UnicodeError, ValueError):
+        raise TableBrowserError("Invalid cursor") from None
+    if not isinstance(values, list) or len(values) != size:
+        raise TableBrowserError("Invalid cursor")
+    # Key values are always encoded as strings or numbers
+    if not all(isinstance(value, (str, int, float)) and not isinstance(value, bool) for value in values):
+        raise TableBrowserError("Invalid cursor")
+    return values
+
+
+def is_denied_column(name):
+    name = name.lower()
+    return name in DENIED_COLUMNS or any(part in name for part in DENIED_COLUMN_PARTS)
+
+
+def _bounded(value):
+    """``value`` as returned to the client, with its approximate size in bytes."""
+    if isinstance(value, (bytes, memoryview)):
+        value = f"<{len(value)} bytes>"
+    if isinstance(value, str):
+        if len(value) > MAX_VALUE_LENGTH:
+            value = value[:MAX_VALUE_LENGTH] + '…'
+        return value, len(value)
+    return value, len(str(value))
+
+
+def _columns(table, info, requested):
+    names = [column['name'] for column in info['columns'] if not is_denied_column(column['name'])]
+    if not requested:
+        return names
+    unknown = [name for name in requested if name not in names]
+    if unknown:
+        raise TableBrowserError(f"Unknown or restricted column(s) of {table}: {', '.join(unknown)}")
+    # Keep the requested order, once each
+    return list(dict.fromkeys(requested))
+
+
+def browse(table, columns=None, cursor=None, limit=DEFAULT_PAGE_SIZE, using=DEFAULT_DB_ALIAS):
+    """One page of ``table``; raises ``LookupError`` for unknown tables, ``TableBrowserError`` for bad input."""
+    info = None if table in DENIED_TABLES else get_schema(using)['tables'].get(table)
+    if info is None:
+        raise LookupError(f"Unknown table: {table}")
+    columns = _columns(table, info, columns)
+    key = info['primary_key']
+    limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+
+    connection = connections[using]
+    qn = connection.ops.quote_name
+    # The key is read even when not projected: the next cursor is built from it
+    selected = columns + [name for name in key if name not in columns]
+    sql = f"SELECT {', '.join(qn(name) for name in selected)} FROM {qn(table)}"
+    params = []
+    if key:
+        if cursor:
+            values = decode_cursor(cursor, len(key))
+            sql += f" WHERE ({', '.join(qn(name) for name in key)}) > ({', '.join(['%s'] * len(key))})"
+            params.extend(values)
+        sql += f" ORDER BY {', '.join(qn(name) for name in key)}"
+    elif cursor:
+        raise TableBrowserError(f"{table} has no primary key and cannot be paged")
+    # One extra row tells whether another page follows
+    sql += f" LIMIT {limit + 1}"
+
+    server_side = (
+        limit > SERVER_SIDE_THRESHOLD
+        and connection.features.can_use_chunked_reads
+        and connection.vendor == 'postgresql'
+        and not connection.settings_dict.get('DISABLE_SERVER_SIDE_CURSORS')
+    )
+    key_positions = [selected.index(name) for name in key]
+    rows, size, last_key, has_more, truncated = [], 0, None, False, False
+    try:
+        with (connection.chunked_cursor() if server_side else connection.cursor()) as db_cursor:
+            db_cursor.execute(sql, params)
+            while not has_more:
+                batch = db_cursor.fetchmany(FETCH_SIZE)
+                if not batch:
+                    break
+                for row in batch:
+                    if len(rows) == limit or (rows and size >= MAX_PAGE_BYTES):
+                        has_more = True
+                        truncated = len(rows) < limit
+                        break
+                    record = {}
+                    for name, value in zip(columns, row):
+                        record[name], value_size = _bounded(value)
+                        size += value_size
+                    rows.append(record)
+                    last_key = [row[position] for position in key_positions]
+    except DatabaseError:
+        # Cursor values the database cannot compare with the key, e.g. a string for an integer key
+        if cursor:
+            raise TableBrowserError("Invalid cursor") from None
+        raise
+
+    return {
+        'table': table,
+        'columns': columns,
+        'primary_key': key,
+        'data': rows,
+        'count': len(rows),
+        'limit': limit,
+        'has_more': has_more,
+        'truncated': truncated,
+        'next_cursor': encode_cursor(last_key) if has_more and key else None,
+    }
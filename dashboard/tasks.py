@@ -0,0 +1,74 @@
+"""Background tasks of the dashboard: student imports and schema exports."""
+import tempfile
+
+from django.core.files.storage import default_storage
+
+from campshub360.jobs import task
+
+from .introspection import get_schema
+
+
+@task('students.import')
+def import_students(context, import_id, path):
+    """Import the uploaded file at ``path`` into StudentImport ``import_id``."""
+    from students.models import StudentImport
+    from .views.students import process_student_import
+
+    import_record = StudentImport.objects.get(pk=import_id)
+    try:
+        with default_storage.open(path, 'rb') as upload:
+            result = process_student_import(
+                upload,
+                import_record,
+                import_record.skip_errors,
+                import_record.create_login,
+                import_record.update_existing,
+                progress=context.progress,
+            )
+    finally:
+        default_storage.delete(path)
+    if not result['success']:
+        raise RuntimeError(result['error'])
+    return result
+
+
+def _save_workbook(context, name, wb):
+    """Save a write-only workbook through a temporary file rather than in memory."""
+    with tempfile.TemporaryFile() as spool:
+        wb.save(spool)
+        spool.seek(0)
+        context.save_artifact(name, spool)
+
+
+@task('dashboard.schema_excel')
+def schema_excel(context):
+    """Database schema as an Excel file with one sheet per table."""
+    from openpyxl import Workbook
+
+    tables = sorted(get_schema()['tables'].items())
+    wb = Workbook(write_only=True)
+    for position, (table, info) in enumerate(tables):
+        context.progress(position, len(tables))
+        ws = wb.create_sheet(title=str(table)[:31])  # Excel sheet name limit
+        ws.append(["column", "type", "not_null", "default", "max_length"])
+        for col in info['columns']:
+            ws.append([col['name'], col['type'], not col['nullable'], col['default'], col['max_length']])
+    _save_workbook(context, 'database_schema.xlsx', wb)
+    return {'tables': len(tables)}
+
+
+@task('dashboard.schema_excel_single')
+def schema_excel_single(context):
+    """Database schema as a single-sheet Excel file consolidating all tables."""
+    from openpyxl import Workbook
+
+    tables = sorted(get_schema()['tables'].items())
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title='schema')
+    ws.append(["table", "column", "type", "not_null", "default", "max_length"])
+    for position, (table, info) in enumerate(tables):
+        context.progress(position, len(tables))
+        for col in info['columns']:
+            ws.append([table, col['name'], col['type'], not col['nullable'], col['default'], col['max_length']])
+    _save_workbook(context, 'database_schema_single.xlsx', wb)
+    return {'tables': len(tables)}
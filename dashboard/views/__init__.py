@@ -0,0 +1,7 @@
+"""
+Dashboard views, one module per area.
+
+The URLconf refers to the views through ``dashboard.lazy.views``, so an area
+module (and what it imports) is only loaded when one of its pages is first
+requested, not when a worker starts.
+"""
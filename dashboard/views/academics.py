@@ -0,0 +1,523 @@
+"""Academics dashboard pages: courses, syllabi, timetables, calendar, departments and programs."""
+from django.shortcuts import render, get_object_or_404
+from django.contrib.auth.decorators import login_required, user_passes_test
+from departments.models import Department
+from academics.models import AcademicProgram
+from django.utils import timezone
+from academics.models import Course, Syllabus, Timetable, CourseEnrollment, AcademicCalendar, CourseSection
+from .common import is_admin
+
+
+# ============================================================================
+# ACADEMICS DASHBOARD VIEWS
+# ============================================================================
+
+@login_required
+@user_passes_test(is_admin)
+def academics_dashboard(request):
+    """Main academics dashboard with statistics"""
+    context = {
+        'total_courses': Course.objects.count(),
+        'active_courses': Course.objects.filter(status='ACTIVE').count(),
+        'total_syllabi': Syllabus.objects.count(),
+        'approved_syllabi': Syllabus.objects.filter(status='APPROVED').count(),
+        'total_timetables': Timetable.objects.filter(is_active=True).count(),
+        'total_enrollments': CourseEnrollment.objects.count(),
+        'active_enrollments': CourseEnrollment.objects.filter(status='ENROLLED').count(),
+        'total_calendar_events': AcademicCalendar.objects.count(),
+        'upcoming_events': AcademicCalendar.objects.filter(start_date__gte=timezone.now().date()).count(),
+        'recent_courses': Course.objects.order_by('-created_at')[:5],
+        'recent_syllabi': Syllabus.objects.order_by('-created_at')[:5],
+        'recent_enrollments': CourseEnrollment.objects.order_by('-created_at')[:5],
+        'recent_events': AcademicCalendar.objects.order_by('-created_at')[:5],
+    }
+    return render(request, 'dashboard/academics/dashboard.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def academics_courses_list(request):
+    """Courses management page"""
+    courses = Course.objects.all().order_by('code')
+    
+    # Filtering
+    level_filter = request.GET.get('level')
+    status_filter = request.GET.get('status')
+    
+    if level_filter:
+        courses = courses.filter(level=level_filter)
+    if status_filter:
+        courses = courses.filter(status=status_filter)
+    
+    # Statistics
+    context = {
+        'courses': courses,
+        'total_courses': Course.objects.count(),
+        'active_courses': Course.objects.filter(status='ACTIVE').count(),
+        'level_choices': Course.COURSE_LEVELS,
+        'status_choices': Course.COURSE_STATUS,
+        'current_filters': {
+            'level': level_filter,
+            'status': status_filter,
+        }
+    }
+    return render(request, 'dashboard/academics/courses.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def academics_course_detail(request, course_id):
+    """Course detail page"""
+    course = get_object_or_404(Course, id=course_id)
+    
+    # Get related data
+    syllabus = getattr(course, 'syllabus', None)
+    timetables = course.timetables.filter(is_active=True).order_by('day_of_week', 'start_time')
+    enrollments = course.enrollments.all().order_by('-academic_year', '-semester')
+    
+    context = {
+        'course': course,
+        'syllabus': syllabus,
+        'timetables': timetables,
+        'enrollments': enrollments,
+        'enrollment_count': enrollments.count(),
+        'active_enrollments': enrollments.filter(status='ENROLLED').count(),
+    }
+    return render(request, 'dashboard/academics/course_detail.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def academics_syllabi_list(request):
+    """Syllabi management page"""
+    syllabi = Syllabus.objects.all().order_by('-academic_year', '-semester', 'course__code')
+    
+    # Filtering
+    status_filter = request.GET.get('status')
+    academic_year_filter = request.GET.get('academic_year')
+    
+    if status_filter:
+        syllabi = syllabi.filter(status=status_filter)
+    if academic_year_filter:
+        syllabi = syllabi.filter(academic_year=academic_year_filter)
+    
+    context = {
+        'syllabi': syllabi,
+        'total_syllabi': Syllabus.objects.count(),
+        'approved_syllabi': Syllabus.objects.filter(status='APPROVED').count(),
+        'status_choices': Syllabus.SYLLABUS_STATUS,
+        'academic_years': Syllabus.objects.values_list('academic_year', flat=True).distinct().order_by('-academic_year'),
+        'current_filters': {
+            'status': status_filter,
+            'academic_year': academic_year_filter,
+        }
+    }
+    return render(request, 'dashboard/academics/syllabi.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def academics_syllabus_detail(request, syllabus_id):
+    """Syllabus detail page"""
+    syllabus = get_object_or_404(Syllabus, id=syllabus_id)
+    topics = syllabus.topics.all().order_by('week_number', 'order')
+    
+    context = {
+        'syllabus': syllabus,
+        'topics': topics,
+        'topics_count': topics.count(),
+        'total_hours': sum(topic.duration_hours for topic in topics),
+    }
+    return render(request, 'dashboard/academics/syllabus_detail.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def academics_timetables_list(request):
+    """Timetables management page"""
+    timetables = Timetable.objects.all().order_by('academic_year', 'semester', 'day_of_week', 'start_time')
+    
+    # Filtering
+    academic_year_filter = request.GET.get('academic_year')
+    semester_filter = request.GET.get('semester')
+    day_filter = request.GET.get('day')
+    
+    if academic_year_filter:
+        timetables = timetables.filter(academic_year=academic_year_filter)
+    if semester_filter:
+        timetables = timetables.filter(semester=semester_filter)
+    if day_filter:
+        timetables = timetables.filter(day_of_week=day_filter)
+    
+    context = {
+        'timetables': timetables,
+        'total_timetables': Timetable.objects.count(),
+        'active_timetables': Timetable.objects.filter(is_active=True).count(),
+        'academic_years': Timetable.objects.values_list('academic_year', flat=True).distinct().order_by('-academic_year'),
+        'semesters': Timetable.objects.values_list('semester', flat=True).distinct().order_by('semester'),
+        'days_of_week': Timetable.DAYS_OF_WEEK,
+        'current_filters': {
+            'academic_year': academic_year_filter,
+            'semester': semester_filter,
+            'day': day_filter,
+        }
+    }
+    return render(request, 'dashboard/academics/timetables.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def academics_timetable_detail(request, timetable_id):
+    """Timetable detail page"""
+    timetable = get_object_or_404(Timetable, id=timetable_id)
+    
+    # Check for conflicts
+    conflicts = Timetable.objects.filter(
+        academic_year=timetable.academic_year,
+        semester=timetable.semester,
+        day_of_week=timetable.day_of_week,
+        room=timetable.room,
+        is_active=True
+    ).exclude(id=timetable.id)
+    
+    context = {
+        'timetable': timetable,
+        'conflicts': conflicts,
+        'has_conflicts': conflicts.exists(),
+        'duration_minutes': timetable.get_duration_minutes(),
+    }
+    return render(request, 'dashboard/academics/timetable_detail.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def academics_enrollments_list(request):
+    """Enrollments management page"""
+    enrollments = CourseEnrollment.objects.all().order_by('-academic_year', '-semester', 'course__code')
+    
+    # Filtering
+    status_filter = request.GET.get('status')
+    academic_year_filter = request.GET.get('academic_year')
+    semester_filter = request.GET.get('semester')
+    
+    if status_filter:
+        enrollments = enrollments.filter(status=status_filter)
+    if academic_year_filter:
+        enrollments = enrollments.filter(academic_year=academic_year_filter)
+    if semester_filter:
+        enrollments = enrollments.filter(semester=semester_filter)
+    
+    context = {
+        'enrollments': enrollments,
+        'total_enrollments': CourseEnrollment.objects.count(),
+        'active_enrollments': CourseEnrollment.objects.filter(status='ENROLLED').count(),
+        'status_choices': CourseEnrollment.ENROLLMENT_STATUS,
+        'academic_years': CourseEnrollment.objects.values_list('academic_year', flat=True).distinct().order_by('-academic_year'),
+        'semesters': CourseEnrollment.objects.values_list('semester', flat=True).distinct().order_by('semester'),
+        'current_filters': {
+            'status': status_filter,
+            'academic_year': academic_year_filter,
+            'semester': semester_filter,
+        }
+    }
+    return render(request, 'dashboard/academics/enrollments.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def academics_enrollment_detail(request, enrollment_id):
+    """Enrollment detail page"""
+    enrollment = get_object_or_404(CourseEnrollment, id=enrollment_id)
+    
+    context = {
+        'enrollment': enrollment,
+        'student': enrollment.student,
+        'course': enrollment.course,
+    }
+    return render(request, 'dashboard/academics/enrollment_detail.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def academics_calendar_list(request):
+    """Academic calendar management page"""
+    events = AcademicCalendar.objects.all().order_by('start_date')
+    
+    # Filtering
+    event_type_filter = request.GET.get('event_type')
+    academic_year_filter = request.GET.get('academic_year')
+    month_filter = request.GET.get('month')
+    
+    if event_type_filter:
+        events = events.filter(event_type=event_type_filter)
+    if academic_year_filter:
+        events = events.filter(academic_year=academic_year_filter)
+    if month_filter:
+        events = events.filter(start_date__month=month_filter)
+    
+    context = {
+        'events': events,
+        'total_events': AcademicCalendar.objects.count(),
+        'upcoming_events': AcademicCalendar.objects.filter(start_date__gte=timezone.now().date()).count(),
+        'event_type_choices': AcademicCalendar.EVENT_TYPE,
+        'academic_years': AcademicCalendar.objects.values_list('academic_year', flat=True).distinct().order_by('-academic_year'),
+        'months': [
+            (1, 'January'), (2, 'February'), (3, 'March'), (4, 'April'),
+            (5, 'May'), (6, 'June'), (7, 'July'), (8, 'August'),
+            (9, 'September'), (10, 'October'), (11, 'November'), (12, 'December')
+        ],
+        'current_filters': {
+            'event_type': event_type_filter,
+            'academic_year': academic_year_filter,
+            'month': month_filter,
+        }
+    }
+    return render(request, 'dashboard/academics/calendar.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def academics_calendar_detail(request, event_id):
+    """Academic calendar event detail page"""
+    event = get_object_or_404(AcademicCalendar, id=event_id)
+    
+    context = {
+        'event': event,
+        'duration_days': (event.end_date - event.start_date).days + 1,
+    }
+    return render(request, 'dashboard/academics/calendar_detail.html', context)
+
+# ============================================================================
+# ACADEMICS API ENDPOINTS DASHBOARD VIEWS
+# ============================================================================
+
+@login_required
+@user_passes_test(is_admin)
+def academics_api_endpoints(request):
+    """Academics API endpoints overview and testing page"""
+    context = {
+        'api_base_url': '/api/v1/academics/',
+        'endpoints': [
+            {
+                'name': 'Courses API',
+                'url': '/api/v1/academics/courses/',
+                'methods': ['GET', 'POST', 'PUT', 'PATCH', 'DELETE'],
+                'description': 'Manage academic courses',
+                'example_request': {
+                    'method': 'POST',
+                    'url': '/api/v1/academics/courses/',
+                    'data': {
+                        'code': 'CS101',
+                        'title': 'Introduction to Computer Science',
+                        'description': 'Basic concepts of computer science',
+                        'credits': 3,
+                        'level': 'UNDERGRADUATE',
+                        'status': 'ACTIVE'
+                    }
+                }
+            },
+            {
+                'name': 'Syllabi API',
+                'url': '/api/v1/academics/syllabi/',
+                'methods': ['GET', 'POST', 'PUT', 'PATCH', 'DELETE'],
+                'description': 'Manage course syllabi and topics',
+                'example_request': {
+                    'method': 'POST',
+                    'url': '/api/v1/academics/syllabi/',
+                    'data': {
+                        'course': 1,
+                        'academic_year': '2024-2025',
+                        'semester': 'FALL',
+                        'learning_objectives': 'Understand basic programming concepts',
+                        'status': 'DRAFT'
+                    }
+                }
+            },
+            {
+                'name': 'Syllabus Topics API',
+                'url': '/api/v1/academics/syllabus-topics/',
+                'methods': ['GET', 'POST', 'PUT', 'PATCH', 'DELETE'],
+                'description': 'Manage individual syllabus topics',
+                'example_request': {
+                    'method': 'POST',
+                    'url': '/api/v1/academics/syllabus-topics/',
+                    'data': {
+                        'syllabus': 1,
+                        'title': 'Variables and Data Types',
+                        'description': 'Introduction to variables and basic data types',
+                        'week_number': 1,
+                        'hours_allocated': 2
+                    }
+                }
+            },
+            {
+                'name': 'Timetables API',
+                'url': '/api/v1/academics/timetables/',
+                'methods': ['GET', 'POST', 'PUT', 'PATCH', 'DELETE'],
+                'description': 'Manage class timetables and schedules',
+                'example_request': {
+                    'method': 'POST',
+                    'url': '/api/v1/academics/timetables/',
+                    'data': {
+                        'course': 1,
+                        'academic_year': '2024-2025',
+                        'semester': 'FALL',
+                        'day_of_week': 'MONDAY',
+                        'start_time': '09:00:00',
+                        'end_time': '10:30:00',
+                        'room': 'Room 101',
+                        'faculty': 1
+                    }
+                }
+            },
+            {
+                'name': 'Enrollments API',
+                'url': '/api/v1/academics/enrollments/',
+                'methods': ['GET', 'POST', 'PUT', 'PATCH', 'DELETE'],
+                'description': 'Manage student course enrollments',
+                'example_request': {
+                    'method': 'POST',
+                    'url': '/api/v1/academics/enrollments/',
+                    'data': {
+                        'student': 1,
+                        'course': 1,
+                        'academic_year': '2024-2025',
+                        'semester': 'FALL',
+                        'enrollment_date': '2024-08-15',
+                        'status': 'ENROLLED'
+                    }
+                }
+            },
+            {
+                'name': 'Academic Calendar API',
+                'url': '/api/v1/academics/academic-calendar/',
+                'methods': ['GET', 'POST', 'PUT', 'PATCH', 'DELETE'],
+                'description': 'Manage academic calendar events',
+                'example_request': {
+                    'method': 'POST',
+                    'url': '/api/v1/academics/academic-calendar/',
+                    'data': {
+                        'title': 'Fall Semester Begins',
+                        'event_type': 'ACADEMIC',
+                        'start_date': '2024-08-26',
+                        'end_date': '2024-08-26',
+                        'academic_year': '2024-2025',
+                        'description': 'First day of Fall semester classes'
+                    }
+                }
+            }
+        ],
+        'authentication': {
+            'type': 'JWT Token',
+            'header': 'Authorization: Bearer <your_token>',
+            'token_endpoint': '/api/auth/token/',
+            'refresh_endpoint': '/api/auth/token/refresh/'
+        },
+        'pagination': {
+            'default_page_size': 10,
+            'max_page_size': 100,
+            'example': '?page=1&page_size=20'
+        },
+        'filtering': {
+            'search': '?search=computer',
+            'ordering': '?ordering=title',
+            'filtering': '?status=ACTIVE&level=UNDERGRADUATE'
+        }
+    }
+    return render(request, 'dashboard/academics/api_endpoints.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def academics_api_test(request):
+    """API testing interface for academics endpoints"""
+    context = {
+        'api_base_url': '/api/v1/academics/',
+        'test_endpoints': [
+            {
+                'name': 'Test Courses API',
+                'url': '/api/v1/academics/courses/',
+                'method': 'GET',
+                'description': 'Test retrieving all courses'
+            },
+            {
+                'name': 'Test Single Course',
+                'url': '/api/v1/academics/courses/1/',
+                'method': 'GET',
+                'description': 'Test retrieving a specific course'
+            },
+            {
+                'name': 'Test Syllabi API',
+                'url': '/api/v1/academics/syllabi/',
+                'method': 'GET',
+                'description': 'Test retrieving all syllabi'
+            },
+            {
+                'name': 'Test Timetables API',
+                'url': '/api/v1/academics/timetables/',
+                'method': 'GET',
+                'description': 'Test retrieving all timetables'
+            },
+            {
+                'name': 'Test Enrollments API',
+                'url': '/api/v1/academics/enrollments/',
+                'method': 'GET',
+                'description': 'Test retrieving all enrollments'
+            },
+            {
+                'name': 'Test Academic Calendar API',
+                'url': '/api/v1/academics/academic-calendar/',
+                'method': 'GET',
+                'description': 'Test retrieving all calendar events'
+            }
+        ]
+    }
+    return render(request, 'dashboard/academics/api_test.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def departments_list(request):
+    """List all departments"""
+    departments = Department.objects.all().order_by('code', 'name')
+    return render(request, 'dashboard/enrollment/departments.html', {'departments': departments})
+
+
+@login_required
+@user_passes_test(is_admin)
+def department_detail(request, department_id):
+    """Detail view for department"""
+    department = get_object_or_404(Department, pk=department_id)
+    return render(request, 'dashboard/enrollment/department_detail.html', {'department': department})
+
+
+@login_required
+@user_passes_test(is_admin)
+def academic_programs_list(request):
+    """List all academic programs"""
+    programs = AcademicProgram.objects.all().order_by('level', 'code', 'name')
+    return render(request, 'dashboard/enrollment/academic_programs.html', {'programs': programs})
+
+
+@login_required
+@user_passes_test(is_admin)
+def academic_program_detail(request, program_id):
+    """Detail view for academic program"""
+    program = get_object_or_404(AcademicProgram, pk=program_id)
+    return render(request, 'dashboard/enrollment/academic_program_detail.html', {'program': program})
+
+
+@login_required
+@user_passes_test(is_admin)
+def course_sections_list(request):
+    """List all course sections"""
+    sections = CourseSection.objects.all().order_by('course__code', 'section_number', 'academic_year', 'semester')
+    return render(request, 'dashboard/enrollment/course_sections.html', {'sections': sections})
+
+
+@login_required
+@user_passes_test(is_admin)
+def course_section_detail(request, section_id):
+    """Detail view for course section"""
+    section = get_object_or_404(CourseSection, pk=section_id)
+    return render(request, 'dashboard/enrollment/course_section_detail.html', {'section': section})
@@ -0,0 +1,387 @@
+"""API testing workspace pages."""
+from django.shortcuts import render, get_object_or_404
+from django.contrib.auth.decorators import login_required, user_passes_test
+from django.http import JsonResponse
+try:
+    from ..models import APICollection, APIEnvironment, APIRequest, APITest, APITestResult, APITestSuite, APITestSuiteResult, APIAutomation
+except Exception:  # Models were removed; provide dummies for view compatibility
+    APICollection = APIEnvironment = APIRequest = APITest = APITestResult = APITestSuite = APITestSuiteResult = APIAutomation = None
+from .common import is_admin
+
+
+# API Testing Dashboard Views
+@login_required
+@user_passes_test(is_admin)
+def api_testing_dashboard(request):
+    """Main API testing dashboard"""
+    context = {
+        'total_collections': APICollection.objects.filter(created_by=request.user).count(),
+        'total_requests': APIRequest.objects.filter(collection__created_by=request.user).count(),
+        'total_tests': APITest.objects.filter(request__collection__created_by=request.user).count(),
+        'total_environments': APIEnvironment.objects.filter(created_by=request.user).count(),
+        'recent_results': APITestResult.objects.filter(
+            test__request__collection__created_by=request.user
+        ).order_by('-executed_at')[:10],
+        'recent_suite_results': APITestSuiteResult.objects.filter(
+            suite__collection__created_by=request.user
+        ).order_by('-started_at')[:5],
+        'active_automations': APIAutomation.objects.filter(
+            test_suite__collection__created_by=request.user,
+            is_active=True
+        ).count(),
+    }
+    return render(request, 'dashboard/api_testing/dashboard.html', context)
+
+@login_required
+@user_passes_test(is_admin)
+def api_collections_list(request):
+    """API Collections management page"""
+    if request.method == 'POST':
+        # Handle collection creation
+        try:
+            collection = APICollection.objects.create(
+                name=request.POST.get('name'),
+                description=request.POST.get('description', ''),
+                base_url=request.POST.get('base_url', ''),
+                is_public=request.POST.get('is_public') == 'on',
+                created_by=request.user
+            )
+            return JsonResponse({
+                'success': True,
+                'message': 'Collection created successfully',
+                'collection_id': str(collection.id)
+            })
+        except Exception as e:
+            return JsonResponse({
+                'success': False,
+                'message': str(e)
+            }, status=400)
+    
+    collections = APICollection.objects.filter(created_by=request.user).order_by('-created_at')
+    return render(request, 'dashboard/api_testing/collections.html', {'collections': collections})
+
+@login_required
+@user_passes_test(is_admin)
+def api_collection_detail_view(request, collection_id):
+    """Get collection details for AJAX requests"""
+    try:
+        collection = APICollection.objects.get(id=collection_id, created_by=request.user)
+        return JsonResponse({
+            'id': str(collection.id),
+            'name': collection.name,
+            'description': collection.description,
+            'base_url': collection.base_url,
+            'is_public': collection.is_public,
+            'created_at': collection.created_at.isoformat(),
+            'updated_at': collection.updated_at.isoformat()
+        })
+    except APICollection.DoesNotExist:
+        return JsonResponse({'error': 'Collection not found'}, status=404)
+
+@login_required
+@user_passes_test(is_admin)
+def api_collection_update_view(request, collection_id):
+    """Update collection for AJAX requests"""
+    try:
+        collection = APICollection.objects.get(id=collection_id, created_by=request.user)
+        if request.method == 'PUT':
+            # Parse PUT data
+            import json
+            data = json.loads(request.body.decode('utf-8'))
+            
+            collection.name = data.get('name', collection.name)
+            collection.description = data.get('description', collection.description)
+            collection.base_url = data.get('base_url', collection.base_url)
+            collection.is_public = data.get('is_public', collection.is_public)
+            collection.save()
+            
+            return JsonResponse({
+                'success': True,
+                'message': 'Collection updated successfully'
+            })
+    except APICollection.DoesNotExist:
+        return JsonResponse({'error': 'Collection not found'}, status=404)
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+@login_required
+@user_passes_test(is_admin)
+def api_collection_duplicate_view(request, collection_id):
+    """Duplicate collection for AJAX requests"""
+    try:
+        collection = APICollection.objects.get(id=collection_id, created_by=request.user)
+        
+        # Create new collection
+        new_collection = APICollection.objects.create(
+            name=f"{collection.name} (Copy)",
+            description=collection.description,
+            base_url=collection.base_url,
+            is_public=collection.is_public,
+            created_by=request.user
+        )
+        
+        return JsonResponse({
+            'success': True,
+            'message': 'Collection duplicated successfully',
+            'new_collection_id': str(new_collection.id)
+        })
+    except APICollection.DoesNotExist:
+        return JsonResponse({'error': 'Collection not found'}, status=404)
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+@login_required
+@user_passes_test(is_admin)
+def api_collection_delete_view(request, collection_id):
+    """Delete collection for AJAX requests"""
+    try:
+        collection = APICollection.objects.get(id=collection_id, created_by=request.user)
+        collection.delete()
+        return JsonResponse({
+            'success': True,
+            'message': 'Collection deleted successfully'
+        })
+    except APICollection.DoesNotExist:
+        return JsonResponse({'error': 'Collection not found'}, status=404)
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+@login_required
+@user_passes_test(is_admin)
+def api_collection_detail(request, collection_id):
+    """API Collection detail page"""
+    collection = get_object_or_404(APICollection, id=collection_id, created_by=request.user)
+    return render(request, 'dashboard/api_testing/collection_detail.html', {'collection': collection})
+
+@login_required
+@user_passes_test(is_admin)
+def api_environments_list(request):
+    """API Environments management page"""
+    if request.method == 'POST':
+        # Handle environment creation
+        try:
+            import json
+            variables = json.loads(request.POST.get('variables', '{}'))
+            
+            # If setting as default, unset other defaults
+            if request.POST.get('is_default') == 'on':
+                APIEnvironment.objects.filter(created_by=request.user, is_default=True).update(is_default=False)
+            
+            environment = APIEnvironment.objects.create(
+                name=request.POST.get('name'),
+                description=request.POST.get('description', ''),
+                variables=variables,
+                is_default=request.POST.get('is_default') == 'on',
+                created_by=request.user
+            )
+            return JsonResponse({
+                'success': True,
+                'message': 'Environment created successfully',
+                'environment_id': str(environment.id)
+            })
+        except Exception as e:
+            return JsonResponse({
+                'success': False,
+                'message': str(e)
+            }, status=400)
+    
+    environments = APIEnvironment.objects.filter(created_by=request.user).order_by('-created_at')
+    return render(request, 'dashboard/api_testing/environments.html', {'environments': environments})
+
+@login_required
+@user_passes_test(is_admin)
+def api_environment_detail_view(request, environment_id):
+    """Get environment details for AJAX requests"""
+    try:
+        environment = APIEnvironment.objects.get(id=environment_id, created_by=request.user)
+        return JsonResponse({
+            'id': str(environment.id),
+            'name': environment.name,
+            'description': environment.description,
+            'variables': environment.variables,
+            'is_default': environment.is_default,
+            'created_at': environment.created_at.isoformat(),
+            'updated_at': environment.updated_at.isoformat()
+        })
+    except APIEnvironment.DoesNotExist:
+        return JsonResponse({'error': 'Environment not found'}, status=404)
+
+@login_required
+@user_passes_test(is_admin)
+def api_environment_update_view(request, environment_id):
+    """Update environment for AJAX requests"""
+    try:
+        environment = APIEnvironment.objects.get(id=environment_id, created_by=request.user)
+        if request.method == 'PUT':
+            # Parse PUT data
+            import json
+            data = json.loads(request.body.decode('utf-8'))
+            
+            environment.name = data.get('name', environment.name)
+            environment.description = data.get('description', environment.description)
+            environment.variables = data.get('variables', environment.variables)
+            environment.is_default = data.get('is_default', environment.is_default)
+            
+            # If setting as default, unset other defaults
+            if environment.is_default:
+                APIEnvironment.objects.filter(created_by=request.user, is_default=True).exclude(id=environment.id).update(is_default=False)
+            
+            environment.save()
+            
+            return JsonResponse({
+                'success': True,
+                'message': 'Environment updated successfully'
+            })
+    except APIEnvironment.DoesNotExist:
+        return JsonResponse({'error': 'Environment not found'}, status=404)
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+@login_required
+@user_passes_test(is_admin)
+def api_environment_duplicate_view(request, environment_id):
+    """Duplicate environment for AJAX requests"""
+    try:
+        environment = APIEnvironment.objects.get(id=environment_id, created_by=request.user)
+        
+        # Create new environment
+        new_environment = APIEnvironment.objects.create(
+            name=f"{environment.name} (Copy)",
+            description=environment.description,
+            variables=environment.variables,
+            is_default=False,  # Don't duplicate default status
+            created_by=request.user
+        )
+        
+        return JsonResponse({
+            'success': True,
+            'message': 'Environment duplicated successfully',
+            'new_environment_id': str(new_environment.id)
+        })
+    except APIEnvironment.DoesNotExist:
+        return JsonResponse({'error': 'Environment not found'}, status=404)
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+@login_required
+@user_passes_test(is_admin)
+def api_environment_set_default_view(request, environment_id):
+    """Set environment as default for AJAX requests"""
+    try:
+        environment = APIEnvironment.objects.get(id=environment_id, created_by=request.user)
+        
+        # Unset other defaults
+        APIEnvironment.objects.filter(created_by=request.user, is_default=True).update(is_default=False)
+        
+        # Set this environment as default
+        environment.is_default = True
+        environment.save()
+        
+        return JsonResponse({
+            'success': True,
+            'message': 'Environment set as default successfully'
+        })
+    except APIEnvironment.DoesNotExist:
+        return JsonResponse({'error': 'Environment not found'}, status=404)
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+@login_required
+@user_passes_test(is_admin)
+def api_environment_delete_view(request, environment_id):
+    """Delete environment for AJAX requests"""
+    try:
+        environment = APIEnvironment.objects.get(id=environment_id, created_by=request.user)
+        environment.delete()
+        return JsonResponse({
+            'success': True,
+            'message': 'Environment deleted successfully'
+        })
+    except APIEnvironment.DoesNotExist:
+        return JsonResponse({'error': 'Environment not found'}, status=404)
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+@login_required
+@user_passes_test(is_admin)
+def api_requests_list(request):
+    """API Requests management page"""
+    requests = APIRequest.objects.filter(collection__created_by=request.user).order_by('collection__name', 'order')
+    return render(request, 'dashboard/api_testing/requests.html', {'requests': requests})
+
+@login_required
+@user_passes_test(is_admin)
+def api_request_detail(request, request_id):
+    """API Request detail page"""
+    api_request = get_object_or_404(APIRequest, id=request_id, collection__created_by=request.user)
+    return render(request, 'dashboard/api_testing/request_detail.html', {'api_request': api_request})
+
+@login_required
+@user_passes_test(is_admin)
+def api_tests_list(request):
+    """API Tests management page"""
+    tests = APITest.objects.filter(request__collection__created_by=request.user).order_by('request__collection__name', 'request__order', 'name')
+    return render(request, 'dashboard/api_testing/tests.html', {'tests': tests})
+
+@login_required
+@user_passes_test(is_admin)
+def api_test_detail(request, test_id):
+    """API Test detail page"""
+    test = get_object_or_404(APITest, id=test_id, request__collection__created_by=request.user)
+    return render(request, 'dashboard/api_testing/test_detail.html', {'test': test})
+
+@login_required
+@user_passes_test(is_admin)
+def api_test_results_list(request):
+    """API Test Results page"""
+    results = APITestResult.objects.filter(
+        test__request__collection__created_by=request.user
+    ).order_by('-executed_at')
+    return render(request, 'dashboard/api_testing/test_results.html', {'results': results})
+
+@login_required
+@user_passes_test(is_admin)
+def api_test_suites_list(request):
+    """API Test Suites management page"""
+    suites = APITestSuite.objects.filter(collection__created_by=request.user).order_by('-created_at')
+    return render(request, 'dashboard/api_testing/test_suites.html', {'suites': suites})
+
+@login_required
+@user_passes_test(is_admin)
+def api_test_suite_detail(request, suite_id):
+    """API Test Suite detail page"""
+    suite = get_object_or_404(APITestSuite, id=suite_id, collection__created_by=request.user)
+    return render(request, 'dashboard/api_testing/test_suite_detail.html', {'suite': suite})
+
+@login_required
+@user_passes_test(is_admin)
+def api_automations_list(request):
+    """API Automations management page"""
+    automations = APIAutomation.objects.filter(test_suite__collection__created_by=request.user).order_by('-created_at')
+    return render(request, 'dashboard/api_testing/automations.html', {'automations': automations})
+
+@login_required
+@user_passes_test(is_admin)
+def api_automation_detail(request, automation_id):
+    """API Automation detail page"""
+    automation = get_object_or_404(APIAutomation, id=automation_id, test_suite__collection__created_by=request.user)
+    return render(request, 'dashboard/api_testing/automation_detail.html', {'automation': automation})
+
+@login_required
+@user_passes_test(is_admin)
+def api_testing_workspace(request):
+    """Interactive API testing workspace"""
+    collections = APICollection.objects.filter(created_by=request.user).order_by('name')
+    environments = APIEnvironment.objects.filter(created_by=request.user).order_by('name')
+    return render(request, 'dashboard/api_testing/workspace.html', {
+        'collections': collections,
+        'environments': environments
+    })
+
+@user_passes_test(is_admin)
+def simple_api_workspace(request):
+    """Simple API testing workspace - Postman-like interface"""
+    collections = APICollection.objects.filter(created_by=request.user).order_by('name')
+    return render(request, 'dashboard/api_testing/simple_workspace.html', {
+        'collections': collections
+    })
@@ -0,0 +1,991 @@
+"""Assignments dashboard pages and their AJAX handlers."""
+from django.shortcuts import render, get_object_or_404, redirect
+from django.contrib.auth.decorators import login_required
+from django.contrib import messages
+from django.apps import apps
+from django.http import JsonResponse
+from students.models import Student
+from django.utils import timezone
+from django.db.models import Avg
+from django.db.models import Q
+from assignments.models import (
+    Assignment,
+    AssignmentSubmission,
+    AssignmentFile,
+    AssignmentGrade,
+    AssignmentComment,
+    AssignmentCategory,
+    AssignmentTemplate,
+)
+
+
+# ==================== ASSIGNMENTS DASHBOARD VIEWS ====================
+
+@login_required
+def assignments_dashboard(request):
+    """Main assignments dashboard"""
+    user = request.user
+    
+    # Get assignments based on user role
+    if hasattr(user, 'faculty_profile'):
+        # Faculty dashboard
+        faculty = user.faculty_profile
+        assignments = Assignment.objects.filter(faculty=faculty).order_by('-created_at')
+        
+        stats = {
+            'total_assignments': assignments.count(),
+            'published_assignments': assignments.filter(status='PUBLISHED').count(),
+            'draft_assignments': assignments.filter(status='DRAFT').count(),
+            'overdue_assignments': assignments.filter(
+                status='PUBLISHED',
+                due_date__lt=timezone.now()
+            ).count(),
+            'total_submissions': AssignmentSubmission.objects.filter(
+                assignment__faculty=faculty
+            ).count(),
+            'graded_submissions': AssignmentSubmission.objects.filter(
+                assignment__faculty=faculty,
+                grade__isnull=False
+            ).count(),
+            'pending_grades': AssignmentSubmission.objects.filter(
+                assignment__faculty=faculty,
+                grade__isnull=True
+            ).count(),
+        }
+        
+        recent_assignments = assignments[:5]
+        recent_submissions = AssignmentSubmission.objects.filter(
+            assignment__faculty=faculty
+        ).order_by('-submission_date')[:5]
+        
+    elif hasattr(user, 'student_profile'):
+        # Student dashboard
+        student = user.student_profile
+        assignments = Assignment.objects.filter(
+            Q(assigned_to_students=student) | 
+            Q(assigned_to_grades__students=student)
+        ).distinct().order_by('-created_at')
+        
+        stats = {
+            'total_assignments': assignments.count(),
+            'submitted_assignments': AssignmentSubmission.objects.filter(student=student).count(),
+            'pending_assignments': assignments.exclude(
+                submissions__student=student
+            ).count(),
+            'late_submissions': AssignmentSubmission.objects.filter(
+                student=student, is_late=True
+            ).count(),
+        }
+        
+        recent_assignments = assignments[:5]
+        my_submissions = AssignmentSubmission.objects.filter(
+            student=student
+        ).order_by('-submission_date')[:5]
+        
+    else:
+        # Admin dashboard
+        assignments = Assignment.objects.all().order_by('-created_at')
+        
+        stats = {
+            'total_assignments': assignments.count(),
+            'published_assignments': assignments.filter(status='PUBLISHED').count(),
+            'draft_assignments': assignments.filter(status='DRAFT').count(),
+            'overdue_assignments': assignments.filter(
+                status='PUBLISHED',
+                due_date__lt=timezone.now()
+            ).count(),
+            'total_submissions': AssignmentSubmission.objects.count(),
+            'graded_submissions': AssignmentSubmission.objects.filter(
+                grade__isnull=False
+            ).count(),
+            'pending_grades': AssignmentSubmission.objects.filter(
+                grade__isnull=True
+            ).count(),
+        }
+        
+        recent_assignments = assignments[:5]
+        recent_submissions = AssignmentSubmission.objects.all().order_by('-submission_date')[:5]
+    
+    context = {
+        'stats': stats,
+        'recent_assignments': recent_assignments,
+        'categories': AssignmentCategory.objects.filter(is_active=True),
+        'user_role': 'faculty' if hasattr(user, 'faculty_profile') else 'student' if hasattr(user, 'student_profile') else 'admin',
+    }
+    
+    if hasattr(user, 'faculty_profile'):
+        context['recent_submissions'] = recent_submissions
+    elif hasattr(user, 'student_profile'):
+        context['my_submissions'] = my_submissions
+    
+    return render(request, 'dashboard/assignments/dashboard.html', context)
+
+
+@login_required
+def assignments_list(request):
+    """List all assignments with filtering"""
+    user = request.user
+    
+    # Get assignments based on user role
+    if hasattr(user, 'faculty_profile'):
+        assignments = Assignment.objects.filter(faculty=user.faculty_profile)
+    elif hasattr(user, 'student_profile'):
+        student = user.student_profile
+        assignments = Assignment.objects.filter(
+            Q(assigned_to_students=student) | 
+            Q(assigned_to_grades__students=student)
+        ).distinct()
+    else:
+        assignments = Assignment.objects.all()
+    
+    # Apply filters
+    search = request.GET.get('search', '')
+    status_filter = request.GET.get('status', '')
+    category_filter = request.GET.get('category', '')
+    is_overdue = request.GET.get('overdue', '')
+    
+    if search:
+        assignments = assignments.filter(
+            Q(title__icontains=search) | 
+            Q(description__icontains=search)
+        )
+    
+    if status_filter:
+        assignments = assignments.filter(status=status_filter)
+    
+    if category_filter:
+        assignments = assignments.filter(category_id=category_filter)
+    
+    if is_overdue == 'true':
+        assignments = assignments.filter(
+            status='PUBLISHED',
+            due_date__lt=timezone.now()
+        )
+    
+    assignments = assignments.order_by('-created_at')
+    
+    context = {
+        'assignments': assignments,
+        'categories': AssignmentCategory.objects.filter(is_active=True),
+        'status_choices': Assignment.STATUS_CHOICES,
+        'filters': {
+            'search': search,
+            'status': status_filter,
+            'category': category_filter,
+            'overdue': is_overdue,
+        }
+    }
+    
+    return render(request, 'dashboard/assignments/list.html', context)
+
+
+@login_required
+def assignment_detail(request, assignment_id):
+    """Assignment detail view"""
+    assignment = get_object_or_404(Assignment, id=assignment_id)
+    user = request.user
+    
+    # Check permissions
+    if hasattr(user, 'student_profile'):
+        student = user.student_profile
+        if not (assignment.assigned_to_students.filter(id=student.id).exists() or 
+                assignment.assigned_to_grades.filter(students=student).exists()):
+            messages.error(request, 'You do not have permission to view this assignment.')
+            return redirect('dashboard:assignments_list')
+    elif hasattr(user, 'faculty_profile'):
+        if assignment.faculty != user.faculty_profile:
+            messages.error(request, 'You do not have permission to view this assignment.')
+            return redirect('dashboard:assignments_list')
+    
+    # Get submissions if user is faculty or admin
+    submissions = None
+    if hasattr(user, 'faculty_profile') or user.is_staff:
+        submissions = AssignmentSubmission.objects.filter(
+            assignment=assignment
+        ).order_by('-submission_date')
+    
+    # Get user's submission if student
+    my_submission = None
+    if hasattr(user, 'student_profile'):
+        my_submission = AssignmentSubmission.objects.filter(
+            assignment=assignment,
+            student=user.student_profile
+        ).first()
+    
+    # Get comments
+    comments = AssignmentComment.objects.filter(
+        assignment=assignment,
+        parent_comment__isnull=True
+    ).order_by('created_at')
+    
+    context = {
+        'assignment': assignment,
+        'submissions': submissions,
+        'my_submission': my_submission,
+        'comments': comments,
+        'can_edit': hasattr(user, 'faculty_profile') and assignment.faculty == user.faculty_profile,
+        'can_submit': hasattr(user, 'student_profile') and not my_submission,
+        'can_grade': hasattr(user, 'faculty_profile') and assignment.faculty == user.faculty_profile,
+    }
+    
+    return render(request, 'dashboard/assignments/detail.html', context)
+
+
+@login_required
+def assignment_create(request):
+    """Create new assignment"""
+    if not hasattr(request.user, 'faculty_profile'):
+        messages.error(request, 'Only faculty can create assignments.')
+        return redirect('dashboard:assignments_list')
+    
+    if request.method == 'POST':
+        # Handle form submission
+        title = request.POST.get('title', '').strip()
+        description = request.POST.get('description', '').strip()
+        instructions = request.POST.get('instructions', '').strip()
+        max_marks = request.POST.get('max_marks', '')
+        due_date = request.POST.get('due_date', '')
+        category_id = request.POST.get('category', '')
+        is_group_assignment = request.POST.get('is_group_assignment') == 'on'
+        max_group_size = request.POST.get('max_group_size', '1')
+        late_submission_allowed = request.POST.get('late_submission_allowed') == 'on'
+        
+        # Validation
+        if not title or not description or not max_marks or not due_date:
+            messages.error(request, 'Please fill in all required fields.')
+        else:
+            try:
+                assignment = Assignment.objects.create(
+                    title=title,
+                    description=description,
+                    instructions=instructions,
+                    max_marks=float(max_marks),
+                    due_date=timezone.datetime.fromisoformat(due_date.replace('Z', '+00:00')),
+                    category_id=category_id if category_id else None,
+                    faculty=request.user.faculty_profile,
+                    is_group_assignment=is_group_assignment,
+                    max_group_size=int(max_group_size) if max_group_size else 1,
+                    late_submission_allowed=late_submission_allowed,
+                    status='DRAFT'
+                )
+                
+                # Handle assigned programs, departments, course sections, and students
+                assigned_programs = request.POST.getlist('assigned_programs')
+                assigned_departments = request.POST.getlist('assigned_departments')
+                assigned_course_sections = request.POST.getlist('assigned_course_sections')
+                assigned_students = request.POST.getlist('assigned_students')
+                
+                if assigned_programs:
+                    assignment.assigned_to_programs.set(assigned_programs)
+                if assigned_departments:
+                    assignment.assigned_to_departments.set(assigned_departments)
+                if assigned_course_sections:
+                    assignment.assigned_to_course_sections.set(assigned_course_sections)
+                if assigned_students:
+                    assignment.assigned_to_students.set(assigned_students)
+                
+                messages.success(request, 'Assignment created successfully.')
+                return redirect('dashboard:assignment_detail', assignment_id=assignment.id)
+                
+            except Exception as e:
+                messages.error(request, f'Error creating assignment: {str(e)}')
+    
+    context = {
+        'categories': AssignmentCategory.objects.filter(is_active=True),
+        'programs': apps.get_model('academics', 'AcademicProgram').objects.filter(is_active=True) if apps.is_installed('academics') else [],
+        'departments': apps.get_model('academics', 'Department').objects.filter(is_active=True) if apps.is_installed('academics') else [],
+        'course_sections': apps.get_model('academics', 'CourseSection').objects.filter(is_active=True) if apps.is_installed('academics') else [],
+        'students': Student.objects.all()[:100],  # Limit for performance
+    }
+    
+    return render(request, 'dashboard/assignments/create.html', context)
+
+
+@login_required
+def assignment_edit(request, assignment_id):
+    """Edit assignment"""
+    assignment = get_object_or_404(Assignment, id=assignment_id)
+    
+    if not hasattr(request.user, 'faculty_profile') or assignment.faculty != request.user.faculty_profile:
+        messages.error(request, 'You do not have permission to edit this assignment.')
+        return redirect('dashboard:assignments_list')
+    
+    if request.method == 'POST':
+        # Handle form submission
+        assignment.title = request.POST.get('title', '').strip()
+        assignment.description = request.POST.get('description', '').strip()
+        assignment.instructions = request.POST.get('instructions', '').strip()
+        assignment.max_marks = float(request.POST.get('max_marks', '0'))
+        assignment.due_date = timezone.datetime.fromisoformat(
+            request.POST.get('due_date', '').replace('Z', '+00:00')
+        )
+        assignment.category_id = request.POST.get('category') or None
+        assignment.is_group_assignment = request.POST.get('is_group_assignment') == 'on'
+        assignment.max_group_size = int(request.POST.get('max_group_size', '1'))
+        assignment.late_submission_allowed = request.POST.get('late_submission_allowed') == 'on'
+        
+        # Handle assigned programs, departments, course sections, and students
+        assigned_programs = request.POST.getlist('assigned_programs')
+        assigned_departments = request.POST.getlist('assigned_departments')
+        assigned_course_sections = request.POST.getlist('assigned_course_sections')
+        assigned_students = request.POST.getlist('assigned_students')
+        
+        assignment.save()
+        
+        if assigned_programs:
+            assignment.assigned_to_programs.set(assigned_programs)
+        if assigned_departments:
+            assignment.assigned_to_departments.set(assigned_departments)
+        if assigned_course_sections:
+            assignment.assigned_to_course_sections.set(assigned_course_sections)
+        if assigned_students:
+            assignment.assigned_to_students.set(assigned_students)
+        
+        messages.success(request, 'Assignment updated successfully.')
+        return redirect('dashboard:assignment_detail', assignment_id=assignment.id)
+    
+    context = {
+        'assignment': assignment,
+        'categories': AssignmentCategory.objects.filter(is_active=True),
+        'programs': apps.get_model('academics', 'AcademicProgram').objects.filter(is_active=True) if apps.is_installed('academics') else [],
+        'departments': apps.get_model('academics', 'Department').objects.filter(is_active=True) if apps.is_installed('academics') else [],
+        'course_sections': apps.get_model('academics', 'CourseSection').objects.filter(is_active=True) if apps.is_installed('academics') else [],
+        'students': Student.objects.all()[:100],
+    }
+    
+    return render(request, 'dashboard/assignments/edit.html', context)
+
+
+@login_required
+def assignment_submit(request, assignment_id):
+    """Submit assignment"""
+    assignment = get_object_or_404(Assignment, id=assignment_id)
+    
+    if not hasattr(request.user, 'student_profile'):
+        messages.error(request, 'Only students can submit assignments.')
+        return redirect('dashboard:assignments_list')
+    
+    student = request.user.student_profile
+    
+    # Check if assignment is assigned to student
+    if not (assignment.assigned_to_students.filter(id=student.id).exists() or 
+            assignment.assigned_to_grades.filter(students=student).exists()):
+        messages.error(request, 'This assignment is not assigned to you.')
+        return redirect('dashboard:assignments_list')
+    
+    # Check if already submitted
+    existing_submission = AssignmentSubmission.objects.filter(
+        assignment=assignment,
+        student=student
+    ).first()
+    
+    if existing_submission:
+        messages.error(request, 'You have already submitted this assignment.')
+        return redirect('dashboard:assignment_detail', assignment_id=assignment.id)
+    
+    if request.method == 'POST':
+        content = request.POST.get('content', '').strip()
+        notes = request.POST.get('notes', '').strip()
+        
+        if not content:
+            messages.error(request, 'Please provide your submission content.')
+        else:
+            try:
+                submission = AssignmentSubmission.objects.create(
+                    assignment=assignment,
+                    student=student,
+                    content=content,
+                    notes=notes,
+                    status='SUBMITTED'
+                )
+                
+                messages.success(request, 'Assignment submitted successfully.')
+                return redirect('dashboard:assignment_detail', assignment_id=assignment.id)
+                
+            except Exception as e:
+                messages.error(request, f'Error submitting assignment: {str(e)}')
+    
+    return render(request, 'dashboard/assignments/submit.html', {'assignment': assignment})
+
+
+@login_required
+def assignment_grade(request, submission_id):
+    """Grade assignment submission"""
+    submission = get_object_or_404(AssignmentSubmission, id=submission_id)
+    
+    if not hasattr(request.user, 'faculty_profile') or submission.assignment.faculty != request.user.faculty_profile:
+        messages.error(request, 'You do not have permission to grade this submission.')
+        return redirect('dashboard:assignments_list')
+    
+    if request.method == 'POST':
+        marks_obtained = request.POST.get('marks_obtained', '')
+        grade_letter = request.POST.get('grade_letter', '')
+        feedback = request.POST.get('feedback', '').strip()
+        
+        if not marks_obtained:
+            messages.error(request, 'Please provide marks obtained.')
+        else:
+            try:
+                # Create or update grade
+                grade, created = AssignmentGrade.objects.get_or_create(
+                    submission=submission,
+                    defaults={
+                        'marks_obtained': float(marks_obtained),
+                        'grade_letter': grade_letter if grade_letter else None,
+                        'feedback': feedback,
+                        'graded_by': request.user
+                    }
+                )
+                
+                if not created:
+                    grade.marks_obtained = float(marks_obtained)
+                    grade.grade_letter = grade_letter if grade_letter else None
+                    grade.feedback = feedback
+                    grade.graded_by = request.user
+                    grade.save()
+                
+                # Update submission
+                submission.grade = grade
+                submission.graded_by = request.user
+                submission.graded_at = timezone.now()
+                submission.feedback = feedback
+                submission.save()
+                
+                messages.success(request, 'Assignment graded successfully.')
+                return redirect('dashboard:assignment_detail', assignment_id=submission.assignment.id)
+                
+            except Exception as e:
+                messages.error(request, f'Error grading assignment: {str(e)}')
+    
+    context = {
+        'submission': submission,
+        'grade_choices': AssignmentGrade.GRADE_LETTER_CHOICES,
+    }
+    
+    return render(request, 'dashboard/assignments/grade.html', context)
+
+
+@login_required
+def assignment_categories(request):
+    """Manage assignment categories"""
+    if not request.user.is_staff:
+        messages.error(request, 'Only administrators can manage categories.')
+        return redirect('dashboard:assignments_dashboard')
+    
+    categories = AssignmentCategory.objects.all().order_by('name')
+    
+    if request.method == 'POST':
+        action = request.POST.get('action')
+        
+        if action == 'create':
+            name = request.POST.get('name', '').strip()
+            description = request.POST.get('description', '').strip()
+            color_code = request.POST.get('color_code', '#007bff')
+            
+            if name:
+                try:
+                    AssignmentCategory.objects.create(
+                        name=name,
+                        description=description,
+                        color_code=color_code
+                    )
+                    messages.success(request, 'Category created successfully.')
+                except Exception as e:
+                    messages.error(request, f'Error creating category: {str(e)}')
+            else:
+                messages.error(request, 'Category name is required.')
+        
+        elif action == 'update':
+            category_id = request.POST.get('category_id')
+            category = get_object_or_404(AssignmentCategory, id=category_id)
+            
+            category.name = request.POST.get('name', '').strip()
+            category.description = request.POST.get('description', '').strip()
+            category.color_code = request.POST.get('color_code', '#007bff')
+            category.is_active = request.POST.get('is_active') == 'on'
+            
+            try:
+                category.save()
+                messages.success(request, 'Category updated successfully.')
+            except Exception as e:
+                messages.error(request, f'Error updating category: {str(e)}')
+        
+        elif action == 'delete':
+            category_id = request.POST.get('category_id')
+            category = get_object_or_404(AssignmentCategory, id=category_id)
+            
+            try:
+                category.delete()
+                messages.success(request, 'Category deleted successfully.')
+            except Exception as e:
+                messages.error(request, f'Error deleting category: {str(e)}')
+        
+        return redirect('dashboard:assignment_categories')
+    
+    return render(request, 'dashboard/assignments/categories.html', {'categories': categories})
+
+
+@login_required
+def assignment_templates(request):
+    """Manage assignment templates"""
+    if not hasattr(request.user, 'faculty_profile') and not request.user.is_staff:
+        messages.error(request, 'Only faculty can manage templates.')
+        return redirect('dashboard:assignments_dashboard')
+    
+    # Get templates accessible to user
+    if request.user.is_staff:
+        templates = AssignmentTemplate.objects.all()
+    else:
+        templates = AssignmentTemplate.objects.filter(
+            Q(is_public=True) | Q(created_by=request.user)
+        )
+    
+    templates = templates.order_by('-created_at')
+    
+    if request.method == 'POST':
+        action = request.POST.get('action')
+        
+        if action == 'create':
+            name = request.POST.get('name', '').strip()
+            description = request.POST.get('description', '').strip()
+            instructions = request.POST.get('instructions', '').strip()
+            max_marks = request.POST.get('max_marks', '')
+            category_id = request.POST.get('category', '')
+            is_group_assignment = request.POST.get('is_group_assignment') == 'on'
+            max_group_size = request.POST.get('max_group_size', '1')
+            is_public = request.POST.get('is_public') == 'on'
+            
+            if name and max_marks:
+                try:
+                    AssignmentTemplate.objects.create(
+                        name=name,
+                        description=description,
+                        instructions=instructions,
+                        max_marks=float(max_marks),
+                        category_id=category_id if category_id else None,
+                        is_group_assignment=is_group_assignment,
+                        max_group_size=int(max_group_size) if max_group_size else 1,
+                        is_public=is_public,
+                        created_by=request.user
+                    )
+                    messages.success(request, 'Template created successfully.')
+                except Exception as e:
+                    messages.error(request, f'Error creating template: {str(e)}')
+            else:
+                messages.error(request, 'Template name and max marks are required.')
+        
+        return redirect('dashboard:assignment_templates')
+    
+    context = {
+        'templates': templates,
+        'categories': AssignmentCategory.objects.filter(is_active=True),
+    }
+    
+    return render(request, 'dashboard/assignments/templates.html', context)
+
+
+@login_required
+def assignment_statistics(request):
+    """Assignment statistics and analytics"""
+    user = request.user
+    
+    if hasattr(user, 'faculty_profile'):
+        # Faculty statistics
+        faculty = user.faculty_profile
+        assignments = Assignment.objects.filter(faculty=faculty)
+        submissions = AssignmentSubmission.objects.filter(assignment__faculty=faculty)
+        
+        stats = {
+            'total_assignments': assignments.count(),
+            'published_assignments': assignments.filter(status='PUBLISHED').count(),
+            'draft_assignments': assignments.filter(status='DRAFT').count(),
+            'overdue_assignments': assignments.filter(
+                status='PUBLISHED',
+                due_date__lt=timezone.now()
+            ).count(),
+            'total_submissions': submissions.count(),
+            'graded_submissions': submissions.filter(grade__isnull=False).count(),
+            'pending_grades': submissions.filter(grade__isnull=True).count(),
+            'average_grade': submissions.filter(grade__isnull=False).aggregate(
+                avg=Avg('grade__marks_obtained')
+            )['avg'] or 0,
+        }
+        
+    elif hasattr(user, 'student_profile'):
+        # Student statistics
+        student = user.student_profile
+        submissions = AssignmentSubmission.objects.filter(student=student)
+        
+        stats = {
+            'total_assignments': Assignment.objects.filter(
+                Q(assigned_to_students=student) | 
+                Q(assigned_to_grades__students=student)
+            ).distinct().count(),
+            'submitted_assignments': submissions.count(),
+            'pending_assignments': Assignment.objects.filter(
+                Q(assigned_to_students=student) | 
+                Q(assigned_to_grades__students=student)
+            ).exclude(submissions__student=student).distinct().count(),
+            'late_submissions': submissions.filter(is_late=True).count(),
+            'average_grade': submissions.filter(grade__isnull=False).aggregate(
+                avg=Avg('grade__marks_obtained')
+            )['avg'] or 0,
+        }
+        
+    else:
+        # Admin statistics
+        stats = {
+            'total_assignments': Assignment.objects.count(),
+            'published_assignments': Assignment.objects.filter(status='PUBLISHED').count(),
+            'draft_assignments': Assignment.objects.filter(status='DRAFT').count(),
+            'overdue_assignments': Assignment.objects.filter(
+                status='PUBLISHED',
+                due_date__lt=timezone.now()
+            ).count(),
+            'total_submissions': AssignmentSubmission.objects.count(),
+            'graded_submissions': AssignmentSubmission.objects.filter(grade__isnull=False).count(),
+            'pending_grades': AssignmentSubmission.objects.filter(grade__isnull=True).count(),
+            'average_grade': AssignmentSubmission.objects.filter(grade__isnull=False).aggregate(
+                avg=Avg('grade__marks_obtained')
+            )['avg'] or 0,
+        }
+    
+    return render(request, 'dashboard/assignments/statistics.html', {'stats': stats})
+
+
+# ==================== AJAX AND FILE UPLOAD HANDLERS ====================
+
+@login_required
+def assignment_file_upload(request):
+    """Handle file uploads for assignments"""
+    if request.method == 'POST':
+        try:
+            assignment_id = request.POST.get('assignment_id')
+            file = request.FILES.get('file')
+            description = request.POST.get('description', '')
+            
+            if not assignment_id or not file:
+                return JsonResponse({'success': False, 'error': 'Missing required fields'})
+            
+            assignment = get_object_or_404(Assignment, id=assignment_id)
+            
+            # Check permissions
+            if hasattr(request.user, 'faculty_profile') and assignment.faculty != request.user.faculty_profile:
+                return JsonResponse({'success': False, 'error': 'Permission denied'})
+            
+            # Create file record
+            assignment_file = AssignmentFile.objects.create(
+                assignment=assignment,
+                file_name=file.name,
+                file_path=file,
+                file_type='ASSIGNMENT',
+                uploaded_by=request.user,
+                description=description
+            )
+            
+            return JsonResponse({
+                'success': True,
+                'file_id': str(assignment_file.id),
+                'file_name': assignment_file.file_name,
+                'file_url': assignment_file.file_path.url,
+                'file_size': assignment_file.file_size
+            })
+            
+        except Exception as e:
+            return JsonResponse({'success': False, 'error': str(e)})
+    
+    return JsonResponse({'success': False, 'error': 'Invalid request method'})
+
+
+@login_required
+def assignment_publish_ajax(request, assignment_id):
+    """AJAX endpoint to publish an assignment"""
+    if request.method == 'POST':
+        try:
+            assignment = get_object_or_404(Assignment, id=assignment_id)
+            
+            if not hasattr(request.user, 'faculty_profile') or assignment.faculty != request.user.faculty_profile:
+                return JsonResponse({'success': False, 'error': 'Permission denied'})
+            
+            if assignment.status != 'DRAFT':
+                return JsonResponse({'success': False, 'error': 'Only draft assignments can be published'})
+            
+            assignment.status = 'PUBLISHED'
+            assignment.save()
+            
+            return JsonResponse({'success': True, 'message': 'Assignment published successfully'})
+            
+        except Exception as e:
+            return JsonResponse({'success': False, 'error': str(e)})
+    
+    return JsonResponse({'success': False, 'error': 'Invalid request method'})
+
+
+@login_required
+def assignment_close_ajax(request, assignment_id):
+    """AJAX endpoint to close an assignment"""
+    if request.method == 'POST':
+        try:
+            assignment = get_object_or_404(Assignment, id=assignment_id)
+            
+            if not hasattr(request.user, 'faculty_profile') or assignment.faculty != request.user.faculty_profile:
+                return JsonResponse({'success': False, 'error': 'Permission denied'})
+            
+            if assignment.status not in ['PUBLISHED', 'DRAFT']:
+                return JsonResponse({'success': False, 'error': 'Only published or draft assignments can be closed'})
+            
+            assignment.status = 'CLOSED'
+            assignment.save()
+            
+            return JsonResponse({'success': True, 'message': 'Assignment closed successfully'})
+            
+        except Exception as e:
+            return JsonResponse({'success': False, 'error': str(e)})
+    
+    return JsonResponse({'success': False, 'error': 'Invalid request method'})
+
+
+@login_required
+def assignment_comment_ajax(request, assignment_id):
+    """AJAX endpoint to add comments to assignments"""
+    if request.method == 'POST':
+        try:
+            assignment = get_object_or_404(Assignment, id=assignment_id)
+            content = request.POST.get('content', '').strip()
+            comment_type = request.POST.get('comment_type', 'GENERAL')
+            
+            if not content:
+                return JsonResponse({'success': False, 'error': 'Comment content is required'})
+            
+            comment = AssignmentComment.objects.create(
+                assignment=assignment,
+                author=request.user,
+                content=content,
+                comment_type=comment_type
+            )
+            
+            return JsonResponse({
+                'success': True,
+                'comment_id': str(comment.id),
+                'author': request.user.email,
+                'content': comment.content,
+                'comment_type': comment.get_comment_type_display(),
+                'created_at': comment.created_at.strftime('%M %d, %Y %H:%i')
+            })
+            
+        except Exception as e:
+            return JsonResponse({'success': False, 'error': str(e)})
+    
+    return JsonResponse({'success': False, 'error': 'Invalid request method'})
+
+
+@login_required
+def assignment_stats_ajax(request):
+    """AJAX endpoint to get assignment statistics"""
+    try:
+        user = request.user
+        
+        if hasattr(user, 'faculty_profile'):
+            faculty = user.faculty_profile
+            assignments = Assignment.objects.filter(faculty=faculty)
+            submissions = AssignmentSubmission.objects.filter(assignment__faculty=faculty)
+            
+            stats = {
+                'total_assignments': assignments.count(),
+                'published_assignments': assignments.filter(status='PUBLISHED').count(),
+                'draft_assignments': assignments.filter(status='DRAFT').count(),
+                'overdue_assignments': assignments.filter(
+                    status='PUBLISHED',
+                    due_date__lt=timezone.now()
+                ).count(),
+                'total_submissions': submissions.count(),
+                'graded_submissions': submissions.filter(grade__isnull=False).count(),
+                'pending_grades': submissions.filter(grade__isnull=True).count(),
+                'average_grade': submissions.filter(grade__isnull=False).aggregate(
+                    avg=Avg('grade__marks_obtained')
+                )['avg'] or 0,
+            }
+            
+        elif hasattr(user, 'student_profile'):
+            student = user.student_profile
+            submissions = AssignmentSubmission.objects.filter(student=student)
+            
+            stats = {
+                'total_assignments': Assignment.objects.filter(
+                    Q(assigned_to_students=student) | 
+                    Q(assigned_to_grades__students=student)
+                ).distinct().count(),
+                'submitted_assignments': submissions.count(),
+                'pending_assignments': Assignment.objects.filter(
+                    Q(assigned_to_students=student) | 
+                    Q(assigned_to_grades__students=student)
+                ).exclude(submissions__student=student).distinct().count(),
+                'late_submissions': submissions.filter(is_late=True).count(),
+                'average_grade': submissions.filter(grade__isnull=False).aggregate(
+                    avg=Avg('grade__marks_obtained')
+                )['avg'] or 0,
+            }
+            
+        else:
+            stats = {
+                'total_assignments': Assignment.objects.count(),
+                'published_assignments': Assignment.objects.filter(status='PUBLISHED').count(),
+                'draft_assignments': Assignment.objects.filter(status='DRAFT').count(),
+                'overdue_assignments': Assignment.objects.filter(
+                    status='PUBLISHED',
+                    due_date__lt=timezone.now()
+                ).count(),
+                'total_submissions': AssignmentSubmission.objects.count(),
+                'graded_submissions': AssignmentSubmission.objects.filter(grade__isnull=False).count(),
+                'pending_grades': AssignmentSubmission.objects.filter(grade__isnull=True).count(),
+                'average_grade': AssignmentSubmission.objects.filter(grade__isnull=False).aggregate(
+                    avg=Avg('grade__marks_obtained')
+                )['avg'] or 0,
+            }
+        
+        return JsonResponse({'success': True, 'stats': stats})
+        
+    except Exception as e:
+        return JsonResponse({'success': False, 'error': str(e)})
+
+
+@login_required
+def assignment_autocomplete(request):
+    """AJAX endpoint for assignment autocomplete"""
+    query = request.GET.get('q', '').strip()
+    
+    if not query or len(query) < 2:
+        return JsonResponse({'results': []})
+    
+    user = request.user
+    
+    if hasattr(user, 'faculty_profile'):
+        assignments = Assignment.objects.filter(
+            faculty=user.faculty_profile,
+            title__icontains=query
+        )[:10]
+    elif hasattr(user, 'student_profile'):
+        student = user.student_profile
+        assignments = Assignment.objects.filter(
+            Q(assigned_to_students=student) | 
+            Q(assigned_to_grades__students=student),
+            title__icontains=query
+        ).distinct()[:10]
+    else:
+        assignments = Assignment.objects.filter(title__icontains=query)[:10]
+    
+    results = []
+    for assignment in assignments:
+        results.append({
+            'id': str(assignment.id),
+            'title': assignment.title,
+            'faculty': assignment.faculty.name,
+            'due_date': assignment.due_date.strftime('%M %d, %Y'),
+            'status': assignment.get_status_display()
+        })
+    
+    return JsonResponse({'results': results})
+
+
+@login_required
+def assignment_bulk_action(request):
+    """AJAX endpoint for bulk actions on assignments"""
+    if request.method == 'POST':
+        try:
+            action = request.POST.get('action')
+            assignment_ids = request.POST.get('assignment_ids', '').split(',')
+            
+            if not action or not assignment_ids:
+                return JsonResponse({'success': False, 'error': 'Missing required parameters'})
+            
+            user = request.user
+            
+            if not hasattr(user, 'faculty_profile'):
+                return JsonResponse({'success': False, 'error': 'Permission denied'})
+            
+            assignments = Assignment.objects.filter(
+                id__in=assignment_ids,
+                faculty=user.faculty_profile
+            )
+            
+            if action == 'publish':
+                assignments.filter(status='DRAFT').update(status='PUBLISHED')
+                message = f'{assignments.filter(status="PUBLISHED").count()} assignments published'
+            elif action == 'close':
+                assignments.filter(status__in=['PUBLISHED', 'DRAFT']).update(status='CLOSED')
+                message = f'{assignments.filter(status="CLOSED").count()} assignments closed'
+            elif action == 'delete':
+                count = assignments.count()
+                assignments.delete()
+                message = f'{count} assignments deleted'
+            else:
+                return JsonResponse({'success': False, 'error': 'Invalid action'})
+            
+            return JsonResponse({'success': True, 'message': message})
+            
+        except Exception as e:
+            return JsonResponse({'success': False, 'error': str(e)})
+    
+    return JsonResponse({'success': False, 'error': 'Invalid request method'})
+
+
+@login_required
+def filter_students_ajax(request):
+    """AJAX endpoint to filter students based on department, year, and section"""
+    if request.method == 'GET':
+        department_id = request.GET.get('department_id')
+        academic_year = request.GET.get('academic_year')
+        semester = request.GET.get('semester')
+        course_section_id = request.GET.get('course_section_id')
+        
+        try:
+            # Start with all students
+            students = Student.objects.all()
+            
+            # Filter by department (through course enrollments)
+            if department_id:
+                from academics.models import CourseEnrollment
+                student_ids = CourseEnrollment.objects.filter(
+                    course_section__course__department_id=department_id,
+                    status='ENROLLED'
+                ).values_list('student_id', flat=True)
+                students = students.filter(id__in=student_ids)
+            
+            # Filter by academic year
+            if academic_year:
+                students = students.filter(academic_year=academic_year)
+            
+            # Filter by course section
+            if course_section_id:
+                from academics.models import CourseEnrollment
+                student_ids = CourseEnrollment.objects.filter(
+                    course_section_id=course_section_id,
+                    status='ENROLLED'
+                ).values_list('student_id', flat=True)
+                students = students.filter(id__in=student_ids)
+            
+            # Limit results for performance
+            students = students[:100]
+            
+            # Format response
+            student_data = []
+            for student in students:
+                student_data.append({
+                    'id': str(student.id),
+                    'name': f"{student.first_name} {student.last_name}",
+                    'roll_number': student.roll_number,
+                    'academic_year': student.academic_year or '',
+                    'section': student.section or '',
+                    'grade_level': student.grade_level
+                })
+            
+            return JsonResponse({
+                'success': True,
+                'students': student_data,
+                'count': len(student_data)
+            })
+            
+        except Exception as e:
+            return JsonResponse({'success': False, 'message': str(e)})
+    
+    return JsonResponse({'success': False, 'message': 'Invalid request method'})
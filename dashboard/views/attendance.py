@@ -0,0 +1,117 @@
+"""Attendance dashboard pages."""
+from django.shortcuts import render, get_object_or_404, redirect
+from django.contrib.auth.decorators import login_required, user_passes_test
+from django.contrib import messages
+from django.http import JsonResponse
+from academics.models import CourseSection
+from attendance.models import AttendanceSession, AttendanceRecord
+from campshub360.jobs import submit
+from .common import is_admin
+
+
+# ============================================================================
+# ATTENDANCE DASHBOARD VIEWS
+# ============================================================================
+
+@login_required
+@user_passes_test(is_admin)
+def attendance_sessions(request):
+    """List attendance sessions with filters and quick actions."""
+    sessions = AttendanceSession.objects.select_related('course_section').order_by('-date', 'start_time')
+
+    # Filters
+    section_id = request.GET.get('section_id')
+    date_from = request.GET.get('date_from')
+    date_to = request.GET.get('date_to')
+    is_cancelled = request.GET.get('is_cancelled')
+
+    if section_id:
+        sessions = sessions.filter(course_section_id=section_id)
+    if date_from:
+        sessions = sessions.filter(date__gte=date_from)
+    if date_to:
+        sessions = sessions.filter(date__lte=date_to)
+    if is_cancelled in ['true', 'false']:
+        sessions = sessions.filter(is_cancelled=(is_cancelled == 'true'))
+
+    context = {
+        'sessions': sessions[:200],
+        'sections': CourseSection.objects.all().order_by('course__code', 'section_number'),
+    }
+    return render(request, 'dashboard/attendance/sessions.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def attendance_session_detail(request, session_id):
+    """Show a single session and all attendance records."""
+    session = get_object_or_404(AttendanceSession.objects.select_related('course_section'), pk=session_id)
+    records = AttendanceRecord.objects.filter(session=session).select_related('student').order_by('student__roll_number')
+    context = {
+        'session': session,
+        'records': records,
+        'status_choices': AttendanceRecord.STATUS_CHOICES,
+    }
+    return render(request, 'dashboard/attendance/session_detail.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def attendance_mark(request, session_id):
+    """Handle marking attendance for a session (AJAX or form POST)."""
+    session = get_object_or_404(AttendanceSession, pk=session_id)
+    if request.method == 'POST':
+        try:
+            student_id = request.POST.get('student_id')
+            status_value = request.POST.get('status')
+            remarks = request.POST.get('remarks', '')
+
+            if status_value not in dict(AttendanceRecord.STATUS_CHOICES):
+                return JsonResponse({'success': False, 'error': 'Invalid status'}, status=400)
+
+            record, _ = AttendanceRecord.objects.get_or_create(session=session, student_id=student_id)
+            record.status = status_value
+            record.remarks = remarks
+            record.save()
+            return JsonResponse({'success': True})
+        except Exception as e:
+            return JsonResponse({'success': False, 'error': str(e)}, status=400)
+
+    # GET fallthrough
+    return attendance_session_detail(request, session_id)
+
+
+@login_required
+@user_passes_test(is_admin)
+def attendance_generate_sessions(request):
+    """Form to queue session generation for a date range from active timetables."""
+    error = None
+    if request.method == 'POST':
+        try:
+            start = request.POST.get('start')
+            end = request.POST.get('end')
+            section_id = request.POST.get('section_id') or None
+
+            from datetime import date
+            start_date = date.fromisoformat(start)
+            end_date = date.fromisoformat(end)
+            if end_date < start_date:
+                raise ValueError('End date must be after start date')
+
+            # Generation runs on a background worker; follow it on the job page
+            job = submit(
+                'attendance.generate_sessions',
+                {'start': start, 'end': end, 'section_id': int(section_id) if section_id else None},
+                user=request.user,
+                label=f'Attendance sessions {start} to {end}',
+            )
+            messages.success(request, 'Attendance session generation started.')
+            return redirect('dashboard:job_detail', job_id=job.pk)
+        except Exception as exc:
+            error = str(exc)
+
+    context = {
+        'sections': CourseSection.objects.all().order_by('course__code', 'section_number'),
+        'error': error,
+    }
+    return render(request, 'dashboard/attendance/generate.html', context)
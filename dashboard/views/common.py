@@ -0,0 +1,10 @@
+"""Helpers shared by the dashboard view modules."""
+from rest_framework.authentication import SessionAuthentication
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+# API views called from dashboard pages accept the page's session as well as a JWT
+DASHBOARD_API_AUTHENTICATION = [SessionAuthentication, JWTAuthentication]
+
+
+def is_admin(user):
+    return user.is_authenticated and user.is_staff
@@ -0,0 +1,234 @@
+"""Dashboard home, user administration pages, login and dashboard statistics."""
+from django.shortcuts import render, redirect
+from django.contrib.auth.decorators import login_required, user_passes_test
+from django.contrib.auth import logout
+from django.contrib import messages
+from django.apps import apps
+from rest_framework.decorators import api_view, authentication_classes, permission_classes
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from accounts.models import User, Role, UserSession, AuditLog
+from students.models import Student
+from faculty.models import Faculty
+from ..counters import get_counters, table_counts
+from ..introspection import get_schema
+from django.contrib.auth.views import LoginView
+from django.views.decorators.csrf import ensure_csrf_cookie, csrf_protect
+from .common import DASHBOARD_API_AUTHENTICATION, is_admin
+
+
+@login_required
+@user_passes_test(is_admin)
+def dashboard_home(request):
+    """Main dashboard view with statistics"""
+    try:
+        # All counters come from one cached statement
+        counters = get_counters()
+        context = {
+            'total_users': counters['total_users'],
+            'total_students': counters['total_students'],
+            'total_faculty': counters['total_faculty'],
+            'total_roles': counters['total_roles'],
+            'total_permissions': counters['total_permissions'],
+            'active_sessions': counters['active_sessions'],
+            'recent_users': User.objects.order_by('-date_joined')[:10],
+            'active_students': counters['active_students'],
+            'active_faculty': counters['active_faculty'],
+            'total_custom_fields': counters['total_custom_fields'],
+            'total_faculty_custom_fields': counters['total_faculty_custom_fields'],
+        }
+        
+        # Try to add more statistics if possible
+        try:
+            context.update({
+                'recent_students': Student.objects.order_by('-created_at')[:5],
+                'recent_faculty': Faculty.objects.order_by('-created_at')[:5],
+            })
+        except Exception as e:
+            import logging
+            logger = logging.getLogger(__name__)
+            logger.warning(f"Some dashboard statistics could not be loaded: {str(e)}")
+        
+        return render(request, 'dashboard/home.html', context)
+        
+    except Exception as e:
+        # If there's an error, return a simple dashboard with basic info
+        import logging
+        logger = logging.getLogger(__name__)
+        logger.error(f"Error in dashboard_home: {str(e)}")
+        
+        context = {
+            'total_users': User.objects.count(),
+            'total_students': Student.objects.count(),
+            'total_faculty': Faculty.objects.count(),
+            'error_message': 'Some statistics could not be loaded. Please check the logs.',
+        }
+        return render(request, 'dashboard/home.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def facilities_dashboard(request):
+    """Facilities management dashboard - redirects to facilities app"""
+    return redirect('facilities_dashboard:dashboard')
+
+
+@login_required
+@user_passes_test(is_admin)
+def users_list(request):
+    """Users management page"""
+    users = User.objects.all().order_by('-date_joined')
+    return render(request, 'dashboard/users.html', {'users': users})
+
+
+@login_required
+@user_passes_test(is_admin)
+def roles_list(request):
+    """Roles management page"""
+    roles = Role.objects.all().order_by('name')
+    return render(request, 'dashboard/roles.html', {'roles': roles})
+
+
+@login_required
+@user_passes_test(is_admin)
+def sessions_list(request):
+    """Active sessions page"""
+    sessions = UserSession.objects.all().order_by('-created_at')
+    return render(request, 'dashboard/sessions.html', {'sessions': sessions})
+
+
+@login_required
+@user_passes_test(is_admin)
+def audit_logs(request):
+    """Audit logs page"""
+    logs = AuditLog.objects.all().order_by('-created_at')[:100]
+    return render(request, 'dashboard/audit_logs.html', {'logs': logs})
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def api_dashboard_stats(request):
+    """API endpoint for dashboard statistics; security counts are estimates on large tables"""
+    counters = get_counters()
+    stats = {
+        'users': {
+            'total': counters['total_users'],
+            'active': counters['active_users'],
+            'staff': counters['staff_users'],
+            'verified': counters['verified_users'],
+        },
+        'auth': {
+            'roles': counters['total_roles'],
+            'permissions': counters['total_permissions'],
+            'identifiers': counters['auth_identifiers'],
+            'active_sessions': counters['active_sessions'],
+        },
+        'security': {
+            'failed_logins': counters['failed_logins'],
+            'audit_logs': counters['audit_logs'],
+        }
+    }
+    return Response(stats)
+
+
+@api_view(['GET'])
+@authentication_classes(DASHBOARD_API_AUTHENTICATION)
+@permission_classes([IsAdminUser])
+def api_models_info(request):
+    """API endpoint to get information about all Django models"""
+    models_info = {}
+    counts = table_counts()
+    tables = get_schema()['tables']
+    
+    for model in apps.get_models():
+        app_label = model._meta.app_label
+        model_name = model._meta.model_name
+        
+        if app_label not in models_info:
+            models_info[app_label] = {}
+        
+        table = tables.get(model._meta.db_table, {})
+        columns = {column['name']: column for column in table.get('columns', [])}
+        fields_info = []
+        for field in model._meta.fields:
+            column = columns.get(field.column)
+            fields_info.append({
+                'name': field.name,
+                'type': field.__class__.__name__,
+                'db_type': column['type'] if column else None,
+                'null': field.null,
+                'blank': field.blank,
+                'unique': field.unique,
+            })
+        
+        models_info[app_label][model_name] = {
+            'table_name': model._meta.db_table,
+            'fields': fields_info,
+            'primary_key': table.get('primary_key', []),
+            'indexes': table.get('indexes', []),
+            'constraints': table.get('constraints', []),
+            'count': counts.get(model._meta.db_table, 0),
+        }
+    
+    return Response(models_info)
+
+
+def custom_logout(request):
+    """Custom logout view that handles both GET and POST requests"""
+    if request.user.is_authenticated:
+        logout(request)
+        messages.success(request, 'You have been successfully logged out.')
+    return redirect('dashboard:login')
+
+
+class CustomLoginView(LoginView):
+    """Custom login view that handles email-based authentication"""
+    template_name = 'dashboard/login.html'
+    redirect_authenticated_user = True
+    
+    def get_success_url(self):
+        return '/dashboard/'
+    
+    def form_valid(self, form):
+        """Override to add custom success message"""
+        from django.contrib import messages
+        messages.success(self.request, f'Welcome back, {form.get_user().email}!')
+        return super().form_valid(form)
+    
+    def form_invalid(self, form):
+        """Override to add custom error message"""
+        from django.contrib import messages
+        messages.error(self.request, 'Invalid email or password.')
+        return super().form_invalid(form)
+
+
+@ensure_csrf_cookie
+@csrf_protect
+def custom_login(request):
+    """Simple login view for testing"""
+    from django.contrib.auth import authenticate, login
+    from django.contrib import messages
+    from django.shortcuts import render, redirect
+    
+    if request.method == 'POST':
+        username = request.POST.get('username', '').strip()
+        password = request.POST.get('password', '')
+        
+        if username and password:
+            user = authenticate(request, username=username, password=password)
+            if user is not None:
+                if user.is_active:
+                    login(request, user)
+                    messages.success(request, f'Welcome back, {user.email}!')
+                    return redirect('dashboard:home')
+                else:
+                    messages.error(request, 'Your account is disabled.')
+            else:
+                messages.error(request, 'Invalid email or password.')
+        else:
+            messages.error(request, 'Please enter both email and password.')
+    
+    # For GET requests, show the login form
+    from django.contrib.auth.forms import AuthenticationForm
+    form = AuthenticationForm()
+    return render(request, 'dashboard/login.html', {'form': form})
@@ -0,0 +1,112 @@
+"""Enrollment dashboard pages."""
+from django.shortcuts import render, get_object_or_404
+from django.contrib.auth.decorators import login_required, user_passes_test
+from academics.models import CourseEnrollment
+from enrollment.models import (
+    EnrollmentRule,
+    CourseAssignment,
+    FacultyAssignment,
+    StudentEnrollmentPlan,
+    EnrollmentRequest,
+    WaitlistEntry,
+)
+from .common import is_admin
+
+
+@login_required
+@user_passes_test(is_admin)
+def enrollment_dashboard(request):
+    """Main enrollment management dashboard"""
+    context = {
+        'total_enrollment_rules': EnrollmentRule.objects.count(),
+        'total_course_assignments': CourseAssignment.objects.count(),
+        'total_faculty_assignments': FacultyAssignment.objects.count(),
+        'total_enrollment_plans': StudentEnrollmentPlan.objects.count(),
+        'total_enrollment_requests': EnrollmentRequest.objects.count(),
+        'total_waitlist_entries': WaitlistEntry.objects.filter(is_active=True).count(),
+        'pending_requests': EnrollmentRequest.objects.filter(status='PENDING').count(),
+        'active_enrollments': CourseEnrollment.objects.filter(status='ENROLLED').count(),
+        'recent_requests': EnrollmentRequest.objects.order_by('-request_date')[:5],
+        'recent_plans': StudentEnrollmentPlan.objects.order_by('-created_at')[:5],
+    }
+    return render(request, 'dashboard/enrollment/dashboard.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def enrollment_rules_list(request):
+    """List all enrollment rules"""
+    rules = EnrollmentRule.objects.all().order_by('-academic_year', '-semester', 'rule_type')
+    return render(request, 'dashboard/enrollment/rules.html', {'rules': rules})
+
+
+@login_required
+@user_passes_test(is_admin)
+def enrollment_rule_detail(request, rule_id):
+    """Detail view for enrollment rule"""
+    rule = get_object_or_404(EnrollmentRule, pk=rule_id)
+    return render(request, 'dashboard/enrollment/rule_detail.html', {'rule': rule})
+
+
+@login_required
+@user_passes_test(is_admin)
+def course_assignments_list(request):
+    """List all course assignments"""
+    assignments = CourseAssignment.objects.all().order_by('-academic_year', '-semester', 'course__code')
+    return render(request, 'dashboard/enrollment/course_assignments.html', {'assignments': assignments})
+
+
+@login_required
+@user_passes_test(is_admin)
+def course_assignment_detail(request, assignment_id):
+    """Detail view for course assignment"""
+    assignment = get_object_or_404(CourseAssignment, pk=assignment_id)
+    return render(request, 'dashboard/enrollment/course_assignment_detail.html', {'assignment': assignment})
+
+
+@login_required
+@user_passes_test(is_admin)
+def enrollment_plans_list(request):
+    """List all student enrollment plans"""
+    plans = StudentEnrollmentPlan.objects.all().order_by('-academic_year', '-semester', 'student__roll_number')
+    return render(request, 'dashboard/enrollment/enrollment_plans.html', {'plans': plans})
+
+
+@login_required
+@user_passes_test(is_admin)
+def enrollment_plan_detail(request, plan_id):
+    """Detail view for enrollment plan"""
+    plan = get_object_or_404(StudentEnrollmentPlan, pk=plan_id)
+    return render(request, 'dashboard/enrollment/enrollment_plan_detail.html', {'plan': plan})
+
+
+@login_required
+@user_passes_test(is_admin)
+def enrollment_requests_list(request):
+    """List all enrollment requests"""
+    requests = EnrollmentRequest.objects.all().order_by('-request_date')
+    return render(request, 'dashboard/enrollment/enrollment_requests.html', {'requests': requests})
+
+
+@login_required
+@user_passes_test(is_admin)
+def enrollment_request_detail(request, request_id):
+    """Detail view for enrollment request"""
+    enrollment_request = get_object_or_404(EnrollmentRequest, pk=request_id)
+    return render(request, 'dashboard/enrollment/enrollment_request_detail.html', {'enrollment_request': enrollment_request})
+
+
+@login_required
+@user_passes_test(is_admin)
+def waitlist_entries_list(request):
+    """List all waitlist entries"""
+    entries = WaitlistEntry.objects.all().order_by('position', 'added_date')
+    return render(request, 'dashboard/enrollment/waitlist_entries.html', {'entries': entries})
+
+
+@login_required
+@user_passes_test(is_admin)
+def waitlist_entry_detail(request, entry_id):
+    """Detail view for waitlist entry"""
+    entry = get_object_or_404(WaitlistEntry, pk=entry_id)
+    return render(request, 'dashboard/enrollment/waitlist_entry_detail.html', {'entry': entry})
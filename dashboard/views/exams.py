@@ -0,0 +1,467 @@
+"""Exam management dashboard pages."""
+from django.shortcuts import render, get_object_or_404, redirect
+from django.contrib.auth.decorators import login_required, user_passes_test
+from django.contrib import messages
+from .common import is_admin
+
+
+# ============================================================================
+# EXAM MANAGEMENT DASHBOARD VIEWS
+# ============================================================================
+
+@login_required
+@user_passes_test(is_admin)
+def exams_dashboard(request):
+    """Main exam management dashboard."""
+    from exams.models import (
+        ExamSession, ExamSchedule, ExamRegistration, HallTicket,
+        ExamAttendance, ExamResult, StudentDue, ExamViolation,
+        ExamRoom, ExamStaffAssignment, ExamRoomAllocation
+    )
+    from students.models import Student
+    from academics.models import Course
+    from faculty.models import Faculty
+    from django.utils import timezone
+    from datetime import timedelta
+    
+    # Get current date and time
+    now = timezone.now()
+    today = now.date()
+    
+    # Calculate statistics
+    active_sessions_count = ExamSession.objects.filter(
+        status__in=['PUBLISHED', 'ONGOING'],
+        start_date__lte=today,
+        end_date__gte=today
+    ).count()
+    
+    upcoming_exams_count = ExamSchedule.objects.filter(
+        exam_date__gte=today,
+        status='SCHEDULED'
+    ).count()
+    
+    total_registrations_count = ExamRegistration.objects.count()
+    
+    pending_approvals_count = ExamRegistration.objects.filter(
+        status='PENDING'
+    ).count()
+    
+    # Get upcoming exams for display
+    upcoming_exams = ExamSchedule.objects.filter(
+        exam_date__gte=today,
+        status='SCHEDULED'
+    ).select_related('course', 'exam_session').order_by('exam_date', 'start_time')[:5]
+    
+    # Get recent activities (simplified for now)
+    recent_activities = []
+    
+    # Quick statistics
+    total_students_count = Student.objects.count()
+    total_courses_count = Course.objects.count()
+    total_rooms_count = ExamRoom.objects.count()
+    total_faculty_count = Faculty.objects.count()
+    total_violations_count = ExamViolation.objects.count()
+    total_results_count = ExamResult.objects.count()
+    
+    context = {
+        'active_sessions_count': active_sessions_count,
+        'upcoming_exams_count': upcoming_exams_count,
+        'total_registrations_count': total_registrations_count,
+        'pending_approvals_count': pending_approvals_count,
+        'upcoming_exams': upcoming_exams,
+        'recent_activities': recent_activities,
+        'total_students_count': total_students_count,
+        'total_courses_count': total_courses_count,
+        'total_rooms_count': total_rooms_count,
+        'total_faculty_count': total_faculty_count,
+        'total_violations_count': total_violations_count,
+        'total_results_count': total_results_count,
+    }
+    
+    return render(request, 'dashboard/exams/dashboard.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def exams_sessions_list(request):
+    """List all exam sessions."""
+    from exams.models import ExamSession
+    
+    if request.method == 'POST':
+        # Handle session creation
+        try:
+            from datetime import datetime
+            from django.utils import timezone
+            
+            # Parse datetime strings
+            registration_start = datetime.fromisoformat(request.POST['registration_start'].replace('Z', '+00:00'))
+            registration_end = datetime.fromisoformat(request.POST['registration_end'].replace('Z', '+00:00'))
+            
+            # Make timezone-aware
+            registration_start = timezone.make_aware(registration_start)
+            registration_end = timezone.make_aware(registration_end)
+            
+            session = ExamSession.objects.create(
+                name=request.POST['name'],
+                session_type=request.POST['session_type'],
+                academic_year=request.POST['academic_year'],
+                semester=int(request.POST['semester']),
+                start_date=request.POST['start_date'],
+                end_date=request.POST['end_date'],
+                registration_start=registration_start,
+                registration_end=registration_end,
+                description=request.POST.get('description', ''),
+                status='DRAFT'
+            )
+            
+            messages.success(request, f'Exam session "{session.name}" created successfully!')
+            return redirect('dashboard:exams_sessions')
+            
+        except Exception as e:
+            messages.error(request, f'Error creating exam session: {str(e)}')
+    
+    exam_sessions = ExamSession.objects.all().order_by('-academic_year', '-semester', '-start_date')
+    
+    context = {
+        'exam_sessions': exam_sessions,
+    }
+    
+    return render(request, 'dashboard/exams/sessions_list.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def exams_session_detail(request, session_id):
+    """Show detailed information about an exam session."""
+    from exams.models import ExamSession
+    
+    session = get_object_or_404(ExamSession, pk=session_id)
+    
+    context = {
+        'session': session,
+    }
+    
+    return render(request, 'dashboard/exams/session_detail.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def exams_schedules_list(request):
+    """List all exam schedules."""
+    from exams.models import ExamSchedule
+    
+    exam_schedules = ExamSchedule.objects.all().select_related('exam_session', 'course').order_by('exam_date', 'start_time')
+    
+    context = {
+        'exam_schedules': exam_schedules,
+    }
+    
+    return render(request, 'dashboard/exams/schedules_list.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def exams_schedule_detail(request, schedule_id):
+    """Show detailed information about an exam schedule."""
+    from exams.models import ExamSchedule
+    
+    schedule = get_object_or_404(ExamSchedule, pk=schedule_id)
+    
+    context = {
+        'schedule': schedule,
+    }
+    
+    return render(request, 'dashboard/exams/schedule_detail.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def exams_rooms_list(request):
+    """List all exam rooms."""
+    from exams.models import ExamRoom
+    
+    exam_rooms = ExamRoom.objects.all().order_by('building', 'floor', 'name')
+    
+    context = {
+        'exam_rooms': exam_rooms,
+    }
+    
+    return render(request, 'dashboard/exams/rooms_list.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def exams_room_detail(request, room_id):
+    """Show detailed information about an exam room."""
+    from exams.models import ExamRoom
+    
+    room = get_object_or_404(ExamRoom, pk=room_id)
+    
+    context = {
+        'room': room,
+    }
+    
+    return render(request, 'dashboard/exams/room_detail.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def exams_registrations_list(request):
+    """List all exam registrations."""
+    from exams.models import ExamRegistration
+    
+    exam_registrations = ExamRegistration.objects.all().select_related('student', 'exam_schedule__course').order_by('-registration_date')
+    
+    context = {
+        'exam_registrations': exam_registrations,
+    }
+    
+    return render(request, 'dashboard/exams/registrations_list.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def exams_registration_detail(request, registration_id):
+    """Show detailed information about an exam registration."""
+    from exams.models import ExamRegistration
+    
+    registration = get_object_or_404(ExamRegistration, pk=registration_id)
+    
+    context = {
+        'registration': registration,
+    }
+    
+    return render(request, 'dashboard/exams/registration_detail.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def exams_hall_tickets_list(request):
+    """List all hall tickets."""
+    from exams.models import HallTicket
+    
+    hall_tickets = HallTicket.objects.all().select_related('exam_registration__student', 'exam_registration__exam_schedule__course').order_by('-generated_date')
+    
+    context = {
+        'hall_tickets': hall_tickets,
+    }
+    
+    return render(request, 'dashboard/exams/hall_tickets_list.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def exams_hall_ticket_detail(request, ticket_id):
+    """Show detailed information about a hall ticket."""
+    from exams.models import HallTicket
+    
+    ticket = get_object_or_404(HallTicket, pk=ticket_id)
+    
+    context = {
+        'ticket': ticket,
+    }
+    
+    return render(request, 'dashboard/exams/hall_ticket_detail.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def exams_attendance_list(request):
+    """List all exam attendance records."""
+    from exams.models import ExamAttendance
+    
+    exam_attendance = ExamAttendance.objects.all().select_related('exam_registration__student', 'exam_registration__exam_schedule__course').order_by('-created_at')
+    
+    context = {
+        'exam_attendance': exam_attendance,
+    }
+    
+    return render(request, 'dashboard/exams/attendance_list.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def exams_attendance_detail(request, attendance_id):
+    """Show detailed information about an exam attendance record."""
+    from exams.models import ExamAttendance
+    
+    attendance = get_object_or_404(ExamAttendance, pk=attendance_id)
+    
+    context = {
+        'attendance': attendance,
+    }
+    
+    return render(request, 'dashboard/exams/attendance_detail.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def exams_results_list(request):
+    """List all exam results."""
+    from exams.models import ExamResult
+    
+    exam_results = ExamResult.objects.all().select_related('exam_registration__student', 'exam_registration__exam_schedule__course').order_by('-evaluated_at', '-created_at')
+    
+    context = {
+        'exam_results': exam_results,
+    }
+    
+    return render(request, 'dashboard/exams/results_list.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def exams_result_detail(request, result_id):
+    """Show detailed information about an exam result."""
+    from exams.models import ExamResult
+    
+    result = get_object_or_404(ExamResult, pk=result_id)
+    
+    context = {
+        'result': result,
+    }
+    
+    return render(request, 'dashboard/exams/result_detail.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def exams_dues_list(request):
+    """List all student dues."""
+    from exams.models import StudentDue
+    
+    student_dues = StudentDue.objects.all().select_related('student').order_by('-due_date')
+    
+    context = {
+        'student_dues': student_dues,
+    }
+    
+    return render(request, 'dashboard/exams/dues_list.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def exams_due_detail(request, due_id):
+    """Show detailed information about a student due."""
+    from exams.models import StudentDue
+    
+    due = get_object_or_404(StudentDue, pk=due_id)
+    
+    context = {
+        'due': due,
+    }
+    
+    return render(request, 'dashboard/exams/due_detail.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def exams_violations_list(request):
+    """List all exam violations."""
+    from exams.models import ExamViolation
+    
+    exam_violations = ExamViolation.objects.all().select_related('exam_registration__student', 'exam_registration__exam_schedule__course').order_by('-reported_at')
+    
+    context = {
+        'exam_violations': exam_violations,
+    }
+    
+    return render(request, 'dashboard/exams/violations_list.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def exams_violation_detail(request, violation_id):
+    """Show detailed information about an exam violation."""
+    from exams.models import ExamViolation
+    
+    violation = get_object_or_404(ExamViolation, pk=violation_id)
+    
+    context = {
+        'violation': violation,
+    }
+    
+    return render(request, 'dashboard/exams/violation_detail.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def exams_staff_assignments_list(request):
+    """List all staff assignments."""
+    from exams.models import ExamStaffAssignment
+    
+    staff_assignments = ExamStaffAssignment.objects.all().select_related('faculty', 'exam_schedule__course').order_by('-assigned_date')
+    
+    context = {
+        'staff_assignments': staff_assignments,
+    }
+    
+    return render(request, 'dashboard/exams/staff_assignments_list.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def exams_staff_assignment_detail(request, assignment_id):
+    """Show detailed information about a staff assignment."""
+    from exams.models import ExamStaffAssignment
+    
+    assignment = get_object_or_404(ExamStaffAssignment, pk=assignment_id)
+    
+    context = {
+        'assignment': assignment,
+    }
+    
+    return render(request, 'dashboard/exams/staff_assignment_detail.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def exams_room_allocations_list(request):
+    """List all room allocations."""
+    from exams.models import ExamRoomAllocation, ExamSchedule, ExamRoom
+    from students.models import Student
+    from departments.models import Department
+    from academics.models import AcademicProgram
+    
+    room_allocations = ExamRoomAllocation.objects.all().select_related('exam_schedule__course', 'exam_room').order_by('-created_at')
+    
+    # Get data for the create modal
+    students = Student.objects.filter(status='ACTIVE').order_by('roll_number')
+    exam_schedules = ExamSchedule.objects.all().select_related('exam_session', 'course').order_by('-exam_date')
+    exam_rooms = ExamRoom.objects.filter(is_active=True).order_by('building', 'name')
+    
+    # Get filter options
+    departments = Department.objects.filter(is_active=True).order_by('name')
+    academic_programs = AcademicProgram.objects.filter(is_active=True).order_by('name')
+    
+    # Get unique academic years and sections from students
+    academic_years = Student.objects.values_list('academic_year', flat=True).distinct().exclude(academic_year__isnull=True).exclude(academic_year='').order_by('-academic_year')
+    sections = Student.objects.values_list('section', flat=True).distinct().exclude(section__isnull=True).exclude(section='').order_by('section')
+    
+    context = {
+        'room_allocations': room_allocations,
+        'students': students,
+        'exam_schedules': exam_schedules,
+        'exam_rooms': exam_rooms,
+        'departments': departments,
+        'academic_programs': academic_programs,
+        'academic_years': academic_years,
+        'sections': sections,
+    }
+    
+    return render(request, 'dashboard/exams/room_allocations_list.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def exams_room_allocation_detail(request, allocation_id):
+    """Show detailed information about a room allocation."""
+    from exams.models import ExamRoomAllocation
+    
+    allocation = get_object_or_404(ExamRoomAllocation, pk=allocation_id)
+    
+    context = {
+        'allocation': allocation,
+    }
+    
+    return render(request, 'dashboard/exams/room_allocation_detail.html', context)
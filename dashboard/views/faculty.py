@@ -0,0 +1,331 @@
+"""Faculty management pages."""
+from django.shortcuts import render, get_object_or_404
+from django.contrib.auth.decorators import login_required, user_passes_test
+from django.http import JsonResponse
+from faculty.models import (
+    Faculty,
+    FacultyLeave,
+    FacultyPerformance,
+    FacultyDocument,
+    CustomField as FacultyCustomField,
+)
+from django.utils import timezone
+from django.db.models import Avg
+from django.db.models import Q, Count
+from enrollment.models import FacultyAssignment
+from .common import is_admin
+
+
+# ------------------------------
+# Faculty Management Views
+# ------------------------------
+@login_required
+@user_passes_test(is_admin)
+def faculty_list(request):
+    """Faculty management page"""
+    # Get filter parameters
+    search = request.GET.get('search', '')
+    department = request.GET.get('department', '')
+    status = request.GET.get('status', '')
+    
+    # Build queryset
+    faculties = Faculty.objects.all()
+    
+    if search:
+        faculties = faculties.filter(
+            Q(name__icontains=search) |
+            Q(employee_id__icontains=search) |
+            Q(apaar_faculty_id__icontains=search) |
+            Q(email__icontains=search) |
+            Q(phone_number__icontains=search)
+        )
+    
+    if department:
+        faculties = faculties.filter(department=department)
+    
+    if status:
+        faculties = faculties.filter(status=status)
+    
+    faculties = faculties.order_by('name')
+    
+    # Get statistics
+    total_faculty = Faculty.objects.count()
+    active_faculty = Faculty.objects.filter(status='ACTIVE', currently_associated=True).count()
+    
+    context = {
+        'faculties': faculties,
+        'total_faculty': total_faculty,
+        'active_faculty': active_faculty,
+        'department_choices': Faculty.DEPARTMENT_CHOICES,
+        'status_choices': Faculty.STATUS_CHOICES,
+    }
+    return render(request, 'dashboard/faculty/list.html', context)
+
+@login_required
+@user_passes_test(is_admin)
+def faculty_detail(request, faculty_id):
+    """Faculty detail page"""
+    try:
+        faculty = Faculty.objects.get(id=faculty_id)
+        context = {
+            'faculty': faculty,
+            'subjects': faculty.subjects.all(),
+            'schedules': faculty.schedules.all(),
+            'leaves': faculty.leaves.all(),
+            'performance_records': faculty.performance_records.all(),
+            'documents': faculty.documents.all(),
+            'custom_fields': faculty.custom_field_values.all(),
+        }
+        return render(request, 'dashboard/faculty/detail.html', context)
+    except Faculty.DoesNotExist:
+        return render(request, 'dashboard/404.html', status=404)
+
+@login_required
+@user_passes_test(is_admin)
+def custom_fields_list(request):
+    """Custom fields management page"""
+    from students.models import CustomField
+    from django.utils import timezone
+    
+    custom_fields = CustomField.objects.all().order_by('order', 'name')
+    
+    # Calculate statistics
+    active_fields_count = custom_fields.filter(is_active=True).count()
+    required_fields_count = custom_fields.filter(required=True).count()
+    field_types_count = custom_fields.values('field_type').distinct().count()
+    
+    context = {
+        'custom_fields': custom_fields,
+        'active_fields_count': active_fields_count,
+        'required_fields_count': required_fields_count,
+        'field_types_count': field_types_count,
+        'now': timezone.now(),
+    }
+    return render(request, 'dashboard/custom_fields.html', context)
+
+@login_required
+@user_passes_test(is_admin)
+def faculty_performance_stats(request):
+    """Faculty performance statistics dashboard"""
+    # Get total faculty count
+    total_faculty = Faculty.objects.count()
+    
+    # Get performance statistics
+    performance_stats = FacultyPerformance.objects.all().aggregate(
+        total_performance_records=Count('id'),
+        average_rating=Avg('overall_score')
+    )
+    
+    # Get recent performance records
+    recent_performance_records = FacultyPerformance.objects.order_by('-created_at')[:10]
+    
+    # Get department-wise statistics
+    department_stats = Faculty.objects.values('department').annotate(
+        count=Count('id')
+    ).order_by('-count')
+    
+    context = {
+        'total_faculty': total_faculty,
+        'performance_stats': performance_stats,
+        'recent_performance_records': recent_performance_records,
+        'department_stats': department_stats,
+    }
+    return render(request, 'dashboard/faculty/performance_stats.html', context)
+
+@login_required
+@user_passes_test(is_admin)
+def faculty_leave_stats(request):
+    """Faculty leave statistics dashboard"""
+    # Get total faculty count
+    total_faculty = Faculty.objects.count()
+    
+    # Get leave statistics
+    leave_stats = FacultyLeave.objects.all().aggregate(
+        total_leaves=Count('id'),
+        approved_leaves=Count('id', filter=Q(status='APPROVED')),
+        pending_leaves=Count('id', filter=Q(status='PENDING')),
+        rejected_leaves=Count('id', filter=Q(status='REJECTED')),
+    )
+    
+    # Get recent leaves
+    recent_leaves = FacultyLeave.objects.order_by('-created_at')[:10]
+    
+    # Get leave type statistics
+    leave_type_stats = FacultyLeave.objects.values('leave_type').annotate(
+        count=Count('id')
+    ).order_by('-count')
+    
+    context = {
+        'total_faculty': total_faculty,
+        'leave_stats': leave_stats,
+        'recent_leaves': recent_leaves,
+        'leave_type_stats': leave_type_stats,
+    }
+    return render(request, 'dashboard/faculty/leave_stats.html', context)
+
+@login_required
+@user_passes_test(is_admin)
+def faculty_document_list(request):
+    """Faculty document management page"""
+    documents = FacultyDocument.objects.all().order_by('-created_at')
+    
+    context = {
+        'documents': documents,
+    }
+    return render(request, 'dashboard/faculty/documents.html', context)
+
+@login_required
+@user_passes_test(is_admin)
+def faculty_custom_field_create(request):
+    """Create a new faculty custom field"""
+    if request.method == 'POST':
+        try:
+            # Get form data
+            name = request.POST.get('name')
+            label = request.POST.get('label')
+            field_type = request.POST.get('field_type')
+            required = request.POST.get('required') == 'on'
+            is_active = request.POST.get('is_active') == 'on'
+            default_value = request.POST.get('default_value', '')
+            choices = request.POST.get('choices', '')
+            help_text = request.POST.get('help_text', '')
+            order = request.POST.get('order', 0)
+            
+            # Validate required fields
+            if not all([name, label, field_type]):
+                return JsonResponse({'success': False, 'error': 'Name, label, and field type are required'})
+            
+            # Check if name already exists
+            if FacultyCustomField.objects.filter(name=name).exists():
+                return JsonResponse({'success': False, 'error': 'A field with this name already exists'})
+            
+            # Create the custom field
+            custom_field = FacultyCustomField.objects.create(
+                name=name,
+                label=label,
+                field_type=field_type,
+                required=required,
+                is_active=is_active,
+                default_value=default_value,
+                choices=choices,
+                help_text=help_text,
+                order=order
+            )
+            
+            return JsonResponse({'success': True, 'message': 'Custom field created successfully'})
+            
+        except Exception as e:
+            return JsonResponse({'success': False, 'error': str(e)})
+    
+    return JsonResponse({'success': False, 'error': 'Invalid request method'})
+
+
+@login_required
+@user_passes_test(is_admin)
+def faculty_custom_field_update(request, field_id):
+    """Update an existing faculty custom field"""
+    if request.method == 'POST':
+        try:
+            # Get the custom field
+            try:
+                custom_field = FacultyCustomField.objects.get(id=field_id)
+            except FacultyCustomField.DoesNotExist:
+                return JsonResponse({'success': False, 'error': 'Custom field not found'})
+            
+            # Get form data
+            name = request.POST.get('name')
+            label = request.POST.get('label')
+            field_type = request.POST.get('field_type')
+            required = request.POST.get('required') == 'on'
+            is_active = request.POST.get('is_active') == 'on'
+            default_value = request.POST.get('default_value', '')
+            choices = request.POST.get('choices', '')
+            help_text = request.POST.get('help_text', '')
+            order = request.POST.get('order', 0)
+            
+            # Validate required fields
+            if not all([name, label, field_type]):
+                return JsonResponse({'success': False, 'error': 'Name, label, and field type are required'})
+            
+            # Check if name already exists (excluding current field)
+            if FacultyCustomField.objects.filter(name=name).exclude(id=field_id).exists():
+                return JsonResponse({'success': False, 'error': 'A field with this name already exists'})
+            
+            # Update the custom field
+            custom_field.name = name
+            custom_field.label = label
+            custom_field.field_type = field_type
+            custom_field.required = required
+            custom_field.is_active = is_active
+            custom_field.default_value = default_value
+            custom_field.choices = choices
+            custom_field.help_text = help_text
+            custom_field.order = order
+            custom_field.save()
+            
+            return JsonResponse({'success': True, 'message': 'Custom field updated successfully'})
+            
+        except Exception as e:
+            return JsonResponse({'success': False, 'error': str(e)})
+    
+    return JsonResponse({'success': False, 'error': 'Invalid request method'})
+
+
+@login_required
+@user_passes_test(is_admin)
+def faculty_custom_field_delete(request, field_id):
+    """Delete a faculty custom field"""
+    if request.method == 'POST':
+        try:
+            # Get the custom field
+            try:
+                custom_field = FacultyCustomField.objects.get(id=field_id)
+            except FacultyCustomField.DoesNotExist:
+                return JsonResponse({'success': False, 'error': 'Custom field not found'})
+            
+            # Delete the custom field
+            custom_field.delete()
+            
+            return JsonResponse({'success': True, 'message': 'Custom field deleted successfully'})
+            
+        except Exception as e:
+            return JsonResponse({'success': False, 'error': str(e)})
+    
+    return JsonResponse({'success': False, 'error': 'Invalid request method'})
+
+
+@login_required
+@user_passes_test(is_admin)
+def faculty_custom_fields_list(request):
+    """Faculty custom fields management page"""
+    custom_fields = FacultyCustomField.objects.all().order_by('order', 'name')
+    
+    # Calculate statistics
+    active_fields_count = custom_fields.filter(is_active=True).count()
+    required_fields_count = custom_fields.filter(required=True).count()
+    field_types_count = custom_fields.values('field_type').distinct().count()
+    
+    context = {
+        'custom_fields': custom_fields,
+        'active_fields_count': active_fields_count,
+        'required_fields_count': required_fields_count,
+        'field_types_count': field_types_count,
+        'now': timezone.now(),
+    }
+    return render(request, 'dashboard/faculty/custom_fields.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def faculty_assignments_list(request):
+    """List all faculty assignments"""
+    assignments = FacultyAssignment.objects.all().order_by('-assignment_date', 'faculty__first_name')
+    return render(request, 'dashboard/enrollment/faculty_assignments.html', {'assignments': assignments})
+
+
+@login_required
+@user_passes_test(is_admin)
+def faculty_assignment_detail(request, assignment_id):
+    """Detail view for faculty assignment"""
+    assignment = get_object_or_404(FacultyAssignment, pk=assignment_id)
+    return render(request, 'dashboard/enrollment/faculty_assignment_detail.html', {'assignment': assignment})
@@ -0,0 +1,148 @@
+"""University feedback dashboard pages."""
+from django.shortcuts import render, get_object_or_404, redirect
+from django.contrib.auth.decorators import login_required, user_passes_test
+from django.contrib import messages
+from departments.models import Department
+from faculty.models import Faculty
+from django.db.models import Q
+from academics.models import Course, Syllabus, CourseSection
+from feedback.models import (
+    Feedback as UnivFeedback,
+    FeedbackCategory as UnivFeedbackCategory,
+    FeedbackTag as UnivFeedbackTag,
+    FeedbackComment as UnivFeedbackComment,
+    FeedbackVote as UnivFeedbackVote,
+)
+from .common import is_admin
+
+
+@login_required
+@user_passes_test(is_admin)
+def feedback_dashboard(request):
+    stats = {
+        'total': UnivFeedback.objects.count(),
+        'open': UnivFeedback.objects.filter(status='open').count(),
+        'in_review': UnivFeedback.objects.filter(status='in_review').count(),
+        'resolved': UnivFeedback.objects.filter(status='resolved').count(),
+        'closed': UnivFeedback.objects.filter(status='closed').count(),
+    }
+    recent = UnivFeedback.objects.select_related('category', 'created_by').order_by('-created_at')[:10]
+    return render(request, 'dashboard/feedback/dashboard.html', {
+        'stats': stats,
+        'recent': recent,
+        'categories': UnivFeedbackCategory.objects.filter(is_active=True).order_by('name'),
+        'tags': UnivFeedbackTag.objects.order_by('name'),
+    })
+
+
+@login_required
+@user_passes_test(is_admin)
+def feedback_items_list(request):
+    items = UnivFeedback.objects.select_related('category', 'created_by', 'department', 'course', 'section', 'faculty', 'syllabus').prefetch_related('tags').all()
+    # Filters
+    q = request.GET.get('q')
+    status_f = request.GET.get('status')
+    category_f = request.GET.get('category')
+    department_f = request.GET.get('department')
+    course_f = request.GET.get('course')
+    faculty_f = request.GET.get('faculty')
+    if q:
+        items = items.filter(Q(title__icontains=q) | Q(description__icontains=q))
+    if status_f:
+        items = items.filter(status=status_f)
+    if category_f:
+        items = items.filter(category_id=category_f)
+    if department_f:
+        items = items.filter(department_id=department_f)
+    if course_f:
+        items = items.filter(course_id=course_f)
+    if faculty_f:
+        items = items.filter(faculty_id=faculty_f)
+    items = items.order_by('-created_at')
+    return render(request, 'dashboard/feedback/items_list.html', {
+        'items': items,
+        'categories': UnivFeedbackCategory.objects.filter(is_active=True).order_by('name'),
+        'departments': Department.objects.order_by('name'),
+        'courses': Course.objects.order_by('code'),
+        'faculties': Faculty.objects.order_by('-created_at')[:100],
+        'status_choices': UnivFeedback.Status.choices,
+        'current': {
+            'q': q, 'status': status_f, 'category': category_f, 'department': department_f, 'course': course_f, 'faculty': faculty_f
+        }
+    })
+
+
+@login_required
+@user_passes_test(is_admin)
+def feedback_item_detail(request, item_id):
+    item = get_object_or_404(UnivFeedback.objects.select_related('category', 'created_by', 'department', 'course', 'section', 'faculty', 'syllabus'), id=item_id)
+    if request.method == 'POST':
+        action = request.POST.get('action')
+        if action == 'comment':
+            content = request.POST.get('content', '').strip()
+            if content:
+                UnivFeedbackComment.objects.create(feedback=item, commented_by=request.user, content=content, is_internal=bool(request.POST.get('is_internal')))
+                messages.success(request, 'Comment added')
+            return redirect('dashboard:feedback_item_detail', item_id=item.id)
+        if action == 'vote':
+            is_up = request.POST.get('is_up') == '1'
+            UnivFeedbackVote.objects.update_or_create(feedback=item, voted_by=request.user, defaults={'is_upvote': is_up})
+            messages.success(request, 'Vote recorded')
+            return redirect('dashboard:feedback_item_detail', item_id=item.id)
+        if action == 'update_status':
+            new_status = request.POST.get('status')
+            if new_status in dict(UnivFeedback.Status.choices):
+                item.status = new_status
+                item.save(update_fields=['status'])
+                messages.success(request, 'Status updated')
+            return redirect('dashboard:feedback_item_detail', item_id=item.id)
+    comments = item.comments.select_related('commented_by').order_by('-created_at')
+    votes = item.votes.select_related('voted_by')
+    score = votes.filter(is_upvote=True).count() - votes.filter(is_upvote=False).count()
+    return render(request, 'dashboard/feedback/item_detail.html', {
+        'item': item,
+        'comments': comments,
+        'votes': votes,
+        'score': score,
+        'status_choices': UnivFeedback.Status.choices,
+    })
+
+
+@login_required
+@user_passes_test(is_admin)
+def feedback_item_create(request):
+    if request.method == 'POST':
+        title = request.POST.get('title', '').strip()
+        description = request.POST.get('description', '').strip()
+        category_id = request.POST.get('category_id') or None
+        priority = request.POST.get('priority') or UnivFeedback.Priority.MEDIUM
+        department_id = request.POST.get('department_id') or None
+        course_id = request.POST.get('course_id') or None
+        section_id = request.POST.get('section_id') or None
+        faculty_id = request.POST.get('faculty_id') or None
+        syllabus_id = request.POST.get('syllabus_id') or None
+        if title and description:
+            item = UnivFeedback.objects.create(
+                title=title,
+                description=description,
+                category_id=category_id,
+                created_by=request.user,
+                priority=priority,
+                department_id=department_id,
+                course_id=course_id,
+                section_id=section_id,
+                faculty_id=faculty_id,
+                syllabus_id=syllabus_id,
+            )
+            messages.success(request, 'Feedback created')
+            return redirect('dashboard:feedback_item_detail', item_id=item.id)
+        messages.error(request, 'Title and description are required')
+    return render(request, 'dashboard/feedback/item_create.html', {
+        'categories': UnivFeedbackCategory.objects.filter(is_active=True).order_by('name'),
+        'departments': Department.objects.order_by('name'),
+        'courses': Course.objects.order_by('code'),
+        'sections': CourseSection.objects.order_by('course__code', 'section_number')[:200],
+        'faculties': Faculty.objects.order_by('-created_at')[:200],
+        'syllabi': Syllabus.objects.order_by('-created_at')[:200],
+        'priority_choices': UnivFeedback.Priority.choices,
+    })
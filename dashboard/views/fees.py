@@ -0,0 +1,768 @@
+"""Fee management dashboard pages."""
+from django.shortcuts import render, get_object_or_404, redirect
+from django.contrib.auth.decorators import login_required, user_passes_test
+from django.db import models
+from django.utils import timezone
+from django.db.models import Q
+from fees.models import (
+    FeeCategory,
+    FeeStructure,
+    FeeStructureDetail,
+    StudentFee,
+    Payment,
+    FeeWaiver,
+    FeeDiscount,
+    FeeReceipt,
+)
+from fees.analytics import fee_breakdown, fee_overview, payment_breakdown, payment_totals
+from fees.overdue import OPEN_STATUSES
+from .common import is_admin
+
+
+# =============================================================================
+# FEE MANAGEMENT DASHBOARD VIEWS
+# =============================================================================
+
+@login_required
+@user_passes_test(is_admin)
+def fees_dashboard(request):
+    """Main fee management dashboard with statistics and overview"""
+    
+    # Fee statistics
+    total_fee_categories = FeeCategory.objects.filter(is_active=True).count()
+    total_fee_structures = FeeStructure.objects.filter(is_active=True).count()
+    
+    # Financial statistics and status counts, from the fee analytics rollups
+    overview = fee_overview()
+    total_student_fees = overview['total_student_fees']
+    total_payments = payment_totals()['count']
+    total_fees_due = overview['total_fees_due']
+    total_fees_paid = overview['total_fees_paid']
+    total_balance = overview['total_balance']
+    pending_fees = overview['pending_count']
+    paid_fees = overview['paid_count']
+    partial_fees = overview['partial_count']
+    overdue_fees = overview['overdue_count']
+    
+    # Recent activities
+    recent_payments = Payment.objects.filter(status='COMPLETED').select_related(
+        'student_fee__student', 'collected_by'
+    ).order_by('-payment_date')[:10]
+    
+    recent_student_fees = StudentFee.objects.select_related(
+        'student', 'fee_structure_detail__fee_category'
+    ).order_by('-created_at')[:10]
+    
+    # Payment method distribution, fee category and academic year breakdowns
+    payment_methods = payment_breakdown('payment_method')
+    fee_category_breakdown = fee_breakdown('category')
+    academic_year_breakdown = fee_breakdown('academic_year')
+    
+    context = {
+        'total_fee_categories': total_fee_categories,
+        'total_fee_structures': total_fee_structures,
+        'total_student_fees': total_student_fees,
+        'total_payments': total_payments,
+        'total_fees_due': total_fees_due,
+        'total_fees_paid': total_fees_paid,
+        'total_balance': total_balance,
+        'pending_fees': pending_fees,
+        'paid_fees': paid_fees,
+        'partial_fees': partial_fees,
+        'overdue_fees': overdue_fees,
+        'recent_payments': recent_payments,
+        'recent_student_fees': recent_student_fees,
+        'payment_methods': payment_methods,
+        'fee_category_breakdown': fee_category_breakdown,
+        'academic_year_breakdown': academic_year_breakdown,
+    }
+    
+    return render(request, 'dashboard/fees/dashboard.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def fees_categories_list(request):
+    """List all fee categories"""
+    categories = FeeCategory.objects.all().order_by('display_order', 'name')
+    
+    if request.method == 'POST':
+        if 'create' in request.POST:
+            name = request.POST.get('name')
+            description = request.POST.get('description')
+            display_order = request.POST.get('display_order', 0)
+            is_active = 'is_active' in request.POST
+            
+            if name:
+                FeeCategory.objects.create(
+                    name=name,
+                    description=description,
+                    display_order=display_order,
+                    is_active=is_active
+                )
+                return redirect('dashboard:fees_categories_list')
+        
+        elif 'update' in request.POST:
+            category_id = request.POST.get('category_id')
+            name = request.POST.get('name')
+            description = request.POST.get('description')
+            display_order = request.POST.get('display_order', 0)
+            is_active = 'is_active' in request.POST
+            
+            if category_id and name:
+                try:
+                    category = FeeCategory.objects.get(id=category_id)
+                    category.name = name
+                    category.description = description
+                    category.display_order = display_order
+                    category.is_active = is_active
+                    category.save()
+                except FeeCategory.DoesNotExist:
+                    pass
+                return redirect('dashboard:fees_categories_list')
+        
+        elif 'delete' in request.POST:
+            category_id = request.POST.get('category_id')
+            if category_id:
+                try:
+                    FeeCategory.objects.get(id=category_id).delete()
+                except FeeCategory.DoesNotExist:
+                    pass
+                return redirect('dashboard:fees_categories_list')
+    
+    context = {
+        'categories': categories,
+    }
+    
+    return render(request, 'dashboard/fees/categories_list.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def fees_structures_list(request):
+    """List all fee structures"""
+    structures = FeeStructure.objects.all().select_related().prefetch_related('fee_details').order_by('-academic_year', 'grade_level')
+    
+    if request.method == 'POST':
+        if 'create' in request.POST:
+            name = request.POST.get('name')
+            academic_year = request.POST.get('academic_year')
+            grade_level = request.POST.get('grade_level')
+            description = request.POST.get('description')
+            is_active = 'is_active' in request.POST
+            
+            if name and academic_year and grade_level:
+                FeeStructure.objects.create(
+                    name=name,
+                    academic_year=academic_year,
+                    grade_level=grade_level,
+                    description=description,
+                    is_active=is_active
+                )
+                return redirect('dashboard:fees_structures_list')
+        
+        elif 'update' in request.POST:
+            structure_id = request.POST.get('structure_id')
+            name = request.POST.get('name')
+            academic_year = request.POST.get('academic_year')
+            grade_level = request.POST.get('grade_level')
+            description = request.POST.get('description')
+            is_active = 'is_active' in request.POST
+            
+            if structure_id and name and academic_year and grade_level:
+                try:
+                    structure = FeeStructure.objects.get(id=structure_id)
+                    structure.name = name
+                    structure.academic_year = academic_year
+                    structure.grade_level = grade_level
+                    structure.description = description
+                    structure.is_active = is_active
+                    structure.save()
+                except FeeStructure.DoesNotExist:
+                    pass
+                return redirect('dashboard:fees_structures_list')
+        
+        elif 'delete' in request.POST:
+            structure_id = request.POST.get('structure_id')
+            if structure_id:
+                try:
+                    FeeStructure.objects.get(id=structure_id).delete()
+                except FeeStructure.DoesNotExist:
+                    pass
+                return redirect('dashboard:fees_structures_list')
+    
+    context = {
+        'structures': structures,
+        'academic_year_choices': FeeStructure.ACADEMIC_YEAR_CHOICES,
+        'grade_choices': FeeStructure.GRADE_CHOICES,
+    }
+    
+    return render(request, 'dashboard/fees/structures_list.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def fees_structure_detail(request, structure_id):
+    """Show detailed information about a fee structure"""
+    structure = get_object_or_404(FeeStructure, pk=structure_id)
+    fee_details = structure.fee_details.all().select_related('fee_category').order_by('fee_category__display_order')
+    
+    if request.method == 'POST':
+        if 'create_detail' in request.POST:
+            fee_category_id = request.POST.get('fee_category_id')
+            amount = request.POST.get('amount')
+            frequency = request.POST.get('frequency')
+            is_optional = 'is_optional' in request.POST
+            due_date = request.POST.get('due_date') or None
+            late_fee_amount = request.POST.get('late_fee_amount', 0)
+            late_fee_percentage = request.POST.get('late_fee_percentage', 0)
+            
+            if fee_category_id and amount:
+                try:
+                    fee_category = FeeCategory.objects.get(id=fee_category_id)
+                    FeeStructureDetail.objects.create(
+                        fee_structure=structure,
+                        fee_category=fee_category,
+                        amount=amount,
+                        frequency=frequency,
+                        is_optional=is_optional,
+                        due_date=due_date,
+                        late_fee_amount=late_fee_amount,
+                        late_fee_percentage=late_fee_percentage
+                    )
+                except FeeCategory.DoesNotExist:
+                    pass
+                return redirect('dashboard:fees_structure_detail', structure_id=structure_id)
+        
+        elif 'update_detail' in request.POST:
+            detail_id = request.POST.get('detail_id')
+            amount = request.POST.get('amount')
+            frequency = request.POST.get('frequency')
+            is_optional = 'is_optional' in request.POST
+            due_date = request.POST.get('due_date') or None
+            late_fee_amount = request.POST.get('late_fee_amount', 0)
+            late_fee_percentage = request.POST.get('late_fee_percentage', 0)
+            
+            if detail_id and amount:
+                try:
+                    detail = FeeStructureDetail.objects.get(id=detail_id)
+                    detail.amount = amount
+                    detail.frequency = frequency
+                    detail.is_optional = is_optional
+                    detail.due_date = due_date
+                    detail.late_fee_amount = late_fee_amount
+                    detail.late_fee_percentage = late_fee_percentage
+                    detail.save()
+                except FeeStructureDetail.DoesNotExist:
+                    pass
+                return redirect('dashboard:fees_structure_detail', structure_id=structure_id)
+        
+        elif 'delete_detail' in request.POST:
+            detail_id = request.POST.get('detail_id')
+            if detail_id:
+                try:
+                    FeeStructureDetail.objects.get(id=detail_id).delete()
+                except FeeStructureDetail.DoesNotExist:
+                    pass
+                return redirect('dashboard:fees_structure_detail', structure_id=structure_id)
+    
+    # Get available fee categories for creating new details
+    available_categories = FeeCategory.objects.filter(is_active=True).exclude(
+        id__in=fee_details.values_list('fee_category_id', flat=True)
+    )
+    
+    context = {
+        'structure': structure,
+        'fee_details': fee_details,
+        'available_categories': available_categories,
+        'frequency_choices': FeeStructureDetail.FREQUENCY_CHOICES,
+    }
+    
+    return render(request, 'dashboard/fees/structure_detail.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def fees_student_fees_list(request):
+    """List all student fees with filtering and search"""
+    student_fees = StudentFee.objects.all().select_related(
+        'student', 'fee_structure_detail__fee_category', 'fee_structure_detail__fee_structure'
+    ).order_by('-created_at')
+    
+    # Filtering
+    status_filter = request.GET.get('status')
+    academic_year_filter = request.GET.get('academic_year')
+    grade_filter = request.GET.get('grade_level')
+    category_filter = request.GET.get('fee_category')
+    search_query = request.GET.get('search')
+    
+    if status_filter:
+        student_fees = student_fees.filter(status=status_filter)
+    
+    if academic_year_filter:
+        student_fees = student_fees.filter(academic_year=academic_year_filter)
+    
+    if grade_filter:
+        student_fees = student_fees.filter(fee_structure_detail__fee_structure__grade_level=grade_filter)
+    
+    if category_filter:
+        student_fees = student_fees.filter(fee_structure_detail__fee_category_id=category_filter)
+    
+    if search_query:
+        student_fees = student_fees.filter(
+            Q(student__roll_number__icontains=search_query) |
+            Q(student__first_name__icontains=search_query) |
+            Q(student__last_name__icontains=search_query)
+        )
+    
+    # Get filter options
+    status_choices = StudentFee.STATUS_CHOICES
+    academic_years = StudentFee.objects.values_list('academic_year', flat=True).distinct().order_by('-academic_year')
+    grade_levels = FeeStructure.objects.values_list('grade_level', flat=True).distinct().order_by('grade_level')
+    fee_categories = FeeCategory.objects.filter(is_active=True).order_by('name')
+    
+    context = {
+        'student_fees': student_fees,
+        'status_choices': status_choices,
+        'academic_years': academic_years,
+        'grade_levels': grade_levels,
+        'fee_categories': fee_categories,
+        'current_filters': {
+            'status': status_filter,
+            'academic_year': academic_year_filter,
+            'grade_level': grade_filter,
+            'fee_category': category_filter,
+            'search': search_query,
+        }
+    }
+    
+    return render(request, 'dashboard/fees/student_fees_list.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def fees_student_fee_detail(request, student_fee_id):
+    """Show detailed information about a student fee"""
+    student_fee = get_object_or_404(StudentFee, pk=student_fee_id)
+    payments = student_fee.payments.all().order_by('-payment_date')
+    waivers = student_fee.waivers.filter(is_active=True).order_by('-created_at')
+    discounts = student_fee.discounts.filter(is_active=True).order_by('-created_at')
+    receipts = student_fee.receipts.all().order_by('-generated_date')
+    
+    context = {
+        'student_fee': student_fee,
+        'payments': payments,
+        'waivers': waivers,
+        'discounts': discounts,
+        'receipts': receipts,
+    }
+    
+    return render(request, 'dashboard/fees/student_fee_detail.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def fees_payments_list(request):
+    """List all payments with filtering and search"""
+    payments = Payment.objects.all().select_related(
+        'student_fee__student', 'student_fee__fee_structure_detail__fee_category', 'collected_by'
+    ).order_by('-payment_date')
+    
+    # Filtering
+    status_filter = request.GET.get('status')
+    method_filter = request.GET.get('payment_method')
+    date_from = request.GET.get('date_from')
+    date_to = request.GET.get('date_to')
+    search_query = request.GET.get('search')
+    
+    if status_filter:
+        payments = payments.filter(status=status_filter)
+    
+    if method_filter:
+        payments = payments.filter(payment_method=method_filter)
+    
+    if date_from:
+        payments = payments.filter(payment_date__date__gte=date_from)
+    
+    if date_to:
+        payments = payments.filter(payment_date__date__lte=date_to)
+    
+    if search_query:
+        payments = payments.filter(
+            Q(receipt_number__icontains=search_query) |
+            Q(transaction_id__icontains=search_query) |
+            Q(student_fee__student__roll_number__icontains=search_query) |
+            Q(student_fee__student__first_name__icontains=search_query)
+        )
+    
+    # Get filter options
+    status_choices = Payment.PAYMENT_STATUS_CHOICES
+    method_choices = Payment.PAYMENT_METHOD_CHOICES
+    
+    context = {
+        'payments': payments,
+        'status_choices': status_choices,
+        'method_choices': method_choices,
+        'current_filters': {
+            'status': status_filter,
+            'payment_method': method_filter,
+            'date_from': date_from,
+            'date_to': date_to,
+            'search': search_query,
+        }
+    }
+    
+    return render(request, 'dashboard/fees/payments_list.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def fees_payment_detail(request, payment_id):
+    """Show detailed information about a payment"""
+    payment = get_object_or_404(Payment, pk=payment_id)
+    receipts = payment.receipts.all().order_by('-generated_date')
+    
+    context = {
+        'payment': payment,
+        'receipts': receipts,
+    }
+    
+    return render(request, 'dashboard/fees/payment_detail.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def fees_waivers_list(request):
+    """List all fee waivers"""
+    waivers = FeeWaiver.objects.all().select_related(
+        'student_fee__student', 'approved_by'
+    ).order_by('-created_at')
+    
+    if request.method == 'POST':
+        if 'create' in request.POST:
+            student_fee_id = request.POST.get('student_fee_id')
+            waiver_type = request.POST.get('waiver_type')
+            amount = request.POST.get('amount')
+            percentage = request.POST.get('percentage')
+            reason = request.POST.get('reason')
+            is_active = 'is_active' in request.POST
+            
+            if student_fee_id and waiver_type and amount and reason:
+                try:
+                    student_fee = StudentFee.objects.get(id=student_fee_id)
+                    FeeWaiver.objects.create(
+                        student_fee=student_fee,
+                        waiver_type=waiver_type,
+                        amount=amount,
+                        percentage=percentage,
+                        reason=reason,
+                        is_active=is_active,
+                        approved_by=request.user,
+                        approved_date=timezone.now()
+                    )
+                except StudentFee.DoesNotExist:
+                    pass
+                return redirect('dashboard:fees_waivers_list')
+        
+        elif 'update' in request.POST:
+            waiver_id = request.POST.get('waiver_id')
+            waiver_type = request.POST.get('waiver_type')
+            amount = request.POST.get('amount')
+            percentage = request.POST.get('percentage')
+            reason = request.POST.get('reason')
+            is_active = 'is_active' in request.POST
+            
+            if waiver_id and waiver_type and amount and reason:
+                try:
+                    waiver = FeeWaiver.objects.get(id=waiver_id)
+                    waiver.waiver_type = waiver_type
+                    waiver.amount = amount
+                    waiver.percentage = percentage
+                    waiver.reason = reason
+                    waiver.is_active = is_active
+                    waiver.save()
+                except FeeWaiver.DoesNotExist:
+                    pass
+                return redirect('dashboard:fees_waivers_list')
+        
+        elif 'delete' in request.POST:
+            waiver_id = request.POST.get('waiver_id')
+            if waiver_id:
+                try:
+                    FeeWaiver.objects.get(id=waiver_id).delete()
+                except FeeWaiver.DoesNotExist:
+                    pass
+                return redirect('dashboard:fees_waivers_list')
+    
+    # Get available student fees for creating new waivers
+    available_student_fees = StudentFee.objects.filter(status__in=OPEN_STATUSES).select_related('student')
+    
+    context = {
+        'waivers': waivers,
+        'available_student_fees': available_student_fees,
+        'waiver_type_choices': FeeWaiver.WAIVER_TYPE_CHOICES,
+    }
+    
+    return render(request, 'dashboard/fees/waivers_list.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def fees_discounts_list(request):
+    """List all fee discounts"""
+    discounts = FeeDiscount.objects.all().select_related(
+        'student_fee__student'
+    ).order_by('-created_at')
+    
+    if request.method == 'POST':
+        if 'create' in request.POST:
+            student_fee_id = request.POST.get('student_fee_id')
+            discount_type = request.POST.get('discount_type')
+            amount = request.POST.get('amount')
+            percentage = request.POST.get('percentage')
+            reason = request.POST.get('reason')
+            valid_until = request.POST.get('valid_until') or None
+            is_active = 'is_active' in request.POST
+            
+            if student_fee_id and discount_type and amount and reason:
+                try:
+                    student_fee = StudentFee.objects.get(id=student_fee_id)
+                    FeeDiscount.objects.create(
+                        student_fee=student_fee,
+                        discount_type=discount_type,
+                        amount=amount,
+                        percentage=percentage,
+                        reason=reason,
+                        valid_until=valid_until,
+                        is_active=is_active
+                    )
+                except StudentFee.DoesNotExist:
+                    pass
+                return redirect('dashboard:fees_discounts_list')
+        
+        elif 'update' in request.POST:
+            discount_id = request.POST.get('discount_id')
+            discount_type = request.POST.get('discount_type')
+            amount = request.POST.get('amount')
+            percentage = request.POST.get('percentage')
+            reason = request.POST.get('reason')
+            valid_until = request.POST.get('valid_until') or None
+            is_active = 'is_active' in request.POST
+            
+            if discount_id and discount_type and amount and reason:
+                try:
+                    discount = FeeDiscount.objects.get(id=discount_id)
+                    discount.discount_type = discount_type
+                    discount.amount = amount
+                    discount.percentage = percentage
+                    discount.reason = reason
+                    discount.valid_until = valid_until
+                    discount.is_active = is_active
+                    discount.save()
+                except FeeDiscount.DoesNotExist:
+                    pass
+                return redirect('dashboard:fees_discounts_list')
+        
+        elif 'delete' in request.POST:
+            discount_id = request.POST.get('discount_id')
+            if discount_id:
+                try:
+                    FeeDiscount.objects.get(id=discount_id).delete()
+                except FeeDiscount.DoesNotExist:
+                    pass
+                return redirect('dashboard:fees_discounts_list')
+    
+    # Get available student fees for creating new discounts
+    available_student_fees = StudentFee.objects.filter(status__in=OPEN_STATUSES).select_related('student')
+    
+    context = {
+        'discounts': discounts,
+        'available_student_fees': available_student_fees,
+        'discount_type_choices': FeeDiscount.DISCOUNT_TYPE_CHOICES,
+    }
+    
+    return render(request, 'dashboard/fees/discounts_list.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def fees_receipts_list(request):
+    """List all fee receipts"""
+    receipts = FeeReceipt.objects.all().select_related(
+        'student_fee__student', 'payment', 'generated_by'
+    ).order_by('-generated_date')
+    
+    # Filtering
+    printed_filter = request.GET.get('printed')
+    date_from = request.GET.get('date_from')
+    date_to = request.GET.get('date_to')
+    search_query = request.GET.get('search')
+    
+    if printed_filter is not None:
+        receipts = receipts.filter(is_printed=printed_filter == 'true')
+    
+    if date_from:
+        receipts = receipts.filter(generated_date__date__gte=date_from)
+    
+    if date_to:
+        receipts = receipts.filter(generated_date__date__lte=date_to)
+    
+    if search_query:
+        receipts = receipts.filter(
+            Q(receipt_number__icontains=search_query) |
+            Q(student_fee__student__roll_number__icontains=search_query) |
+            Q(student_fee__student__first_name__icontains=search_query)
+        )
+    
+    context = {
+        'receipts': receipts,
+        'current_filters': {
+            'printed': printed_filter,
+            'date_from': date_from,
+            'date_to': date_to,
+            'search': search_query,
+        }
+    }
+    
+    return render(request, 'dashboard/fees/receipts_list.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def fees_receipt_detail(request, receipt_id):
+    """Show detailed information about a receipt"""
+    receipt = get_object_or_404(FeeReceipt, pk=receipt_id)
+    
+    context = {
+        'receipt': receipt,
+    }
+    
+    return render(request, 'dashboard/fees/receipt_detail.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def fees_reports(request):
+    """Fee management reports and analytics"""
+    
+    # Date range filtering
+    date_from = request.GET.get('date_from', (timezone.now() - timezone.timedelta(days=30)).strftime('%Y-%m-%d'))
+    date_to = request.GET.get('date_to', timezone.now().strftime('%Y-%m-%d'))
+    
+    # Convert to date objects
+    try:
+        from_date = timezone.datetime.strptime(date_from, '%Y-%m-%d').date()
+        to_date = timezone.datetime.strptime(date_to, '%Y-%m-%d').date()
+    except ValueError:
+        from_date = (timezone.now() - timezone.timedelta(days=30)).date()
+        to_date = timezone.now().date()
+    
+    # Payment reports, from the daily payment rollups
+    payments_in_range = payment_totals(from_date, to_date)
+    total_payments_amount = payments_in_range['amount']
+    total_payments_count = payments_in_range['count']
+    payment_method_breakdown = payment_breakdown('payment_method', from_date, to_date)
+    daily_payments = payment_breakdown('date', from_date, to_date)
+    
+    # Fee category and academic year performance for fees falling due in the range
+    fee_category_performance = fee_breakdown('category', from_date, to_date)
+    academic_year_performance = fee_breakdown('academic_year', from_date, to_date)
+    
+    # Overdue fees report
+    overdue_fees = StudentFee.objects.filter(
+        status='OVERDUE'
+    ).select_related('student', 'fee_structure_detail__fee_category')
+    
+    overdue_amount = fee_overview()['overdue_amount']
+    
+    # Waiver and discount reports, bounded on created_at itself so its index applies
+    range_start = timezone.make_aware(timezone.datetime.combine(from_date, timezone.datetime.min.time()))
+    range_end = range_start + timezone.timedelta(days=(to_date - from_date).days + 1)
+    totals = {
+        model: model.objects.filter(
+            created_at__gte=range_start, created_at__lt=range_end, is_active=True
+        ).aggregate(total=models.Sum('amount'))['total'] or 0
+        for model in (FeeWaiver, FeeDiscount)
+    }
+    total_waiver_amount = totals[FeeWaiver]
+    total_discount_amount = totals[FeeDiscount]
+    
+    context = {
+        'date_from': date_from,
+        'date_to': date_to,
+        'total_payments_amount': total_payments_amount,
+        'total_payments_count': total_payments_count,
+        'payment_method_breakdown': payment_method_breakdown,
+        'daily_payments': daily_payments,
+        'fee_category_performance': fee_category_performance,
+        'academic_year_performance': academic_year_performance,
+        'overdue_fees': overdue_fees,
+        'overdue_amount': overdue_amount,
+        'total_waiver_amount': total_waiver_amount,
+        'total_discount_amount': total_discount_amount,
+    }
+    
+    return render(request, 'dashboard/fees/reports.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def fees_api_endpoints(request):
+    """Show available fee management API endpoints"""
+    
+    context = {
+        'app_name': 'Fee Management',
+        'base_url': '/api/v1/fees/api/',
+        'endpoints': [
+            {
+                'name': 'Fee Categories',
+                'url': 'categories/',
+                'methods': ['GET', 'POST'],
+                'description': 'Manage fee categories (Tuition, Library, Sports, etc.)'
+            },
+            {
+                'name': 'Fee Structures',
+                'url': 'structures/',
+                'methods': ['GET', 'POST'],
+                'description': 'Manage fee structures for different academic years and grades'
+            },
+            {
+                'name': 'Fee Structure Details',
+                'url': 'structure-details/',
+                'methods': ['GET', 'POST'],
+                'description': 'Manage individual fee items within structures'
+            },
+            {
+                'name': 'Student Fees',
+                'url': 'student-fees/',
+                'methods': ['GET', 'POST'],
+                'description': 'Manage individual student fee records'
+            },
+            {
+                'name': 'Payments',
+                'url': 'payments/',
+                'methods': ['GET', 'POST'],
+                'description': 'Manage fee payments and transactions'
+            },
+            {
+                'name': 'Fee Waivers',
+                'url': 'waivers/',
+                'methods': ['GET', 'POST'],
+                'description': 'Manage fee waivers and scholarships'
+            },
+            {
+                'name': 'Fee Discounts',
+                'url': 'discounts/',
+                'methods': ['GET', 'POST'],
+                'description': 'Manage fee discounts and reductions'
+            },
+            {
+                'name': 'Fee Receipts',
+                'url': 'receipts/',
+                'methods': ['GET', 'POST'],
+                'description': 'Manage fee receipts and documentation'
+            },
+        ]
+    }
+    
+    return render(request, 'dashboard/fees/api_endpoints.html', context)
@@ -0,0 +1,169 @@
+"""Grades, results and transcript dashboard pages."""
+from django.shortcuts import render, get_object_or_404
+from django.contrib.auth.decorators import login_required, user_passes_test
+from django.http import JsonResponse
+from students.models import Student
+from departments.models import Department
+from academics.models import AcademicProgram
+from django.http import HttpResponse
+from academics.models import Course, CourseSection
+from grads.models import GradeScale, Term, CourseResult, GraduateRecord
+from grads.transcripts import TranscriptService
+from .common import is_admin
+
+
+# ---------------------
+# Grads & Marks Dashboard
+# ---------------------
+
+@login_required
+@user_passes_test(is_admin)
+def grads_dashboard(request):
+    context = {
+        'grade_scales_count': GradeScale.objects.count(),
+        'terms_count': Term.objects.count(),
+        'results_count': CourseResult.objects.count(),
+        'students_with_records': GraduateRecord.objects.count(),
+    }
+    return render(request, 'dashboard/grads/dashboard.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def grads_grade_scales(request):
+    items = GradeScale.objects.order_by('-grade_points')
+    departments = Department.objects.order_by('code')
+    programs = AcademicProgram.objects.order_by('code')
+    return render(request, 'dashboard/grads/grade_scales.html', {
+        'items': items,
+        'departments': departments,
+        'programs': programs,
+    })
+
+
+@login_required
+@user_passes_test(is_admin)
+def grads_terms(request):
+    terms = Term.objects.order_by('-academic_year', 'semester')
+    return render(request, 'dashboard/grads/terms.html', {'terms': terms})
+
+
+@login_required
+@user_passes_test(is_admin)
+def grads_results(request):
+    student_id = request.GET.get('student')
+    term_id = request.GET.get('term')
+    dept_code = request.GET.get('department')
+    course_id = request.GET.get('course')
+    year = request.GET.get('year')
+    section = request.GET.get('section')
+    results = CourseResult.objects.select_related('student', 'term', 'course_section', 'course_section__course')
+    if student_id:
+        results = results.filter(student_id=student_id)
+    if term_id:
+        results = results.filter(term_id=term_id)
+    if dept_code:
+        results = results.filter(course_section__course__department__code__iexact=dept_code)
+    if course_id:
+        results = results.filter(course_section__course_id=course_id)
+    if year:
+        results = results.filter(course_section__academic_year=year)
+    if section:
+        results = results.filter(course_section__section_number__iexact=section)
+    results = results.order_by('-evaluated_at')[:500]
+    # Build filter option lists
+    years = CourseSection.objects.values_list('academic_year', flat=True).distinct().order_by('-academic_year')
+    sections = CourseSection.objects.values_list('section_number', flat=True).distinct().order_by('section_number')
+    courses = Course.objects.order_by('code')[:500]
+    students_qs = Student.objects.order_by('roll_number')[:500]
+    course_sections = CourseSection.objects.select_related('course').order_by('course__code', 'section_number')[:500]
+    return render(request, 'dashboard/grads/results.html', {
+        'results': results,
+        'terms': Term.objects.all().order_by('-academic_year'),
+        'years': years,
+        'sections': sections,
+        'courses': courses,
+        'students_list': students_qs,
+        'course_sections': course_sections,
+    })
+
+
+@login_required
+@user_passes_test(is_admin)
+def grads_bulk_entry(request):
+    terms = Term.objects.all().order_by('-academic_year')
+    years = CourseSection.objects.values_list('academic_year', flat=True).distinct().order_by('-academic_year')
+    sections = CourseSection.objects.values_list('section_number', flat=True).distinct().order_by('section_number')
+    courses = Course.objects.order_by('code')[:500]
+    students_qs = Student.objects.order_by('roll_number')[:500]
+    return render(request, 'dashboard/grads/bulk_entry.html', {
+        'terms': terms,
+        'years': years,
+        'sections': sections,
+        'courses': courses,
+        'students_list': students_qs,
+    })
+
+
+@login_required
+@user_passes_test(is_admin)
+def grads_sections_api(request):
+    year = request.GET.get('year')
+    course_id = request.GET.get('course')
+    qs = CourseSection.objects.all()
+    if year:
+        qs = qs.filter(academic_year=year)
+    if course_id:
+        qs = qs.filter(course_id=course_id)
+    data = [
+        {
+            'id': s.id,
+            'section_number': s.section_number,
+            'faculty': getattr(s.faculty, 'name', ''),
+            'semester': s.semester,
+        } for s in qs.order_by('section_number')[:200]
+    ]
+    return JsonResponse({'sections': data})
+
+
+@login_required
+@user_passes_test(is_admin)
+def grads_students_api(request):
+    year = request.GET.get('year')
+    section = request.GET.get('section')
+    # Filter students by enrollment history if available else return all
+    students = Student.objects.all()
+    if section:
+        students = students.filter(section=section)
+    if year:
+        students = students.filter(academic_year=year)
+    data = [
+        {
+            'id': s.id,
+            'roll_number': s.roll_number,
+            'full_name': s.full_name,
+        } for s in students.order_by('roll_number')[:500]
+    ]
+    return JsonResponse({'students': data})
+
+
+@login_required
+@user_passes_test(is_admin)
+def grads_transcript(request, student_id):
+    student = get_object_or_404(Student, id=student_id)
+    grad = GraduateRecord.objects.filter(student=student).first()
+    context = {
+        'student': student,
+        'grad': grad,
+        'terms': TranscriptService().terms_for_display(student),
+    }
+    return render(request, 'dashboard/grads/transcript.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def grads_transcript_pdf(request, student_id):
+    student = get_object_or_404(Student, id=student_id)
+    response = HttpResponse(TranscriptService(workers=1).render(student), content_type='application/pdf')
+    response['Content-Disposition'] = f'attachment; filename="transcript_{student.roll_number}.pdf"'
+    return response
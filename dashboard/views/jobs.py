@@ -0,0 +1,91 @@
+"""Background job pages."""
+from django.shortcuts import render, get_object_or_404, redirect
+from django.contrib.auth.decorators import login_required, user_passes_test
+from django.contrib import messages
+from django.core.files.storage import default_storage
+from django.http import FileResponse, Http404, JsonResponse
+import os
+from campshub360.jobs import cancel as cancel_job
+from campshub360.models import BackgroundJob
+from django.urls import reverse
+from .common import is_admin
+
+
+@login_required
+@user_passes_test(is_admin)
+def jobs_list(request):
+    """Background jobs, newest first"""
+    jobs = BackgroundJob.objects.select_related('requested_by').order_by('-created_at')
+    status = request.GET.get('status')
+    if status:
+        jobs = jobs.filter(status=status)
+    return render(request, 'dashboard/jobs/list.html', {
+        'jobs': jobs[:100],
+        'status': status,
+        'status_choices': BackgroundJob.STATUS_CHOICES,
+    })
+
+
+@login_required
+@user_passes_test(is_admin)
+def job_detail(request, job_id):
+    """One background job; the page polls ``job_status`` until the job finishes"""
+    job = get_object_or_404(BackgroundJob, pk=job_id)
+    return render(request, 'dashboard/jobs/detail.html', {'job': job})
+
+
+def _job_payload(job):
+    return {
+        'id': str(job.pk),
+        'task': job.task,
+        'label': job.label,
+        'status': job.status,
+        'finished': job.is_finished,
+        'progress': job.progress,
+        'progress_done': job.progress_done,
+        'progress_total': job.progress_total,
+        'message': job.message,
+        'result': job.result,
+        'error': job.error,
+        'cancel_requested': job.cancel_requested,
+        'artifacts': [
+            {
+                'name': os.path.basename(path),
+                'url': reverse('dashboard:job_artifact', kwargs={'job_id': job.pk, 'index': index}),
+            }
+            for index, path in enumerate(job.artifacts)
+        ],
+    }
+
+
+@login_required
+@user_passes_test(is_admin)
+def job_status(request, job_id):
+    """JSON status of a background job, polled by the dashboard pages"""
+    job = get_object_or_404(BackgroundJob, pk=job_id)
+    return JsonResponse(_job_payload(job))
+
+
+@login_required
+@user_passes_test(is_admin)
+def job_cancel(request, job_id):
+    """Cancel a background job (POST)"""
+    job = get_object_or_404(BackgroundJob, pk=job_id)
+    if request.method == 'POST':
+        job = cancel_job(job)
+        messages.info(request, 'Cancellation requested.' if job.status == 'RUNNING' else 'Job cancelled.')
+    return redirect('dashboard:job_detail', job_id=job.pk)
+
+
+@login_required
+def job_artifact(request, job_id, index):
+    """Download one file produced by a job (the requester's own jobs, or any job for staff)"""
+    jobs = BackgroundJob.objects.all()
+    if not request.user.is_staff:
+        jobs = jobs.filter(requested_by=request.user)
+    job = get_object_or_404(jobs, pk=job_id)
+    try:
+        path = job.artifacts[index]
+    except IndexError:
+        raise Http404("No such artifact")
+    return FileResponse(default_storage.open(path, 'rb'), as_attachment=True, filename=os.path.basename(path))
@@ -0,0 +1,57 @@
+"""Mentoring dashboard pages."""
+from django.shortcuts import render
+from django.contrib.auth.decorators import login_required, user_passes_test
+from django.utils import timezone
+from mentoring.models import Mentorship, Project, Meeting, Feedback
+from .common import is_admin
+
+
+# -----------------
+# Mentoring Dashboard
+# -----------------
+
+@login_required
+@user_passes_test(is_admin)
+def mentoring_dashboard(request):
+    total_mentorships = Mentorship.objects.count()
+    active_mentorships = Mentorship.objects.filter(is_active=True).count()
+    total_projects = Project.objects.count()
+    upcoming_meetings = Meeting.objects.filter(scheduled_at__gte=timezone.now()).order_by('scheduled_at')[:10]
+    recent_feedback = Feedback.objects.order_by('-created_at')[:10]
+
+    context = {
+        'total_mentorships': total_mentorships,
+        'active_mentorships': active_mentorships,
+        'total_projects': total_projects,
+        'upcoming_meetings': upcoming_meetings,
+        'recent_feedback': recent_feedback,
+    }
+    return render(request, 'dashboard/mentoring/dashboard.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def mentoring_mentorships(request):
+    mentorships = Mentorship.objects.select_related('mentor', 'student').all()[:200]
+    return render(request, 'dashboard/mentoring/mentorships.html', {'mentorships': mentorships})
+
+
+@login_required
+@user_passes_test(is_admin)
+def mentoring_projects(request):
+    projects = Project.objects.select_related('mentorship').all()[:200]
+    return render(request, 'dashboard/mentoring/projects.html', {'projects': projects})
+
+
+@login_required
+@user_passes_test(is_admin)
+def mentoring_meetings(request):
+    meetings = Meeting.objects.select_related('mentorship').order_by('-scheduled_at')[:200]
+    return render(request, 'dashboard/mentoring/meetings.html', {'meetings': meetings})
+
+
+@login_required
+@user_passes_test(is_admin)
+def mentoring_feedback(request):
+    feedback = Feedback.objects.select_related('mentorship', 'project', 'meeting').order_by('-created_at')[:200]
+    return render(request, 'dashboard/mentoring/feedback.html', {'feedback': feedback})
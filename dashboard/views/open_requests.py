@@ -0,0 +1,45 @@
+"""Open request pages."""
+from django.core.paginator import Paginator
+from django.shortcuts import render, get_object_or_404, redirect
+from django.contrib.auth.decorators import login_required
+try:
+    from open_requests.models import OpenRequest, RequestTarget
+except Exception:
+    OpenRequest = RequestTarget = None
+
+
+# ------------------------------
+# Open Requests (UI)
+# ------------------------------
+
+@login_required
+def open_requests_list(request):
+    if OpenRequest is None:
+        return redirect('dashboard:home')
+    queryset = OpenRequest.objects.select_related('created_by', 'assignee').all()
+    paginator = Paginator(queryset, 20)
+    page = request.GET.get('page')
+    items = paginator.get_page(page)
+    return render(request, 'dashboard/open_requests/list.html', {'items': items})
+
+
+@login_required
+def open_request_create(request):
+    if OpenRequest is None:
+        return redirect('dashboard:home')
+    if request.method == 'POST':
+        OpenRequest.objects.create(
+            title=request.POST.get('title',''),
+            description=request.POST.get('description',''),
+            created_by=request.user,
+        )
+        return redirect('dashboard:open_requests_list')
+    return render(request, 'dashboard/open_requests/create.html')
+
+
+@login_required
+def open_request_detail(request, request_id):
+    if OpenRequest is None:
+        return redirect('dashboard:home')
+    item = get_object_or_404(OpenRequest, id=request_id)
+    return render(request, 'dashboard/open_requests/detail.html', {'item': item})
@@ -0,0 +1,221 @@
+"""Placements dashboard pages."""
+from django.shortcuts import render
+from django.contrib.auth.decorators import login_required, user_passes_test
+from django.db.models import Q
+from .common import is_admin
+
+
+# ------------------------------
+# Placements Dashboard Views
+# ------------------------------
+@login_required
+@user_passes_test(is_admin)
+def placements_dashboard(request):
+    """Placements overview page."""
+    from placements.models import Company, JobPosting, Application, PlacementDrive, InterviewRound, Offer
+    context = {
+        'companies_count': Company.objects.count(),
+        'jobs_count': JobPosting.objects.count(),
+        'applications_count': Application.objects.count(),
+        'drives_count': PlacementDrive.objects.count(),
+        'rounds_count': InterviewRound.objects.count(),
+        'offers_count': Offer.objects.count(),
+    }
+    return render(request, 'dashboard/placements/dashboard.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def placements_companies(request):
+    """List and create companies."""
+    from placements.models import Company
+    if request.method == 'POST':
+        name = request.POST.get('name', '').strip()
+        website = request.POST.get('website', '').strip() or None
+        industry = request.POST.get('industry', '').strip()
+        description = request.POST.get('description', '').strip()
+        headquarters = request.POST.get('headquarters', '').strip()
+        contact_email = request.POST.get('contact_email', '').strip() or None
+        contact_phone = request.POST.get('contact_phone', '').strip()
+        if name:
+            Company.objects.create(
+                name=name,
+                website=website,
+                industry=industry,
+                description=description,
+                headquarters=headquarters,
+                contact_email=contact_email,
+                contact_phone=contact_phone,
+            )
+    search = request.GET.get('search', '').strip()
+    companies = Company.objects.all()
+    if search:
+        companies = companies.filter(Q(name__icontains=search) | Q(industry__icontains=search))
+    companies = companies.order_by('name')
+    context = {'companies': companies}
+    return render(request, 'dashboard/placements/companies.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def placements_jobs(request):
+    """List and create job postings."""
+    from placements.models import Company, JobPosting, JobType, WorkMode
+    if request.method == 'POST':
+        company_id = request.POST.get('company_id')
+        title = request.POST.get('title', '').strip()
+        description = request.POST.get('description', '').strip()
+        location = request.POST.get('location', '').strip()
+        work_mode = request.POST.get('work_mode') or WorkMode.ONSITE
+        job_type = request.POST.get('job_type') or JobType.INTERNSHIP
+        is_active = request.POST.get('is_active') == 'on'
+        if title and company_id:
+            try:
+                company = Company.objects.get(id=company_id)
+                JobPosting.objects.create(
+                    company=company,
+                    title=title,
+                    description=description,
+                    location=location,
+                    work_mode=work_mode,
+                    job_type=job_type,
+                    is_active=is_active,
+                    posted_by=request.user,
+                )
+            except Company.DoesNotExist:
+                pass
+    jobs = (
+        JobPosting.objects.select_related('company')
+        .all()
+        .order_by('-created_at')
+    )
+    companies = Company.objects.order_by('name')
+    context = {
+        'jobs': jobs,
+        'companies': companies,
+        'job_types': [(c.value, c.label) for c in JobType],
+        'work_modes': [(c.value, c.label) for c in WorkMode],
+    }
+    return render(request, 'dashboard/placements/jobs.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def placements_applications(request):
+    """List applications with simple filters."""
+    from placements.models import Application, ApplicationStatus
+    status = request.GET.get('status', '').strip()
+    qs = Application.objects.select_related('student', 'job', 'job__company').all()
+    if status:
+        qs = qs.filter(status=status)
+    applications = qs.order_by('-applied_at')
+    context = {
+        'applications': applications,
+        'status_choices': [(c.value, c.label) for c in ApplicationStatus],
+    }
+    return render(request, 'dashboard/placements/applications.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def placements_drives(request):
+    """List and simple create for placement drives."""
+    from placements.models import PlacementDrive, Company
+    if request.method == 'POST':
+        title = request.POST.get('title', '').strip()
+        company_name = request.POST.get('company', '').strip()
+        drive_type = request.POST.get('drive_type') or 'CAMPUS'
+        start_date = request.POST.get('start_date')
+        end_date = request.POST.get('end_date') or None
+        description = request.POST.get('description', '').strip()
+        if title and company_name and start_date:
+            company = Company.objects.filter(name__iexact=company_name).first()
+            if company:
+                PlacementDrive.objects.create(
+                    company=company,
+                    title=title,
+                    description=description,
+                    drive_type=drive_type,
+                    start_date=start_date,
+                    end_date=end_date or None,
+                    created_by=request.user,
+                )
+    drives = PlacementDrive.objects.select_related('company').all().order_by('-start_date')
+    companies = Company.objects.order_by('name')
+    context = {
+        'drives': drives,
+        'companies': companies,
+    }
+    return render(request, 'dashboard/placements/drives.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def placements_rounds(request):
+    """List and create interview rounds linked to a drive."""
+    from placements.models import InterviewRound, PlacementDrive, InterviewRoundType
+    if request.method == 'POST':
+        drive_id = request.POST.get('drive_id')
+        name = request.POST.get('name', '').strip()
+        round_type = request.POST.get('round_type') or InterviewRoundType.OTHER
+        scheduled_at = request.POST.get('scheduled_at') or None
+        location = request.POST.get('location', '').strip()
+        instructions = request.POST.get('instructions', '').strip()
+        if drive_id and name:
+            try:
+                drive = PlacementDrive.objects.get(id=drive_id)
+                InterviewRound.objects.create(
+                    drive=drive,
+                    name=name,
+                    round_type=round_type,
+                    scheduled_at=scheduled_at or None,
+                    location=location,
+                    instructions=instructions,
+                )
+            except PlacementDrive.DoesNotExist:
+                pass
+    rounds = InterviewRound.objects.select_related('drive').all().order_by('-scheduled_at')
+    drives = PlacementDrive.objects.order_by('-start_date')
+    context = {
+        'rounds': rounds,
+        'drives': drives,
+        'round_types': [(c.value, c.label) for c in InterviewRoundType],
+    }
+    return render(request, 'dashboard/placements/rounds.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def placements_offers(request):
+    """List and create offers for applications."""
+    from placements.models import Offer, Application, OfferStatus
+    if request.method == 'POST':
+        application_id = request.POST.get('application_id')
+        offered_role = request.POST.get('offered_role', '').strip()
+        package_annual_ctc = request.POST.get('package_annual_ctc')
+        joining_location = request.POST.get('joining_location', '').strip()
+        joining_date = request.POST.get('joining_date') or None
+        status = request.POST.get('status') or OfferStatus.PENDING
+        if application_id and offered_role and package_annual_ctc:
+            try:
+                application = Application.objects.get(id=application_id)
+                Offer.objects.update_or_create(
+                    application=application,
+                    defaults={
+                        'offered_role': offered_role,
+                        'package_annual_ctc': package_annual_ctc,
+                        'joining_location': joining_location,
+                        'joining_date': joining_date or None,
+                        'status': status,
+                    }
+                )
+            except Application.DoesNotExist:
+                pass
+    offers = Offer.objects.select_related('application', 'application__student', 'application__job', 'application__job__company').all().order_by('-offered_at')
+    applications = Application.objects.select_related('student', 'job', 'job__company').all().order_by('-applied_at')
+    context = {
+        'offers': offers,
+        'applications': applications,
+        'status_choices': [(c.value, c.label) for c in OfferStatus],
+    }
+    return render(request, 'dashboard/placements/offers.html', context)
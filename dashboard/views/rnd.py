@@ -0,0 +1,131 @@
+"""Research and development dashboard pages."""
+from django.shortcuts import render, get_object_or_404
+from django.contrib.auth.decorators import login_required, user_passes_test
+from django.db.models import Q
+from rnd.models import (
+    Researcher as RndResearcher,
+    Grant as RndGrant,
+    Project as RndProject,
+    Publication as RndPublication,
+    Patent as RndPatent,
+    Dataset as RndDataset,
+    Collaboration as RndCollaboration,
+)
+from .common import is_admin
+
+
+# ------------------------------
+# R&D (Research & Development)
+# ------------------------------
+
+@login_required
+@user_passes_test(is_admin)
+def rnd_dashboard(request):
+    context = {
+        'projects_count': RndProject.objects.count(),
+        'publications_count': RndPublication.objects.count(),
+        'grants_count': RndGrant.objects.count(),
+        'researchers_count': RndResearcher.objects.count(),
+        'datasets_count': RndDataset.objects.count(),
+        'patents_count': RndPatent.objects.count(),
+        'recent_projects': RndProject.objects.order_by('-start_date')[:10],
+        'recent_publications': RndPublication.objects.order_by('-year')[:10],
+    }
+    return render(request, 'dashboard/rnd/dashboard.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def rnd_projects(request):
+    search = request.GET.get('search', '')
+    status = request.GET.get('status', '')
+    qs = RndProject.objects.select_related('principal_investigator').prefetch_related('members')
+    if search:
+        qs = qs.filter(Q(title__icontains=search) | Q(abstract__icontains=search))
+    if status:
+        qs = qs.filter(status=status)
+    projects = qs.order_by('-start_date')[:500]
+    return render(request, 'dashboard/rnd/projects.html', {
+        'projects': projects,
+        'status_filter': status,
+        'search': search,
+    })
+
+
+@login_required
+@user_passes_test(is_admin)
+def rnd_project_detail(request, project_id: int):
+    project = get_object_or_404(RndProject.objects.select_related('principal_investigator').prefetch_related('members', 'grants', 'publications', 'datasets', 'patents', 'collaborations'), id=project_id)
+    return render(request, 'dashboard/rnd/project_detail.html', {
+        'project': project,
+    })
+
+
+@login_required
+@user_passes_test(is_admin)
+def rnd_researchers(request):
+    search = request.GET.get('search', '')
+    dept = request.GET.get('department', '')
+    qs = RndResearcher.objects.select_related('user')
+    if search:
+        qs = qs.filter(Q(user__first_name__icontains=search) | Q(user__last_name__icontains=search) | Q(user__username__icontains=search) | Q(department__icontains=search))
+    if dept:
+        qs = qs.filter(department__icontains=dept)
+    researchers = qs.order_by('user__last_name', 'user__first_name')[:500]
+    return render(request, 'dashboard/rnd/researchers.html', {
+        'researchers': researchers,
+        'search': search,
+        'department': dept,
+    })
+
+
+@login_required
+@user_passes_test(is_admin)
+def rnd_researcher_detail(request, researcher_id: int):
+    researcher = get_object_or_404(RndResearcher.objects.select_related('user'), id=researcher_id)
+    led_projects = RndProject.objects.filter(principal_investigator=researcher).order_by('-start_date')
+    member_projects = RndProject.objects.filter(members=researcher).exclude(principal_investigator=researcher).order_by('-start_date')
+    publications = RndPublication.objects.filter(authors=researcher).order_by('-year')
+    patents = RndPatent.objects.filter(inventors=researcher).order_by('-grant_date')
+    return render(request, 'dashboard/rnd/researcher_detail.html', {
+        'researcher': researcher,
+        'led_projects': led_projects,
+        'member_projects': member_projects,
+        'publications': publications,
+        'patents': patents,
+    })
+
+
+@login_required
+@user_passes_test(is_admin)
+def rnd_grants(request):
+    grants = RndGrant.objects.order_by('-start_date')[:500]
+    return render(request, 'dashboard/rnd/grants.html', {'grants': grants})
+
+
+@login_required
+@user_passes_test(is_admin)
+def rnd_publications(request):
+    pubs = RndPublication.objects.order_by('-year', 'title')[:500]
+    return render(request, 'dashboard/rnd/publications.html', {'publications': pubs})
+
+
+@login_required
+@user_passes_test(is_admin)
+def rnd_patents(request):
+    items = RndPatent.objects.order_by('-grant_date', '-filing_date')[:500]
+    return render(request, 'dashboard/rnd/patents.html', {'patents': items})
+
+
+@login_required
+@user_passes_test(is_admin)
+def rnd_datasets(request):
+    items = RndDataset.objects.order_by('name')[:500]
+    return render(request, 'dashboard/rnd/datasets.html', {'datasets': items})
+
+
+@login_required
+@user_passes_test(is_admin)
+def rnd_collaborations(request):
+    items = RndCollaboration.objects.select_related('project').order_by('-start_date')[:500]
+    return render(request, 'dashboard/rnd/collaborations.html', {'collaborations': items})
@@ -0,0 +1,147 @@
+"""Database schema pages, exports and the ER diagram."""
+from django.shortcuts import render, redirect
+from django.contrib.auth.decorators import login_required, user_passes_test
+from rest_framework.decorators import api_view, authentication_classes, permission_classes
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from django.http import HttpResponse, StreamingHttpResponse
+import csv
+import itertools
+from campshub360.jobs import submit
+from ..introspection import column_rows, get_schema, mermaid_er_diagram
+from ..table_browser import DEFAULT_PAGE_SIZE, TableBrowserError, browse
+from .common import DASHBOARD_API_AUTHENTICATION, is_admin
+
+
+@login_required
+@user_passes_test(is_admin)
+def database_schema(request):
+    """Database schema overview"""
+    schema_info = []
+    for table, info in sorted(get_schema()['tables'].items()):
+        primary_key = set(info['primary_key'])
+        schema_info.append({
+            'table': table,
+            'columns': [{**column, 'primary_key': column['name'] in primary_key} for column in info['columns']],
+            'indexes': info['indexes'],
+            'constraints': info['constraints'],
+        })
+    return render(request, 'dashboard/schema.html', {'schema_info': schema_info})
+
+
+# API Endpoints for dashboard data
+@api_view(['GET'])
+@authentication_classes(DASHBOARD_API_AUTHENTICATION)
+@permission_classes([IsAdminUser])
+def api_database_schema(request):
+    """API endpoint to get database schema information"""
+    schema_data = {
+        table: [
+            {
+                'name': column['name'],
+                'type': column['type'],
+                'not_null': not column['nullable'],
+                'default': column['default'],
+                'max_length': column['max_length'],
+            }
+            for column in info['columns']
+        ]
+        for table, info in sorted(get_schema()['tables'].items())
+    }
+    return Response(schema_data)
+
+
+@login_required
+@user_passes_test(is_admin)
+def download_schema_excel(request):
+    """Queue an Excel export of the database schema with one sheet per table."""
+    job = submit('dashboard.schema_excel', user=request.user, label='Database schema (Excel)')
+    return redirect('dashboard:job_detail', job_id=job.pk)
+
+
+@login_required
+@user_passes_test(is_admin)
+def download_schema_excel_single(request):
+    """Queue a single-sheet Excel export of the database schema consolidating all tables."""
+    job = submit('dashboard.schema_excel_single', user=request.user, label='Database schema (single-sheet Excel)')
+    return redirect('dashboard:job_detail', job_id=job.pk)
+
+
+class _Echo:
+    """File-like object whose ``write`` hands the CSV line back to the generator."""
+
+    def write(self, value):
+        return value
+
+
+@login_required
+@user_passes_test(is_admin)
+def download_schema_csv(request):
+    """Download database schema as CSV with all tables consolidated."""
+    try:
+        schema = get_schema()
+    except Exception as e:
+        return HttpResponse(f"Error generating CSV: {e}", status=500)
+
+    writer = csv.writer(_Echo())
+    header = ["table", "column", "type", "not_null", "default", "max_length"]
+    response = StreamingHttpResponse(
+        (writer.writerow(row) for row in itertools.chain([header], column_rows(schema))), content_type='text/csv'
+    )
+    response['Content-Disposition'] = 'attachment; filename="database_schema.csv"'
+    return response
+
+
+@api_view(['GET'])
+@authentication_classes(DASHBOARD_API_AUTHENTICATION)
+@permission_classes([IsAdminUser])
+def api_table_data(request, table_name):
+    """One page of any table.
+
+    Query parameters: ``columns`` (comma separated, default all), ``limit``
+    (default 100, at most 1000) and ``cursor`` (the ``next_cursor`` of the
+    previous page).
+    """
+    columns = [name.strip() for name in request.GET.get('columns', '').split(',') if name.strip()]
+    try:
+        limit = int(request.GET.get('limit', DEFAULT_PAGE_SIZE))
+    except ValueError:
+        return Response({'error': 'limit must be an integer'}, status=400)
+    try:
+        page = browse(table_name, columns=columns, cursor=request.GET.get('cursor'), limit=limit)
+    except LookupError as e:
+        return Response({'error': str(e)}, status=404)
+    except TableBrowserError as e:
+        return Response({'error': str(e)}, status=400)
+    return Response(page)
+
+
+@login_required
+@user_passes_test(is_admin)
+def er_diagram_page(request):
+    """Render a page that shows the ER diagram using Mermaid."""
+    mermaid = mermaid_er_diagram()
+    return render(request, 'dashboard/er.html', { 'mermaid': mermaid })
+
+
+@api_view(['GET'])
+@authentication_classes(DASHBOARD_API_AUTHENTICATION)
+@permission_classes([IsAdminUser])
+def api_er_diagram(request):
+    """Return Mermaid ER diagram string."""
+    mermaid = mermaid_er_diagram()
+    return Response({ 'mermaid': mermaid })
+
+
+@login_required
+@user_passes_test(is_admin)
+def test_openpyxl(request):
+    """Test endpoint to check openpyxl import."""
+    try:
+        from openpyxl import Workbook
+        wb = Workbook()
+        return HttpResponse("openpyxl works fine!")
+    except ImportError as e:
+        return HttpResponse(f"ImportError: {e}", status=500)
+    except Exception as e:
+        return HttpResponse(f"Other error: {e}", status=500)
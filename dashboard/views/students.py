@@ -0,0 +1,856 @@
+"""Student management, import and division pages."""
+from django.shortcuts import render, redirect
+from django.contrib.auth.decorators import login_required, user_passes_test
+from django.contrib import messages
+from django.http import JsonResponse
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from accounts.models import UserSession
+from students.models import Student, StudentImport
+from departments.models import Department
+from academics.models import AcademicProgram
+from django.http import HttpResponse
+from django.db.models import Q
+import os
+from campshub360.jobs import JobCancelled, submit
+from django.core.files.storage import default_storage
+from django.urls import reverse
+from .common import is_admin
+
+
+# ------------------------------
+# Student Management Views
+# ------------------------------
+@login_required
+@user_passes_test(is_admin)
+def students_list(request):
+    """Students management page"""
+    from students.models import Student
+    
+    # Get filter parameters
+    search = request.GET.get('search', '')
+    status = request.GET.get('status', '')
+    grade = request.GET.get('grade', '')
+    section = request.GET.get('section', '')
+    
+    # Build queryset
+    students = Student.objects.all()
+    
+    if search:
+        students = students.filter(
+            Q(roll_number__icontains=search) |
+            Q(first_name__icontains=search) |
+            Q(last_name__icontains=search) |
+            Q(email__icontains=search) |
+            Q(father_name__icontains=search) |
+            Q(mother_name__icontains=search)
+        )
+    
+    if status:
+        students = students.filter(status=status)
+    
+    if grade:
+        students = students.filter(grade_level=grade)
+    
+    if section:
+        students = students.filter(section=section)
+    
+    students = students.order_by('-created_at')
+    
+    # Get choices for filter
+    from students.models import Student
+    year_choices = Student.YEAR_OF_STUDY_CHOICES
+    semester_choices = Student.SEMESTER_CHOICES
+    
+    context = {
+        'students': students,
+        'year_choices': year_choices,
+        'semester_choices': semester_choices,
+    }
+    return render(request, 'dashboard/students.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def student_detail(request, student_id):
+    """Student detail page"""
+    try:
+        student = Student.objects.get(id=student_id)
+        context = {
+            'student': student,
+            'enrollment_history': student.enrollment_history.all(),
+            'documents': student.documents.all(),
+            'custom_fields': student.custom_field_values.all(),
+        }
+        return render(request, 'dashboard/student_detail.html', context)
+    except Student.DoesNotExist:
+        return render(request, 'dashboard/404.html', status=404)
+
+
+@login_required
+@user_passes_test(is_admin)
+def custom_fields_list(request):
+    """Custom fields management page"""
+    from students.models import CustomField
+    from django.utils import timezone
+    
+    custom_fields = CustomField.objects.all().order_by('order', 'name')
+    
+    # Calculate statistics
+    active_fields_count = custom_fields.filter(is_active=True).count()
+    required_fields_count = custom_fields.filter(required=True).count()
+    field_types_count = custom_fields.values('field_type').distinct().count()
+    
+    context = {
+        'custom_fields': custom_fields,
+        'active_fields_count': active_fields_count,
+        'required_fields_count': required_fields_count,
+        'field_types_count': field_types_count,
+        'now': timezone.now(),
+    }
+    return render(request, 'dashboard/custom_fields.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def student_login_page(request):
+    """Student login page"""
+    return render(request, 'dashboard/student_login.html')
+
+
+@login_required
+@user_passes_test(is_admin)
+def student_sessions(request):
+    """Student login sessions page"""
+    from django.utils import timezone
+    from datetime import timedelta
+    
+    # Get filter parameters
+    search = request.GET.get('search', '')
+    status = request.GET.get('status', '')
+    date_from = request.GET.get('date_from', '')
+    date_to = request.GET.get('date_to', '')
+    
+    # Build queryset
+    sessions = UserSession.objects.filter(user__student_profile__isnull=False)
+    
+    if search:
+        sessions = sessions.filter(
+            Q(user__student_profile__roll_number__icontains=search) |
+            Q(user__student_profile__first_name__icontains=search) |
+            Q(user__student_profile__last_name__icontains=search) |
+            Q(user__email__icontains=search)
+        )
+    
+    if status == 'active':
+        sessions = sessions.filter(revoked=False, expires_at__gt=timezone.now())
+    elif status == 'expired':
+        sessions = sessions.filter(expires_at__lt=timezone.now())
+    elif status == 'revoked':
+        sessions = sessions.filter(revoked=True)
+    
+    if date_from:
+        sessions = sessions.filter(created_at__date__gte=date_from)
+    
+    if date_to:
+        sessions = sessions.filter(created_at__date__lte=date_to)
+    
+    sessions = sessions.order_by('-created_at')
+    
+    # Calculate statistics
+    active_sessions_count = UserSession.objects.filter(
+        user__student_profile__isnull=False,
+        revoked=False,
+        expires_at__gt=timezone.now()
+    ).count()
+    
+    unique_students_count = UserSession.objects.filter(
+        user__student_profile__isnull=False
+    ).values('user').distinct().count()
+    
+    today = timezone.now().date()
+    today_logins_count = UserSession.objects.filter(
+        user__student_profile__isnull=False,
+        created_at__date=today
+    ).count()
+    
+    context = {
+        'sessions': sessions,
+        'active_sessions_count': active_sessions_count,
+        'unique_students_count': unique_students_count,
+        'today_logins_count': today_logins_count,
+        'now': timezone.now(),
+    }
+    return render(request, 'dashboard/student_sessions.html', context)
+
+
+# ------------------------------
+# Student Import Views
+# ------------------------------
+@login_required
+@user_passes_test(is_admin)
+def student_import_page(request):
+    """Student import page"""
+    recent_imports = StudentImport.objects.all()[:10]
+    context = {
+        'recent_imports': recent_imports,
+    }
+    return render(request, 'dashboard/student_import.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def student_import_process(request):
+    """Process student import from Excel/CSV file"""
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'error': 'Invalid request method'})
+    
+    try:
+        file = request.FILES.get('file')
+        if not file:
+            return JsonResponse({'success': False, 'error': 'No file uploaded'})
+        
+        # Validate file type
+        allowed_extensions = ['.xlsx', '.xls', '.csv']
+        file_extension = os.path.splitext(file.name)[1].lower()
+        if file_extension not in allowed_extensions:
+            return JsonResponse({'success': False, 'error': 'Invalid file type. Please upload Excel or CSV file.'})
+        
+        # Get import options
+        skip_errors = request.POST.get('skip_errors') == 'on'
+        create_login = request.POST.get('create_login') == 'on'
+        update_existing = request.POST.get('update_existing') == 'on'
+        
+        # Create import record
+        import_record = StudentImport.objects.create(
+            filename=file.name,
+            file_size=file.size,
+            created_by=request.user,
+            skip_errors=skip_errors,
+            create_login=create_login,
+            update_existing=update_existing,
+            status='PENDING'
+        )
+        
+        # The file is processed by a background worker; the page polls the job
+        path = default_storage.save(f"student_imports/{import_record.pk}{file_extension}", file)
+        job = submit(
+            'students.import',
+            {'import_id': str(import_record.pk), 'path': path},
+            user=request.user,
+            label=f"Student import {file.name}",
+        )
+        return JsonResponse({
+            'success': True,
+            'job_id': str(job.pk),
+            'status_url': reverse('dashboard:job_status', args=[job.pk]),
+        }, status=202)
+        
+    except Exception as e:
+        return JsonResponse({'success': False, 'error': str(e)})
+
+
+@login_required
+@user_passes_test(is_admin)
+def download_template(request):
+    """Download Excel template for student import"""
+    try:
+        import pandas as pd
+        from io import BytesIO
+        
+        # Create sample data
+        sample_data = {
+            'roll_number': ['STU001', 'STU002', 'STU003'],
+            'first_name': ['John', 'Jane', 'Mike'],
+            'last_name': ['Doe', 'Smith', 'Johnson'],
+            'middle_name': ['A', 'B', 'C'],
+            'date_of_birth': ['2010-01-15', '2010-03-20', '2010-06-10'],
+            'gender': ['M', 'F', 'M'],
+            'section': ['A', 'B', 'A'],
+            'academic_year': ['2023-2024', '2023-2024', '2023-2024'],
+            'email': ['john.doe@example.com', 'jane.smith@example.com', 'mike.johnson@example.com'],
+            'student_mobile': ['+1234567890', '+1234567891', '+1234567892'],
+            'quota': ['GENERAL', 'SC', 'OBC'],
+            'rank': ['1', '5', '10'],
+            'status': ['ACTIVE', 'ACTIVE', 'ACTIVE'],
+            'father_name': ['John Doe Sr', 'James Smith', 'Robert Johnson'],
+            'mother_name': ['Mary Doe', 'Sarah Smith', 'Lisa Johnson'],
+            'father_mobile': ['+1234567893', '+1234567894', '+1234567895'],
+            'mother_mobile': ['+1234567896', '+1234567897', '+1234567898'],
+            'address': ['123 Main St', '456 Oak Ave', '789 Pine Rd'],
+            'city': ['New York', 'Los Angeles', 'Chicago'],
+            'state': ['NY', 'CA', 'IL'],
+            'country': ['USA', 'USA', 'USA'],
+            'postal_code': ['10001', '90210', '60601'],
+        }
+        
+        # Create DataFrame
+        df = pd.DataFrame(sample_data)
+        
+        # Create Excel file in memory
+        output = BytesIO()
+        with pd.ExcelWriter(output, engine='openpyxl') as writer:
+            df.to_excel(writer, sheet_name='Students', index=False)
+            
+            # Get the workbook and worksheet
+            workbook = writer.book
+            worksheet = writer.sheets['Students']
+            
+            # Add instructions sheet
+            instructions_data = {
+                'Field': [
+                    'roll_number', 'first_name', 'last_name', 'middle_name', 'date_of_birth', 'gender',
+                    'section', 'academic_year', 'email', 'student_mobile', 'quota', 'rank',
+                    'status', 'father_name', 'mother_name', 'father_mobile', 'mother_mobile', 'address',
+                    'city', 'state', 'country', 'postal_code'
+                ],
+                'Required': [
+                    'Yes', 'Yes', 'Yes', 'No', 'Yes', 'Yes', 'No', 'No', 'No', 'No', 'No', 'No', 'No',
+                    'No', 'No', 'No', 'No', 'No', 'No', 'No', 'No', 'No', 'No'
+                ],
+                'Description': [
+                    'Unique student identifier', 'Student first name', 'Student last name', 'Student middle name',
+                    'Date of birth (YYYY-MM-DD)', 'Gender: M (Male), F (Female), O (Other)',
+                    'Section: A, B, C, D, E', 'Academic year (e.g., 2023-2024)',
+                    'Student email address', 'Student phone number', 'Quota category', 'Academic rank',
+                    'Status: ACTIVE, INACTIVE, GRADUATED', 'Father name', 'Mother name', 'Father phone',
+                    'Mother phone', 'Full address', 'City', 'State', 'Country', 'Postal code'
+                ],
+                'Example': [
+                    'STU001', 'John', 'Doe', 'A', '2010-01-15', 'M', 'A', '2023-2024',
+                    'john.doe@example.com', '+1234567890', 'GENERAL', '1', 'ACTIVE', 'John Doe Sr',
+                    'Mary Doe', '+1234567893', '+1234567896', '123 Main St', 'New York', 'NY', 'USA', '10001'
+                ]
+            }
+            
+            instructions_df = pd.DataFrame(instructions_data)
+            instructions_df.to_excel(writer, sheet_name='Instructions', index=False)
+        
+        output.seek(0)
+        
+        # Create response
+        response = HttpResponse(
+            output.read(),
+            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+        )
+        response['Content-Disposition'] = 'attachment; filename="student_import_template.xlsx"'
+        return response
+        
+    except ImportError:
+        return JsonResponse({'error': 'openpyxl is not installed'}, status=500)
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
+
+
+def process_student_import(file, import_record, skip_errors, create_login, update_existing, progress=None):
+    """Process student import from file; ``progress(done, total)`` is called before each row"""
+    try:
+        import pandas as pd
+        from datetime import datetime
+        
+        # Read file based on extension
+        file_extension = os.path.splitext(file.name)[1].lower()
+        
+        if file_extension == '.csv':
+            df = pd.read_csv(file)
+        else:  # Excel files
+            df = pd.read_excel(file)
+        
+        # Remove empty rows
+        df = df.dropna(how='all')
+        
+        # Initialize counters
+        success_count = 0
+        error_count = 0
+        warning_count = 0
+        errors = []
+        warnings = []
+        
+        # Update import record
+        import_record.total_rows = len(df)
+        import_record.status = 'PROCESSING'
+        import_record.save()
+        
+        # Process each row
+        for position, (index, row) in enumerate(df.iterrows()):
+            if progress is not None:
+                progress(position, len(df))
+            row_number = index + 2  # +2 because Excel is 1-indexed and we have header
+            
+            try:
+                # Validate required fields
+                required_fields = ['roll_number', 'first_name', 'last_name', 'date_of_birth', 'gender']
+                for field in required_fields:
+                    if pd.isna(row.get(field, '')) or str(row[field]).strip() == '':
+                        raise ValueError(f"Required field '{field}' is missing or empty")
+                
+                # Clean and validate data
+                roll_number = str(row['roll_number']).strip()
+                first_name = str(row['first_name']).strip()
+                last_name = str(row['last_name']).strip()
+                date_of_birth = str(row['date_of_birth']).strip()
+                gender = str(row['gender']).strip().upper()
+                
+                # Validate gender
+                if gender not in ['M', 'F', 'O']:
+                    raise ValueError(f"Invalid gender '{gender}'. Must be M, F, or O")
+                
+                # Validate date format
+                try:
+                    datetime.strptime(date_of_birth, '%Y-%m-%d')
+                except ValueError:
+                    raise ValueError(f"Invalid date format '{date_of_birth}'. Use YYYY-MM-DD")
+                
+                # Check if student exists
+                existing_student = None
+                if update_existing:
+                    existing_student = Student.objects.filter(roll_number=roll_number).first()
+                
+                if existing_student:
+                    # Update existing student
+                    student = existing_student
+                    warnings.append({
+                        'row': row_number,
+                        'field': 'roll_number',
+                        'message': f"Student with roll number '{roll_number}' already exists. Updating."
+                    })
+                    warning_count += 1
+                else:
+                    # Create new student
+                    student = Student()
+                
+                # Set basic fields
+                student.roll_number = roll_number
+                student.first_name = first_name
+                student.last_name = last_name
+                student.date_of_birth = date_of_birth
+                student.gender = gender
+                # grade_level removed in schema; ignore if present in file
+                
+                # Set optional fields
+                if not pd.isna(row.get('middle_name', '')):
+                    student.middle_name = str(row['middle_name']).strip()
+                
+                if not pd.isna(row.get('email', '')):
+                    student.email = str(row['email']).strip()
+                
+                if not pd.isna(row.get('student_mobile', '')):
+                    student.student_mobile = str(row['student_mobile']).strip()
+                
+                if not pd.isna(row.get('section', '')):
+                    section = str(row['section']).strip().upper()
+                    if section in ['A', 'B', 'C', 'D', 'E']:
+                        student.section = section
+                
+                if not pd.isna(row.get('academic_year', '')):
+                    student.academic_year = str(row['academic_year']).strip()
+                
+                if not pd.isna(row.get('quota', '')):
+                    quota = str(row['quota']).strip().upper()
+                    if quota in [choice[0] for choice in Student.QUOTA_CHOICES]:
+                        student.quota = quota
+                
+                if not pd.isna(row.get('rank', '')):
+                    try:
+                        student.rank = int(row['rank'])
+                    except (ValueError, TypeError):
+                        pass
+                
+                if not pd.isna(row.get('status', '')):
+                    status = str(row['status']).strip().upper()
+                    if status in [choice[0] for choice in Student.STATUS_CHOICES]:
+                        student.status = status
+                
+                # Set parent information
+                if not pd.isna(row.get('father_name', '')):
+                    student.father_name = str(row['father_name']).strip()
+                
+                if not pd.isna(row.get('mother_name', '')):
+                    student.mother_name = str(row['mother_name']).strip()
+                
+                if not pd.isna(row.get('father_mobile', '')):
+                    student.father_mobile = str(row['father_mobile']).strip()
+                
+                if not pd.isna(row.get('mother_mobile', '')):
+                    student.mother_mobile = str(row['mother_mobile']).strip()
+                
+                # Set address information
+                address_parts = []
+                for field in ['address', 'city', 'state', 'country', 'postal_code']:
+                    if not pd.isna(row.get(field, '')):
+                        address_parts.append(str(row[field]).strip())
+                
+                if address_parts:
+                    student.full_address = ', '.join(address_parts)
+                
+                # Save student
+                student.save()
+
+                # Ensure login/identifiers if requested
+                if create_login:
+                    try:
+                        if student.user:
+                            from accounts.models import AuthIdentifier, IdentifierType
+                            if student.email:
+                                AuthIdentifier.objects.get_or_create(
+                                    user=student.user,
+                                    identifier=student.email,
+                                    id_type=IdentifierType.EMAIL,
+                                    defaults={'is_primary': True}
+                                )
+                            AuthIdentifier.objects.get_or_create(
+                                user=student.user,
+                                identifier=student.roll_number,
+                                id_type=IdentifierType.USERNAME,
+                                defaults={'is_primary': not bool(student.email)}
+                            )
+                    except Exception:
+                        pass
+
+                success_count += 1
+                
+            except Exception as e:
+                error_count += 1
+                errors.append({
+                    'row': row_number,
+                    'field': 'general',
+                    'message': str(e)
+                })
+                
+                if not skip_errors:
+                    break
+        
+        # Update import record
+        import_record.success_count = success_count
+        import_record.error_count = error_count
+        import_record.warning_count = warning_count
+        import_record.errors = errors
+        import_record.warnings = warnings
+        import_record.status = 'COMPLETED'
+        import_record.save()
+        
+        return {
+            'success': True,
+            'success_count': success_count,
+            'error_count': error_count,
+            'warning_count': warning_count,
+            'errors': errors,
+            'warnings': warnings
+        }
+        
+    except JobCancelled:
+        # Rows imported before the cancellation stay imported
+        import_record.success_count = success_count
+        import_record.error_count = error_count
+        import_record.warning_count = warning_count
+        import_record.errors = errors + [{'row': 0, 'field': 'general', 'message': 'Import cancelled'}]
+        import_record.warnings = warnings
+        import_record.status = 'FAILED'
+        import_record.save()
+        raise
+    except Exception as e:
+        import_record.status = 'FAILED'
+        import_record.errors = [{'row': 0, 'field': 'general', 'message': str(e)}]
+        import_record.save()
+        
+        return {
+            'success': False,
+            'error': str(e)
+        }
+
+
+# Student Division Management Views
+@login_required
+@user_passes_test(is_admin)
+def student_divisions(request):
+    """Student division management dashboard"""
+    # Get filter parameters
+    department_id = request.GET.get('department')
+    academic_program_id = request.GET.get('academic_program')
+    academic_year = request.GET.get('academic_year')
+    year_of_study = request.GET.get('year_of_study')
+    semester = request.GET.get('semester')
+    section = request.GET.get('section')
+    
+    # Get all departments and programs for filters
+    departments = Department.objects.filter(is_active=True).order_by('name')
+    programs = AcademicProgram.objects.filter(is_active=True).order_by('name')
+    
+    # Get students with filters
+    students = Student.objects.filter(status='ACTIVE')
+    
+    if department_id:
+        students = students.filter(department_id=department_id)
+    if academic_program_id:
+        students = students.filter(academic_program_id=academic_program_id)
+    if academic_year:
+        students = students.filter(academic_year=academic_year)
+    if year_of_study:
+        students = students.filter(year_of_study=year_of_study)
+    if semester:
+        students = students.filter(semester=semester)
+    if section:
+        students = students.filter(section=section)
+    
+    # Group students by division
+    divisions = {}
+    for student in students:
+        dept_code = student.department.code if student.department else 'No Department'
+        program_code = student.academic_program.code if student.academic_program else 'No Program'
+        
+        if dept_code not in divisions:
+            divisions[dept_code] = {
+                'department': student.department,
+                'programs': {}
+            }
+        
+        if program_code not in divisions[dept_code]['programs']:
+            divisions[dept_code]['programs'][program_code] = {
+                'program': student.academic_program,
+                'years': {}
+            }
+        
+        year_key = f"{student.academic_year or 'No Year'}"
+        if year_key not in divisions[dept_code]['programs'][program_code]['years']:
+            divisions[dept_code]['programs'][program_code]['years'][year_key] = {
+                'academic_year': student.academic_year,
+                'year_of_study': {},
+                'total_students': 0
+            }
+        
+        study_year = student.year_of_study or 'No Year'
+        if study_year not in divisions[dept_code]['programs'][program_code]['years'][year_key]['year_of_study']:
+            divisions[dept_code]['programs'][program_code]['years'][year_key]['year_of_study'][study_year] = {
+                'semesters': {},
+                'total_students': 0
+            }
+        
+        sem = student.semester or 'No Semester'
+        if sem not in divisions[dept_code]['programs'][program_code]['years'][year_key]['year_of_study'][study_year]['semesters']:
+            divisions[dept_code]['programs'][program_code]['years'][year_key]['year_of_study'][study_year]['semesters'][sem] = {
+                'sections': {},
+                'total_students': 0
+            }
+        
+        sec = student.section or 'No Section'
+        if sec not in divisions[dept_code]['programs'][program_code]['years'][year_key]['year_of_study'][study_year]['semesters'][sem]['sections']:
+            divisions[dept_code]['programs'][program_code]['years'][year_key]['year_of_study'][study_year]['semesters'][sem]['sections'][sec] = {
+                'students': [],
+                'count': 0
+            }
+        
+        divisions[dept_code]['programs'][program_code]['years'][year_key]['year_of_study'][study_year]['semesters'][sem]['sections'][sec]['students'].append(student)
+        divisions[dept_code]['programs'][program_code]['years'][year_key]['year_of_study'][study_year]['semesters'][sem]['sections'][sec]['count'] += 1
+        divisions[dept_code]['programs'][program_code]['years'][year_key]['year_of_study'][study_year]['semesters'][sem]['total_students'] += 1
+        divisions[dept_code]['programs'][program_code]['years'][year_key]['year_of_study'][study_year]['total_students'] += 1
+        divisions[dept_code]['programs'][program_code]['years'][year_key]['total_students'] += 1
+    
+    context = {
+        'divisions': divisions,
+        'departments': departments,
+        'programs': programs,
+        'year_choices': Student.YEAR_OF_STUDY_CHOICES,
+        'semester_choices': Student.SEMESTER_CHOICES,
+        'section_choices': Student.SECTION_CHOICES,
+        'filters': {
+            'department_id': department_id,
+            'academic_program_id': academic_program_id,
+            'academic_year': academic_year,
+            'year_of_study': year_of_study,
+            'semester': semester,
+            'section': section,
+        }
+    }
+    
+    return render(request, 'dashboard/student_divisions.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def student_assignments(request):
+    """Student assignment management page"""
+    if request.method == 'POST':
+        # Handle student assignment
+        student_ids = request.POST.getlist('student_ids')
+        department_id = request.POST.get('department_id')
+        academic_program_id = request.POST.get('academic_program_id')
+        academic_year = request.POST.get('academic_year')
+        year_of_study = request.POST.get('year_of_study')
+        semester = request.POST.get('semester')
+        section = request.POST.get('section')
+        
+        try:
+            updated_count = 0
+            for student_id in student_ids:
+                student = Student.objects.get(id=student_id)
+                
+                if department_id:
+                    student.department_id = department_id
+                if academic_program_id:
+                    student.academic_program_id = academic_program_id
+                if academic_year:
+                    student.academic_year = academic_year
+                if year_of_study:
+                    student.year_of_study = year_of_study
+                if semester:
+                    student.semester = semester
+                if section:
+                    student.section = section
+                
+                student.updated_by = request.user
+                student.save()
+                updated_count += 1
+            
+            messages.success(request, f'Successfully updated {updated_count} students.')
+            return redirect('dashboard:student_assignments')
+            
+        except Exception as e:
+            messages.error(request, f'Error updating students: {str(e)}')
+    
+    # Get all departments and programs
+    departments = Department.objects.filter(is_active=True).order_by('name')
+    programs = AcademicProgram.objects.filter(is_active=True).order_by('name')
+    
+    # Get students for assignment
+    students = Student.objects.filter(status='ACTIVE').order_by('roll_number')
+    
+    context = {
+        'students': students,
+        'departments': departments,
+        'programs': programs,
+        'year_choices': Student.YEAR_OF_STUDY_CHOICES,
+        'semester_choices': Student.SEMESTER_CHOICES,
+        'section_choices': Student.SECTION_CHOICES,
+    }
+    
+    return render(request, 'dashboard/student_assignments.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def student_division_statistics(request):
+    """Student division statistics page"""
+    # Get filter parameters
+    department_id = request.GET.get('department')
+    academic_year = request.GET.get('academic_year')
+    
+    # Get all departments
+    departments = Department.objects.filter(is_active=True).order_by('name')
+    
+    # Get students with filters
+    students = Student.objects.filter(status='ACTIVE')
+    
+    if department_id:
+        students = students.filter(department_id=department_id)
+    if academic_year:
+        students = students.filter(academic_year=academic_year)
+    
+    # Calculate statistics
+    stats = {}
+    for dept in departments:
+        dept_students = students.filter(department=dept)
+        if dept_students.exists():
+            # Count by year of study
+            year_counts = {}
+            for year, _ in Student.YEAR_OF_STUDY_CHOICES:
+                count = dept_students.filter(year_of_study=year).count()
+                if count > 0:
+                    year_counts[year] = count
+            
+            # Count by semester
+            semester_counts = {}
+            for semester, _ in Student.SEMESTER_CHOICES:
+                count = dept_students.filter(semester=semester).count()
+                if count > 0:
+                    semester_counts[semester] = count
+            
+            # Count by gender
+            gender_counts = {}
+            for gender, _ in Student.GENDER_CHOICES:
+                count = dept_students.filter(gender=gender).count()
+                if count > 0:
+                    gender_counts[gender] = count
+            
+            # Count by program
+            program_counts = {}
+            for program in AcademicProgram.objects.filter(department=dept, is_active=True):
+                count = dept_students.filter(academic_program=program).count()
+                if count > 0:
+                    program_counts[program.code] = {
+                        'name': program.name,
+                        'count': count
+                    }
+            
+            stats[dept.code] = {
+                'department': dept,
+                'total_students': dept_students.count(),
+                'by_year_of_study': year_counts,
+                'by_semester': semester_counts,
+                'by_gender': gender_counts,
+                'by_program': program_counts
+            }
+    
+    context = {
+        'stats': stats,
+        'departments': departments,
+        'year_choices': Student.YEAR_OF_STUDY_CHOICES,
+        'semester_choices': Student.SEMESTER_CHOICES,
+        'filters': {
+            'department_id': department_id,
+            'academic_year': academic_year,
+        }
+    }
+    
+    return render(request, 'dashboard/student_division_statistics.html', context)
+
+
+@api_view(['POST'])
+@permission_classes([IsAdminUser])
+def bulk_assign_students(request):
+    """API endpoint for bulk student assignment"""
+    try:
+        data = request.data
+        student_ids = data.get('student_ids', [])
+        assignment_data = data.get('assignment', {})
+        
+        updated_count = 0
+        errors = []
+        
+        for student_id in student_ids:
+            try:
+                student = Student.objects.get(id=student_id)
+                
+                if assignment_data.get('department_id'):
+                    student.department_id = assignment_data['department_id']
+                if assignment_data.get('academic_program_id'):
+                    student.academic_program_id = assignment_data['academic_program_id']
+                if assignment_data.get('academic_year'):
+                    student.academic_year = assignment_data['academic_year']
+                if assignment_data.get('year_of_study'):
+                    student.year_of_study = assignment_data['year_of_study']
+                if assignment_data.get('semester'):
+                    student.semester = assignment_data['semester']
+                if assignment_data.get('section'):
+                    student.section = assignment_data['section']
+                
+                student.updated_by = request.user
+                student.save()
+                updated_count += 1
+                
+            except Student.DoesNotExist:
+                errors.append(f'Student with ID {student_id} not found')
+            except Exception as e:
+                errors.append(f'Error updating student {student_id}: {str(e)}')
+        
+        return Response({
+            'success': True,
+            'updated_count': updated_count,
+            'errors': errors
+        })
+        
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=400)
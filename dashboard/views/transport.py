@@ -0,0 +1,230 @@
+"""Transportation dashboard pages."""
+from django.shortcuts import render, redirect
+from django.contrib.auth.decorators import login_required, user_passes_test
+from django.contrib import messages
+from django.http import HttpResponse
+from django.db.models import Q
+import csv
+from transportation.models import Vehicle, Driver, Route, Stop, VehicleAssignment, TripSchedule, TransportPass
+from transportation.forms import (
+    VehicleForm,
+    DriverForm,
+    RouteForm,
+    StopForm,
+    VehicleAssignmentForm,
+    TripScheduleForm,
+    TransportPassForm,
+)
+from .common import is_admin
+
+
+# ---------------------
+# Transportation Dashboard
+# ---------------------
+
+@login_required
+@user_passes_test(is_admin)
+def transport_dashboard(request):
+    context = {
+        'vehicles_count': Vehicle.objects.count(),
+        'drivers_count': Driver.objects.count(),
+        'routes_count': Route.objects.count(),
+        'stops_count': Stop.objects.count(),
+        'assignments_count': VehicleAssignment.objects.count(),
+        'schedules_count': TripSchedule.objects.count(),
+        'passes_count': TransportPass.objects.count(),
+    }
+    return render(request, 'dashboard/transportation/dashboard.html', context)
+
+
+@login_required
+@user_passes_test(is_admin)
+def transport_vehicles(request):
+    q = request.GET.get('q')
+    items = Vehicle.objects.all()
+    if q:
+        items = items.filter(Q(number_plate__icontains=q) | Q(registration_number__icontains=q) | Q(make__icontains=q) | Q(model__icontains=q))
+    items = items.order_by('number_plate')
+    if request.GET.get('export') == 'csv':
+        response = HttpResponse(content_type='text/csv')
+        response['Content-Disposition'] = 'attachment; filename="vehicles.csv"'
+        writer = csv.writer(response)
+        writer.writerow(['Number Plate', 'Registration', 'Make', 'Model', 'Capacity', 'Active'])
+        for v in items:
+            writer.writerow([v.number_plate, v.registration_number, v.make, v.model, v.capacity, v.is_active])
+        return response
+    return render(request, 'dashboard/transportation/vehicles.html', {'items': items, 'q': q or ''})
+
+
+@login_required
+@user_passes_test(is_admin)
+def transport_drivers(request):
+    q = request.GET.get('q')
+    items = Driver.objects.all()
+    if q:
+        items = items.filter(Q(full_name__icontains=q) | Q(phone__icontains=q) | Q(license_number__icontains=q))
+    items = items.order_by('full_name')
+    return render(request, 'dashboard/transportation/drivers.html', {'items': items, 'q': q or ''})
+
+
+@login_required
+@user_passes_test(is_admin)
+def transport_routes(request):
+    q = request.GET.get('q')
+    items = Route.objects.all()
+    if q:
+        items = items.filter(Q(name__icontains=q) | Q(description__icontains=q))
+    items = items.order_by('name').prefetch_related('route_stops__stop')
+    if request.GET.get('export') == 'csv':
+        response = HttpResponse(content_type='text/csv')
+        response['Content-Disposition'] = 'attachment; filename="routes.csv"'
+        writer = csv.writer(response)
+        writer.writerow(['Name', 'Description', 'Distance (km)', 'Active'])
+        for r in items:
+            writer.writerow([r.name, r.description, r.distance_km, r.is_active])
+        return response
+    return render(request, 'dashboard/transportation/routes.html', {'items': items, 'q': q or ''})
+
+
+@login_required
+@user_passes_test(is_admin)
+def transport_stops(request):
+    q = request.GET.get('q')
+    items = Stop.objects.all()
+    if q:
+        items = items.filter(Q(name__icontains=q) | Q(landmark__icontains=q))
+    items = items.order_by('name')
+    return render(request, 'dashboard/transportation/stops.html', {'items': items, 'q': q or ''})
+
+
+@login_required
+@user_passes_test(is_admin)
+def transport_assignments(request):
+    q = request.GET.get('q')
+    items = VehicleAssignment.objects.select_related('vehicle', 'driver', 'route').all()
+    if q:
+        items = items.filter(Q(vehicle__number_plate__icontains=q) | Q(driver__full_name__icontains=q) | Q(route__name__icontains=q))
+    items = items.order_by('-start_date')
+    return render(request, 'dashboard/transportation/assignments.html', {'items': items, 'q': q or ''})
+
+
+@login_required
+@user_passes_test(is_admin)
+def transport_schedules(request):
+    q = request.GET.get('q')
+    items = TripSchedule.objects.select_related('assignment', 'assignment__vehicle', 'assignment__route').all()
+    if q:
+        items = items.filter(Q(assignment__vehicle__number_plate__icontains=q) | Q(assignment__route__name__icontains=q))
+    items = items.order_by('day_of_week', 'departure_time')
+    return render(request, 'dashboard/transportation/schedules.html', {'items': items, 'q': q or ''})
+
+
+@login_required
+@user_passes_test(is_admin)
+def transport_passes(request):
+    q = request.GET.get('q')
+    items = TransportPass.objects.select_related('user', 'route', 'start_stop', 'end_stop').all()
+    if q:
+        items = items.filter(Q(user__username__icontains=q) | Q(user__email__icontains=q) | Q(route__name__icontains=q))
+    items = items.order_by('-valid_from')
+    return render(request, 'dashboard/transportation/passes.html', {'items': items, 'q': q or ''})
+
+
+# Create Views (simple create-only forms for now)
+
+@login_required
+@user_passes_test(is_admin)
+def transport_vehicle_create(request):
+    if request.method == 'POST':
+        form = VehicleForm(request.POST)
+        if form.is_valid():
+            form.save()
+            messages.success(request, 'Vehicle created successfully.')
+            return redirect('dashboard:transport_vehicles')
+    else:
+        form = VehicleForm()
+    return render(request, 'dashboard/transportation/create_form.html', {'form': form, 'title': 'Add Vehicle'})
+
+
+@login_required
+@user_passes_test(is_admin)
+def transport_driver_create(request):
+    if request.method == 'POST':
+        form = DriverForm(request.POST)
+        if form.is_valid():
+            form.save()
+            messages.success(request, 'Driver created successfully.')
+            return redirect('dashboard:transport_drivers')
+    else:
+        form = DriverForm()
+    return render(request, 'dashboard/transportation/create_form.html', {'form': form, 'title': 'Add Driver'})
+
+
+@login_required
+@user_passes_test(is_admin)
+def transport_route_create(request):
+    if request.method == 'POST':
+        form = RouteForm(request.POST)
+        if form.is_valid():
+            form.save()
+            messages.success(request, 'Route created successfully.')
+            return redirect('dashboard:transport_routes')
+    else:
+        form = RouteForm()
+    return render(request, 'dashboard/transportation/create_form.html', {'form': form, 'title': 'Add Route'})
+
+
+@login_required
+@user_passes_test(is_admin)
+def transport_stop_create(request):
+    if request.method == 'POST':
+        form = StopForm(request.POST)
+        if form.is_valid():
+            form.save()
+            messages.success(request, 'Stop created successfully.')
+            return redirect('dashboard:transport_stops')
+    else:
+        form = StopForm()
+    return render(request, 'dashboard/transportation/create_form.html', {'form': form, 'title': 'Add Stop'})
+
+
+@login_required
+@user_passes_test(is_admin)
+def transport_assignment_create(request):
+    if request.method == 'POST':
+        form = VehicleAssignmentForm(request.POST)
+        if form.is_valid():
+            form.save()
+            messages.success(request, 'Assignment created successfully.')
+            return redirect('dashboard:transport_assignments')
+    else:
+        form = VehicleAssignmentForm()
+    return render(request, 'dashboard/transportation/create_form.html', {'form': form, 'title': 'Add Assignment'})
+
+
+@login_required
+@user_passes_test(is_admin)
+def transport_schedule_create(request):
+    if request.method == 'POST':
+        form = TripScheduleForm(request.POST)
+        if form.is_valid():
+            form.save()
+            messages.success(request, 'Schedule created successfully.')
+            return redirect('dashboard:transport_schedules')
+    else:
+        form = TripScheduleForm()
+    return render(request, 'dashboard/transportation/create_form.html', {'form': form, 'title': 'Add Schedule'})
+
+
+@login_required
+@user_passes_test(is_admin)
+def transport_pass_create(request):
+    if request.method == 'POST':
+        form = TransportPassForm(request.POST)
+        if form.is_valid():
+            form.save()
+            messages.success(request, 'Transport pass created successfully.')
+            return redirect('dashboard:transport_passes')
+    else:
+        form = TransportPassForm()
+    return render(request, 'dashboard/transportation/create_form.html', {'form': form, 'title': 'Add Transport Pass'})
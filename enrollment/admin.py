@@ -121,7 +121,7 @@ class WaitlistEntryAdmin(admin.ModelAdmin):
     def move_to_enrollment(self, request, queryset):
         """Move selected waitlist entries to enrollment if possible"""
         moved_count = 0
-        for waitlist_entry in queryset.filter(is_active=True, position=1):
+        for waitlist_entry in queryset.filter(is_active=True).order_by('course_section_id', 'position'):
             try:
                 if waitlist_entry.move_to_enrollment():
                     moved_count += 1
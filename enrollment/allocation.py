@@ -0,0 +1,103 @@
+"""
+Contention-free seat allocation for course sections.
+
+A seat is taken with a single conditional UPDATE on the section row::
+
+    UPDATE academics_coursesection
+       SET current_enrollment = current_enrollment + 1
+     WHERE id = %s AND is_active AND current_enrollment < max_students
+ RETURNING current_enrollment
+
+Nothing reads a stale ``current_enrollment`` and the counter can never pass
+``max_students``. The UPDATE runs inside ``transaction.atomic()``, so the
+section row stays locked until the outermost transaction commits: other
+allocations to the same section wait until then. Keep slow work out of a
+transaction that calls ``allocate``.
+Enrollment rows are written without going through ``CourseEnrollment.save``
+(which would increment the counter a second time), and a failed insert
+rolls the reservation back with the surrounding transaction.
+"""
+from django.core.exceptions import ValidationError
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from academics.models import CourseSection, CourseEnrollment
+from campshub360.utils import use_primary_reads
+
+# Enrollments that may be switched back to ENROLLED; the others are history or
+# belong to another workflow (COMPLETED, PENDING approval, WAITLISTED)
+REACTIVATABLE_STATUSES = ('DROPPED', 'WITHDRAWN')
+
+
+def _reserve_sql():
+    table = connection.ops.quote_name(CourseSection._meta.db_table)
+    qn = connection.ops.quote_name
+    return (
+        f"UPDATE {table} SET {qn('current_enrollment')} = {qn('current_enrollment')} + 1 "
+        f"WHERE {qn('id')} = %s AND {qn('is_active')} AND {qn('current_enrollment')} < {qn('max_students')} "
+        f"RETURNING {qn('current_enrollment')}"
+    )
+
+
+class SeatAllocator:
+    """Allocate seats in a course section, falling back to the waitlist when full."""
+
+    ENROLLED = 'enrolled'
+    WAITLISTED = 'waitlisted'
+
+    @staticmethod
+    def reserve_seat(course_section_id):
+        """Atomically take one seat. Returns the new enrollment count, or None if full."""
+        with connection.cursor() as cursor:
+            cursor.execute(_reserve_sql(), [course_section_id])
+            row = cursor.fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def release_seat(course_section_id):
+        """Give a seat back (used when an enrollment leaves ENROLLED outside of save())."""
+        return CourseSection.objects.filter(
+            pk=course_section_id, current_enrollment__gt=0
+        ).update(current_enrollment=F('current_enrollment') - 1)
+
+    @classmethod
+    def allocate(cls, student, course_section, enrollment_type='REGULAR'):
+        """
+        Enroll ``student`` in ``course_section`` or put them on its waitlist.
+
+        Returns a ``(outcome, obj)`` tuple where outcome is ``ENROLLED`` with the
+        CourseEnrollment or ``WAITLISTED`` with the WaitlistEntry.
+        """
+        with use_primary_reads(), transaction.atomic():
+            existing = CourseEnrollment.objects.select_for_update().filter(
+                student=student, course_section_id=course_section.pk
+            ).order_by('pk').first()
+            if existing and existing.status == 'ENROLLED':
+                raise ValidationError("Student is already enrolled in this course section")
+            if existing and existing.status not in REACTIVATABLE_STATUSES:
+                raise ValidationError(
+                    f"Student has a {existing.get_status_display().lower()} enrollment in this course section"
+                )
+
+            if cls.reserve_seat(course_section.pk) is None:
+                from .services import EnrollmentService
+                return cls.WAITLISTED, EnrollmentService.add_to_waitlist(student, course_section)
+
+            if existing:
+                # Reactivation; the seat is already counted, so bypass save()
+                CourseEnrollment.objects.filter(pk=existing.pk).update(
+                    status='ENROLLED', updated_at=timezone.now()
+                )
+                existing.status = 'ENROLLED'
+                return cls.ENROLLED, existing
+
+            enrollment = CourseEnrollment(
+                student=student,
+                course_section_id=course_section.pk,
+                status='ENROLLED',
+                enrollment_type=enrollment_type,
+            )
+            # bulk_create skips CourseEnrollment.save(), which would count the seat again
+            CourseEnrollment.objects.bulk_create([enrollment])
+            return cls.ENROLLED, enrollment
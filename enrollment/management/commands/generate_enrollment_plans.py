@@ -0,0 +1,39 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from departments.models import Department
+from enrollment.planning import BulkEnrollmentPlanner
+
+
+class Command(BaseCommand):
+    help = 'Generate enrollment plans for every eligible student of a department in bulk.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--department', type=str, required=True, help='Department code')
+        parser.add_argument('--academic-year', type=str, required=True, help='Academic year, e.g. 2024-2025')
+        parser.add_argument('--semester', type=str, required=True, help='Semester')
+        parser.add_argument('--program-id', type=int, help='Optional AcademicProgram ID to limit generation')
+        parser.add_argument('--year-of-study', type=int, help='Optional year of study to limit generation')
+        parser.add_argument('--chunk-size', type=int, default=1000, help='Rows per bulk insert')
+        parser.add_argument('--dry-run', action='store_true', help='Report the diff without writing')
+
+    def handle(self, *args, **options):
+        department = Department.objects.filter(code=options['department']).first()
+        if department is None:
+            raise CommandError(f"Department {options['department']} not found")
+
+        planner = BulkEnrollmentPlanner(
+            department,
+            options['academic_year'],
+            options['semester'],
+            academic_program=options.get('program_id'),
+            year_of_study=options.get('year_of_study'),
+            chunk_size=options['chunk_size'],
+        )
+        report = planner.run(dry_run=options['dry_run'])
+        self.stdout.write(json.dumps(report.as_dict(), indent=2, default=str))
+        verb = 'Would create' if options['dry_run'] else 'Created'
+        self.stdout.write(self.style.SUCCESS(
+            f'{verb} {report.plans_to_create} plans and {report.planned_courses_to_create} planned courses'
+        ))
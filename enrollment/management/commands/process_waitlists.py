@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from enrollment.waitlist import WaitlistEngine
+
+
+class Command(BaseCommand):
+    help = 'Promote waitlisted students into free seats for every course section (run periodically).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--academic-year', type=str, help='Limit the sweep to one academic year')
+        parser.add_argument('--semester', type=str, help='Limit the sweep to one semester')
+
+    def handle(self, *args, **options):
+        promoted = WaitlistEngine.sweep(
+            academic_year=options.get('academic_year'),
+            semester=options.get('semester'),
+        )
+        for section_id, count in promoted.items():
+            self.stdout.write(f'Section {section_id}: promoted {count}')
+        self.stdout.write(self.style.SUCCESS(
+            f'Promoted {sum(promoted.values())} students across {len(promoted)} sections'
+        ))
@@ -0,0 +1,113 @@
+"""
+Concurrent load test for SeatAllocator.
+
+Runs N parallel workers enrolling distinct students into one course section
+and verifies that the section is never over-allocated and that its counter
+matches the real number of ENROLLED rows. Intended for a PostgreSQL database;
+by default everything the run creates is removed afterwards.
+
+    python manage.py seat_allocation_loadtest --section-id 42 --workers 64 --min-rate 200
+"""
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import F
+
+from academics.models import CourseSection, CourseEnrollment
+from enrollment.allocation import SeatAllocator
+from enrollment.models import WaitlistEntry, EnrollmentRequest
+from students.models import Student
+
+
+class Command(BaseCommand):
+    help = 'Hammer one course section with parallel enrollments and check for over-allocation.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--section-id', type=int, required=True, help='CourseSection ID to enroll into')
+        parser.add_argument('--workers', type=int, default=32, help='Number of parallel workers')
+        parser.add_argument('--attempts', type=int, help='Number of students to enroll (default: 2x free seats)')
+        parser.add_argument('--min-rate', type=float, default=0.0, help='Fail if fewer enrollments/second than this')
+        parser.add_argument('--keep', action='store_true', help='Keep created enrollments instead of cleaning up')
+
+    def handle(self, *args, **options):
+        try:
+            section = CourseSection.objects.get(pk=options['section_id'])
+        except CourseSection.DoesNotExist:
+            raise CommandError('Course section not found')
+
+        initial_enrollment = section.current_enrollment
+        free_seats = max(0, section.max_students - initial_enrollment)
+        attempts = options['attempts'] or max(1, free_seats * 2)
+
+        students = list(
+            Student.objects.exclude(enrollments__course_section=section)
+            .exclude(waitlist_entries__course_section=section)
+            .order_by('pk')[:attempts]
+        )
+        if not students:
+            raise CommandError('No students available that are not already in this section')
+
+        self.stdout.write(
+            f'Section {section} : {free_seats} free seats, {len(students)} students, {options["workers"]} workers'
+        )
+
+        def worker(student):
+            try:
+                outcome, obj = SeatAllocator.allocate(student, section)
+                return outcome, obj.pk
+            except Exception as exc:
+                return 'error', repr(exc)
+            finally:
+                connection.close()
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options['workers']) as pool:
+            results = list(pool.map(worker, students))
+        elapsed = time.perf_counter() - started
+
+        outcomes = Counter(outcome for outcome, _ in results)
+        enrolled_ids = [pk for outcome, pk in results if outcome == SeatAllocator.ENROLLED]
+        waitlisted_ids = [pk for outcome, pk in results if outcome == SeatAllocator.WAITLISTED]
+
+        section.refresh_from_db()
+        enrolled_rows = CourseEnrollment.objects.filter(course_section=section, status='ENROLLED').count()
+        rate = len(enrolled_ids) / elapsed if elapsed else float('inf')
+
+        self.stdout.write(
+            f'enrolled={outcomes[SeatAllocator.ENROLLED]} waitlisted={outcomes[SeatAllocator.WAITLISTED]} '
+            f'errors={outcomes["error"]} elapsed={elapsed:.3f}s rate={rate:.1f}/s'
+        )
+        for outcome, detail in results:
+            if outcome == 'error':
+                self.stderr.write(f'  error: {detail}')
+                break
+
+        failures = []
+        if section.current_enrollment > section.max_students:
+            failures.append(f'over-allocated: {section.current_enrollment} > {section.max_students}')
+        if section.current_enrollment != enrolled_rows:
+            failures.append(f'counter drift: current_enrollment={section.current_enrollment} enrolled rows={enrolled_rows}')
+        if len(enrolled_ids) > free_seats:
+            failures.append(f'{len(enrolled_ids)} seats granted but only {free_seats} were free')
+        if options['min_rate'] and rate < options['min_rate']:
+            failures.append(f'throughput {rate:.1f}/s below required {options["min_rate"]}/s')
+
+        if not options['keep']:
+            request_ids = list(
+                WaitlistEntry.objects.filter(pk__in=waitlisted_ids).values_list('enrollment_request_id', flat=True)
+            )
+            # Queryset deletes bypass CourseEnrollment.delete(); the counter is restored explicitly
+            CourseEnrollment.objects.filter(pk__in=enrolled_ids).delete()
+            WaitlistEntry.objects.filter(pk__in=waitlisted_ids).delete()
+            EnrollmentRequest.objects.filter(pk__in=request_ids).delete()
+            CourseSection.objects.filter(pk=section.pk).update(
+                current_enrollment=F('current_enrollment') - len(enrolled_ids)
+            )
+            self.stdout.write('Cleaned up load test enrollments')
+
+        if failures:
+            raise CommandError('; '.join(failures))
+        self.stdout.write(self.style.SUCCESS('No over-allocation detected'))
@@ -0,0 +1,27 @@
+# Generated by Django 5.1.4 on 2026-10-19 05:19
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0002_initial'),
+        ('enrollment', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WaitlistCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('last_position', models.PositiveIntegerField(default=0)),
+                ('course_section', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='waitlist_counter', to='academics.coursesection')),
+            ],
+            options={
+                'verbose_name': 'Waitlist Counter',
+                'verbose_name_plural': 'Waitlist Counters',
+            },
+        ),
+    ]
@@ -264,37 +264,35 @@ class WaitlistEntry(models.Model):
     
     def move_to_enrollment(self):
         """Move student from waitlist to enrollment when space becomes available"""
-        if self.position == 1:  # First in waitlist
-            # Check if course section has available space
-            if self.course_section.can_enroll_student():
-                # Create enrollment
-                from academics.models import CourseEnrollment
-                CourseEnrollment.objects.create(
-                    student=self.student,
-                    course_section=self.course_section,
-                    status='ENROLLED',
-                    enrollment_type='REGULAR'
-                )
-                
-                # Update enrollment request
-                self.enrollment_request.status = 'APPROVED'
-                self.enrollment_request.approved_at = timezone.now()
-                self.enrollment_request.save()
-                
-                # Remove from waitlist
-                self.is_active = False
-                self.save()
-                
-                # Move next person up in waitlist
-                next_entry = WaitlistEntry.objects.filter(
-                    course_section=self.course_section,
-                    is_active=True,
-                    position__gt=self.position
-                ).order_by('position').first()
-                
-                if next_entry:
-                    next_entry.position = 1
-                    next_entry.save()
-                
-                return True
+        if not self.is_active:
+            return False
+        head = WaitlistEntry.objects.filter(
+            course_section_id=self.course_section_id,
+            is_active=True
+        ).order_by('position', 'added_date').values_list('pk', flat=True).first()
+        if head != self.pk:  # Only the head of the waitlist can be promoted
+            return False
+        
+        from .waitlist import WaitlistEngine
+        promoted = WaitlistEngine.promote(self.course_section_id, limit=1)
+        if any(entry.pk == self.pk for entry in promoted):
+            self.is_active = False
+            return True
         return False
+
+
+class WaitlistCounter(models.Model):
+    """Per-section sequence for waitlist positions.
+
+    Positions are handed out with a single ``UPDATE ... RETURNING`` on this row
+    instead of ``MAX(position) + 1``, so concurrent joins never share a position.
+    """
+    course_section = models.OneToOneField(CourseSection, on_delete=models.CASCADE, related_name='waitlist_counter')
+    last_position = models.PositiveIntegerField(default=0)
+    
+    class Meta:
+        verbose_name = "Waitlist Counter"
+        verbose_name_plural = "Waitlist Counters"
+    
+    def __str__(self):
+        return f"{self.course_section} - {self.last_position}"
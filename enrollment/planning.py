@@ -0,0 +1,193 @@
+"""
+Bulk enrollment plan generation for a whole department.
+
+The department's active MANDATORY/ELECTIVE ``CourseAssignment`` rows are
+loaded once into a (program, year_of_study) -> courses matrix, every eligible
+student's plan is built in memory against the plans and planned courses that
+already exist, and only the missing rows are written with chunked
+``bulk_create``. Re-running is idempotent: a second run has an empty diff.
+"""
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from django.db import transaction
+
+from campshub360.utils import use_primary_reads
+from students.models import Student
+from .models import CourseAssignment, StudentEnrollmentPlan, PlannedCourse
+
+
+ASSIGNMENT_PRIORITY = {
+    'MANDATORY': (1, True),
+    'ELECTIVE': (2, False),
+}
+
+
+@dataclass
+class PlanningReport:
+    dry_run: bool
+    students_considered: int = 0
+    students_without_courses: int = 0
+    plans_existing: int = 0
+    plans_to_create: int = 0
+    planned_courses_to_create: int = 0
+    timings: dict = field(default_factory=dict)
+    sample: list = field(default_factory=list)
+
+    def as_dict(self):
+        return {
+            'dry_run': self.dry_run,
+            'students_considered': self.students_considered,
+            'students_without_courses': self.students_without_courses,
+            'plans_existing': self.plans_existing,
+            'plans_to_create': self.plans_to_create,
+            'planned_courses_to_create': self.planned_courses_to_create,
+            'timings_ms': {stage: round(seconds * 1000, 2) for stage, seconds in self.timings.items()},
+            'sample': self.sample,
+        }
+
+
+class BulkEnrollmentPlanner:
+    """Generate StudentEnrollmentPlan/PlannedCourse rows for every student of a department."""
+
+    SAMPLE_SIZE = 20
+
+    def __init__(self, department, academic_year, semester, academic_program=None,
+                 year_of_study=None, chunk_size=1000):
+        self.department = department
+        self.academic_year = academic_year
+        self.semester = semester
+        self.academic_program = academic_program
+        self.year_of_study = year_of_study
+        self.chunk_size = chunk_size
+
+    @contextmanager
+    def _stage(self, report, name):
+        started = time.perf_counter()
+        yield
+        report.timings[name] = time.perf_counter() - started
+
+    def _load_matrix(self):
+        assignments = CourseAssignment.objects.filter(
+            department=self.department,
+            academic_year=self.academic_year,
+            semester=self.semester,
+            assignment_type__in=ASSIGNMENT_PRIORITY.keys(),
+            is_active=True,
+        )
+        if self.academic_program:
+            assignments = assignments.filter(academic_program=self.academic_program)
+        matrix = defaultdict(list)
+        for program_id, year, course_id, assignment_type, credits in assignments.values_list(
+            'academic_program_id', 'year_of_study', 'course_id', 'assignment_type', 'course__credits'
+        ).order_by():
+            priority, is_mandatory = ASSIGNMENT_PRIORITY[assignment_type]
+            matrix[(program_id, year)].append((course_id, priority, is_mandatory, credits or 0))
+        return matrix
+
+    def _load_students(self):
+        students = Student.objects.filter(
+            department=self.department,
+            academic_program__isnull=False,
+            status='ACTIVE',
+        )
+        if self.academic_program:
+            students = students.filter(academic_program=self.academic_program)
+        if self.year_of_study:
+            students = students.filter(year_of_study=str(self.year_of_study))
+        return list(students.values_list('id', 'academic_program_id', 'year_of_study').order_by())
+
+    def _load_existing(self, student_ids):
+        plans = {}
+        planned = defaultdict(set)
+        for start in range(0, len(student_ids), self.chunk_size):
+            chunk = student_ids[start:start + self.chunk_size]
+            for plan_id, student_id in StudentEnrollmentPlan.objects.filter(
+                student_id__in=chunk, academic_year=self.academic_year, semester=self.semester
+            ).values_list('id', 'student_id').order_by():
+                plans[student_id] = plan_id
+        plan_ids = list(plans.values())
+        for start in range(0, len(plan_ids), self.chunk_size):
+            for plan_id, course_id in PlannedCourse.objects.filter(
+                enrollment_plan_id__in=plan_ids[start:start + self.chunk_size]
+            ).values_list('enrollment_plan_id', 'course_id').order_by():
+                planned[plan_id].add(course_id)
+        return plans, planned
+
+    def run(self, dry_run=False):
+        report = PlanningReport(dry_run=dry_run)
+
+        with use_primary_reads():
+            with self._stage(report, 'load_matrix'):
+                matrix = self._load_matrix()
+            with self._stage(report, 'load_students'):
+                students = self._load_students()
+            with self._stage(report, 'load_existing'):
+                plans, planned = self._load_existing([s[0] for s in students])
+
+        new_plans = []  # (StudentEnrollmentPlan, courses)
+        missing_courses = []  # (plan_id, courses)
+        with self._stage(report, 'build'):
+            report.students_considered = len(students)
+            for student_id, program_id, year in students:
+                try:
+                    year = int(year)
+                except (TypeError, ValueError):
+                    year = 1
+                courses = matrix.get((program_id, year))
+                if not courses:
+                    report.students_without_courses += 1
+                    continue
+                plan_id = plans.get(student_id)
+                if plan_id is None:
+                    plan = StudentEnrollmentPlan(
+                        student_id=student_id,
+                        academic_program_id=program_id,
+                        academic_year=self.academic_year,
+                        semester=self.semester,
+                        year_of_study=year,
+                        status='DRAFT',
+                        total_credits=sum(c[3] for c in courses),
+                    )
+                    new_plans.append((plan, courses))
+                    report.planned_courses_to_create += len(courses)
+                    if len(report.sample) < self.SAMPLE_SIZE:
+                        report.sample.append({
+                            'student': str(student_id), 'plan': None,
+                            'add_courses': [c[0] for c in courses],
+                        })
+                else:
+                    report.plans_existing += 1
+                    missing = [c for c in courses if c[0] not in planned[plan_id]]
+                    if missing:
+                        missing_courses.append((plan_id, missing))
+                        report.planned_courses_to_create += len(missing)
+                        if len(report.sample) < self.SAMPLE_SIZE:
+                            report.sample.append({
+                                'student': str(student_id), 'plan': plan_id,
+                                'add_courses': [c[0] for c in missing],
+                            })
+            report.plans_to_create = len(new_plans)
+
+        if dry_run:
+            return report
+
+        with self._stage(report, 'persist'), transaction.atomic():
+            plan_objs = [plan for plan, _ in new_plans]
+            StudentEnrollmentPlan.objects.bulk_create(plan_objs, batch_size=self.chunk_size)
+            rows = [
+                PlannedCourse(enrollment_plan_id=plan.pk, course_id=course_id,
+                              priority=priority, is_mandatory=is_mandatory)
+                for plan, courses in new_plans
+                for course_id, priority, is_mandatory, _ in courses
+            ]
+            rows.extend(
+                PlannedCourse(enrollment_plan_id=plan_id, course_id=course_id,
+                              priority=priority, is_mandatory=is_mandatory)
+                for plan_id, courses in missing_courses
+                for course_id, priority, is_mandatory, _ in courses
+            )
+            PlannedCourse.objects.bulk_create(rows, batch_size=self.chunk_size, ignore_conflicts=True)
+        return report
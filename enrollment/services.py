@@ -1,11 +1,15 @@
 from django.db import transaction
 from django.core.exceptions import ValidationError
 from django.utils import timezone
+from .allocation import SeatAllocator
+from .planning import BulkEnrollmentPlanner
+from .waitlist import WaitlistEngine
 from .models import (
     EnrollmentRule, CourseAssignment, FacultyAssignment, StudentEnrollmentPlan,
     PlannedCourse, EnrollmentRequest, WaitlistEntry
 )
-from academics.models import Course, CourseSection, CourseEnrollment
+from academics.models import Course, CourseSection, CourseEnrollment, Timetable
+from academics.scheduling import TimetableConflictEngine, FACULTY
 from faculty.models import Faculty
 from students.models import Student
 from django.db import models
@@ -104,21 +108,21 @@ class EnrollmentService:
             if faculty.department_ref != course_section.course.department:
                 raise ValidationError("Faculty must belong to the same department as the course")
             
-            # Check for conflicting assignments
+            # Check for conflicting assignments: load the section's timetable and
+            # the faculty's other assigned sections once and sweep them by day
             if is_primary:
-                conflicting_assignments = FacultyAssignment.objects.filter(
-                    faculty=faculty,
-                    course_section__timetables__is_active=True,
-                    status__in=['ASSIGNED', 'CONFIRMED']
-                ).exclude(course_section=course_section)
-                
-                for assignment in conflicting_assignments:
-                    for timetable1 in course_section.timetables.filter(is_active=True):
-                        for timetable2 in assignment.course_section.timetables.filter(is_active=True):
-                            if (timetable1.day_of_week == timetable2.day_of_week and
-                                timetable1.start_time < timetable2.end_time and
-                                timetable1.end_time > timetable2.start_time):
-                                raise ValidationError(f"Faculty has conflicting schedule with {assignment.course_section}")
+                timetables = Timetable.objects.filter(is_active=True).filter(
+                    models.Q(course_section=course_section) |
+                    models.Q(
+                        course_section__faculty_assignments__faculty=faculty,
+                        course_section__faculty_assignments__status__in=['ASSIGNED', 'CONFIRMED'],
+                    )
+                ).select_related('course_section__course').distinct()
+                engine = TimetableConflictEngine(timetables, key_func=lambda t: [(FACULTY, faculty.pk)])
+                conflicts = engine.conflicts_involving({course_section.pk})
+                if conflicts:
+                    other = conflicts[0].first if conflicts[0].first.course_section_id != course_section.pk else conflicts[0].second
+                    raise ValidationError(f"Faculty has conflicting schedule with {other.course_section}")
             
             # Create or update faculty assignment
             assignment, created = FacultyAssignment.objects.get_or_create(
@@ -179,41 +183,11 @@ class EnrollmentService:
         Enroll a student in a course section
         """
         try:
-            with transaction.atomic():
-                # Check if student can enroll
-                if not course_section.can_enroll_student():
-                    # Add to waitlist
-                    return EnrollmentService.add_to_waitlist(student, course_section)
-                
-                # Check if student is already enrolled
-                existing_enrollment = CourseEnrollment.objects.filter(
-                    student=student,
-                    course_section=course_section
-                ).first()
-                
-                if existing_enrollment:
-                    if existing_enrollment.status == 'ENROLLED':
-                        raise ValidationError("Student is already enrolled in this course section")
-                    elif existing_enrollment.status in ['DROPPED', 'WITHDRAWN']:
-                        # Reactivate enrollment
-                        existing_enrollment.status = 'ENROLLED'
-                        existing_enrollment.save()
-                        return existing_enrollment
-                
-                # Create enrollment
-                enrollment = CourseEnrollment.objects.create(
-                    student=student,
-                    course_section=course_section,
-                    status='ENROLLED',
-                    enrollment_type=enrollment_type
-                )
-                
-                # Update section enrollment count
-                course_section.current_enrollment += 1
-                course_section.save()
-                
-                return enrollment
-                
+            # Seat is taken with a conditional UPDATE; a full section falls
+            # through to the waitlist inside the same transaction
+            _, enrollment_or_entry = SeatAllocator.allocate(student, course_section, enrollment_type)
+            return enrollment_or_entry
+            
         except Exception as e:
             raise ValidationError(f"Error enrolling student: {str(e)}")
     
@@ -233,12 +207,6 @@ class EnrollmentService:
             if existing_waitlist:
                 raise ValidationError("Student is already on the waitlist for this course section")
             
-            # Get next position in waitlist
-            last_position = WaitlistEntry.objects.filter(
-                course_section=course_section,
-                is_active=True
-            ).aggregate(models.Max('position'))['position__max'] or 0
-            
             # Create enrollment request
             enrollment_plan = StudentEnrollmentPlan.objects.filter(
                 student=student,
@@ -264,7 +232,7 @@ class EnrollmentService:
                 student=student,
                 course_section=course_section,
                 enrollment_request=enrollment_request,
-                position=last_position + 1
+                position=WaitlistEngine.next_position(course_section.pk)
             )
             
             return waitlist_entry
@@ -273,27 +241,15 @@ class EnrollmentService:
             raise ValidationError(f"Error adding to waitlist: {str(e)}")
     
     @staticmethod
-    def process_waitlist_for_course_section(course_section):
+    def process_waitlist_for_course_section(course_section, limit=None):
         """
-        Process waitlist when space becomes available in a course section
+        Process waitlist when space becomes available in a course section.
+        Promotes as many students as there are free seats (or ``limit``) and
+        returns the promoted waitlist entries.
         """
         try:
-            with transaction.atomic():
-                # Get first person on waitlist
-                first_waitlist_entry = WaitlistEntry.objects.filter(
-                    course_section=course_section,
-                    is_active=True
-                ).order_by('position').first()
-                
-                if not first_waitlist_entry:
-                    return None
-                
-                # Try to move to enrollment
-                if first_waitlist_entry.move_to_enrollment():
-                    return first_waitlist_entry
-                
-                return None
-                
+            return WaitlistEngine.promote(course_section.pk, limit=limit)
+            
         except Exception as e:
             raise ValidationError(f"Error processing waitlist: {str(e)}")
     
@@ -398,6 +354,25 @@ class EnrollmentService:
 class DepartmentEnrollmentService:
     """Service for department-wide enrollment operations"""
     
+    @staticmethod
+    def create_department_enrollment_plans(department, academic_year, semester, academic_program=None,
+                                           year_of_study=None, dry_run=False, chunk_size=1000):
+        """
+        Create enrollment plans for every eligible student of a department in bulk.
+        Returns a PlanningReport; with ``dry_run`` nothing is written.
+        """
+        try:
+            planner = BulkEnrollmentPlanner(
+                department, academic_year, semester,
+                academic_program=academic_program,
+                year_of_study=year_of_study,
+                chunk_size=chunk_size,
+            )
+            return planner.run(dry_run=dry_run)
+            
+        except Exception as e:
+            raise ValidationError(f"Error creating department enrollment plans: {str(e)}")
+    
     @staticmethod
     def create_department_course_sections(department, academic_year, semester):
         """
@@ -408,30 +383,30 @@ class DepartmentEnrollmentService:
                 courses = Course.objects.filter(department=department, status='ACTIVE')
                 created_sections = []
                 
+                # Load assignments and the first available faculty once instead of per course/section
+                assignments_by_course = {}
+                for assignment in CourseAssignment.objects.filter(
+                    course__in=courses,
+                    department=department,
+                    academic_year=academic_year,
+                    semester=semester,
+                    is_active=True
+                ).select_related('course'):
+                    assignments_by_course.setdefault(assignment.course_id, []).append(assignment)
+                available_faculty = Faculty.objects.filter(
+                    department_ref=department,
+                    status='ACTIVE',
+                    currently_associated=True
+                ).first()
+                
                 for course in courses:
-                    # Get course assignments
-                    assignments = CourseAssignment.objects.filter(
-                        course=course,
-                        department=department,
-                        academic_year=academic_year,
-                        semester=semester,
-                        is_active=True
-                    )
-                    
-                    for assignment in assignments:
+                    for assignment in assignments_by_course.get(course.pk, []):
                         # Create sections based on demand
                         sections_needed = max(1, assignment.course.max_students // 50)
                         
                         for i in range(sections_needed):
                             section_number = chr(65 + i) if i < 26 else str(i + 1)  # A, B, C... or 1, 2, 3...
                             
-                            # Find available faculty
-                            available_faculty = Faculty.objects.filter(
-                                department_ref=department,
-                                status='ACTIVE',
-                                currently_associated=True
-                            ).first()
-                            
                             if available_faculty:
                                 section = EnrollmentService.create_course_section(
                                     course=course,
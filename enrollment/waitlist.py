@@ -0,0 +1,165 @@
+"""
+Batch waitlist promotion.
+
+Promotion locks the section row (skipping sections another worker is already
+promoting), then claims up to the number of free seats from the head of the
+waitlist with ``SELECT ... ORDER BY position LIMIT n FOR UPDATE SKIP LOCKED``.
+Enrollments, request approvals, waitlist deactivation and the seat counter
+are each written with one statement, all in the same transaction.
+
+Waitlist positions come from ``WaitlistCounter`` rather than
+``MAX(position) + 1``; positions are therefore increasing but not compacted,
+and the head of the queue is always the lowest active position.
+"""
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F, Max
+from django.utils import timezone
+
+from academics.models import CourseSection, CourseEnrollment
+from campshub360.utils import use_primary_reads
+from .allocation import REACTIVATABLE_STATUSES
+from .models import WaitlistEntry, WaitlistCounter, EnrollmentRequest
+
+
+def _next_position_sql():
+    qn = connection.ops.quote_name
+    table = qn(WaitlistCounter._meta.db_table)
+    return (
+        f"UPDATE {table} SET {qn('last_position')} = {qn('last_position')} + 1 "
+        f"WHERE {qn('course_section_id')} = %s RETURNING {qn('last_position')}"
+    )
+
+
+class WaitlistEngine:
+    """Race-free waitlist positions and batched promotion."""
+
+    @staticmethod
+    def _increment(course_section_id):
+        with connection.cursor() as cursor:
+            cursor.execute(_next_position_sql(), [course_section_id])
+            row = cursor.fetchone()
+        return row[0] if row else None
+
+    @classmethod
+    def next_position(cls, course_section_id):
+        """Hand out the next waitlist position for a section."""
+        position = cls._increment(course_section_id)
+        if position is not None:
+            return position
+
+        # First waitlist entry since the counter was introduced; continue
+        # numbering after any positions already handed out.
+        with use_primary_reads():
+            seed = WaitlistEntry.objects.filter(
+                course_section_id=course_section_id
+            ).aggregate(Max('position'))['position__max'] or 0
+        try:
+            with transaction.atomic():
+                WaitlistCounter.objects.create(course_section_id=course_section_id, last_position=seed + 1)
+            return seed + 1
+        except IntegrityError:
+            # Another worker created the counter first
+            position = cls._increment(course_section_id)
+            if position is None:
+                raise
+            return position
+
+    @staticmethod
+    def promote(course_section_id, limit=None):
+        """
+        Promote waitlisted students into every free seat of a section.
+
+        Returns the list of promoted WaitlistEntry objects (empty if the
+        section is full, inactive, or being promoted by another worker).
+        """
+        with use_primary_reads(), transaction.atomic():
+            section = CourseSection.objects.select_for_update(skip_locked=True).filter(
+                pk=course_section_id, is_active=True
+            ).only('id', 'max_students', 'current_enrollment').order_by('pk').first()
+            if section is None:
+                return []
+
+            free_seats = section.max_students - section.current_enrollment
+            if limit is not None:
+                free_seats = min(free_seats, limit)
+            if free_seats <= 0:
+                return []
+
+            entries = list(
+                WaitlistEntry.objects.select_for_update(skip_locked=True).filter(
+                    course_section_id=course_section_id, is_active=True
+                ).order_by('position', 'added_date')[:free_seats]
+            )
+            if not entries:
+                return []
+
+            now = timezone.now()
+            student_ids = [entry.student_id for entry in entries]
+            existing = {
+                enrollment.student_id: enrollment
+                for enrollment in CourseEnrollment.objects.filter(
+                    course_section_id=course_section_id, student_id__in=student_ids
+                ).only('id', 'student_id', 'status')
+            }
+            to_create = [
+                CourseEnrollment(
+                    student_id=student_id,
+                    course_section_id=course_section_id,
+                    status='ENROLLED',
+                    enrollment_type='REGULAR',
+                )
+                for student_id in student_ids if student_id not in existing
+            ]
+            to_reactivate = [e.pk for e in existing.values() if e.status in REACTIVATABLE_STATUSES]
+            # Completed, pending or waitlisted enrollments are not overwritten; their entries leave the queue
+            blocked = {
+                e.student_id for e in existing.values()
+                if e.status != 'ENROLLED' and e.status not in REACTIVATABLE_STATUSES
+            }
+            if blocked:
+                EnrollmentRequest.objects.filter(
+                    pk__in=[entry.enrollment_request_id for entry in entries if entry.student_id in blocked],
+                    status='PENDING',
+                ).update(status='REJECTED', rejection_reason='Existing enrollment cannot be reactivated')
+                entries = [entry for entry in entries if entry.student_id not in blocked]
+                WaitlistEntry.objects.filter(
+                    course_section_id=course_section_id, student_id__in=blocked, is_active=True
+                ).update(is_active=False)
+
+            # Seats are counted once here; bulk writes bypass CourseEnrollment.save()
+            CourseEnrollment.objects.bulk_create(to_create)
+            if to_reactivate:
+                CourseEnrollment.objects.filter(pk__in=to_reactivate).update(status='ENROLLED', updated_at=now)
+            seats_taken = len(to_create) + len(to_reactivate)
+            if seats_taken:
+                CourseSection.objects.filter(pk=course_section_id).update(
+                    current_enrollment=F('current_enrollment') + seats_taken
+                )
+
+            EnrollmentRequest.objects.filter(
+                pk__in=[entry.enrollment_request_id for entry in entries], status='PENDING'
+            ).update(status='APPROVED', approved_at=now)
+            WaitlistEntry.objects.filter(pk__in=[entry.pk for entry in entries]).update(is_active=False)
+            for entry in entries:
+                entry.is_active = False
+            return entries
+
+    @classmethod
+    def sweep(cls, academic_year=None, semester=None):
+        """Promote waitlists of every section with free seats. Returns {section_id: promoted}."""
+        sections = CourseSection.objects.filter(
+            is_active=True,
+            current_enrollment__lt=F('max_students'),
+            waitlist_entries__is_active=True,
+        )
+        if academic_year:
+            sections = sections.filter(academic_year=academic_year)
+        if semester:
+            sections = sections.filter(semester=semester)
+
+        promoted = {}
+        for section_id in sections.values_list('pk', flat=True).distinct().order_by('pk'):
+            entries = cls.promote(section_id)
+            if entries:
+                promoted[section_id] = len(entries)
+        return promoted
@@ -5,7 +5,7 @@ from django.utils.safestring import mark_safe
 from .models import (
     ExamSession, ExamSchedule, ExamRoom, ExamRoomAllocation,
     ExamStaffAssignment, StudentDue, ExamRegistration, HallTicket,
-    ExamAttendance, ExamViolation, ExamResult
+    ExamAttendance, ExamViolation, ExamResult, HallTicketJob
 )
 
 
@@ -347,6 +347,16 @@ class ExamResultAdmin(admin.ModelAdmin):
         super().save_model(request, obj, form, change)
 
 
+@admin.register(HallTicketJob)
+class HallTicketJobAdmin(admin.ModelAdmin):
+    list_display = ['exam_schedule', 'status', 'tickets_created', 'rendered_tickets', 'total_tickets', 'created_at', 'finished_at']
+    list_filter = ['status', 'created_at']
+    readonly_fields = [
+        'exam_schedule', 'requested_by', 'status', 'tickets_created', 'total_tickets',
+        'rendered_tickets', 'room_files', 'error', 'started_at', 'finished_at', 'created_at', 'updated_at',
+    ]
+
+
 # Custom admin site configuration
 admin.site.site_header = "CampsHub360 Exam Management"
 admin.site.site_title = "Exam Admin"
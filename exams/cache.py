@@ -0,0 +1,54 @@
+"""
+Cache keys for exam reports.
+
+Student performance reports are cached per (student, exam session) with
+``'all'`` standing for the unfiltered report; invalidating a batch of
+students removes every variant for the affected sessions with a single
+``delete_many``.
+
+Exam summary reports are cached per session, and date-range reports under a
+shared scope. Each scope has a version number in its key, so a write bumps
+the versions of its session and of the shared scope instead of hunting down
+every cached variant.
+"""
+from django.core.cache import cache
+
+STUDENT_PERFORMANCE_TTL = 600
+EXAM_SUMMARY_TTL = 900
+
+
+def student_performance_key(student_id, exam_session_id=None):
+    return f"exams:student_performance:{student_id}:{exam_session_id or 'all'}"
+
+
+def invalidate_student_performance(student_ids, exam_session_ids=()):
+    """Drop cached performance reports of ``student_ids`` in one pass."""
+    sessions = [None, *exam_session_ids]
+    keys = [
+        student_performance_key(student_id, session_id)
+        for student_id in set(student_ids)
+        for session_id in sessions
+    ]
+    if keys:
+        cache.delete_many(keys)
+    return len(keys)
+
+
+def _summary_version_key(scope):
+    return f"exams:summary_version:{scope}"
+
+
+def exam_summary_key(exam_session_id=None, start_date=None, end_date=None):
+    scope = str(exam_session_id) if exam_session_id else 'range'
+    version = cache.get(_summary_version_key(scope), 0)
+    return f"exams:summary:{scope}:{start_date or ''}:{end_date or ''}:v{version}"
+
+
+def invalidate_exam_summary(exam_session_ids):
+    """Expire cached summaries of the given sessions and every date-range summary."""
+    for scope in {*(str(pk) for pk in exam_session_ids if pk), 'range'}:
+        key = _summary_version_key(scope)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, None)
@@ -0,0 +1,241 @@
+"""
+Bulk exam eligibility.
+
+Every pending or approved registration of an exam session is checked against
+three rules. Each rule is evaluated for the whole session with one grouped
+query:
+
+* dues: the student has no uncleared ``StudentDue`` (not PAID/WAIVED and
+  with a balance left) that is overdue or past its due date;
+* enrollment: the student is ENROLLED (or COMPLETED) in a section of the
+  exam's course for the session's academic year;
+* attendance: attendance in those sections is at least ``MIN_ATTENDANCE``
+  percent. It is taken from ``AttendanceRecord``, where PRESENT and LATE
+  count as attended and EXCUSED sessions are left out. When no attendance
+  has been recorded, the enrollment's ``attendance_percentage`` is used
+  instead, and when neither exists the rule is skipped.
+
+``apply`` approves eligible pending registrations with one UPDATE. It then
+creates their hall tickets, exam attendance and result rows in bulk, which
+is what the per-registration ``post_save`` signals do on approval. Failing
+rules are recorded on the other registrations, and ineligible pending
+registrations can optionally be rejected.
+"""
+from collections import defaultdict
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Count, F, Max, Q, Sum
+from django.utils import timezone
+
+from academics.models import CourseEnrollment
+from attendance.models import AttendanceRecord
+from campshub360.utils import use_primary_reads
+from .cache import invalidate_exam_summary
+from .hall_tickets import allocate_ticket_numbers
+from .models import ExamAttendance, ExamRegistration, ExamResult, HallTicket, StudentDue
+
+MIN_ATTENDANCE = Decimal('75')
+
+ISSUE_LABELS = {
+    'DUES': 'Outstanding dues',
+    'NOT_ENROLLED': 'Not enrolled in the course',
+    'LOW_ATTENDANCE': 'Attendance below the minimum',
+}
+
+EXCEPTION_COLUMNS = [
+    ('registration_id', 'Registration ID'),
+    ('roll_number', 'Roll Number'),
+    ('student_name', 'Student'),
+    ('course_code', 'Course'),
+    ('exam_title', 'Exam'),
+    ('status', 'Status'),
+    ('issues', 'Issues'),
+    ('outstanding_dues', 'Outstanding Dues'),
+    ('attendance_percentage', 'Attendance %'),
+]
+
+
+@dataclass
+class EligibilityReport:
+    checked: int = 0
+    eligible: int = 0
+    approved: int = 0
+    rejected: int = 0
+    exceptions: list = field(default_factory=list)
+
+    def as_dict(self):
+        counts = defaultdict(int)
+        for row in self.exceptions:
+            for code in row['issue_codes']:
+                counts[code] += 1
+        return {
+            'checked': self.checked,
+            'eligible': self.eligible,
+            'ineligible': len(self.exceptions),
+            'approved': self.approved,
+            'rejected': self.rejected,
+            'issues': dict(counts),
+            'exceptions': self.exceptions,
+        }
+
+
+class EligibilityEngine:
+    """Check, approve and flag the registrations of an exam session."""
+
+    def __init__(self, exam_session, min_attendance=MIN_ATTENDANCE):
+        self.exam_session = exam_session
+        self.min_attendance = Decimal(str(min_attendance))
+        self.report = EligibilityReport()
+        self.outcomes = []
+
+    def _registrations(self):
+        return ExamRegistration.objects.filter(
+            exam_schedule__exam_session=self.exam_session, status__in=['PENDING', 'APPROVED']
+        )
+
+    def _load(self):
+        registrations = self._registrations()
+        students = registrations.values('student_id')
+        rows = list(registrations.values(
+            'id', 'status', 'student_id', 'student__roll_number', 'student__first_name',
+            'student__last_name', 'exam_schedule__course_id', 'exam_schedule__course__code',
+            'exam_schedule__title',
+        ).order_by('student__roll_number', 'exam_schedule__exam_date'))
+        course_ids = {row['exam_schedule__course_id'] for row in rows}
+        today = timezone.now().date()
+
+        self.dues = dict(StudentDue.objects.filter(
+            student_id__in=students, paid_amount__lt=F('amount'),
+        ).exclude(status__in=['PAID', 'WAIVED']).filter(
+            Q(status='OVERDUE') | Q(due_date__lt=today)
+        ).values('student_id').annotate(
+            outstanding=Sum(F('amount') - F('paid_amount'))
+        ).values_list('student_id', 'outstanding').order_by())
+
+        self.enrolled = {}
+        for student_id, course_id, percentage in CourseEnrollment.objects.filter(
+            student_id__in=students,
+            status__in=['ENROLLED', 'COMPLETED'],
+            course_section__course_id__in=course_ids,
+            course_section__academic_year=self.exam_session.academic_year,
+        ).values('student_id', 'course_section__course_id').annotate(
+            percentage=Max('attendance_percentage')
+        ).values_list('student_id', 'course_section__course_id', 'percentage').order_by():
+            self.enrolled[(student_id, course_id)] = percentage
+
+        self.attendance = {}
+        for student_id, course_id, attended, counted in AttendanceRecord.objects.filter(
+            student_id__in=students,
+            session__is_cancelled=False,
+            session__course_section__course_id__in=course_ids,
+            session__course_section__academic_year=self.exam_session.academic_year,
+        ).values('student_id', 'session__course_section__course_id').annotate(
+            attended=Count('id', filter=Q(status__in=['PRESENT', 'LATE'])),
+            counted=Count('id', filter=~Q(status='EXCUSED')),
+        ).values_list('student_id', 'session__course_section__course_id', 'attended', 'counted').order_by():
+            if counted:
+                self.attendance[(student_id, course_id)] = Decimal(attended * 100) / counted
+        return rows
+
+    def evaluate(self):
+        """Compute eligibility of every registration. Returns the EligibilityReport."""
+        with use_primary_reads():
+            rows = self._load()
+
+        for row in rows:
+            key = (row['student_id'], row['exam_schedule__course_id'])
+            issues = []
+            outstanding = self.dues.get(row['student_id'])
+            if outstanding:
+                issues.append('DUES')
+            if key not in self.enrolled:
+                issues.append('NOT_ENROLLED')
+            attendance = self.attendance.get(key, self.enrolled.get(key))
+            if attendance is not None and attendance < self.min_attendance:
+                issues.append('LOW_ATTENDANCE')
+
+            self.outcomes.append((row['id'], row['status'], issues))
+            if not issues:
+                self.report.eligible += 1
+                continue
+            self.report.exceptions.append({
+                'registration_id': str(row['id']),
+                'roll_number': row['student__roll_number'],
+                'student_name': f"{row['student__first_name']} {row['student__last_name']}".strip(),
+                'course_code': row['exam_schedule__course__code'],
+                'exam_title': row['exam_schedule__title'],
+                'status': row['status'],
+                'issue_codes': issues,
+                'issues': '; '.join(ISSUE_LABELS[code] for code in issues),
+                'outstanding_dues': str(outstanding) if outstanding else '',
+                'attendance_percentage': str(round(attendance, 2)) if attendance is not None else '',
+            })
+        self.report.checked = len(self.outcomes)
+        return self.report
+
+    @transaction.atomic
+    def apply(self, approved_by=None, reject_ineligible=False):
+        """Approve eligible pending registrations and record issues on the rest."""
+        now = timezone.now()
+        by_issues = defaultdict(list)
+        to_approve, to_reject = [], []
+        for pk, registration_status, issues in self.outcomes:
+            by_issues[tuple(issues)].append(pk)
+            if registration_status != 'PENDING':
+                continue
+            if not issues:
+                to_approve.append(pk)
+            elif reject_ineligible:
+                to_reject.append((pk, issues))
+
+        # One UPDATE per distinct combination of failing rules
+        for issues, pks in by_issues.items():
+            ExamRegistration.objects.filter(pk__in=pks).update(
+                eligibility_issues=list(issues), eligibility_checked_at=now,
+            )
+
+        if to_approve:
+            self.report.approved = ExamRegistration.objects.filter(
+                pk__in=to_approve, status='PENDING'
+            ).update(status='APPROVED', approved_by=approved_by, approved_date=now, updated_at=now)
+            self._create_approval_records(to_approve)
+
+        rejected = defaultdict(list)
+        for pk, issues in to_reject:
+            rejected['; '.join(ISSUE_LABELS[code] for code in issues)].append(pk)
+        for reason, pks in rejected.items():
+            self.report.rejected += ExamRegistration.objects.filter(pk__in=pks, status='PENDING').update(
+                status='REJECTED', rejection_reason=f"Not eligible: {reason}", updated_at=now,
+            )
+
+        invalidate_exam_summary([self.exam_session.pk])
+        return self.report
+
+    def _create_approval_records(self, registration_ids):
+        """Hall ticket, exam attendance and result rows for newly approved registrations."""
+        have_ticket = set(HallTicket.objects.filter(
+            exam_registration_id__in=registration_ids
+        ).values_list('exam_registration_id', flat=True))
+        have_attendance = set(ExamAttendance.objects.filter(
+            exam_registration_id__in=registration_ids
+        ).values_list('exam_registration_id', flat=True))
+        have_result = set(ExamResult.objects.filter(
+            exam_registration_id__in=registration_ids
+        ).values_list('exam_registration_id', flat=True))
+
+        missing_tickets = [pk for pk in registration_ids if pk not in have_ticket]
+        numbers = allocate_ticket_numbers(self.exam_session.academic_year, len(missing_tickets))
+        HallTicket.objects.bulk_create([
+            HallTicket(exam_registration_id=pk, ticket_number=number)
+            for pk, number in zip(missing_tickets, numbers)
+        ], batch_size=1000)
+        ExamAttendance.objects.bulk_create([
+            ExamAttendance(exam_registration_id=pk, status='ABSENT')
+            for pk in registration_ids if pk not in have_attendance
+        ], batch_size=1000)
+        ExamResult.objects.bulk_create([
+            ExamResult(exam_registration_id=pk)
+            for pk in registration_ids if pk not in have_result
+        ], batch_size=1000)
@@ -0,0 +1,58 @@
+"""
+Hall ticket PDF layout.
+
+Kept free of Django imports so the render functions can run in worker
+processes; they take plain dicts (see ``HallTicketPipeline.payload``) and
+return PDF bytes.
+"""
+from io import BytesIO
+
+from reportlab.lib.pagesizes import letter
+from reportlab.pdfgen import canvas
+
+
+def draw_hall_ticket(p, ticket):
+    """Draw one hall ticket on the current page of canvas ``p``."""
+    p.drawString(100, 750, "HALL TICKET")
+    p.drawString(100, 720, f"Ticket Number: {ticket['ticket_number']}")
+    p.drawString(100, 690, f"Student: {ticket['student_name']}")
+    p.drawString(100, 660, f"Roll Number: {ticket['roll_number']}")
+    p.drawString(100, 630, f"Exam: {ticket['exam_title']}")
+    p.drawString(100, 600, f"Course: {ticket['course_code']}")
+    p.drawString(100, 570, f"Date: {ticket['exam_date']}")
+    p.drawString(100, 540, f"Time: {ticket['start_time']} - {ticket['end_time']}")
+
+    if ticket.get('room_name'):
+        p.drawString(100, 510, f"Room: {ticket['room_name']}")
+        p.drawString(100, 480, f"Building: {ticket['building']}")
+
+    if ticket.get('seat_number'):
+        p.drawString(100, 450, f"Seat Number: {ticket['seat_number']}")
+
+    p.showPage()
+
+
+def render_ticket(ticket):
+    """Render a single hall ticket and return the PDF bytes."""
+    buffer = BytesIO()
+    p = canvas.Canvas(buffer, pagesize=letter)
+    draw_hall_ticket(p, ticket)
+    p.save()
+    return buffer.getvalue()
+
+
+def render_batch(tickets):
+    """
+    Render a batch of tickets (normally one room).
+
+    Returns ``(files, merged)`` where files is a list of
+    ``(ticket_number, pdf_bytes)`` and merged is one PDF with a page per ticket.
+    """
+    files = [(ticket['ticket_number'], render_ticket(ticket)) for ticket in tickets]
+
+    buffer = BytesIO()
+    p = canvas.Canvas(buffer, pagesize=letter)
+    for ticket in tickets:
+        draw_hall_ticket(p, ticket)
+    p.save()
+    return files, buffer.getvalue()
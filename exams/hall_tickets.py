@@ -0,0 +1,205 @@
+"""
+Bulk hall ticket pipeline.
+
+Generation loads every approved registration of a schedule in one query
+(students, schedule, course, session and any existing ticket/room joined
+in), takes its ticket numbers from the ``hall_ticket`` document number
+series in one call, fills the schedule's allocated rooms seat by
+seat and writes the tickets with one ``bulk_create``.
+
+Rendering happens in a ``HallTicketJob``, run by a background worker
+(the ``exams.render_hall_tickets`` task): ticket payloads are built from a
+single joined query, grouped by room and rendered by a process pool
+(``hall_ticket_pdf`` has no Django dependencies). The parent process writes
+one PDF per ticket plus a merged PDF per room to the default storage and
+records progress on the job row.
+"""
+import logging
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.utils import timezone
+from django.utils.text import slugify
+
+from campshub360.jobs import submit
+from campshub360.numbering import allocate
+from campshub360.utils import use_primary_reads
+from .models import (
+    ExamRegistration, ExamRoomAllocation, HallTicket, HallTicketJob,
+)
+
+logger = logging.getLogger(__name__)
+
+STORAGE_ROOT = 'hall_tickets'
+
+
+def ticket_series(academic_year):
+    return academic_year[:4]
+
+
+def allocate_ticket_numbers(academic_year, count):
+    """Reserve ``count`` ticket numbers for an academic year."""
+    return allocate('hall_ticket', count, scope=ticket_series(academic_year))
+
+
+class HallTicketPipeline:
+    """Generate and render hall tickets for one exam schedule."""
+
+    def __init__(self, exam_schedule, workers=None, batch_size=200, storage=None):
+        self.exam_schedule = exam_schedule
+        self.workers = workers
+        self.batch_size = batch_size
+        self.storage = storage or default_storage
+
+    def _registrations(self):
+        return ExamRegistration.objects.filter(
+            exam_schedule=self.exam_schedule, status='APPROVED'
+        ).select_related(
+            'student', 'exam_schedule__course', 'exam_schedule__exam_session', 'hall_ticket__exam_room',
+        ).order_by('student__roll_number')
+
+    def _free_seats(self):
+        """Yield (room, seat_number) pairs still free in the schedule's allocated rooms."""
+        allocations = ExamRoomAllocation.objects.filter(
+            exam_schedule=self.exam_schedule, exam_room__is_active=True
+        ).select_related('exam_room').order_by('-is_primary', 'exam_room__building', 'exam_room__name')
+        taken = defaultdict(set)
+        for room_id, seat in HallTicket.objects.filter(
+            exam_registration__exam_schedule=self.exam_schedule, exam_room__isnull=False
+        ).values_list('exam_room_id', 'seat_number').order_by():
+            taken[room_id].add(seat)
+        for allocation in allocations:
+            room = allocation.exam_room
+            capacity = min(allocation.allocated_capacity, room.capacity)
+            for seat in range(1, capacity + 1):
+                if str(seat) not in taken[room.pk]:
+                    yield room, str(seat)
+
+    def generate(self):
+        """Create tickets for approved registrations that have none. Returns the new tickets."""
+        with use_primary_reads(), transaction.atomic():
+            pending = [
+                registration for registration in self._registrations()
+                if not hasattr(registration, 'hall_ticket')
+            ]
+            if not pending:
+                return []
+
+            numbers = allocate_ticket_numbers(self.exam_schedule.exam_session.academic_year, len(pending))
+            seats = self._free_seats()
+            tickets = []
+            for registration, number in zip(pending, numbers):
+                room, seat = next(seats, (None, ''))
+                tickets.append(HallTicket(
+                    exam_registration=registration,
+                    ticket_number=number,
+                    exam_room=room,
+                    seat_number=seat,
+                    status='GENERATED',
+                ))
+            # Numbers are assigned up front, so the post_save numbering signal isn't needed
+            HallTicket.objects.bulk_create(tickets)
+            return tickets
+
+    @staticmethod
+    def payload(ticket):
+        registration = ticket.exam_registration
+        schedule = registration.exam_schedule
+        room = ticket.exam_room
+        return {
+            'ticket_number': ticket.ticket_number,
+            'student_name': registration.student.full_name,
+            'roll_number': registration.student.roll_number,
+            'exam_title': schedule.title,
+            'course_code': schedule.course.code,
+            'exam_date': str(schedule.exam_date),
+            'start_time': str(schedule.start_time),
+            'end_time': str(schedule.end_time),
+            'room_name': room.name if room else '',
+            'building': room.building if room else '',
+            'seat_number': ticket.seat_number,
+        }
+
+    def _batches(self):
+        tickets = HallTicket.objects.filter(
+            exam_registration__exam_schedule=self.exam_schedule
+        ).select_related(
+            'exam_registration__student', 'exam_registration__exam_schedule__course', 'exam_room',
+        ).order_by('ticket_number')
+
+        rooms = defaultdict(list)
+        for ticket in tickets:
+            room = ticket.exam_room
+            label = slugify(f"{room.building}-{room.name}") if room else 'unassigned'
+            rooms[label].append(self.payload(ticket))
+
+        for label, payloads in rooms.items():
+            # Seat numbers are strings; keep "2" ahead of "10"
+            payloads.sort(key=lambda t: (len(t['seat_number']), t['seat_number']))
+            parts = range(0, len(payloads), self.batch_size)
+            for index, start in enumerate(parts, start=1):
+                name = label if len(parts) == 1 else f"{label}-part{index}"
+                yield name, payloads[start:start + self.batch_size]
+
+    def _write(self, path, content):
+        if self.storage.exists(path):
+            self.storage.delete(path)
+        return self.storage.save(path, ContentFile(content))
+
+    def render(self, job=None):
+        """Render every ticket of the schedule; returns the merged per-room file paths."""
+        from .hall_ticket_pdf import render_batch
+        with use_primary_reads():
+            batches = list(self._batches())
+        total = sum(len(payloads) for _, payloads in batches)
+        if job is not None:
+            HallTicketJob.objects.filter(pk=job.pk).update(total_tickets=total, rendered_tickets=0)
+
+        base = f"{STORAGE_ROOT}/{self.exam_schedule.pk}"
+        room_files = []
+        rendered = 0
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            futures = {pool.submit(render_batch, payloads): name for name, payloads in batches}
+            for future in as_completed(futures):
+                files, merged = future.result()
+                for ticket_number, content in files:
+                    self._write(f"{base}/tickets/{ticket_number}.pdf", content)
+                room_files.append(self._write(f"{base}/rooms/{futures[future]}.pdf", merged))
+                rendered += len(files)
+                if job is not None:
+                    HallTicketJob.objects.filter(pk=job.pk).update(rendered_tickets=rendered)
+
+        HallTicket.objects.filter(
+            exam_registration__exam_schedule=self.exam_schedule, status='DRAFT'
+        ).update(status='GENERATED')
+        return sorted(room_files)
+
+
+def run_hall_ticket_job(job_id, workers=None):
+    """Execute a pending HallTicketJob, recording progress and outcome on the row."""
+    job = HallTicketJob.objects.select_related('exam_schedule__exam_session').get(pk=job_id)
+    HallTicketJob.objects.filter(pk=job.pk).update(status='RUNNING', started_at=timezone.now())
+    try:
+        room_files = HallTicketPipeline(job.exam_schedule, workers=workers).render(job)
+    except Exception as exc:
+        logger.exception("Hall ticket job %s failed", job_id)
+        HallTicketJob.objects.filter(pk=job.pk).update(
+            status='FAILED', error=str(exc), finished_at=timezone.now()
+        )
+    else:
+        HallTicketJob.objects.filter(pk=job.pk).update(
+            status='COMPLETED', room_files=room_files, finished_at=timezone.now()
+        )
+
+
+def start_hall_ticket_job(job):
+    """Queue the job for a background worker (see ``exams.tasks``)."""
+    return submit(
+        'exams.render_hall_tickets',
+        {'hall_ticket_job_id': str(job.pk)},
+        user=job.requested_by,
+        label=f"Hall tickets for {job.exam_schedule}",
+    )
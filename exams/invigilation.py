@@ -0,0 +1,266 @@
+"""
+Invigilation rostering.
+
+Everything the roster depends on is loaded once per run: the session's
+schedules and room allocations, active faculty, their weekly teaching
+schedule, leave overlapping the session and any existing "not available"
+assignments. Schedules are grouped into overlapping time slots (see
+``seating.time_slots``) and staffed slot by slot:
+
+* every room in use gets ``ceil(students / STUDENTS_PER_INVIGILATOR)``
+  invigilators, assigned to the schedule with the most students in that
+  room;
+* every schedule gets one chief invigilator, preferring senior designations;
+* every schedule gets one observer per ``ROOMS_PER_OBSERVER`` rooms.
+
+Candidates are faculty who are not on approved leave, not teaching during
+the slot, not already on duty in the slot and under ``MAX_DUTIES_PER_DAY``;
+among them the least loaded (by duty minutes) is picked, so duty is spread
+evenly. Unfilled requirements are returned in the conflict report rather
+than raising.
+"""
+import math
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from django.db import transaction
+
+from campshub360.utils import use_primary_reads
+from faculty.models import Faculty, FacultyLeave, FacultySchedule
+from .models import ExamRoomAllocation, ExamSchedule, ExamStaffAssignment
+from .seating import time_slots
+
+SENIOR_DESIGNATIONS = {
+    'PROFESSOR', 'ASSOCIATE_PROFESSOR', 'HEAD_OF_DEPARTMENT', 'DEAN', 'PRINCIPAL', 'VICE_PRINCIPAL',
+}
+
+
+def _minutes(schedule):
+    start = datetime.combine(schedule.exam_date, schedule.start_time)
+    end = datetime.combine(schedule.exam_date, schedule.end_time)
+    return max(int((end - start).total_seconds() // 60), 0)
+
+
+@dataclass
+class Duty:
+    schedule: object
+    faculty_id: object
+    role: str
+    room: object = None
+
+
+@dataclass
+class RosterReport:
+    duties: int = 0
+    shortfalls: list = field(default_factory=list)
+    load: dict = field(default_factory=dict)
+
+    def as_dict(self):
+        minutes = list(self.load.values())
+        return {
+            'duties': self.duties,
+            'faculty_on_duty': len(minutes),
+            'shortfalls': self.shortfalls,
+            'load_minutes': {
+                'min': min(minutes) if minutes else 0,
+                'max': max(minutes) if minutes else 0,
+                'mean': round(sum(minutes) / len(minutes), 1) if minutes else 0,
+            },
+        }
+
+
+class InvigilationScheduler:
+    """Assign chief invigilators, invigilators and observers for an exam session."""
+
+    STUDENTS_PER_INVIGILATOR = 30
+    ROOMS_PER_OBSERVER = 5
+    MAX_DUTIES_PER_DAY = 2
+
+    def __init__(self, exam_session):
+        self.exam_session = exam_session
+        self.duties = []
+        self.report = RosterReport()
+
+    def _load(self):
+        self.schedules = list(ExamSchedule.objects.filter(
+            exam_session=self.exam_session, is_online=False
+        ).exclude(status='CANCELLED'))
+        schedule_ids = [s.pk for s in self.schedules]
+
+        self.allocations = defaultdict(list)
+        for allocation in ExamRoomAllocation.objects.filter(
+            exam_schedule__in=schedule_ids
+        ).select_related('exam_room'):
+            self.allocations[allocation.exam_schedule_id].append(allocation)
+
+        self.faculty = {
+            f.pk: f for f in Faculty.objects.filter(status='ACTIVE', currently_associated=True).only(
+                'id', 'name', 'designation'
+            )
+        }
+
+        self.teaching = defaultdict(list)
+        for faculty_id, day, start, end in FacultySchedule.objects.filter(
+            faculty_id__in=self.faculty.keys()
+        ).values_list('faculty_id', 'day_of_week', 'start_time', 'end_time').order_by():
+            self.teaching[faculty_id].append((day, start, end))
+
+        self.leave = defaultdict(list)
+        for faculty_id, start, end in FacultyLeave.objects.filter(
+            faculty_id__in=self.faculty.keys(),
+            status='APPROVED',
+            start_date__lte=self.exam_session.end_date,
+            end_date__gte=self.exam_session.start_date,
+        ).values_list('faculty_id', 'start_date', 'end_date').order_by():
+            self.leave[faculty_id].append((start, end))
+
+        self.declined = set(ExamStaffAssignment.objects.filter(
+            exam_schedule__in=schedule_ids, is_available=False
+        ).values_list('exam_schedule_id', 'faculty_id').order_by())
+
+    def is_available(self, faculty_id, date, start, end):
+        if any(s <= date <= e for s, e in self.leave.get(faculty_id, ())):
+            return False
+        day = date.strftime('%A').upper()
+        return not any(
+            d == day and s < end and start < e for d, s, e in self.teaching.get(faculty_id, ())
+        )
+
+    def solve(self):
+        with use_primary_reads():
+            self._load()
+
+        load = defaultdict(int)
+        daily = defaultdict(int)
+        for slot in time_slots(self.schedules):
+            date = slot[0].exam_date
+            start = min(s.start_time for s in slot)
+            end = max(s.end_time for s in slot)
+            busy = set()
+            candidates = [
+                pk for pk in self.faculty
+                if daily[(pk, date)] < self.MAX_DUTIES_PER_DAY and self.is_available(pk, date, start, end)
+            ]
+
+            def pick(schedule, senior=False):
+                pool = [
+                    pk for pk in candidates
+                    if pk not in busy and (schedule.pk, pk) not in self.declined
+                ]
+                if senior:
+                    pool = [pk for pk in pool if self.faculty[pk].designation in SENIOR_DESIGNATIONS] or pool
+                if not pool:
+                    return None
+                chosen = min(pool, key=lambda pk: (load[pk], str(pk)))
+                busy.add(chosen)
+                daily[(chosen, date)] += 1
+                load[chosen] += _minutes(schedule)
+                return chosen
+
+            def assign(schedule, role, room=None, senior=False):
+                faculty_id = pick(schedule, senior=senior)
+                if faculty_id is None:
+                    return False
+                self.duties.append(Duty(schedule, faculty_id, role, room))
+                return True
+
+            # Rooms can be shared by several schedules of the slot; staff them once
+            rooms = {}
+            for schedule in slot:
+                for allocation in self.allocations.get(schedule.pk, []):
+                    entry = rooms.setdefault(allocation.exam_room.pk, {
+                        'room': allocation.exam_room, 'students': 0, 'by_schedule': defaultdict(int),
+                    })
+                    entry['students'] += allocation.allocated_capacity
+                    entry['by_schedule'][schedule] += allocation.allocated_capacity
+
+            for schedule in slot:
+                if not assign(schedule, 'CHIEF_INVIGILATOR', senior=True):
+                    self._shortfall(schedule, 'CHIEF_INVIGILATOR', None, 1, 0)
+
+            for entry in rooms.values():
+                required = max(1, math.ceil(entry['students'] / self.STUDENTS_PER_INVIGILATOR))
+                schedule = max(entry['by_schedule'].items(), key=lambda item: item[1])[0]
+                assigned = sum(
+                    assign(schedule, 'INVIGILATOR', room=entry['room']) for _ in range(required)
+                )
+                if assigned < required:
+                    self._shortfall(schedule, 'INVIGILATOR', entry['room'], required, assigned)
+
+            for schedule in slot:
+                room_count = len(self.allocations.get(schedule.pk, []))
+                required = math.ceil(room_count / self.ROOMS_PER_OBSERVER)
+                assigned = sum(assign(schedule, 'OBSERVER') for _ in range(required))
+                if assigned < required:
+                    self._shortfall(schedule, 'OBSERVER', None, required, assigned)
+
+        self.report.duties = len(self.duties)
+        self.report.load = {str(pk): minutes for pk, minutes in load.items()}
+        return self.report
+
+    def _shortfall(self, schedule, role, room, required, assigned):
+        self.report.shortfalls.append({
+            'exam_schedule': str(schedule.pk),
+            'exam_date': str(schedule.exam_date),
+            'start_time': str(schedule.start_time),
+            'role': role,
+            'room': room.name if room else None,
+            'required': required,
+            'assigned': assigned,
+        })
+
+    @transaction.atomic
+    def apply(self):
+        """Replace the session's available staff assignments with the computed roster."""
+        ExamStaffAssignment.objects.filter(
+            exam_schedule__in=[s.pk for s in self.schedules], is_available=True
+        ).delete()
+        ExamStaffAssignment.objects.bulk_create([
+            ExamStaffAssignment(
+                exam_schedule=duty.schedule,
+                faculty_id=duty.faculty_id,
+                role=duty.role,
+                exam_room=duty.room,
+                notes='Auto-rostered',
+            )
+            for duty in self.duties
+        ], batch_size=1000)
+        return len(self.duties)
+
+
+def assignment_conflicts(exam_schedule, faculty_ids):
+    """
+    Check caller-supplied staff for an exam schedule.
+
+    Returns a list of ``{'faculty_id', 'reason'}`` for faculty on approved
+    leave, teaching during the exam or on duty in an overlapping exam.
+    """
+    scheduler = InvigilationScheduler(exam_schedule.exam_session)
+    date, start, end = exam_schedule.exam_date, exam_schedule.start_time, exam_schedule.end_time
+    with use_primary_reads():
+        scheduler.leave = defaultdict(list)
+        for faculty_id, s, e in FacultyLeave.objects.filter(
+            faculty_id__in=faculty_ids, status='APPROVED', start_date__lte=date, end_date__gte=date,
+        ).values_list('faculty_id', 'start_date', 'end_date').order_by():
+            scheduler.leave[faculty_id].append((s, e))
+        scheduler.teaching = defaultdict(list)
+        for faculty_id, day, s, e in FacultySchedule.objects.filter(
+            faculty_id__in=faculty_ids
+        ).values_list('faculty_id', 'day_of_week', 'start_time', 'end_time').order_by():
+            scheduler.teaching[faculty_id].append((day, s, e))
+        double_booked = set(ExamStaffAssignment.objects.filter(
+            faculty_id__in=faculty_ids,
+            is_available=True,
+            exam_schedule__exam_date=date,
+            exam_schedule__start_time__lt=end,
+            exam_schedule__end_time__gt=start,
+        ).exclude(exam_schedule=exam_schedule).values_list('faculty_id', flat=True).order_by())
+
+    conflicts = []
+    for faculty_id in faculty_ids:
+        if faculty_id in double_booked:
+            conflicts.append({'faculty_id': str(faculty_id), 'reason': 'On duty in an overlapping exam'})
+        elif not scheduler.is_available(faculty_id, date, start, end):
+            conflicts.append({'faculty_id': str(faculty_id), 'reason': 'On leave or teaching during the exam'})
+    return conflicts
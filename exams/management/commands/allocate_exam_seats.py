@@ -0,0 +1,43 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from exams.models import ExamSchedule, ExamSession
+from exams.seating import SeatingEngine
+
+
+class Command(BaseCommand):
+    help = 'Assign exam rooms and seats for an exam schedule or a whole exam session.'
+
+    def add_arguments(self, parser):
+        target = parser.add_mutually_exclusive_group(required=True)
+        target.add_argument('--exam-schedule', type=str, help='ExamSchedule ID')
+        target.add_argument('--exam-session', type=str, help='ExamSession ID')
+        parser.add_argument('--dry-run', action='store_true', help='Report the assignment without writing')
+
+    def handle(self, *args, **options):
+        if options['exam_schedule']:
+            schedule = ExamSchedule.objects.select_related('exam_session').filter(
+                pk=options['exam_schedule']
+            ).first()
+            if schedule is None:
+                raise CommandError(f"Exam schedule {options['exam_schedule']} not found")
+            engine = SeatingEngine.for_schedule(schedule)
+        else:
+            session = ExamSession.objects.filter(pk=options['exam_session']).first()
+            if session is None:
+                raise CommandError(f"Exam session {options['exam_session']} not found")
+            engine = SeatingEngine.for_session(session)
+
+        report = engine.solve()
+        summary = report.as_dict()
+        summary.pop('unseated_registrations')
+        summary.pop('double_booked_registrations')
+        self.stdout.write(json.dumps(summary, indent=2))
+        if options['dry_run']:
+            return
+        written = engine.apply()
+        self.stdout.write(self.style.SUCCESS(
+            f"Seated {report.seated} students: {written['allocations']} room allocations, "
+            f"{written['tickets_updated']} tickets updated, {written['tickets_created']} created"
+        ))
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from exams.hall_tickets import HallTicketPipeline, run_hall_ticket_job
+from exams.models import ExamSchedule, HallTicketJob
+
+
+class Command(BaseCommand):
+    help = 'Generate hall tickets for an exam schedule and render their PDFs to storage.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--exam-schedule', type=str, required=True, help='ExamSchedule ID')
+        parser.add_argument('--workers', type=int, help='Renderer processes (defaults to CPU count)')
+        parser.add_argument('--skip-render', action='store_true', help='Only create the tickets')
+
+    def handle(self, *args, **options):
+        exam_schedule = ExamSchedule.objects.select_related('exam_session').filter(
+            pk=options['exam_schedule']
+        ).first()
+        if exam_schedule is None:
+            raise CommandError(f"Exam schedule {options['exam_schedule']} not found")
+
+        tickets = HallTicketPipeline(exam_schedule).generate()
+        self.stdout.write(f'Created {len(tickets)} hall tickets')
+        if options['skip_render']:
+            return
+
+        job = HallTicketJob.objects.create(exam_schedule=exam_schedule, tickets_created=len(tickets))
+        run_hall_ticket_job(job.pk, workers=options.get('workers'))
+        job.refresh_from_db()
+        if job.status != 'COMPLETED':
+            raise CommandError(f'Rendering failed: {job.error}')
+        for path in job.room_files:
+            self.stdout.write(path)
+        self.stdout.write(self.style.SUCCESS(
+            f'Rendered {job.rendered_tickets} hall tickets into {len(job.room_files)} room files'
+        ))
@@ -0,0 +1,29 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from exams.invigilation import InvigilationScheduler
+from exams.models import ExamSession
+
+
+class Command(BaseCommand):
+    help = 'Assign chief invigilators, invigilators and observers for every exam of a session.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--exam-session', type=str, required=True, help='ExamSession ID')
+        parser.add_argument('--dry-run', action='store_true', help='Report the roster without writing')
+
+    def handle(self, *args, **options):
+        session = ExamSession.objects.filter(pk=options['exam_session']).first()
+        if session is None:
+            raise CommandError(f"Exam session {options['exam_session']} not found")
+
+        scheduler = InvigilationScheduler(session)
+        report = scheduler.solve()
+        self.stdout.write(json.dumps(report.as_dict(), indent=2))
+        if options['dry_run']:
+            return
+        created = scheduler.apply()
+        self.stdout.write(self.style.SUCCESS(
+            f'Created {created} staff assignments with {len(report.shortfalls)} shortfalls'
+        ))
@@ -0,0 +1,52 @@
+# Generated by Django 5.1.4 on 2026-10-19 05:26
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exams', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HallTicketSequence',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('series', models.CharField(help_text='Ticket number prefix, e.g. HT2024', max_length=20, unique=True)),
+                ('last_value', models.PositiveBigIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Hall Ticket Sequence',
+                'verbose_name_plural': 'Hall Ticket Sequences',
+            },
+        ),
+        migrations.CreateModel(
+            name='HallTicketJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('RUNNING', 'Running'), ('COMPLETED', 'Completed'), ('FAILED', 'Failed')], default='PENDING', max_length=20)),
+                ('tickets_created', models.PositiveIntegerField(default=0)),
+                ('total_tickets', models.PositiveIntegerField(default=0)),
+                ('rendered_tickets', models.PositiveIntegerField(default=0)),
+                ('room_files', models.JSONField(blank=True, default=list, help_text='Storage paths of the merged per-room PDFs')),
+                ('error', models.TextField(blank=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('exam_schedule', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='hall_ticket_jobs', to='exams.examschedule')),
+                ('requested_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='hall_ticket_jobs', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Hall Ticket Job',
+                'verbose_name_plural': 'Hall Ticket Jobs',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.4 on 2026-10-19 05:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exams', '0002_hall_ticket_sequence_job'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='examregistration',
+            name='eligibility_checked_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='examregistration',
+            name='eligibility_issues',
+            field=models.JSONField(blank=True, default=list, help_text='Failed eligibility rules from the last bulk check'),
+        ),
+    ]
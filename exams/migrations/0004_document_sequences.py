@@ -0,0 +1,29 @@
+# Generated by Django 5.1.4 on 2026-10-19 06:01
+
+from django.db import migrations
+
+
+def move_ticket_sequences(apps, schema_editor):
+    """Carry hall ticket counters (series ``HT<year>``) over to ``hall_ticket:<year>``."""
+    HallTicketSequence = apps.get_model('exams', 'HallTicketSequence')
+    DocumentSequence = apps.get_model('campshub360', 'DocumentSequence')
+    for sequence in HallTicketSequence.objects.all():
+        DocumentSequence.objects.update_or_create(
+            series=f"hall_ticket:{sequence.series[2:]}",
+            defaults={'last_value': sequence.last_value},
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exams', '0003_registration_eligibility'),
+        ('campshub360', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(move_ticket_sequences, migrations.RunPython.noop),
+        migrations.DeleteModel(
+            name='HallTicketSequence',
+        ),
+    ]
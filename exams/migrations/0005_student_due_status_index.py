@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-19 06:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exams', '0004_document_sequences'),
+        ('students', '0002_document_numbers'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='studentdue',
+            index=models.Index(fields=['status', 'due_date'], name='exams_stude_status_a10c02_idx'),
+        ),
+    ]
@@ -240,6 +240,9 @@ class StudentDue(models.Model):
         ordering = ['-due_date', 'student']
         verbose_name = "Student Due"
         verbose_name_plural = "Student Dues"
+        indexes = [
+            models.Index(fields=['status', 'due_date']),
+        ]
     
     def __str__(self):
         return f"{self.student.roll_number} - {self.due_type} (₹{self.amount})"
@@ -250,7 +253,7 @@ class StudentDue(models.Model):
     
     @property
     def is_overdue(self):
-        return self.due_date < timezone.now().date() and self.status == 'PENDING'
+        return self.status == 'OVERDUE' or (self.due_date < timezone.now().date() and self.status == 'PENDING')
 
 
 class ExamRegistration(TimeStampedUUIDModel):
@@ -271,6 +274,8 @@ class ExamRegistration(TimeStampedUUIDModel):
     approved_date = models.DateTimeField(null=True, blank=True)
     rejection_reason = models.TextField(blank=True, help_text="Reason for rejection if applicable")
     special_requirements = models.TextField(blank=True, help_text="Any special requirements or accommodations")
+    eligibility_issues = models.JSONField(default=list, blank=True, help_text="Failed eligibility rules from the last bulk check")
+    eligibility_checked_at = models.DateTimeField(null=True, blank=True)
     
     class Meta:
         unique_together = ['student', 'exam_schedule']
@@ -317,14 +322,47 @@ class HallTicket(TimeStampedUUIDModel):
     def generate_ticket_number(self):
         """Generate unique ticket number"""
         if not self.ticket_number:
-            import random
-            import string
-            prefix = f"HT{self.exam_registration.exam_schedule.exam_session.academic_year[:4]}"
-            suffix = ''.join(random.choices(string.ascii_uppercase + string.digits, k=8))
-            self.ticket_number = f"{prefix}{suffix}"
+            from .hall_tickets import allocate_ticket_numbers
+            academic_year = self.exam_registration.exam_schedule.exam_session.academic_year
+            self.ticket_number = allocate_ticket_numbers(academic_year, 1)[0]
         return self.ticket_number
 
 
+class HallTicketJob(TimeStampedUUIDModel):
+    """Background rendering of hall ticket PDFs for an exam schedule"""
+    STATUS_CHOICES = [
+        ('PENDING', 'Pending'),
+        ('RUNNING', 'Running'),
+        ('COMPLETED', 'Completed'),
+        ('FAILED', 'Failed'),
+    ]
+
+    exam_schedule = models.ForeignKey(ExamSchedule, on_delete=models.CASCADE, related_name='hall_ticket_jobs')
+    requested_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name='hall_ticket_jobs')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='PENDING')
+    tickets_created = models.PositiveIntegerField(default=0)
+    total_tickets = models.PositiveIntegerField(default=0)
+    rendered_tickets = models.PositiveIntegerField(default=0)
+    room_files = models.JSONField(default=list, blank=True, help_text="Storage paths of the merged per-room PDFs")
+    error = models.TextField(blank=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = "Hall Ticket Job"
+        verbose_name_plural = "Hall Ticket Jobs"
+
+    def __str__(self):
+        return f"{self.exam_schedule} - {self.status} ({self.rendered_tickets}/{self.total_tickets})"
+
+    @property
+    def progress(self):
+        if not self.total_tickets:
+            return 100.0 if self.status == 'COMPLETED' else 0.0
+        return round(self.rendered_tickets * 100 / self.total_tickets, 1)
+
+
 class ExamAttendance(TimeStampedUUIDModel):
     """Model for tracking exam attendance"""
     STATUS_CHOICES = [
@@ -0,0 +1,142 @@
+"""
+Exam reporting queries and exports.
+
+Per-schedule figures are computed with conditional aggregates grouped by
+schedule in a single query. Attendance and results are one-to-one with a
+registration, but violations are not, so every count is ``distinct`` to
+stay correct across the joins.
+"""
+import csv
+
+from django.db.models import Count, Q
+from django.http import HttpResponse, StreamingHttpResponse
+
+from .models import ExamRegistration, ExamSchedule, ExamSession, HallTicket, StudentDue
+
+SUMMARY_COLUMNS = [
+    ('exam_title', 'Exam'),
+    ('course', 'Course'),
+    ('exam_date', 'Date'),
+    ('total_registrations', 'Registrations'),
+    ('present_students', 'Present'),
+    ('absent_students', 'Absent'),
+    ('violations', 'Violations'),
+    ('results_published', 'Results Published'),
+]
+
+
+def exam_summary_rows(schedules):
+    """One row per schedule with registration, attendance, violation and result counts."""
+    rows = schedules.order_by('exam_date', 'start_time').values(
+        'id', 'title', 'course__code', 'exam_date',
+    ).annotate(
+        total_registrations=Count('registrations', distinct=True),
+        present_students=Count(
+            'registrations__attendance', filter=Q(registrations__attendance__status='PRESENT'), distinct=True
+        ),
+        absent_students=Count(
+            'registrations__attendance', filter=Q(registrations__attendance__status='ABSENT'), distinct=True
+        ),
+        violations=Count('registrations__violations', distinct=True),
+        results_published=Count(
+            'registrations__result', filter=Q(registrations__result__is_published=True), distinct=True
+        ),
+    )
+    return [
+        {
+            'exam_title': row['title'],
+            'course': row['course__code'],
+            **{key: row[key] for key, _ in SUMMARY_COLUMNS[2:]},
+        }
+        for row in rows
+    ]
+
+
+def session_statistics(exam_session):
+    """Exam and registration counts for one session in a single query."""
+    return ExamSchedule.objects.filter(exam_session=exam_session).aggregate(
+        total_exams=Count('id', distinct=True),
+        total_registrations=Count('registrations', distinct=True),
+        total_students=Count('registrations__student', distinct=True),
+        completed_exams=Count('id', filter=Q(status='COMPLETED'), distinct=True),
+        ongoing_exams=Count('id', filter=Q(status='ONGOING'), distinct=True),
+        upcoming_exams=Count('id', filter=Q(status='SCHEDULED'), distinct=True),
+    )
+
+
+def dashboard_stats(today):
+    """Dashboard figures with one conditional aggregate per table."""
+    sessions = ExamSession.objects.aggregate(
+        total=Count('id'),
+        active=Count('id', filter=Q(is_active=True)),
+    )
+    schedules = ExamSchedule.objects.aggregate(
+        total=Count('id'),
+        today=Count('id', filter=Q(exam_date=today)),
+        ongoing=Count('id', filter=Q(status='ONGOING')),
+    )
+    registrations = ExamRegistration.objects.aggregate(
+        students=Count('student', distinct=True),
+        pending=Count('id', filter=Q(status='PENDING')),
+        recent=Count('id', filter=Q(created_at__date=today)),
+    )
+    overdue_dues = StudentDue.objects.filter(status='OVERDUE').count()
+    recent_hall_tickets = HallTicket.objects.filter(generated_date__date=today).count()
+
+    return {
+        'overview': {
+            'total_exam_sessions': sessions['total'],
+            'active_exam_sessions': sessions['active'],
+            'total_exam_schedules': schedules['total'],
+            'total_students': registrations['students'],
+        },
+        'today': {
+            'exams_count': schedules['today'],
+            'ongoing_exams': schedules['ongoing'],
+        },
+        'pending': {
+            'registrations': registrations['pending'],
+            'overdue_dues': overdue_dues,
+        },
+        'recent_activity': {
+            'registrations': registrations['recent'],
+            'hall_tickets': recent_hall_tickets,
+        }
+    }
+
+
+class _Echo:
+    """File-like object whose write() hands the line back to the csv writer"""
+
+    def write(self, value):
+        return value
+
+
+def csv_response(rows, columns, filename):
+    """Stream ``rows`` (dicts) as CSV."""
+    writer = csv.writer(_Echo())
+
+    def generate():
+        yield writer.writerow([label for _, label in columns])
+        for row in rows:
+            yield writer.writerow([row[key] for key, _ in columns])
+
+    response = StreamingHttpResponse(generate(), content_type='text/csv')
+    response['Content-Disposition'] = f'attachment; filename="{filename}.csv"'
+    return response
+
+
+def xlsx_response(rows, columns, filename, title='Report'):
+    """Write ``rows`` (dicts) to an XLSX workbook in write-only mode."""
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title=title[:31])
+    ws.append([label for _, label in columns])
+    for row in rows:
+        ws.append([row[key] for key, _ in columns])
+
+    response = HttpResponse(content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
+    response['Content-Disposition'] = f'attachment; filename="{filename}.xlsx"'
+    wb.save(response)
+    return response
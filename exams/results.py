@@ -0,0 +1,180 @@
+"""
+Bulk result processing.
+
+Marks for a whole exam schedule are resolved against its registrations with
+one query, percentage/grade/pass are computed for the batch with numpy
+(imported on first use), and
+``ExamResult`` rows are upserted with a single
+``bulk_create(update_conflicts=True)``. Publishing is one ``UPDATE`` over the
+schedule (or session). Both paths drop the cached student performance
+reports of every affected student in one ``delete_many`` and expire the
+cached exam summaries of the session.
+
+Grades and pass/fail follow the same rules as
+``ExamResult.calculate_grade_and_percentage``.
+"""
+import csv
+import io
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from django.db import transaction
+from django.utils import timezone
+
+from campshub360.utils import use_primary_reads
+from .cache import invalidate_exam_summary, invalidate_student_performance
+from .models import ExamRegistration, ExamResult
+
+# Lower bounds (percent) of each grade above F, ascending
+GRADE_BOUNDARIES = [30, 40, 50, 60, 70, 80, 90]
+GRADE_LABELS = ['F', 'D', 'C', 'C+', 'B', 'B+', 'A', 'A+']
+
+UPSERT_FIELDS = [
+    'marks_obtained', 'percentage', 'grade', 'is_pass', 'remarks',
+    'evaluated_by', 'evaluated_at', 'updated_at',
+]
+
+
+def parse_marks_csv(uploaded_file):
+    """Read a marks CSV (roll_number or registration_id, marks_obtained[, remarks])."""
+    content = uploaded_file.read()
+    if isinstance(content, bytes):
+        content = content.decode('utf-8-sig')
+    return list(csv.DictReader(io.StringIO(content)))
+
+
+def compute_grades(marks, total_marks, passing_marks):
+    """Return (percentage, grade, is_pass) arrays for a sequence of marks."""
+    import numpy as np
+
+    percentage = np.round(np.asarray(marks) / total_marks * 100, 2)
+    grade = np.asarray(GRADE_LABELS)[np.searchsorted(GRADE_BOUNDARIES, percentage, side='right')]
+    is_pass = percentage >= passing_marks
+    return percentage, grade, is_pass
+
+
+@dataclass
+class ResultBatchReport:
+    processed: int = 0
+    upserted: int = 0
+    published: int = 0
+    errors: list = field(default_factory=list)
+    skipped_published: list = field(default_factory=list)
+
+    def as_dict(self):
+        return {
+            'processed': self.processed,
+            'upserted': self.upserted,
+            'published': self.published,
+            'errors': self.errors,
+            'skipped_published': self.skipped_published,
+        }
+
+
+class ResultProcessor:
+    """Compute and publish results for one exam schedule."""
+
+    def __init__(self, exam_schedule, evaluated_by=None):
+        self.exam_schedule = exam_schedule
+        self.evaluated_by = evaluated_by
+
+    def _registrations(self):
+        by_roll, by_id = {}, {}
+        for pk, student_id, roll_number in ExamRegistration.objects.filter(
+            exam_schedule=self.exam_schedule, status__in=['APPROVED', 'COMPLETED']
+        ).values_list('id', 'student_id', 'student__roll_number').order_by():
+            by_roll[roll_number] = (pk, student_id)
+            by_id[str(pk)] = (pk, student_id)
+        return by_roll, by_id
+
+    def ingest(self, rows, overwrite_published=False):
+        """Validate, grade and upsert a batch of ``{roll_number|registration_id, marks_obtained, remarks}``."""
+        report = ResultBatchReport(processed=len(rows))
+        total_marks = self.exam_schedule.total_marks
+
+        with use_primary_reads():
+            by_roll, by_id = self._registrations()
+            published = set(ExamResult.objects.filter(
+                exam_registration__exam_schedule=self.exam_schedule, is_published=True
+            ).values_list('exam_registration_id', flat=True).order_by())
+
+        matched, marks, remarks = [], [], []
+        seen = set()
+        for line, row in enumerate(rows, start=1):
+            key = row.get('registration_id') or row.get('roll_number')
+            registration = by_id.get(str(key)) or by_roll.get(str(key).strip() if key else None)
+            if registration is None:
+                report.errors.append({'row': line, 'key': key, 'error': 'No approved registration found'})
+                continue
+            if registration[0] in seen:
+                report.errors.append({'row': line, 'key': key, 'error': 'Duplicate row'})
+                continue
+            try:
+                value = float(row.get('marks_obtained'))
+            except (TypeError, ValueError):
+                report.errors.append({'row': line, 'key': key, 'error': 'Invalid marks_obtained'})
+                continue
+            if not 0 <= value <= total_marks:
+                report.errors.append({'row': line, 'key': key, 'error': f'Marks must be between 0 and {total_marks}'})
+                continue
+            if registration[0] in published and not overwrite_published:
+                report.skipped_published.append(str(key))
+                continue
+            seen.add(registration[0])
+            matched.append(registration)
+            marks.append(value)
+            remarks.append(row.get('remarks') or '')
+
+        if not matched:
+            return report
+
+        percentage, grade, is_pass = compute_grades(
+            marks, total_marks, self.exam_schedule.passing_marks
+        )
+        now = timezone.now()
+        results = [
+            ExamResult(
+                exam_registration_id=registration_id,
+                marks_obtained=Decimal(str(round(marks[i], 2))),
+                percentage=Decimal(str(percentage[i])),
+                grade=str(grade[i]),
+                is_pass=bool(is_pass[i]),
+                remarks=remarks[i],
+                evaluated_by=self.evaluated_by,
+                evaluated_at=now,
+                updated_at=now,
+            )
+            for i, (registration_id, _) in enumerate(matched)
+        ]
+        with transaction.atomic():
+            ExamResult.objects.bulk_create(
+                results,
+                batch_size=1000,
+                update_conflicts=True,
+                unique_fields=['exam_registration'],
+                update_fields=UPSERT_FIELDS,
+            )
+        report.upserted = len(results)
+        invalidate_student_performance(
+            [student_id for _, student_id in matched], [self.exam_schedule.exam_session_id]
+        )
+        invalidate_exam_summary([self.exam_schedule.exam_session_id])
+        return report
+
+    @staticmethod
+    def publish(exam_schedules):
+        """Publish every evaluated, unpublished result of ``exam_schedules`` with one UPDATE."""
+        results = ExamResult.objects.filter(
+            exam_registration__exam_schedule__in=exam_schedules,
+            is_published=False,
+            marks_obtained__isnull=False,
+        )
+        with use_primary_reads(), transaction.atomic():
+            affected = list(results.values_list(
+                'exam_registration__student_id', 'exam_registration__exam_schedule__exam_session_id'
+            ).order_by())
+            published = results.update(is_published=True, published_at=timezone.now())
+        sessions = {session_id for _, session_id in affected}
+        invalidate_student_performance([student_id for student_id, _ in affected], sessions)
+        invalidate_exam_summary(sessions)
+        return published
@@ -0,0 +1,352 @@
+"""
+Automatic exam seating.
+
+Schedules are grouped into time slots (schedules on the same date whose
+times overlap share the same rooms). For every slot the engine:
+
+* drops all but the earliest registration of a student who is booked into
+  more than one schedule of the slot (reported as double-booked);
+* seats students with special requirements first, in accessible rooms;
+* fills the remaining seats room by room, picking for each seat the largest
+  remaining group that differs from the neighbours' course, falling back to
+  a different section, then to leaving the seat empty while spare seats
+  remain; only when none of that is possible are neighbours allowed to
+  clash, and every clash is counted in the report.
+
+Rooms are treated as a single row of seats numbered from 1, so the
+neighbours of seat ``n`` are seats ``n - 1`` and ``n + 1`` in the same room.
+Seats held by schedules outside the engine that overlap a slot in time
+(their hall ticket seats, and the rest of their ``ExamRoomAllocation``
+capacity) are occupied for that slot, so schedules seated one at a time do
+not share seats. ``apply`` writes
+the result with one delete and one ``bulk_create`` for
+``ExamRoomAllocation``, ``bulk_update`` for existing hall tickets and a
+``bulk_create`` (with sequence-allocated numbers) for missing ones.
+"""
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+
+from django.db import transaction
+
+from campshub360.utils import use_primary_reads
+from .hall_tickets import allocate_ticket_numbers
+from .models import ExamRegistration, ExamRoom, ExamRoomAllocation, ExamSchedule, HallTicket
+
+
+def time_slots(schedules):
+    """Group schedules into clusters that overlap in time on the same date."""
+    slots = []
+    current, current_end = [], None
+    for schedule in sorted(schedules, key=lambda s: (s.exam_date, s.start_time, s.end_time)):
+        if current and schedule.exam_date == current[0].exam_date and schedule.start_time < current_end:
+            current.append(schedule)
+            current_end = max(current_end, schedule.end_time)
+        else:
+            if current:
+                slots.append(current)
+            current, current_end = [schedule], schedule.end_time
+    if current:
+        slots.append(current)
+    return slots
+
+
+def _clash(key, neighbour):
+    """0 for a different course, 1 for the same course, 2 for the same course and section."""
+    if key[0] != neighbour[0]:
+        return 0
+    return 1 if key[1] != neighbour[1] else 2
+
+
+@dataclass
+class Seat:
+    registration_id: object
+    schedule_id: object
+    room: object
+    seat_number: int
+
+
+@dataclass
+class SeatingReport:
+    slots: list = field(default_factory=list)
+    seated: int = 0
+    unseated: list = field(default_factory=list)
+    double_booked: list = field(default_factory=list)
+    same_course_neighbours: int = 0
+    same_section_neighbours: int = 0
+    elapsed: float = 0.0
+
+    def as_dict(self):
+        capacity = sum(slot['capacity'] for slot in self.slots)
+        return {
+            'seated': self.seated,
+            'unseated': len(self.unseated),
+            'unseated_registrations': [str(pk) for pk in self.unseated],
+            'double_booked': len(self.double_booked),
+            'double_booked_registrations': [str(pk) for pk in self.double_booked],
+            'same_course_neighbours': self.same_course_neighbours,
+            'same_section_neighbours': self.same_section_neighbours,
+            'utilization': round(self.seated * 100 / capacity, 2) if capacity else 0.0,
+            'elapsed_ms': round(self.elapsed * 1000, 2),
+            'slots': self.slots,
+        }
+
+
+class SeatingEngine:
+    """Compute and persist room and seat assignments for exam schedules."""
+
+    def __init__(self, schedules, rooms=None):
+        self.schedules = [s for s in schedules if not s.is_online]
+        self.rooms = rooms
+        self.seats = []
+        self.report = SeatingReport()
+        # (room pk, seat number) -> (course, section) of whoever sits there in the current slot
+        self._occupants = {}
+
+    @classmethod
+    def for_schedule(cls, exam_schedule):
+        return cls([exam_schedule])
+
+    @classmethod
+    def for_session(cls, exam_session):
+        return cls(list(ExamSchedule.objects.filter(
+            exam_session=exam_session
+        ).exclude(status='CANCELLED').select_related('exam_session')))
+
+    def _load_rooms(self):
+        if self.rooms is not None:
+            return list(self.rooms)
+        return list(ExamRoom.objects.filter(is_active=True).exclude(room_type='ONLINE'))
+
+    def _load_registrations(self):
+        by_schedule = defaultdict(list)
+        rows = ExamRegistration.objects.filter(
+            exam_schedule__in=[s.pk for s in self.schedules], status='APPROVED'
+        ).values_list(
+            'id', 'exam_schedule_id', 'student_id', 'student__section', 'special_requirements',
+        ).order_by('student__roll_number')
+        for pk, schedule_id, student_id, section, special in rows:
+            by_schedule[schedule_id].append((pk, student_id, section or '', bool(special.strip())))
+        return by_schedule
+
+    def _load_other_schedules(self):
+        """Seated schedules outside the engine on the same dates, with the seats they hold."""
+        others = list(ExamSchedule.objects.filter(
+            exam_date__in={s.exam_date for s in self.schedules}, is_online=False
+        ).exclude(status='CANCELLED').exclude(
+            pk__in=[s.pk for s in self.schedules]
+        ).only('id', 'course_id', 'exam_date', 'start_time', 'end_time'))
+        if not others:
+            return []
+        held = {s.pk: {'schedule': s, 'seats': {}, 'allocated': {}} for s in others}
+        tickets = HallTicket.objects.filter(
+            exam_registration__exam_schedule__in=list(held), exam_room__isnull=False
+        ).exclude(seat_number='').values_list(
+            'exam_registration__exam_schedule_id', 'exam_room_id', 'seat_number',
+            'exam_registration__student__section',
+        )
+        for schedule_id, room_id, seat_number, section in tickets:
+            if seat_number.isdigit():
+                held[schedule_id]['seats'][(room_id, int(seat_number))] = section or ''
+        allocations = ExamRoomAllocation.objects.filter(exam_schedule__in=list(held)).values_list(
+            'exam_schedule_id', 'exam_room_id', 'allocated_capacity'
+        )
+        for schedule_id, room_id, capacity in allocations:
+            held[schedule_id]['allocated'][room_id] = capacity
+        return [entry for entry in held.values() if entry['seats'] or entry['allocated']]
+
+    def _occupied(self, slot, rooms, others):
+        """Seats of the slot's rooms held by other schedules that overlap it in time."""
+        start = min(s.start_time for s in slot)
+        end = max(s.end_time for s in slot)
+        capacity = {room.pk: room.capacity for room in rooms}
+        occupied = {}
+        for entry in others:
+            schedule = entry['schedule']
+            if schedule.exam_date != slot[0].exam_date or schedule.start_time >= end or schedule.end_time <= start:
+                continue
+            for seat, section in entry['seats'].items():
+                occupied[seat] = (schedule.course_id, section)
+            # Allocated capacity without seated tickets (manual allocations) takes the lowest free seats
+            for room_id, allocated in entry['allocated'].items():
+                missing = allocated - sum(1 for room, _ in entry['seats'] if room == room_id)
+                number = 1
+                while missing > 0 and number <= capacity.get(room_id, 0):
+                    if (room_id, number) not in occupied:
+                        occupied[(room_id, number)] = (schedule.course_id, '')
+                        missing -= 1
+                    number += 1
+        return occupied
+
+    def solve(self):
+        """Compute assignments for every slot. Returns the SeatingReport."""
+        started = time.perf_counter()
+        with use_primary_reads():
+            rooms = self._load_rooms()
+            registrations = self._load_registrations()
+            others = self._load_other_schedules()
+
+        # Accessible rooms first so special-requirement students land there; larger rooms first
+        rooms.sort(key=lambda r: (not r.is_accessible, -r.capacity, r.building, r.name))
+
+        for slot in time_slots(self.schedules):
+            self._solve_slot(slot, rooms, registrations, others)
+
+        self.report.seated = len(self.seats)
+        self.report.elapsed = time.perf_counter() - started
+        return self.report
+
+    def _solve_slot(self, slot, rooms, registrations, others):
+        slot.sort(key=lambda s: (s.start_time, str(s.pk)))
+        course_of = {s.pk: s.course_id for s in slot}
+
+        # One seat per student per slot
+        seen = set()
+        special, regular = defaultdict(deque), defaultdict(deque)
+        for schedule in slot:
+            for pk, student_id, section, needs_access in registrations.get(schedule.pk, []):
+                if student_id in seen:
+                    self.report.double_booked.append(pk)
+                    continue
+                seen.add(student_id)
+                key = (course_of[schedule.pk], section)
+                target = special if needs_access else regular
+                target[key].append((pk, schedule.pk))
+
+        first_seat = len(self.seats)
+        self._occupants = self._occupied(slot, rooms, others)
+        seat_list = [
+            (room, number) for room in rooms for number in range(1, room.capacity + 1)
+            if (room.pk, number) not in self._occupants
+        ]
+        accessible = sum(1 for room, _ in seat_list if room.is_accessible)
+        index = self._fill(seat_list[:accessible], 0, special)
+        # Special-requirement students that did not fit the accessible rooms still need a seat
+        for key, members in special.items():
+            regular[key].extendleft(reversed(members))
+        self._fill(seat_list, index, regular)
+
+        for members in regular.values():
+            self.report.unseated.extend(pk for pk, _ in members)
+
+        slot_seats = self.seats[first_seat:]
+        per_room = defaultdict(lambda: defaultdict(int))
+        for seat in slot_seats:
+            per_room[seat.room.pk][seat.schedule_id] += 1
+        room_rows = []
+        for room in rooms:
+            counts = per_room.get(room.pk)
+            if not counts:
+                continue
+            seated = sum(counts.values())
+            room_rows.append({
+                'room': str(room.pk),
+                'name': room.name,
+                'building': room.building,
+                'capacity': room.capacity,
+                'seated': seated,
+                'utilization': round(seated * 100 / room.capacity, 2),
+                'schedules': {str(pk): count for pk, count in counts.items()},
+            })
+        capacity = sum(row['capacity'] for row in room_rows)
+        self.report.slots.append({
+            'exam_date': str(slot[0].exam_date),
+            'start_time': str(slot[0].start_time),
+            'schedules': [str(s.pk) for s in slot],
+            'rooms_used': len(room_rows),
+            'capacity': capacity,
+            'seated': len(slot_seats),
+            'utilization': round(len(slot_seats) * 100 / capacity, 2) if capacity else 0.0,
+            'rooms': room_rows,
+        })
+
+    def _fill(self, seat_list, index, groups):
+        """Seat members of ``groups`` from ``seat_list[index:]``; consumed members are removed."""
+        remaining = sum(len(members) for members in groups.values())
+        while remaining and index < len(seat_list):
+            room, number = seat_list[index]
+            # Occupants persist across calls, so the regular pass sees the special-requirements seats
+            neighbours = [
+                self._occupants[seat] for seat in ((room.pk, number - 1), (room.pk, number + 1))
+                if seat in self._occupants
+            ]
+            spare = len(seat_list) - index - remaining
+
+            best, best_level = None, None
+            for key, members in groups.items():
+                if not members:
+                    continue
+                level = max((_clash(key, neighbour) for neighbour in neighbours), default=0)
+                if best is None or (level, -len(members)) < (best_level, -len(groups[best])):
+                    best, best_level = key, level
+
+            if best_level and spare > 0:
+                # Leave the seat empty rather than seat two students of the same course together
+                index += 1
+                continue
+            if best_level == 1:
+                self.report.same_course_neighbours += 1
+            elif best_level == 2:
+                self.report.same_section_neighbours += 1
+
+            pk, schedule_id = groups[best].popleft()
+            self.seats.append(Seat(pk, schedule_id, room, number))
+            self._occupants[(room.pk, number)] = best
+            remaining -= 1
+            index += 1
+        return index
+
+    @transaction.atomic
+    def apply(self):
+        """Persist room allocations and hall ticket seats computed by ``solve``."""
+        schedule_ids = [s.pk for s in self.schedules]
+        counts = defaultdict(lambda: defaultdict(int))
+        for seat in self.seats:
+            counts[seat.schedule_id][seat.room] += 1
+
+        ExamRoomAllocation.objects.filter(exam_schedule__in=schedule_ids).delete()
+        allocations = []
+        for schedule_id, rooms in counts.items():
+            primary = max(rooms.items(), key=lambda item: item[1])[0]
+            allocations.extend(
+                ExamRoomAllocation(
+                    exam_schedule_id=schedule_id,
+                    exam_room=room,
+                    allocated_capacity=count,
+                    is_primary=room is primary,
+                    notes='Auto-assigned',
+                )
+                for room, count in rooms.items()
+            )
+        ExamRoomAllocation.objects.bulk_create(allocations)
+
+        seat_by_registration = {seat.registration_id: seat for seat in self.seats}
+        tickets = list(HallTicket.objects.filter(
+            exam_registration__exam_schedule__in=schedule_ids
+        ).only('id', 'exam_registration_id', 'exam_room', 'seat_number'))
+        for ticket in tickets:
+            seat = seat_by_registration.pop(ticket.exam_registration_id, None)
+            ticket.exam_room = seat.room if seat else None
+            ticket.seat_number = str(seat.seat_number) if seat else ''
+        HallTicket.objects.bulk_update(tickets, ['exam_room', 'seat_number'], batch_size=1000)
+
+        academic_year = {s.pk: s.exam_session.academic_year for s in self.schedules}
+        missing = defaultdict(list)
+        for seat in seat_by_registration.values():
+            missing[academic_year[seat.schedule_id]].append(seat)
+        new_tickets = []
+        for year, seats in missing.items():
+            for seat, number in zip(seats, allocate_ticket_numbers(year, len(seats))):
+                new_tickets.append(HallTicket(
+                    exam_registration_id=seat.registration_id,
+                    ticket_number=number,
+                    exam_room=seat.room,
+                    seat_number=str(seat.seat_number),
+                    status='GENERATED',
+                ))
+        HallTicket.objects.bulk_create(new_tickets, batch_size=1000)
+        return {
+            'allocations': len(allocations),
+            'tickets_updated': len(tickets),
+            'tickets_created': len(new_tickets),
+        }
@@ -118,7 +118,9 @@ class ExamRegistrationSerializer(serializers.ModelSerializer):
     class Meta:
         model = ExamRegistration
         fields = '__all__'
-        read_only_fields = ['registration_date', 'created_at', 'updated_at']
+        read_only_fields = [
+            'registration_date', 'created_at', 'updated_at', 'eligibility_issues', 'eligibility_checked_at',
+        ]
     
     def validate(self, data):
         # Check if student has pending dues
@@ -1,10 +1,11 @@
-from django.db.models.signals import post_save, pre_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 from django.utils import timezone
 from .models import (
     ExamRegistration, HallTicket, ExamAttendance, 
-    ExamResult, StudentDue, ExamSchedule
+    ExamResult, StudentDue, ExamSchedule, ExamViolation
 )
+from .cache import invalidate_exam_summary, invalidate_student_performance
 
 
 @receiver(post_save, sender=ExamRegistration)
@@ -37,6 +38,42 @@ def create_result_record(sender, instance, created, **kwargs):
             ExamResult.objects.create(exam_registration=instance)
 
 
+def _invalidate_registration_caches(registration_id, student_reports=False):
+    row = ExamRegistration.objects.filter(pk=registration_id).values_list(
+        'student_id', 'exam_schedule__exam_session_id'
+    ).first()
+    if row:
+        invalidate_exam_summary([row[1]])
+        if student_reports:
+            invalidate_student_performance([row[0]], [row[1]])
+
+
+@receiver(post_save, sender=ExamResult)
+@receiver(post_delete, sender=ExamResult)
+def invalidate_result_caches(sender, instance, **kwargs):
+    """Drop cached reports that include the result"""
+    _invalidate_registration_caches(instance.exam_registration_id, student_reports=True)
+
+
+@receiver(post_save, sender=ExamAttendance)
+@receiver(post_delete, sender=ExamAttendance)
+@receiver(post_save, sender=ExamViolation)
+@receiver(post_delete, sender=ExamViolation)
+def invalidate_attendance_caches(sender, instance, **kwargs):
+    """Drop cached exam summaries that include the attendance or violation"""
+    _invalidate_registration_caches(instance.exam_registration_id)
+
+
+@receiver(post_save, sender=ExamRegistration)
+@receiver(post_delete, sender=ExamRegistration)
+def invalidate_registration_caches(sender, instance, **kwargs):
+    """Drop cached exam summaries of the registration's session"""
+    session_id = ExamSchedule.objects.filter(pk=instance.exam_schedule_id).values_list(
+        'exam_session_id', flat=True
+    ).first()
+    invalidate_exam_summary([session_id])
+
+
 @receiver(pre_save, sender=StudentDue)
 def update_due_status(sender, instance, **kwargs):
     """Update due status based on payment amount"""
@@ -0,0 +1,14 @@
+"""Background tasks of the exams app."""
+from campshub360.jobs import task
+from .hall_tickets import run_hall_ticket_job
+from .models import HallTicketJob
+
+
+@task('exams.render_hall_tickets')
+def render_hall_tickets(context, hall_ticket_job_id):
+    """Render the PDFs of a HallTicketJob; its own row keeps the detailed progress."""
+    run_hall_ticket_job(hall_ticket_job_id)
+    job = HallTicketJob.objects.get(pk=hall_ticket_job_id)
+    if job.status == 'FAILED':
+        raise RuntimeError(job.error)
+    return {'tickets': job.rendered_tickets, 'room_files': job.room_files}
@@ -25,6 +25,10 @@ urlpatterns = [
     path('api/reports/exam-summary/', views.ExamSummaryReportView.as_view(), name='exam-summary-report'),
     path('api/reports/student-performance/', views.StudentPerformanceReportView.as_view(), name='student-performance-report'),
     path('api/bulk-operations/generate-hall-tickets/', views.BulkGenerateHallTicketsView.as_view(), name='bulk-generate-hall-tickets'),
+    path('api/bulk-operations/hall-ticket-jobs/<uuid:job_id>/', views.HallTicketJobStatusView.as_view(), name='hall-ticket-job-status'),
     path('api/bulk-operations/assign-rooms/', views.BulkAssignRoomsView.as_view(), name='bulk-assign-rooms'),
+    path('api/bulk-operations/auto-seating/', views.AutoSeatingView.as_view(), name='auto-seating'),
     path('api/bulk-operations/assign-staff/', views.BulkAssignStaffView.as_view(), name='bulk-assign-staff'),
+    path('api/bulk-operations/invigilation-roster/', views.InvigilationRosterView.as_view(), name='invigilation-roster'),
+    path('api/bulk-operations/eligibility/', views.BulkEligibilityView.as_view(), name='bulk-eligibility'),
 ]
@@ -3,22 +3,35 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from rest_framework.views import APIView
+from rest_framework.exceptions import ValidationError
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Q, Count, Sum, Avg
+from django.db import transaction
+from django.db.models import Q, Sum, Avg
 from django.utils import timezone
 from django.shortcuts import get_object_or_404
 from django.http import HttpResponse
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.units import inch
+from django.urls import reverse
+from django.core.cache import cache
+from django.core.files.storage import default_storage
 from io import BytesIO
 import json
 
 from .models import (
     ExamSession, ExamSchedule, ExamRoom, ExamRoomAllocation,
     ExamStaffAssignment, StudentDue, ExamRegistration, HallTicket,
-    ExamAttendance, ExamViolation, ExamResult
+    ExamAttendance, ExamViolation, ExamResult, HallTicketJob
 )
+from .hall_tickets import HallTicketPipeline, start_hall_ticket_job
+from .seating import SeatingEngine
+from .cache import EXAM_SUMMARY_TTL, STUDENT_PERFORMANCE_TTL, exam_summary_key, student_performance_key
+from .reports import (
+    SUMMARY_COLUMNS, csv_response, dashboard_stats, exam_summary_rows, session_statistics, xlsx_response,
+)
+from .results import ResultProcessor, parse_marks_csv
+from .invigilation import InvigilationScheduler, assignment_conflicts
+from .eligibility import EXCEPTION_COLUMNS, EligibilityEngine
+from faculty.models import Faculty
+from campshub360.utils import parse_bool
 from .serializers import (
     ExamSessionSerializer, ExamScheduleSerializer, ExamRoomSerializer,
     ExamRoomAllocationSerializer, ExamStaffAssignmentSerializer, StudentDueSerializer,
@@ -56,19 +69,7 @@ class ExamSessionViewSet(viewsets.ModelViewSet):
     def statistics(self, request, pk=None):
         """Get statistics for a specific exam session"""
         session = self.get_object()
-        
-        stats = {
-            'total_exams': session.exam_schedules.count(),
-            'total_registrations': sum(exam.registrations.count() for exam in session.exam_schedules.all()),
-            'total_students': session.exam_schedules.aggregate(
-                total_students=Count('registrations__student', distinct=True)
-            )['total_students'] or 0,
-            'completed_exams': session.exam_schedules.filter(status='COMPLETED').count(),
-            'ongoing_exams': session.exam_schedules.filter(status='ONGOING').count(),
-            'upcoming_exams': session.exam_schedules.filter(status='SCHEDULED').count(),
-        }
-        
-        return Response(stats)
+        return Response(session_statistics(session))
     
     @action(detail=False, methods=['get'])
     def active_sessions(self, request):
@@ -249,10 +250,7 @@ class StudentDueViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def overdue_dues(self, request):
         """Get all overdue dues"""
-        overdue_dues = StudentDue.objects.filter(
-            due_date__lt=timezone.now().date(),
-            status='PENDING'
-        )
+        overdue_dues = StudentDue.objects.filter(status='OVERDUE')
         serializer = self.get_serializer(overdue_dues, many=True)
         return Response(serializer.data)
     
@@ -363,6 +361,14 @@ class HallTicketViewSet(viewsets.ModelViewSet):
     ordering_fields = ['generated_date', 'printed_date', 'issued_date']
     ordering = ['-generated_date']
     
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'download_pdf':
+            queryset = queryset.select_related(
+                'exam_registration__student', 'exam_registration__exam_schedule__course', 'exam_room'
+            )
+        return queryset
+    
     def get_serializer_class(self):
         if self.action == 'retrieve':
             return HallTicketDetailSerializer
@@ -393,33 +399,9 @@ class HallTicketViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=['get'])
     def download_pdf(self, request, pk=None):
         """Download hall ticket as PDF"""
+        from .hall_ticket_pdf import render_ticket
         hall_ticket = self.get_object()
-        
-        # Create PDF
-        buffer = BytesIO()
-        p = canvas.Canvas(buffer, pagesize=letter)
-        
-        # Add content to PDF
-        p.drawString(100, 750, f"HALL TICKET")
-        p.drawString(100, 720, f"Ticket Number: {hall_ticket.ticket_number}")
-        p.drawString(100, 690, f"Student: {hall_ticket.exam_registration.student.get_full_name()}")
-        p.drawString(100, 660, f"Roll Number: {hall_ticket.exam_registration.student.roll_number}")
-        p.drawString(100, 630, f"Exam: {hall_ticket.exam_registration.exam_schedule.title}")
-        p.drawString(100, 600, f"Course: {hall_ticket.exam_registration.exam_schedule.course.code}")
-        p.drawString(100, 570, f"Date: {hall_ticket.exam_registration.exam_schedule.exam_date}")
-        p.drawString(100, 540, f"Time: {hall_ticket.exam_registration.exam_schedule.start_time} - {hall_ticket.exam_registration.exam_schedule.end_time}")
-        
-        if hall_ticket.exam_room:
-            p.drawString(100, 510, f"Room: {hall_ticket.exam_room.name}")
-            p.drawString(100, 480, f"Building: {hall_ticket.exam_room.building}")
-        
-        if hall_ticket.seat_number:
-            p.drawString(100, 450, f"Seat Number: {hall_ticket.seat_number}")
-        
-        p.showPage()
-        p.save()
-        
-        buffer.seek(0)
+        buffer = BytesIO(render_ticket(HallTicketPipeline.payload(hall_ticket)))
         response = HttpResponse(buffer, content_type='application/pdf')
         response['Content-Disposition'] = f'attachment; filename="hall_ticket_{hall_ticket.ticket_number}.pdf"'
         return response
@@ -521,6 +503,65 @@ class ExamResultViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(result)
         return Response(serializer.data)
     
+    @action(detail=False, methods=['post'], url_path='bulk-upload')
+    def bulk_upload(self, request):
+        """Upload marks for a whole exam schedule (CSV file or JSON array)"""
+        exam_schedule_id = request.data.get('exam_schedule_id')
+        if not exam_schedule_id:
+            return Response(
+                {'error': 'exam_schedule_id is required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        exam_schedule = get_object_or_404(ExamSchedule, id=exam_schedule_id)
+        
+        if 'file' in request.FILES:
+            rows = parse_marks_csv(request.FILES['file'])
+        else:
+            rows = request.data.get('results')
+            if isinstance(rows, str):
+                try:
+                    rows = json.loads(rows)
+                except ValueError:
+                    return Response(
+                        {'error': 'results must be a JSON array'},
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+            if rows and not isinstance(rows, list):
+                return Response(
+                    {'error': 'results must be a JSON array'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+        if not rows:
+            return Response(
+                {'error': 'Provide a CSV file or a results array'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        processor = ResultProcessor(exam_schedule, evaluated_by=getattr(request.user, 'faculty_profile', None))
+        report = processor.ingest(rows, overwrite_published=parse_bool(request.data.get('overwrite_published')))
+        if parse_bool(request.data.get('publish')):
+            report.published = ResultProcessor.publish([exam_schedule.pk])
+        return Response(report.as_dict())
+    
+    @action(detail=False, methods=['post'], url_path='bulk-publish')
+    def bulk_publish(self, request):
+        """Publish all evaluated results of an exam schedule or session"""
+        exam_schedule_id = request.data.get('exam_schedule_id')
+        exam_session_id = request.data.get('exam_session_id')
+        if exam_schedule_id:
+            schedules = [get_object_or_404(ExamSchedule, id=exam_schedule_id).pk]
+        elif exam_session_id:
+            session = get_object_or_404(ExamSession, id=exam_session_id)
+            schedules = ExamSchedule.objects.filter(exam_session=session).values('pk')
+        else:
+            return Response(
+                {'error': 'exam_schedule_id or exam_session_id is required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        published = ResultProcessor.publish(schedules)
+        return Response({'message': f'Published {published} results', 'published': published})
+    
     @action(detail=False, methods=['get'])
     def student_results(self, request):
         """Get results for a specific student"""
@@ -560,60 +601,7 @@ class DashboardStatsView(APIView):
     permission_classes = [IsAuthenticated]
     
     def get(self, request):
-        # Get current date
-        today = timezone.now().date()
-        
-        # Overall statistics
-        total_exam_sessions = ExamSession.objects.count()
-        active_exam_sessions = ExamSession.objects.filter(is_active=True).count()
-        total_exam_schedules = ExamSchedule.objects.count()
-        total_students = ExamRegistration.objects.values('student').distinct().count()
-        
-        # Today's exams
-        today_exams = ExamSchedule.objects.filter(exam_date=today)
-        today_exams_count = today_exams.count()
-        ongoing_exams = ExamSchedule.objects.filter(status='ONGOING').count()
-        
-        # Pending approvals
-        pending_registrations = ExamRegistration.objects.filter(status='PENDING').count()
-        
-        # Overdue dues
-        overdue_dues = StudentDue.objects.filter(
-            due_date__lt=today,
-            status='PENDING'
-        ).count()
-        
-        # Recent activities
-        recent_registrations = ExamRegistration.objects.filter(
-            created_at__date=today
-        ).count()
-        
-        recent_hall_tickets = HallTicket.objects.filter(
-            generated_date__date=today
-        ).count()
-        
-        stats = {
-            'overview': {
-                'total_exam_sessions': total_exam_sessions,
-                'active_exam_sessions': active_exam_sessions,
-                'total_exam_schedules': total_exam_schedules,
-                'total_students': total_students,
-            },
-            'today': {
-                'exams_count': today_exams_count,
-                'ongoing_exams': ongoing_exams,
-            },
-            'pending': {
-                'registrations': pending_registrations,
-                'overdue_dues': overdue_dues,
-            },
-            'recent_activity': {
-                'registrations': recent_registrations,
-                'hall_tickets': recent_hall_tickets,
-            }
-        }
-        
-        return Response(stats)
+        return Response(dashboard_stats(timezone.now().date()))
 
 
 class ExamSummaryReportView(APIView):
@@ -624,48 +612,37 @@ class ExamSummaryReportView(APIView):
         exam_session_id = request.query_params.get('exam_session_id')
         start_date = request.query_params.get('start_date')
         end_date = request.query_params.get('end_date')
+        export = request.query_params.get('export')
         
         if exam_session_id:
             # Report for specific exam session
             exam_session = get_object_or_404(ExamSession, id=exam_session_id)
             exam_schedules = ExamSchedule.objects.filter(exam_session=exam_session)
+            cache_key = exam_summary_key(exam_session.pk)
         elif start_date and end_date:
             # Report for date range
             exam_schedules = ExamSchedule.objects.filter(
                 exam_date__range=[start_date, end_date]
             )
+            cache_key = exam_summary_key(start_date=start_date, end_date=end_date)
         else:
             # Default to current month
-            current_month = timezone.now().month
-            current_year = timezone.now().year
+            today = timezone.now().date()
             exam_schedules = ExamSchedule.objects.filter(
-                exam_date__month=current_month,
-                exam_date__year=current_year
+                exam_date__month=today.month,
+                exam_date__year=today.year
             )
+            cache_key = exam_summary_key(start_date=today.strftime('%Y-%m'))
         
-        report_data = []
-        for schedule in exam_schedules:
-            registrations = schedule.registrations.all()
-            attendance = ExamAttendance.objects.filter(
-                exam_registration__exam_schedule=schedule
-            )
-            
-            schedule_data = {
-                'exam_title': schedule.title,
-                'course': schedule.course.code,
-                'exam_date': schedule.exam_date,
-                'total_registrations': registrations.count(),
-                'present_students': attendance.filter(status='PRESENT').count(),
-                'absent_students': attendance.filter(status='ABSENT').count(),
-                'violations': ExamViolation.objects.filter(
-                    exam_registration__exam_schedule=schedule
-                ).count(),
-                'results_published': ExamResult.objects.filter(
-                    exam_registration__exam_schedule=schedule,
-                    is_published=True
-                ).count(),
-            }
-            report_data.append(schedule_data)
+        report_data = cache.get(cache_key)
+        if report_data is None:
+            report_data = exam_summary_rows(exam_schedules)
+            cache.set(cache_key, report_data, EXAM_SUMMARY_TTL)
+        
+        if export == 'csv':
+            return csv_response(report_data, SUMMARY_COLUMNS, 'exam_summary')
+        if export == 'xlsx':
+            return xlsx_response(report_data, SUMMARY_COLUMNS, 'exam_summary', title='Exam Summary')
         
         return Response({
             'report_period': {
@@ -692,6 +669,11 @@ class StudentPerformanceReportView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
+        cache_key = student_performance_key(student_id, exam_session_id)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return Response(cached)
+        
         # Get student's exam results
         results_query = ExamResult.objects.filter(
             exam_registration__student_id=student_id
@@ -733,7 +715,7 @@ class StudentPerformanceReportView(APIView):
         
         overall_percentage = (obtained_marks / total_marks * 100) if total_marks > 0 else 0
         
-        return Response({
+        report = {
             'student_id': student_id,
             'exam_session_id': exam_session_id,
             'overall_performance': {
@@ -745,7 +727,9 @@ class StudentPerformanceReportView(APIView):
                 'obtained_marks': obtained_marks,
             },
             'exam_results': performance_data
-        })
+        }
+        cache.set(cache_key, report, STUDENT_PERFORMANCE_TTL)
+        return Response(report)
 
 
 class BulkGenerateHallTicketsView(APIView):
@@ -761,28 +745,68 @@ class BulkGenerateHallTicketsView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Get approved registrations without hall tickets
-        approved_registrations = ExamRegistration.objects.filter(
-            exam_schedule_id=exam_schedule_id,
-            status='APPROVED'
-        ).exclude(
-            hall_ticket__isnull=False
+        exam_schedule = get_object_or_404(
+            ExamSchedule.objects.select_related('exam_session'), id=exam_schedule_id
         )
+        pipeline = HallTicketPipeline(exam_schedule)
+        tickets = pipeline.generate()
+        
+        generated_tickets = [
+            {
+                'student': ticket.exam_registration.student.full_name,
+                'roll_number': ticket.exam_registration.student.roll_number,
+                'ticket_number': ticket.ticket_number,
+                'room': ticket.exam_room.name if ticket.exam_room else None,
+                'seat_number': ticket.seat_number,
+            }
+            for ticket in tickets
+        ]
+        
+        response = {
+            'message': f'Generated {len(generated_tickets)} hall tickets',
+            'generated_tickets': generated_tickets,
+        }
         
-        generated_tickets = []
-        for registration in approved_registrations:
-            hall_ticket = HallTicket.objects.create(
-                exam_registration=registration
+        # PDFs are rendered in the background unless explicitly skipped
+        if parse_bool(request.data.get('render_pdfs'), default=True):
+            job = HallTicketJob.objects.create(
+                exam_schedule=exam_schedule,
+                requested_by=request.user,
+                tickets_created=len(tickets),
             )
-            generated_tickets.append({
-                'student': registration.student.get_full_name(),
-                'roll_number': registration.student.roll_number,
-                'ticket_number': hall_ticket.ticket_number,
-            })
+            start_hall_ticket_job(job)
+            response['job'] = {
+                'id': str(job.id),
+                'status': job.status,
+                'status_url': request.build_absolute_uri(
+                    reverse('exams:hall-ticket-job-status', kwargs={'job_id': job.id})
+                ),
+            }
+            return Response(response, status=status.HTTP_202_ACCEPTED)
         
+        return Response(response)
+
+
+class HallTicketJobStatusView(APIView):
+    """Progress of a background hall ticket rendering job"""
+    permission_classes = [IsAuthenticated]
+    
+    def get(self, request, job_id):
+        job = get_object_or_404(HallTicketJob, id=job_id)
         return Response({
-            'message': f'Generated {len(generated_tickets)} hall tickets',
-            'generated_tickets': generated_tickets
+            'id': str(job.id),
+            'exam_schedule': str(job.exam_schedule_id),
+            'status': job.status,
+            'tickets_created': job.tickets_created,
+            'total_tickets': job.total_tickets,
+            'rendered_tickets': job.rendered_tickets,
+            'progress': job.progress,
+            'room_files': [
+                {'path': path, 'url': default_storage.url(path)} for path in job.room_files
+            ],
+            'error': job.error,
+            'started_at': job.started_at,
+            'finished_at': job.finished_at,
         })
 
 
@@ -800,35 +824,49 @@ class BulkAssignRoomsView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
+        if any(not assignment.get('room_id') for assignment in room_assignments):
+            return Response(
+                {'error': 'Every room assignment requires a room_id'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
         exam_schedule = get_object_or_404(ExamSchedule, id=exam_schedule_id)
         
-        # Clear existing allocations
-        ExamRoomAllocation.objects.filter(exam_schedule=exam_schedule).delete()
+        room_ids = [str(assignment.get('room_id')) for assignment in room_assignments]
+        # in_bulk keys are UUIDs; request ids are strings
+        rooms = {str(pk): room for pk, room in ExamRoom.objects.in_bulk(room_ids).items()}
+        missing = [room_id for room_id in room_ids if room_id not in rooms]
+        if missing:
+            return Response(
+                {'error': f'Exam rooms not found: {missing}'},
+                status=status.HTTP_404_NOT_FOUND
+            )
         
-        # Create new allocations
-        created_allocations = []
-        for assignment in room_assignments:
-            room_id = assignment.get('room_id')
-            allocated_capacity = assignment.get('allocated_capacity')
-            is_primary = assignment.get('is_primary', False)
-            notes = assignment.get('notes', '')
-            
-            room = get_object_or_404(ExamRoom, id=room_id)
-            
-            allocation = ExamRoomAllocation.objects.create(
+        allocations = [
+            ExamRoomAllocation(
                 exam_schedule=exam_schedule,
-                exam_room=room,
-                allocated_capacity=allocated_capacity,
-                is_primary=is_primary,
-                notes=notes
+                exam_room=rooms[str(assignment.get('room_id'))],
+                allocated_capacity=assignment.get('allocated_capacity'),
+                is_primary=assignment.get('is_primary', False),
+                notes=assignment.get('notes', ''),
             )
-            
-            created_allocations.append({
-                'room_name': room.name,
-                'building': room.building,
-                'allocated_capacity': allocated_capacity,
-                'is_primary': is_primary,
-            })
+            for assignment in room_assignments
+        ]
+        
+        # Replace existing allocations
+        with transaction.atomic():
+            ExamRoomAllocation.objects.filter(exam_schedule=exam_schedule).delete()
+            ExamRoomAllocation.objects.bulk_create(allocations)
+        
+        created_allocations = [
+            {
+                'room_name': allocation.exam_room.name,
+                'building': allocation.exam_room.building,
+                'allocated_capacity': allocation.allocated_capacity,
+                'is_primary': allocation.is_primary,
+            }
+            for allocation in allocations
+        ]
         
         return Response({
             'message': f'Assigned {len(created_allocations)} rooms to exam schedule',
@@ -836,6 +874,35 @@ class BulkAssignRoomsView(APIView):
         })
 
 
+class AutoSeatingView(APIView):
+    """Compute room and seat assignments for an exam schedule or a whole session"""
+    permission_classes = [IsAuthenticated]
+    
+    def post(self, request):
+        exam_schedule_id = request.data.get('exam_schedule_id')
+        exam_session_id = request.data.get('exam_session_id')
+        dry_run = parse_bool(request.data.get('dry_run'))
+        
+        if exam_schedule_id:
+            exam_schedule = get_object_or_404(
+                ExamSchedule.objects.select_related('exam_session'), id=exam_schedule_id
+            )
+            engine = SeatingEngine.for_schedule(exam_schedule)
+        elif exam_session_id:
+            engine = SeatingEngine.for_session(get_object_or_404(ExamSession, id=exam_session_id))
+        else:
+            return Response(
+                {'error': 'exam_schedule_id or exam_session_id is required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        report = engine.solve().as_dict()
+        report['dry_run'] = dry_run
+        if not dry_run:
+            report['written'] = engine.apply()
+        return Response(report)
+
+
 class BulkAssignStaffView(APIView):
     """Bulk assign staff to exam schedules"""
     permission_classes = [IsAuthenticated]
@@ -850,39 +917,139 @@ class BulkAssignStaffView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        exam_schedule = get_object_or_404(ExamSchedule, id=exam_schedule_id)
+        if any(not assignment.get('faculty_id') for assignment in staff_assignments):
+            return Response(
+                {'error': 'Every staff assignment requires a faculty_id'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
-        # Clear existing assignments
-        ExamStaffAssignment.objects.filter(exam_schedule=exam_schedule).delete()
+        exam_schedule = get_object_or_404(
+            ExamSchedule.objects.select_related('exam_session'), id=exam_schedule_id
+        )
         
-        # Create new assignments
-        created_assignments = []
-        for assignment in staff_assignments:
-            faculty_id = assignment.get('faculty_id')
-            role = assignment.get('role')
-            room_id = assignment.get('room_id')
-            notes = assignment.get('notes', '')
-            
-            faculty = get_object_or_404('faculty.Faculty', id=faculty_id)
-            room = get_object_or_404(ExamRoom, id=room_id) if room_id else None
-            
-            staff_assignment = ExamStaffAssignment.objects.create(
+        # in_bulk keys are UUIDs; request ids are strings
+        faculty_ids = [str(assignment.get('faculty_id')) for assignment in staff_assignments]
+        room_ids = [str(assignment['room_id']) for assignment in staff_assignments if assignment.get('room_id')]
+        faculty = {str(pk): f for pk, f in Faculty.objects.only('id', 'name').in_bulk(faculty_ids).items()}
+        rooms = {str(pk): room for pk, room in ExamRoom.objects.in_bulk(room_ids).items()}
+        missing = [pk for pk in faculty_ids if pk not in faculty] + [pk for pk in room_ids if pk not in rooms]
+        if missing:
+            return Response(
+                {'error': f'Faculty or rooms not found: {missing}'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
+        conflicts = assignment_conflicts(exam_schedule, [f.pk for f in faculty.values()])
+        if conflicts and not parse_bool(request.data.get('force')):
+            return Response(
+                {'error': 'Some staff are unavailable for this exam', 'conflicts': conflicts},
+                status=status.HTTP_409_CONFLICT
+            )
+        
+        assignments = [
+            ExamStaffAssignment(
                 exam_schedule=exam_schedule,
-                faculty=faculty,
-                role=role,
-                exam_room=room,
-                notes=notes
+                faculty=faculty[str(assignment.get('faculty_id'))],
+                role=assignment.get('role'),
+                exam_room=rooms.get(str(assignment.get('room_id'))),
+                notes=assignment.get('notes', ''),
             )
-            
-            created_assignments.append({
-                'faculty_name': faculty.user.get_full_name(),
-                'role': role,
-                'room_name': room.name if room else 'Not assigned',
-                'notes': notes,
-            })
+            for assignment in staff_assignments
+        ]
+        
+        # Replace existing assignments
+        with transaction.atomic():
+            ExamStaffAssignment.objects.filter(exam_schedule=exam_schedule).delete()
+            ExamStaffAssignment.objects.bulk_create(assignments)
+        
+        created_assignments = [
+            {
+                'faculty_name': assignment.faculty.name,
+                'role': assignment.role,
+                'room_name': assignment.exam_room.name if assignment.exam_room else 'Not assigned',
+                'notes': assignment.notes,
+            }
+            for assignment in assignments
+        ]
         
         return Response({
             'message': f'Assigned {len(created_assignments)} staff members to exam schedule',
-            'staff_assignments': created_assignments
+            'staff_assignments': created_assignments,
+            'conflicts': conflicts,
         })
 
+
+class InvigilationRosterView(APIView):
+    """Roster invigilation duties for every exam of a session"""
+    permission_classes = [IsAuthenticated]
+    
+    def post(self, request):
+        exam_session_id = request.data.get('exam_session_id')
+        dry_run = parse_bool(request.data.get('dry_run'))
+        
+        if not exam_session_id:
+            return Response(
+                {'error': 'exam_session_id is required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        scheduler = InvigilationScheduler(get_object_or_404(ExamSession, id=exam_session_id))
+        report = scheduler.solve().as_dict()
+        report['dry_run'] = dry_run
+        if not dry_run:
+            report['assignments_created'] = scheduler.apply()
+        return Response(report)
+
+
+class BulkEligibilityView(APIView):
+    """Check exam eligibility for a whole session; approve or flag registrations in bulk"""
+    permission_classes = [IsAuthenticated]
+    
+    def _engine(self, params):
+        exam_session_id = params.get('exam_session_id')
+        if not exam_session_id:
+            return None
+        exam_session = get_object_or_404(ExamSession, id=exam_session_id)
+        min_attendance = params.get('min_attendance')
+        if min_attendance in (None, ''):
+            return EligibilityEngine(exam_session)
+        try:
+            float(min_attendance)
+        except (TypeError, ValueError):
+            raise ValidationError({'min_attendance': 'Must be a number'})
+        return EligibilityEngine(exam_session, min_attendance=min_attendance)
+    
+    def get(self, request):
+        """Exceptions report; ``?export=csv|xlsx`` downloads it"""
+        engine = self._engine(request.query_params)
+        if engine is None:
+            return Response(
+                {'error': 'exam_session_id is required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        report = engine.evaluate()
+        export = request.query_params.get('export')
+        filename = f"eligibility_exceptions_{engine.exam_session.pk}"
+        if export == 'csv':
+            return csv_response(report.exceptions, EXCEPTION_COLUMNS, filename)
+        if export == 'xlsx':
+            return xlsx_response(report.exceptions, EXCEPTION_COLUMNS, filename, title='Eligibility Exceptions')
+        return Response(report.as_dict())
+    
+    def post(self, request):
+        engine = self._engine(request.data)
+        if engine is None:
+            return Response(
+                {'error': 'exam_session_id is required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        dry_run = parse_bool(request.data.get('dry_run'))
+        engine.evaluate()
+        if not dry_run:
+            engine.apply(
+                approved_by=getattr(request.user, 'faculty_profile', None),
+                reject_ineligible=parse_bool(request.data.get('reject_ineligible')),
+            )
+        report = engine.report.as_dict()
+        report['dry_run'] = dry_run
+        return Response(report)
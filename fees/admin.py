@@ -4,7 +4,7 @@ from django.urls import reverse
 from django.db.models import Sum, Q
 from .models import (
     FeeCategory, FeeStructure, FeeStructureDetail, StudentFee,
-    Payment, FeeWaiver, FeeDiscount, FeeReceipt
+    Payment, FeeWaiver, FeeDiscount, FeeReceipt, StudentFeeBalance, ReceiptPrintJob
 )
 
 
@@ -233,3 +233,28 @@ class FeeReceiptAdmin(admin.ModelAdmin):
         return super().get_queryset(request).select_related(
             'student_fee__student', 'payment', 'generated_by'
         )
+
+
+@admin.register(StudentFeeBalance)
+class StudentFeeBalanceAdmin(admin.ModelAdmin):
+    list_display = [
+        'student', 'total_fees_due', 'total_fees_paid', 'late_fee_amount',
+        'oldest_unpaid_due_date', 'last_payment_date', 'updated_at'
+    ]
+    search_fields = ['student__roll_number', 'student__first_name', 'student__last_name']
+    list_select_related = ['student']
+    readonly_fields = [
+        'student', 'total_fees_due', 'total_fees_paid', 'late_fee_amount',
+        'oldest_unpaid_due_date', 'last_payment_date', 'updated_at'
+    ]
+    ordering = ['student__roll_number']
+
+
+@admin.register(ReceiptPrintJob)
+class ReceiptPrintJobAdmin(admin.ModelAdmin):
+    list_display = ['print_date', 'status', 'rendered_receipts', 'total_receipts', 'created_at', 'finished_at']
+    list_filter = ['status', 'print_date']
+    readonly_fields = [
+        'print_date', 'requested_by', 'status', 'total_receipts', 'rendered_receipts',
+        'files', 'error', 'started_at', 'finished_at', 'created_at', 'updated_at'
+    ]
@@ -0,0 +1,222 @@
+"""
+Fee analytics rollups.
+
+Two tables hold pre-aggregated fee figures so dashboards and reports never
+scan ``StudentFee`` or ``Payment``:
+
+* ``FeePaymentRollup``: completed payments per local payment date, fee
+  category, academic year, payment method and department;
+* ``FeeStatusRollup``: student fees per due date, fee category, academic
+  year, department and status, with amounts due and paid.
+
+Single-row writes keep them current incrementally. ``Payment.save``,
+payment deletes and direct ``StudentFee`` saves/deletes subtract the row's
+old contribution and add its new one (``record_payment`` / ``record_fee``).
+Bulk paths such as fee assignment and settlement reconciliation rebuild the
+slice they touched with one grouped aggregate (``rebuild_fee_rollups`` /
+``rebuild_payment_rollups``). The ``rebuild_fee_rollups`` command backfills
+everything.
+
+Readers always sum, so a key may be spread over several rows.
+"""
+import datetime
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .models import FeePaymentRollup, FeeStatusRollup, Payment, StudentFee
+
+ZERO = Decimal('0.00')
+
+PAYMENT_KEY = ('date', 'fee_category_id', 'academic_year', 'payment_method', 'department_id')
+FEE_KEY = ('due_date', 'fee_category_id', 'academic_year', 'department_id', 'status')
+
+
+def fee_states(fee_ids):
+    """Rollup dimensions and amounts of ``fee_ids``, keyed by fee id."""
+    return {
+        row.pop('id'): row
+        for row in StudentFee.objects.filter(pk__in=fee_ids).values(
+            'id', 'academic_year', 'due_date', 'status', 'amount_due', 'amount_paid',
+            fee_category_id=F('fee_structure_detail__fee_category_id'),
+            department_id=F('student__department_id'),
+        ).order_by()
+    }
+
+
+def payment_state(payment, fee_state):
+    """What a payment contributes to ``FeePaymentRollup``, or None when it is not completed."""
+    if payment.status != 'COMPLETED':
+        return None
+    return {
+        'date': timezone.localdate(payment.payment_date),
+        'fee_category_id': fee_state['fee_category_id'],
+        'academic_year': fee_state['academic_year'],
+        'payment_method': payment.payment_method,
+        'department_id': fee_state['department_id'],
+        'amount': payment.amount,
+    }
+
+
+def _add(model, key, deltas):
+    """Add ``deltas`` to one row of ``key``, creating it when there is none."""
+    filters = dict(key)
+    pk = model.objects.filter(**filters).values_list('pk', flat=True).first()
+    if pk is None:
+        model.objects.create(**filters, **deltas)
+    else:
+        model.objects.filter(pk=pk).update(**{name: F(name) + value for name, value in deltas.items()})
+
+
+def _apply(model, key_fields, changes):
+    """Net out ``(state, sign)`` changes per key and write the non-zero ones."""
+    totals = defaultdict(lambda: defaultdict(int))
+    for state, sign, measures in changes:
+        key = tuple((name, state[name]) for name in key_fields)
+        for name, value in measures.items():
+            totals[key][name] += sign * value
+    for key, deltas in totals.items():
+        if any(deltas.values()):
+            _add(model, key, dict(deltas))
+
+
+def record_payment(old, new):
+    """Move a payment's contribution from state ``old`` to ``new`` (either may be None)."""
+    changes = [
+        (state, sign, {'payment_count': 1, 'amount': state['amount']})
+        for state, sign in ((old, -1), (new, 1)) if state
+    ]
+    _apply(FeePaymentRollup, PAYMENT_KEY, changes)
+
+
+def record_fee(old, new):
+    """Move a student fee's contribution from state ``old`` to ``new`` (either may be None)."""
+    changes = [
+        (state, sign, {'fee_count': 1, 'amount_due': state['amount_due'], 'amount_paid': state['amount_paid']})
+        for state, sign in ((old, -1), (new, 1)) if state
+    ]
+    _apply(FeeStatusRollup, FEE_KEY, changes)
+
+
+def _day_bounds(date_from, date_to):
+    """Aware datetimes covering the local days ``date_from`` to ``date_to``, so indexes on payment_date apply."""
+    bounds = Q()
+    if date_from:
+        bounds &= Q(payment_date__gte=timezone.make_aware(datetime.datetime.combine(date_from, datetime.time.min)))
+    if date_to:
+        next_day = date_to + datetime.timedelta(days=1)
+        bounds &= Q(payment_date__lt=timezone.make_aware(datetime.datetime.combine(next_day, datetime.time.min)))
+    return bounds
+
+
+@transaction.atomic
+def rebuild_payment_rollups(date_from=None, date_to=None):
+    """Recompute ``FeePaymentRollup`` for local payment dates in the range (everything by default)."""
+    existing = FeePaymentRollup.objects.all()
+    if date_from:
+        existing = existing.filter(date__gte=date_from)
+    if date_to:
+        existing = existing.filter(date__lte=date_to)
+    existing.delete()
+    rows = Payment.objects.filter(_day_bounds(date_from, date_to), status='COMPLETED').values(
+        'payment_method',
+        date=TruncDate('payment_date'),
+        fee_category_id=F('student_fee__fee_structure_detail__fee_category_id'),
+        academic_year=F('student_fee__academic_year'),
+        department_id=F('student_fee__student__department_id'),
+    ).annotate(payment_count=Count('id'), amount=Sum('amount')).order_by()
+    created = FeePaymentRollup.objects.bulk_create([FeePaymentRollup(**row) for row in rows], batch_size=1000)
+    return len(created)
+
+
+@transaction.atomic
+def rebuild_fee_rollups(academic_year=None, fee_category_ids=None):
+    """Recompute ``FeeStatusRollup`` for an academic year and/or fee categories (everything by default)."""
+    existing = FeeStatusRollup.objects.all()
+    fees = StudentFee.objects.all()
+    if academic_year:
+        existing = existing.filter(academic_year=academic_year)
+        fees = fees.filter(academic_year=academic_year)
+    if fee_category_ids is not None:
+        existing = existing.filter(fee_category_id__in=fee_category_ids)
+        fees = fees.filter(fee_structure_detail__fee_category_id__in=fee_category_ids)
+    existing.delete()
+    rows = fees.values(
+        'due_date', 'academic_year', 'status',
+        fee_category_id=F('fee_structure_detail__fee_category_id'),
+        department_id=F('student__department_id'),
+    ).annotate(
+        fee_count=Count('id'), amount_due=Sum('amount_due'), amount_paid=Sum('amount_paid'),
+    ).order_by()
+    created = FeeStatusRollup.objects.bulk_create([FeeStatusRollup(**row) for row in rows], batch_size=1000)
+    return len(created)
+
+
+def fee_overview():
+    """Fee counts and totals by status, plus the overdue figures, from ``FeeStatusRollup``."""
+    totals = FeeStatusRollup.objects.aggregate(
+        fees=Sum('fee_count'),
+        due=Sum('amount_due'),
+        paid_amount=Sum('amount_paid'),
+        pending=Sum('fee_count', filter=Q(status='PENDING')),
+        paid=Sum('fee_count', filter=Q(status='PAID')),
+        partial=Sum('fee_count', filter=Q(status='PARTIAL')),
+        overdue=Sum('fee_count', filter=Q(status='OVERDUE')),
+        overdue_amount=Sum('amount_due', filter=Q(status='OVERDUE')),
+    )
+    due = totals['due'] or ZERO
+    paid = totals['paid_amount'] or ZERO
+    return {
+        'total_student_fees': totals['fees'] or 0,
+        'total_fees_due': due,
+        'total_fees_paid': paid,
+        'total_balance': due - paid,
+        'pending_count': totals['pending'] or 0,
+        'paid_count': totals['paid'] or 0,
+        'partial_count': totals['partial'] or 0,
+        'overdue_count': totals['overdue'] or 0,
+        'overdue_amount': totals['overdue_amount'] or ZERO,
+    }
+
+
+def fee_breakdown(dimension, due_from=None, due_to=None):
+    """Fees grouped by ``'category'`` or ``'academic_year'``, optionally for due dates in a range."""
+    rollups = FeeStatusRollup.objects.all()
+    if due_from:
+        rollups = rollups.filter(due_date__gte=due_from)
+    if due_to:
+        rollups = rollups.filter(due_date__lte=due_to)
+    if dimension == 'category':
+        rollups = rollups.values(category=F('fee_category__name'))
+    else:
+        rollups = rollups.values('academic_year')
+    rows = rollups.annotate(
+        total_due=Sum('amount_due'), total_paid=Sum('amount_paid'), count=Sum('fee_count'),
+    )
+    return rows.order_by('-total_due' if dimension == 'category' else '-academic_year')
+
+
+def payment_rollups(date_from=None, date_to=None):
+    rollups = FeePaymentRollup.objects.all()
+    if date_from:
+        rollups = rollups.filter(date__gte=date_from)
+    if date_to:
+        rollups = rollups.filter(date__lte=date_to)
+    return rollups
+
+
+def payment_totals(date_from=None, date_to=None):
+    totals = payment_rollups(date_from, date_to).aggregate(count=Sum('payment_count'), amount=Sum('amount'))
+    return {'count': totals['count'] or 0, 'amount': totals['amount'] or ZERO}
+
+
+def payment_breakdown(dimension, date_from=None, date_to=None):
+    """Completed payments grouped by ``'payment_method'`` or ``'date'``."""
+    rows = payment_rollups(date_from, date_to).values(dimension).annotate(
+        count=Sum('payment_count'), total_amount=Sum('amount'),
+    )
+    return rows.order_by('-total_amount' if dimension == 'payment_method' else 'date')
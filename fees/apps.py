@@ -7,6 +7,5 @@ class FeesConfig(AppConfig):
     verbose_name = 'Fee Management'
 
     def ready(self):
-        # Import signals if needed
-        # from . import signals  # noqa: F401
+        from . import signals  # noqa: F401
         return super().ready()
@@ -0,0 +1,205 @@
+"""
+Fee assignment from a ``FeeStructure`` to the students it covers.
+
+The structure's cohort is the set of active students whose year of study
+equals its ``grade_level``. It is narrowed further by department, academic
+program and quota when the structure sets them. Amounts are worked out in
+memory for every student and fee item: each active ``FeeWaiver`` and each
+active, unexpired ``FeeDiscount`` already attached to the student's fee row
+for the year reduces the item amount, by its percentage when one is set and
+otherwise by its fixed amount, never going below zero.
+
+``apply`` writes every row with one ``bulk_create(update_conflicts=True)``
+on the (student, fee item, academic year) key, so running it again after a
+structure change only rewrites amounts and due dates. Paid amounts are left
+alone. Statuses are then brought in line with the new amounts using a few
+UPDATEs, and the cohort's ledger balances and the fee analytics rollups
+of the structure's year and categories are recomputed. Waived and
+cancelled rows are never touched. ``plan`` on its own is the dry run: the
+diff between what is stored and what would be written.
+"""
+from collections import defaultdict
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from campshub360.utils import use_primary_reads
+from students.models import Student
+from .analytics import rebuild_fee_rollups
+from .ledger import refresh_balances
+from .models import FeeDiscount, FeeWaiver, StudentFee
+
+FROZEN_STATUSES = ('WAIVED', 'CANCELLED')
+UPSERT_FIELDS = ['amount_due', 'due_date', 'updated_at']
+
+
+def reduce_amount(base, rules):
+    """Apply waiver/discount ``(amount, percentage)`` rules to ``base``."""
+    amount = base
+    for fixed, percentage in rules:
+        reduction = (base * percentage / 100) if percentage else fixed
+        amount -= reduction
+    return max(amount, Decimal('0.00')).quantize(Decimal('0.01'))
+
+
+@dataclass
+class AssignmentPlan:
+    students: int = 0
+    create: list = field(default_factory=list)
+    update: list = field(default_factory=list)
+    unchanged: int = 0
+    frozen: int = 0
+    skipped_items: list = field(default_factory=list)
+
+    def as_dict(self, limit=200):
+        changes = self.update[:limit]
+        return {
+            'students': self.students,
+            'to_create': len(self.create),
+            'to_update': len(self.update),
+            'unchanged': self.unchanged,
+            'frozen': self.frozen,
+            'skipped_items': self.skipped_items,
+            'amount_to_create': str(sum((fee.amount_due for fee in self.create), Decimal('0.00'))),
+            'changes': [
+                {
+                    'student_fee': str(before['id']),
+                    'roll_number': before['roll_number'],
+                    'fee_category': before['category'],
+                    'amount_due': [str(before['amount_due']), str(after.amount_due)],
+                    'due_date': [str(before['due_date']), str(after.due_date)],
+                }
+                for before, after in changes
+            ],
+            'changes_truncated': len(self.update) > limit,
+        }
+
+
+class FeeAssignmentEngine:
+    """Generate ``StudentFee`` rows for every student covered by a fee structure."""
+
+    def __init__(self, fee_structure, include_optional=False, default_due_date=None):
+        self.fee_structure = fee_structure
+        self.include_optional = include_optional
+        self.default_due_date = default_due_date
+        self.plan_result = None
+
+    def students(self):
+        structure = self.fee_structure
+        students = Student.objects.filter(status='ACTIVE', year_of_study=structure.grade_level)
+        if structure.department_id:
+            students = students.filter(department_id=structure.department_id)
+        if structure.academic_program_id:
+            students = students.filter(academic_program_id=structure.academic_program_id)
+        if structure.quota_id:
+            students = students.filter(quota_id=structure.quota_id)
+        return students
+
+    def _details(self, plan):
+        details = []
+        for detail in self.fee_structure.fee_details.select_related('fee_category'):
+            if detail.is_optional and not self.include_optional:
+                continue
+            if not (detail.due_date or self.default_due_date):
+                plan.skipped_items.append({
+                    'fee_structure_detail': str(detail.pk),
+                    'fee_category': detail.fee_category.name,
+                    'reason': 'No due date on the item and none given',
+                })
+                continue
+            details.append(detail)
+        return details
+
+    def _reductions(self, fee_ids):
+        rules = defaultdict(list)
+        today = timezone.now().date()
+        for fee_id, amount, percentage in FeeWaiver.objects.filter(
+            student_fee_id__in=fee_ids, is_active=True
+        ).values_list('student_fee_id', 'amount', 'percentage').order_by():
+            rules[fee_id].append((amount, percentage))
+        for fee_id, amount, percentage in FeeDiscount.objects.filter(
+            Q(valid_until__isnull=True) | Q(valid_until__gte=today),
+            student_fee_id__in=fee_ids, is_active=True,
+        ).values_list('student_fee_id', 'amount', 'percentage').order_by():
+            rules[fee_id].append((amount, percentage))
+        return rules
+
+    def plan(self):
+        """Compute the rows to create and update without writing. Returns the AssignmentPlan."""
+        plan = AssignmentPlan()
+        year = self.fee_structure.academic_year
+        with use_primary_reads():
+            details = self._details(plan)
+            student_ids = list(self.students().values_list('id', flat=True))
+            existing = {
+                (row['student_id'], row['fee_structure_detail_id']): row
+                for row in StudentFee.objects.filter(
+                    fee_structure_detail__in=details, academic_year=year, student__in=self.students(),
+                ).values(
+                    'id', 'student_id', 'fee_structure_detail_id', 'amount_due', 'due_date', 'status',
+                    roll_number=F('student__roll_number'), category=F('fee_structure_detail__fee_category__name'),
+                ).order_by()
+            }
+            rules = self._reductions([row['id'] for row in existing.values()])
+        plan.students = len(student_ids)
+
+        now = timezone.now()
+        for detail in details:
+            due_date = detail.due_date or self.default_due_date
+            for student_id in student_ids:
+                current = existing.get((student_id, detail.pk))
+                if current and current['status'] in FROZEN_STATUSES:
+                    plan.frozen += 1
+                    continue
+                amount = reduce_amount(detail.amount, rules.get(current['id'], ()) if current else ())
+                fee = StudentFee(
+                    student_id=student_id,
+                    fee_structure_detail=detail,
+                    academic_year=year,
+                    due_date=due_date,
+                    amount_due=amount,
+                    updated_at=now,
+                )
+                if current is None:
+                    plan.create.append(fee)
+                elif current['amount_due'] != amount or current['due_date'] != due_date:
+                    plan.update.append((current, fee))
+                else:
+                    plan.unchanged += 1
+        self.plan_result = plan
+        return plan
+
+    @transaction.atomic
+    def apply(self):
+        """Upsert the planned rows and realign statuses. Returns the number of rows written."""
+        plan = self.plan_result or self.plan()
+        rows = plan.create + [fee for _, fee in plan.update]
+        if not rows:
+            return 0
+        StudentFee.objects.bulk_create(
+            rows,
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=['student', 'fee_structure_detail', 'academic_year'],
+            update_fields=UPSERT_FIELDS,
+        )
+
+        fees = StudentFee.objects.filter(
+            fee_structure_detail__fee_structure=self.fee_structure,
+            academic_year=self.fee_structure.academic_year,
+        ).exclude(status__in=FROZEN_STATUSES)
+        fees.filter(amount_paid__gte=F('amount_due')).exclude(status='PAID').update(
+            status='PAID', updated_at=timezone.now()
+        )
+        underpaid = fees.filter(status='PAID', amount_paid__lt=F('amount_due'))
+        underpaid.filter(amount_paid__gt=0).update(status='PARTIAL', updated_at=timezone.now())
+        underpaid.filter(amount_paid=0).update(status='PENDING', updated_at=timezone.now())
+        refresh_balances(self.students().values('id'))
+        rebuild_fee_rollups(
+            academic_year=self.fee_structure.academic_year,
+            fee_category_ids=set(self.fee_structure.fee_details.values_list('fee_category_id', flat=True)),
+        )
+        return len(rows)
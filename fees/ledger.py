@@ -0,0 +1,129 @@
+"""
+Per-student fee ledger.
+
+``StudentFeeBalance`` holds one row per student with the figures the fee
+summaries show: totals due, paid and late fees, the earliest due date still
+open and the last completed payment. ``Payment.save`` moves the paid total
+by the difference it made to its fee (``apply_payment``). Everything else
+that changes fee rows, such as direct edits, deletes and bulk assignment,
+recomputes the affected students with ``refresh_balances``, which runs one
+grouped aggregate over ``StudentFee``.
+
+``student_summaries`` reads only the balance table joined to students, so
+listing every student in the college never scans ``StudentFee``.
+"""
+from django.db.models import (
+    Case, CharField, DecimalField, ExpressionWrapper, F, Min, OuterRef, Q,
+    Subquery, Sum, Value, When,
+)
+from django.db.models.functions import Concat
+from django.utils import timezone
+
+from .models import Payment, StudentFee, StudentFeeBalance
+
+CLOSED_STATUSES = ('WAIVED', 'CANCELLED')
+BALANCE_FIELDS = [
+    'total_fees_due', 'total_fees_paid', 'late_fee_amount',
+    'oldest_unpaid_due_date', 'last_payment_date', 'updated_at',
+]
+
+OPEN_FEE = Q(amount_paid__lt=F('amount_due')) & ~Q(status__in=CLOSED_STATUSES)
+
+
+def balance_totals(student_ids=None):
+    """One grouped aggregate of ``StudentFee`` per student, with the last payment date."""
+    fees = StudentFee.objects.all()
+    if student_ids is not None:
+        fees = fees.filter(student_id__in=student_ids)
+    # The last payment comes from a subquery: joining payments into the
+    # GROUP BY would repeat each fee once per payment and inflate the sums.
+    last_payment = Payment.objects.filter(
+        student_fee__student_id=OuterRef('student_id'), status='COMPLETED'
+    ).order_by('-payment_date').values('payment_date')[:1]
+    return fees.values('student_id').annotate(
+        total_fees_due=Sum('amount_due'),
+        total_fees_paid=Sum('amount_paid'),
+        late_fee_amount=Sum('late_fee_amount'),
+        oldest_unpaid_due_date=Min('due_date', filter=OPEN_FEE),
+        last_payment_date=Subquery(last_payment),
+    ).order_by()
+
+
+def refresh_balances(student_ids=None):
+    """Recompute balances of ``student_ids`` (a list or queryset; all students when None)."""
+    now = timezone.now()
+    rows = [
+        StudentFeeBalance(updated_at=now, **totals)
+        for totals in balance_totals(student_ids)
+    ]
+    StudentFeeBalance.objects.bulk_create(
+        rows,
+        batch_size=1000,
+        update_conflicts=True,
+        unique_fields=['student'],
+        update_fields=BALANCE_FIELDS,
+    )
+    stale = StudentFeeBalance.objects.exclude(student_id__in=StudentFee.objects.values('student_id'))
+    if student_ids is not None:
+        stale = stale.filter(student_id__in=student_ids)
+    stale.delete()
+    return len(rows)
+
+
+def apply_payment(student_id, paid_delta, payment_date, reopened_or_cleared=False):
+    """Move a student's paid total by ``paid_delta`` after a payment was applied to one fee."""
+    if not paid_delta and not reopened_or_cleared:
+        return
+    changes = {
+        'total_fees_paid': F('total_fees_paid') + paid_delta,
+        'last_payment_date': Case(
+            When(Q(last_payment_date__isnull=True) | Q(last_payment_date__lt=payment_date),
+                 then=Value(payment_date)),
+            default=F('last_payment_date'),
+        ),
+        'updated_at': timezone.now(),
+    }
+    if reopened_or_cleared:
+        changes['oldest_unpaid_due_date'] = Subquery(
+            StudentFee.objects.filter(OPEN_FEE, student_id=student_id)
+            .values('student_id').annotate(oldest=Min('due_date')).values('oldest')[:1]
+        )
+    if not StudentFeeBalance.objects.filter(student_id=student_id).update(**changes):
+        refresh_balances([student_id])
+
+
+def student_summaries(department=None, overdue=None, status=None, today=None):
+    """Per-student summary rows from the balance table, ordered by roll number.
+
+    ``overdue`` keeps students with (True) or without (False) an open fee past
+    its due date. ``status`` is ``PAID`` (nothing left to pay) or ``PENDING``.
+    """
+    today = today or timezone.now().date()
+    balances = StudentFeeBalance.objects.all()
+    if department:
+        balances = balances.filter(student__department_id=department)
+    if overdue is not None:
+        past_due = Q(oldest_unpaid_due_date__lt=today)
+        balances = balances.filter(past_due if overdue else ~past_due)
+    balance = ExpressionWrapper(
+        F('total_fees_due') - F('total_fees_paid'),
+        output_field=DecimalField(max_digits=12, decimal_places=2),
+    )
+    if status == 'PAID':
+        balances = balances.filter(total_fees_paid__gte=F('total_fees_due'))
+    elif status == 'PENDING':
+        balances = balances.filter(total_fees_paid__lt=F('total_fees_due'))
+    return balances.values(
+        'student_id', 'total_fees_due', 'total_fees_paid', 'last_payment_date', 'oldest_unpaid_due_date',
+    ).annotate(
+        roll_number=F('student__roll_number'),
+        student_name=Concat('student__first_name', Value(' '), 'student__last_name', output_field=CharField()),
+        total_balance=balance,
+        overdue_amount=F('late_fee_amount'),
+        status=Case(
+            When(total_fees_paid__gte=F('total_fees_due'), then=Value('PAID')),
+            default=Value('PENDING'),
+            output_field=CharField(),
+        ),
+    )
+
@@ -0,0 +1,40 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from fees.assignment import FeeAssignmentEngine
+from fees.models import FeeStructure
+
+
+class Command(BaseCommand):
+    help = 'Create or refresh StudentFee rows for every student covered by fee structures.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--fee-structure', type=str, help='FeeStructure ID')
+        parser.add_argument('--academic-year', type=str, help='Every active structure of this academic year')
+        parser.add_argument('--due-date', type=str, help='Due date (YYYY-MM-DD) for items without one')
+        parser.add_argument('--include-optional', action='store_true', help='Also assign optional items')
+        parser.add_argument('--dry-run', action='store_true', help='Report the diff without writing')
+
+    def handle(self, *args, **options):
+        if options['fee_structure']:
+            structures = FeeStructure.objects.filter(pk=options['fee_structure'])
+        elif options['academic_year']:
+            structures = FeeStructure.objects.filter(academic_year=options['academic_year'], is_active=True)
+        else:
+            raise CommandError('Give --fee-structure or --academic-year')
+        if not structures.exists():
+            raise CommandError('No matching fee structures')
+
+        due_date = parse_date(options['due_date']) if options['due_date'] else None
+        for structure in structures:
+            engine = FeeAssignmentEngine(
+                structure, include_optional=options['include_optional'], default_due_date=due_date,
+            )
+            plan = engine.plan()
+            self.stdout.write(f'{structure}:')
+            self.stdout.write(json.dumps(plan.as_dict(limit=20), indent=2))
+            if not options['dry_run']:
+                written = engine.apply()
+                self.stdout.write(self.style.SUCCESS(f'Wrote {written} student fee rows'))
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from fees.models import ReceiptPrintJob
+from fees.receipts import run_receipt_print_job
+
+
+class Command(BaseCommand):
+    help = 'Render the unprinted fee receipts of a day to storage and mark them printed.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--date', type=str, help='Receipts generated on this day (YYYY-MM-DD), today by default')
+        parser.add_argument('--workers', type=int, help='Renderer processes (defaults to CPU count)')
+
+    def handle(self, *args, **options):
+        print_date = timezone.localdate()
+        if options['date']:
+            print_date = parse_date(options['date'])
+            if print_date is None:
+                raise CommandError(f"Invalid date {options['date']}")
+
+        job = ReceiptPrintJob.objects.create(print_date=print_date)
+        run_receipt_print_job(job.pk, workers=options.get('workers'))
+        job.refresh_from_db()
+        if job.status != 'COMPLETED':
+            raise CommandError(f'Printing failed: {job.error}')
+        for path in job.files:
+            self.stdout.write(path)
+        self.stdout.write(self.style.SUCCESS(
+            f'Rendered {job.rendered_receipts} receipts into {len(job.files)} files'
+        ))
@@ -0,0 +1,42 @@
+import csv
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from fees.overdue import CHANGE_COLUMNS, OverdueProcessor
+
+
+class Command(BaseCommand):
+    help = 'Mark overdue fees and dues and charge late fees. Meant to run nightly.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--date', type=str, help='Process as of this date (YYYY-MM-DD), today by default')
+        parser.add_argument('--chunk-size', type=int, default=5000, help='Rows per UPDATE')
+        parser.add_argument('--log-file', type=str, help='Write the change log CSV here')
+        parser.add_argument('--dry-run', action='store_true', help='Report the changes without writing them')
+
+    def handle(self, *args, **options):
+        today = None
+        if options['date']:
+            today = parse_date(options['date'])
+            if today is None:
+                raise CommandError(f"Invalid date {options['date']}")
+        report = OverdueProcessor(today=today, chunk_size=options['chunk_size']).run(dry_run=options['dry_run'])
+
+        summary = report.as_dict(limit=0)
+        for key in ('changes', 'truncated'):
+            summary.pop(key)
+        self.stdout.write(json.dumps(summary, indent=2))
+
+        if options['log_file']:
+            with open(options['log_file'], 'w', newline='') as out:
+                writer = csv.writer(out)
+                writer.writerow([label for _, label in CHANGE_COLUMNS])
+                writer.writerows([row[key] for key, _ in CHANGE_COLUMNS] for row in report.changes)
+            self.stdout.write(f"Wrote {len(report.changes)} changes to {options['log_file']}")
+        if not options['dry_run']:
+            self.stdout.write(self.style.SUCCESS(
+                f'Marked {report.fees_marked_overdue} fees and {report.dues_marked_overdue} dues overdue, '
+                f'charged {report.late_fees_charged} late fees'
+            ))
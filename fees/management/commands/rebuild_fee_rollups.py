@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from fees.analytics import rebuild_fee_rollups, rebuild_payment_rollups
+
+
+class Command(BaseCommand):
+    help = 'Backfill or repair the fee analytics rollups from StudentFee and Payment.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--from', dest='date_from', type=str, help='First payment date (YYYY-MM-DD)')
+        parser.add_argument('--to', dest='date_to', type=str, help='Last payment date (YYYY-MM-DD)')
+        parser.add_argument('--academic-year', type=str, help='Only rebuild fee rollups of this academic year')
+        parser.add_argument('--payments-only', action='store_true', help='Skip the fee status rollups')
+        parser.add_argument('--fees-only', action='store_true', help='Skip the payment rollups')
+
+    def handle(self, *args, **options):
+        dates = {}
+        for key in ('date_from', 'date_to'):
+            if options[key]:
+                dates[key] = parse_date(options[key])
+                if dates[key] is None:
+                    raise CommandError(f"Invalid date {options[key]}")
+        if not options['fees_only']:
+            count = rebuild_payment_rollups(**dates)
+            self.stdout.write(f'Wrote {count} payment rollup rows')
+        if not options['payments_only']:
+            count = rebuild_fee_rollups(academic_year=options['academic_year'])
+            self.stdout.write(f'Wrote {count} fee status rollup rows')
+        self.stdout.write(self.style.SUCCESS('Fee rollups rebuilt'))
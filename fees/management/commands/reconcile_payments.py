@@ -0,0 +1,52 @@
+import csv
+import json
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from fees.reconciliation import (
+    DUPLICATE_COLUMNS, MATCHED_COLUMNS, UNMATCHED_COLUMNS, ReconciliationEngine, read_settlement,
+)
+
+
+class Command(BaseCommand):
+    help = 'Record the payments of a bank/gateway settlement CSV against student fees.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('file', type=str, help='Settlement CSV')
+        parser.add_argument('--payment-method', type=str, default='ONLINE', help='Method of the recorded payments')
+        parser.add_argument('--academic-year', type=str, help='Only match fees of this academic year')
+        parser.add_argument('--report-dir', type=str, help='Write matched/unmatched/duplicates CSVs here')
+        parser.add_argument('--dry-run', action='store_true', help='Match and report without writing')
+
+    def handle(self, *args, **options):
+        if not os.path.exists(options['file']):
+            raise CommandError(f"No such file: {options['file']}")
+        engine = ReconciliationEngine(
+            payment_method=options['payment_method'], academic_year=options['academic_year'],
+        )
+        with open(options['file'], encoding='utf-8-sig', newline='') as lines:
+            report = engine.run(read_settlement(lines), dry_run=options['dry_run'])
+
+        summary = report.as_dict(limit=0)
+        for key in ('unmatched_rows', 'duplicate_rows', 'truncated'):
+            summary.pop(key)
+        self.stdout.write(json.dumps(summary, indent=2))
+
+        if options['report_dir']:
+            os.makedirs(options['report_dir'], exist_ok=True)
+            for name, rows, columns in (
+                ('matched', report.matched, MATCHED_COLUMNS),
+                ('unmatched', report.unmatched, UNMATCHED_COLUMNS),
+                ('duplicates', report.duplicates, DUPLICATE_COLUMNS),
+            ):
+                path = os.path.join(options['report_dir'], f'{name}.csv')
+                with open(path, 'w', newline='') as out:
+                    writer = csv.writer(out)
+                    writer.writerow([label for _, label in columns])
+                    writer.writerows([row[key] for key, _ in columns] for row in rows)
+                self.stdout.write(f'Wrote {len(rows)} rows to {path}')
+        if not options['dry_run']:
+            self.stdout.write(self.style.SUCCESS(
+                f'Created {report.payments_created} payments, completed {report.payments_completed}'
+            ))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from fees.ledger import refresh_balances
+
+
+class Command(BaseCommand):
+    help = 'Recompute the per-student fee ledger balances from StudentFee.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--student', action='append', help='Student ID (repeatable); all students by default')
+
+    def handle(self, *args, **options):
+        refreshed = refresh_balances(options['student'])
+        self.stdout.write(self.style.SUCCESS(f'Refreshed {refreshed} student balances'))
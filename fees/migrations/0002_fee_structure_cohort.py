@@ -0,0 +1,45 @@
+# Generated by Django 5.1.4 on 2026-10-19 05:47
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0002_initial'),
+        ('departments', '0002_initial'),
+        ('fees', '0001_initial'),
+        ('students', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='feestructure',
+            unique_together=set(),
+        ),
+        migrations.AddField(
+            model_name='feestructure',
+            name='academic_program',
+            field=models.ForeignKey(blank=True, help_text='Limit to students of this program', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='fee_structures', to='academics.academicprogram'),
+        ),
+        migrations.AddField(
+            model_name='feestructure',
+            name='department',
+            field=models.ForeignKey(blank=True, help_text='Limit to students of this department', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='fee_structures', to='departments.department'),
+        ),
+        migrations.AddField(
+            model_name='feestructure',
+            name='quota',
+            field=models.ForeignKey(blank=True, help_text='Limit to students admitted under this quota', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='fee_structures', to='students.quota'),
+        ),
+        migrations.AlterField(
+            model_name='feestructure',
+            name='grade_level',
+            field=models.CharField(choices=[('1', 'Grade 1'), ('2', 'Grade 2'), ('3', 'Grade 3'), ('4', 'Grade 4'), ('5', 'Grade 5'), ('6', 'Grade 6'), ('7', 'Grade 7'), ('8', 'Grade 8'), ('9', 'Grade 9'), ('10', 'Grade 10'), ('11', 'Grade 11'), ('12', 'Grade 12')], help_text="Matched against the student's year of study", max_length=2),
+        ),
+        migrations.AlterUniqueTogether(
+            name='feestructure',
+            unique_together={('academic_year', 'grade_level', 'department', 'academic_program', 'quota')},
+        ),
+    ]
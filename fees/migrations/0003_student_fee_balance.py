@@ -0,0 +1,53 @@
+# Generated by Django 5.1.4 on 2026-10-19 05:50
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.db import migrations, models
+from django.db.models import F, Min, OuterRef, Q, Subquery, Sum
+
+
+def backfill_balances(apps, schema_editor):
+    StudentFee = apps.get_model('fees', 'StudentFee')
+    Payment = apps.get_model('fees', 'Payment')
+    StudentFeeBalance = apps.get_model('fees', 'StudentFeeBalance')
+    last_payment = Payment.objects.filter(
+        student_fee__student_id=OuterRef('student_id'), status='COMPLETED'
+    ).order_by('-payment_date').values('payment_date')[:1]
+    open_fee = Q(amount_paid__lt=F('amount_due')) & ~Q(status__in=['WAIVED', 'CANCELLED'])
+    rows = StudentFee.objects.values('student_id').annotate(
+        total_fees_due=Sum('amount_due'),
+        total_fees_paid=Sum('amount_paid'),
+        late_fee_amount=Sum('late_fee_amount'),
+        oldest_unpaid_due_date=Min('due_date', filter=open_fee),
+        last_payment_date=Subquery(last_payment),
+    ).order_by()
+    StudentFeeBalance.objects.bulk_create(
+        [StudentFeeBalance(**totals) for totals in rows], batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fees', '0002_fee_structure_cohort'),
+        ('students', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StudentFeeBalance',
+            fields=[
+                ('student', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='fee_balance', serialize=False, to='students.student')),
+                ('total_fees_due', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12)),
+                ('total_fees_paid', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12)),
+                ('late_fee_amount', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12)),
+                ('oldest_unpaid_due_date', models.DateField(blank=True, help_text='Earliest due date among fees not yet fully paid, waived or cancelled', null=True)),
+                ('last_payment_date', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['oldest_unpaid_due_date'], name='fees_studen_oldest__2c8ddf_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_balances, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.4 on 2026-10-19 05:53
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fees', '0003_student_fee_balance'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['transaction_id'], name='fees_paymen_transac_a509d1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['reference_number', 'status'], name='fees_paymen_referen_582b46_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-19 06:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fees', '0004_payment_settlement_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='feereceipt',
+            name='receipt_number',
+            field=models.CharField(blank=True, max_length=50, unique=True),
+        ),
+    ]
@@ -0,0 +1,75 @@
+# Generated by Django 5.1.4 on 2026-10-19 06:06
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.db import migrations, models
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate
+
+
+def backfill_rollups(apps, schema_editor):
+    Payment = apps.get_model('fees', 'Payment')
+    StudentFee = apps.get_model('fees', 'StudentFee')
+    FeePaymentRollup = apps.get_model('fees', 'FeePaymentRollup')
+    FeeStatusRollup = apps.get_model('fees', 'FeeStatusRollup')
+    payments = Payment.objects.filter(status='COMPLETED').values(
+        'payment_method',
+        date=TruncDate('payment_date'),
+        fee_category_id=F('student_fee__fee_structure_detail__fee_category_id'),
+        academic_year=F('student_fee__academic_year'),
+        department_id=F('student_fee__student__department_id'),
+    ).annotate(payment_count=Count('id'), amount=Sum('amount')).order_by()
+    FeePaymentRollup.objects.bulk_create([FeePaymentRollup(**row) for row in payments], batch_size=1000)
+    fees = StudentFee.objects.values(
+        'due_date', 'academic_year', 'status',
+        fee_category_id=F('fee_structure_detail__fee_category_id'),
+        department_id=F('student__department_id'),
+    ).annotate(
+        fee_count=Count('id'), amount_due=Sum('amount_due'), amount_paid=Sum('amount_paid'),
+    ).order_by()
+    FeeStatusRollup.objects.bulk_create([FeeStatusRollup(**row) for row in fees], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departments', '0002_initial'),
+        ('fees', '0005_document_numbers'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FeePaymentRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('academic_year', models.CharField(max_length=9)),
+                ('payment_method', models.CharField(choices=[('CASH', 'Cash'), ('CHEQUE', 'Cheque'), ('BANK_TRANSFER', 'Bank Transfer'), ('ONLINE', 'Online Payment'), ('CARD', 'Credit/Debit Card'), ('UPI', 'UPI'), ('OTHER', 'Other')], max_length=20)),
+                ('payment_count', models.IntegerField(default=0)),
+                ('amount', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=14)),
+                ('department', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='fee_payment_rollups', to='departments.department')),
+                ('fee_category', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='payment_rollups', to='fees.feecategory')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['date', 'fee_category', 'academic_year', 'payment_method', 'department'], name='fees_feepay_date_54f32f_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='FeeStatusRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('due_date', models.DateField()),
+                ('academic_year', models.CharField(max_length=9)),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('PAID', 'Paid'), ('PARTIAL', 'Partially Paid'), ('OVERDUE', 'Overdue'), ('WAIVED', 'Waived'), ('CANCELLED', 'Cancelled')], max_length=20)),
+                ('fee_count', models.IntegerField(default=0)),
+                ('amount_due', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=14)),
+                ('amount_paid', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=14)),
+                ('department', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='fee_status_rollups', to='departments.department')),
+                ('fee_category', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='status_rollups', to='fees.feecategory')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['due_date', 'fee_category', 'academic_year', 'department', 'status'], name='fees_feesta_due_dat_8fc1dd_idx'), models.Index(fields=['academic_year', 'fee_category'], name='fees_feesta_academi_b1bcd8_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-19 06:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fees', '0006_fee_rollups'),
+        ('students', '0002_document_numbers'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='studentfee',
+            index=models.Index(fields=['status', 'due_date'], name='fees_studen_status_5a4170_idx'),
+        ),
+    ]
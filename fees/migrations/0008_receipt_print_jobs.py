@@ -0,0 +1,45 @@
+# Generated by Django 5.1.4 on 2026-10-19 06:13
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fees', '0007_overdue_status_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReceiptPrintJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('print_date', models.DateField(help_text='Receipts generated on this day are printed')),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('RUNNING', 'Running'), ('COMPLETED', 'Completed'), ('FAILED', 'Failed')], default='PENDING', max_length=20)),
+                ('total_receipts', models.PositiveIntegerField(default=0)),
+                ('rendered_receipts', models.PositiveIntegerField(default=0)),
+                ('files', models.JSONField(blank=True, default=list, help_text='Storage paths of the rendered PDFs')),
+                ('error', models.TextField(blank=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='feereceipt',
+            index=models.Index(fields=['is_printed', 'generated_date'], name='fees_feerec_is_prin_1e1062_idx'),
+        ),
+        migrations.AddField(
+            model_name='receiptprintjob',
+            name='requested_by',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='receipt_print_jobs', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.1.4 on 2026-10-19 07:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0002_initial'),
+        ('departments', '0002_initial'),
+        ('fees', '0008_receipt_print_jobs'),
+        ('students', '0002_document_numbers'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='feestructure',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='feestructure',
+            constraint=models.UniqueConstraint(fields=('academic_year', 'grade_level', 'department', 'academic_program', 'quota'), name='uniq_fee_structure_scope', nulls_distinct=False),
+        ),
+    ]
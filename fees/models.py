@@ -7,6 +7,8 @@ from django.contrib.auth import get_user_model
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
 
+from campshub360.numbering import next_number
+
 User = get_user_model()
 
 
@@ -63,12 +65,43 @@ class FeeStructure(TimeStampedUUIDModel):
     
     name = models.CharField(max_length=200)
     academic_year = models.CharField(max_length=9, choices=ACADEMIC_YEAR_CHOICES)
-    grade_level = models.CharField(max_length=2, choices=GRADE_CHOICES)
+    grade_level = models.CharField(max_length=2, choices=GRADE_CHOICES, help_text="Matched against the student's year of study")
+    department = models.ForeignKey(
+        'departments.Department',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='fee_structures',
+        help_text="Limit to students of this department"
+    )
+    academic_program = models.ForeignKey(
+        'academics.AcademicProgram',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='fee_structures',
+        help_text="Limit to students of this program"
+    )
+    quota = models.ForeignKey(
+        'students.Quota',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='fee_structures',
+        help_text="Limit to students admitted under this quota"
+    )
     is_active = models.BooleanField(default=True)
     description = models.TextField(blank=True, null=True)
     
     class Meta:
-        unique_together = ['academic_year', 'grade_level']
+        constraints = [
+            # NULL scope fields mean "all"; they must collide, so NULLs are not distinct
+            models.UniqueConstraint(
+                fields=['academic_year', 'grade_level', 'department', 'academic_program', 'quota'],
+                nulls_distinct=False,
+                name='uniq_fee_structure_scope',
+            ),
+        ]
         ordering = ['academic_year', 'grade_level']
     
     def __str__(self):
@@ -173,6 +206,7 @@ class StudentFee(TimeStampedUUIDModel):
         indexes = [
             Index(fields=['student', 'status']),
             Index(fields=['due_date', 'status']),
+            Index(fields=['status', 'due_date']),
         ]
     
     def __str__(self):
@@ -186,8 +220,8 @@ class StudentFee(TimeStampedUUIDModel):
     
     @property
     def is_overdue(self):
-        """Check if fee is overdue"""
-        return self.due_date < timezone.now().date() and self.status == 'PENDING'
+        """Check if fee is overdue, including fees the nightly run has not marked yet"""
+        return self.status == 'OVERDUE' or (self.due_date < timezone.now().date() and self.status == 'PENDING')
     
     @property
     def total_amount_due(self):
@@ -244,39 +278,67 @@ class Payment(TimeStampedUUIDModel):
     
     class Meta:
         ordering = ['-payment_date']
+        indexes = [
+            Index(fields=['transaction_id']),
+            Index(fields=['reference_number', 'status']),
+        ]
     
     def __str__(self):
         return f"{self.student_fee.student.roll_number} - {self.amount} - {self.payment_date.date()}"
     
     def save(self, *args, **kwargs):
-        # Collision-safe receipt generation with retries, and atomic aggregation update
-        max_retries = 3
-        for _ in range(max_retries):
-            try:
-                with transaction.atomic():
-                    if not self.receipt_number:
-                        # Use time + random suffix to avoid contention, keep uniqueness at DB level
-                        ts = timezone.now().strftime('%Y%m%d%H%M%S%f')
-                        import secrets
-                        self.receipt_number = f"RCPT{ts}-{secrets.token_hex(3).upper()}"
-                    super().save(*args, **kwargs)
-
-                    if self.status == 'COMPLETED':
-                        # Recompute paid aggregate safely
-                        total_paid = self.student_fee.payments.filter(
-                            status='COMPLETED'
-                        ).aggregate(total=models.Sum('amount'))['total'] or Decimal('0.00')
-                        self.student_fee.amount_paid = total_paid
-                        if self.student_fee.amount_paid >= self.student_fee.amount_due:
-                            self.student_fee.status = 'PAID'
-                        elif self.student_fee.amount_paid > 0:
-                            self.student_fee.status = 'PARTIAL'
-                        self.student_fee.save(update_fields=['amount_paid', 'status'])
-                break
-            except Exception as e:
-                # Retry on potential unique collisions
-                self.receipt_number = None
-                continue
+        # Receipt numbers come from the document number allocator, so there is nothing to retry
+        with transaction.atomic():
+            previous = None if self._state.adding else Payment.objects.filter(pk=self.pk).first()
+            if not self.receipt_number:
+                self.receipt_number = next_number('receipt', scope=str(timezone.now().year))
+            super().save(*args, **kwargs)
+
+            if self.status == 'COMPLETED':
+                self._apply_to_student_fee()
+            self._update_rollup(previous)
+
+    def _update_rollup(self, previous):
+        """Move this payment's contribution in the daily payment rollup."""
+        from .analytics import fee_states, payment_state, record_payment
+
+        was_completed = previous is not None and previous.status == 'COMPLETED'
+        if not (was_completed or self.status == 'COMPLETED'):
+            return
+        states = fee_states({self.student_fee_id} | ({previous.student_fee_id} if was_completed else set()))
+        record_payment(
+            payment_state(previous, states[previous.student_fee_id]) if was_completed else None,
+            payment_state(self, states[self.student_fee_id]),
+        )
+
+    def _apply_to_student_fee(self):
+        """Recompute the fee's paid amount and move the student's balance by the difference."""
+        from .analytics import fee_states, record_fee
+        from .ledger import apply_payment
+
+        fee = StudentFee.objects.select_for_update().get(pk=self.student_fee_id)
+        previous_paid, was_open = fee.amount_paid, fee.amount_paid < fee.amount_due
+        previous_state = fee_states([fee.pk])[fee.pk]
+        total_paid = fee.payments.filter(
+            status='COMPLETED'
+        ).aggregate(total=models.Sum('amount'))['total'] or Decimal('0.00')
+        fee.amount_paid = total_paid
+        if fee.amount_paid >= fee.amount_due:
+            fee.status = 'PAID'
+        elif fee.amount_paid > 0:
+            fee.status = 'PARTIAL'
+        # Queryset update so the StudentFee signal does not rebuild the balance from scratch
+        StudentFee.objects.filter(pk=fee.pk).update(
+            amount_paid=fee.amount_paid, status=fee.status, updated_at=timezone.now()
+        )
+        self.student_fee = fee
+        record_fee(previous_state, {**previous_state, 'amount_paid': fee.amount_paid, 'status': fee.status})
+        apply_payment(
+            fee.student_id,
+            total_paid - previous_paid,
+            self.payment_date,
+            reopened_or_cleared=was_open != (fee.amount_paid < fee.amount_due),
+        )
 
 
 class FeeWaiver(TimeStampedUUIDModel):
@@ -377,7 +439,7 @@ class FeeReceipt(TimeStampedUUIDModel):
         on_delete=models.CASCADE, 
         related_name='receipts'
     )
-    receipt_number = models.CharField(max_length=50, unique=True)
+    receipt_number = models.CharField(max_length=50, unique=True, blank=True)
     generated_date = models.DateTimeField(auto_now_add=True)
     generated_by = models.ForeignKey(
         User, 
@@ -391,6 +453,163 @@ class FeeReceipt(TimeStampedUUIDModel):
     
     class Meta:
         ordering = ['-generated_date']
+        indexes = [
+            Index(fields=['is_printed', 'generated_date']),
+        ]
     
     def __str__(self):
         return f"Receipt {self.receipt_number} - {self.student_fee.student.roll_number}"
+
+    def save(self, *args, **kwargs):
+        if not self.receipt_number:
+            self.receipt_number = next_number('fee_receipt', scope=str(timezone.now().year))
+        super().save(*args, **kwargs)
+
+
+class ReceiptPrintJob(TimeStampedUUIDModel):
+    """Background rendering of the unprinted fee receipts of one day"""
+    
+    STATUS_CHOICES = [
+        ('PENDING', 'Pending'),
+        ('RUNNING', 'Running'),
+        ('COMPLETED', 'Completed'),
+        ('FAILED', 'Failed'),
+    ]
+    
+    print_date = models.DateField(help_text="Receipts generated on this day are printed")
+    requested_by = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='receipt_print_jobs'
+    )
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='PENDING')
+    total_receipts = models.PositiveIntegerField(default=0)
+    rendered_receipts = models.PositiveIntegerField(default=0)
+    files = models.JSONField(default=list, blank=True, help_text="Storage paths of the rendered PDFs")
+    error = models.TextField(blank=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        ordering = ['-created_at']
+    
+    def __str__(self):
+        return f"Receipts of {self.print_date} - {self.status} ({self.rendered_receipts}/{self.total_receipts})"
+    
+    @property
+    def progress(self):
+        if not self.total_receipts:
+            return 100.0 if self.status == 'COMPLETED' else 0.0
+        return round(self.rendered_receipts * 100 / self.total_receipts, 1)
+
+
+class StudentFeeBalance(models.Model):
+    """Materialized per-student fee totals for summaries and dashboards.
+
+    Payment.save moves ``total_fees_paid`` incrementally; direct StudentFee
+    changes and bulk assignment recompute the affected students.
+    """
+
+    student = models.OneToOneField(
+        'students.Student',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='fee_balance'
+    )
+    total_fees_due = models.DecimalField(max_digits=12, decimal_places=2, default=Decimal('0.00'))
+    total_fees_paid = models.DecimalField(max_digits=12, decimal_places=2, default=Decimal('0.00'))
+    late_fee_amount = models.DecimalField(max_digits=12, decimal_places=2, default=Decimal('0.00'))
+    oldest_unpaid_due_date = models.DateField(
+        null=True,
+        blank=True,
+        help_text="Earliest due date among fees not yet fully paid, waived or cancelled"
+    )
+    last_payment_date = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            Index(fields=['oldest_unpaid_due_date']),
+        ]
+
+    def __str__(self):
+        return f"{self.student_id} - {self.balance_amount}"
+
+    @property
+    def balance_amount(self):
+        return self.total_fees_due - self.total_fees_paid
+
+
+class FeePaymentRollup(models.Model):
+    """Completed payments per day, fee category, academic year, method and department.
+
+    Keys are not unique: concurrent first writes may add two rows for the
+    same key, which is harmless because every reader sums.
+    """
+
+    date = models.DateField()
+    fee_category = models.ForeignKey(
+        FeeCategory,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='payment_rollups'
+    )
+    academic_year = models.CharField(max_length=9)
+    payment_method = models.CharField(max_length=20, choices=Payment.PAYMENT_METHOD_CHOICES)
+    department = models.ForeignKey(
+        'departments.Department',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='fee_payment_rollups'
+    )
+    payment_count = models.IntegerField(default=0)
+    amount = models.DecimalField(max_digits=14, decimal_places=2, default=Decimal('0.00'))
+
+    class Meta:
+        indexes = [
+            Index(fields=['date', 'fee_category', 'academic_year', 'payment_method', 'department']),
+        ]
+
+    def __str__(self):
+        return f"{self.date} {self.payment_method} - {self.amount}"
+
+
+class FeeStatusRollup(models.Model):
+    """Student fees per due date, fee category, academic year, department and status.
+
+    Keys are not unique for the same reason as ``FeePaymentRollup``.
+    """
+
+    due_date = models.DateField()
+    fee_category = models.ForeignKey(
+        FeeCategory,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='status_rollups'
+    )
+    academic_year = models.CharField(max_length=9)
+    department = models.ForeignKey(
+        'departments.Department',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='fee_status_rollups'
+    )
+    status = models.CharField(max_length=20, choices=StudentFee.STATUS_CHOICES)
+    fee_count = models.IntegerField(default=0)
+    amount_due = models.DecimalField(max_digits=14, decimal_places=2, default=Decimal('0.00'))
+    amount_paid = models.DecimalField(max_digits=14, decimal_places=2, default=Decimal('0.00'))
+
+    class Meta:
+        indexes = [
+            Index(fields=['due_date', 'fee_category', 'academic_year', 'department', 'status']),
+            Index(fields=['academic_year', 'fee_category']),
+        ]
+
+    def __str__(self):
+        return f"{self.due_date} {self.status} - {self.fee_count}"
@@ -0,0 +1,187 @@
+"""
+Nightly overdue and late-fee processing.
+
+``status`` is the source of truth for overdue fees, so overdue lists and
+counts are indexed ``status = 'OVERDUE'`` lookups. A nightly run of
+``process_overdue_fees`` keeps it current:
+
+* unpaid ``PENDING`` fees whose due date has passed become ``OVERDUE``, and
+  ``OVERDUE`` fees whose due date was moved forward go back to ``PENDING``.
+  ``exams.StudentDue`` gets the same two transitions;
+* open fees past their due date are charged the late fee of their
+  ``FeeStructureDetail``: ``late_fee_amount`` plus ``late_fee_percentage`` of
+  the amount due. A late fee is only ever raised, so a higher amount set by
+  hand is kept.
+
+Rows are walked in primary key order, a chunk at a time, and each chunk is
+changed with one set-based UPDATE that repeats the selection condition, so
+a fee paid in the meantime is left alone. Every run is idempotent: a failed
+run is finished by running it again. The balances of students charged a
+late fee and the fee status rollups of the touched slices are refreshed at
+the end.
+
+Each changed row adds one line to a compact change log (``CHANGE_COLUMNS``).
+"""
+import datetime
+from collections import defaultdict
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from django.db.models import DecimalField, ExpressionWrapper, F, Q, Value
+from django.db.models.functions import Round
+from django.utils import timezone
+
+from campshub360.utils import use_primary_reads
+from .analytics import rebuild_fee_rollups
+from .ledger import refresh_balances
+from .models import FeeStructureDetail, StudentFee
+
+CHUNK_SIZE = 5000
+ZERO = Decimal('0.00')
+OPEN_STATUSES = ('PENDING', 'PARTIAL', 'OVERDUE')
+
+CHANGE_COLUMNS = [
+    ('model', 'Model'),
+    ('id', 'ID'),
+    ('roll_number', 'Roll Number'),
+    ('field', 'Field'),
+    ('old', 'Old'),
+    ('new', 'New'),
+]
+
+
+@dataclass
+class OverdueReport:
+    run_date: datetime.date
+    dry_run: bool = False
+    fees_marked_overdue: int = 0
+    fees_reopened: int = 0
+    late_fees_charged: int = 0
+    late_fee_total: Decimal = ZERO
+    dues_marked_overdue: int = 0
+    dues_reopened: int = 0
+    changes: list = field(default_factory=list)
+
+    def as_dict(self, limit=100):
+        return {
+            'run_date': self.run_date.isoformat(),
+            'dry_run': self.dry_run,
+            'fees_marked_overdue': self.fees_marked_overdue,
+            'fees_reopened': self.fees_reopened,
+            'late_fees_charged': self.late_fees_charged,
+            'late_fee_total': str(self.late_fee_total),
+            'dues_marked_overdue': self.dues_marked_overdue,
+            'dues_reopened': self.dues_reopened,
+            'changes': self.changes[:limit],
+            'truncated': len(self.changes) > limit,
+        }
+
+
+def late_fee_charge(detail):
+    """Late fee of one fee under the rule of ``detail``, as a database expression."""
+    charge = Value(detail.late_fee_amount) + F('amount_due') * Value(detail.late_fee_percentage / 100)
+    return ExpressionWrapper(Round(charge, 2), output_field=DecimalField(max_digits=10, decimal_places=2))
+
+
+class OverdueProcessor:
+    """Move fees and dues in and out of ``OVERDUE`` and charge late fees as of ``today``."""
+
+    def __init__(self, today=None, chunk_size=CHUNK_SIZE):
+        self.today = today or timezone.localdate()
+        self.chunk_size = chunk_size
+        self.dry_run = False
+        self.report = OverdueReport(run_date=self.today)
+        self._slices = defaultdict(set)
+        self._charged_students = set()
+
+    def run(self, dry_run=False):
+        self.report.dry_run = dry_run
+        self.dry_run = dry_run
+        with use_primary_reads():
+            past_due = Q(due_date__lt=self.today)
+            self.report.fees_marked_overdue = self._transition(
+                StudentFee, past_due & Q(status='PENDING', amount_paid=0), 'OVERDUE',
+            )
+            self.report.fees_reopened = self._transition(StudentFee, ~past_due & Q(status='OVERDUE'), 'PENDING')
+            for detail in FeeStructureDetail.objects.filter(
+                Q(late_fee_amount__gt=0) | Q(late_fee_percentage__gt=0)
+            ).order_by('pk'):
+                self._charge_late_fees(detail)
+            self._process_dues()
+
+            if not dry_run:
+                student_ids = list(self._charged_students)
+                for start in range(0, len(student_ids), self.chunk_size):
+                    refresh_balances(student_ids[start:start + self.chunk_size])
+                for year, category_ids in self._slices.items():
+                    rebuild_fee_rollups(academic_year=year, fee_category_ids=category_ids)
+        return self.report
+
+    def _chunks(self, queryset, *fields, **expressions):
+        """Rows of ``queryset`` in primary key order, ``chunk_size`` at a time."""
+        queryset = queryset.order_by('pk')
+        last = None
+        while True:
+            page = queryset if last is None else queryset.filter(pk__gt=last)
+            rows = list(page.values('pk', *fields, **expressions)[:self.chunk_size])
+            if not rows:
+                return
+            yield rows
+            last = rows[-1]['pk']
+
+    def _log(self, model, row, name, old, new):
+        self.report.changes.append({
+            'model': model, 'id': str(row['pk']), 'roll_number': row['student__roll_number'],
+            'field': name, 'old': str(old), 'new': str(new),
+        })
+
+    def _transition(self, model, condition, to_status):
+        """Set ``status`` to ``to_status`` on every row matching ``condition``."""
+        selected = model.objects.filter(condition)
+        fields = ['status', 'student__roll_number']
+        if model is StudentFee:
+            fields += ['academic_year', 'fee_structure_detail__fee_category_id']
+        changed = 0
+        for rows in self._chunks(selected, *fields):
+            ids = [row['pk'] for row in rows]
+            if self.dry_run:
+                updated = len(rows)
+            else:
+                updated = model.objects.filter(condition, pk__in=ids).update(
+                    status=to_status, updated_at=timezone.now()
+                )
+            changed += updated
+            for row in rows:
+                self._log(model._meta.label, row, 'status', row['status'], to_status)
+                if model is StudentFee:
+                    self._slices[row['academic_year']].add(row['fee_structure_detail__fee_category_id'])
+        return changed
+
+    def _charge_late_fees(self, detail):
+        """Raise the late fee of the open past-due fees of ``detail`` to what its rule charges."""
+        charge = late_fee_charge(detail)
+        condition = Q(
+            fee_structure_detail=detail, due_date__lt=self.today, status__in=OPEN_STATUSES,
+            amount_paid__lt=F('amount_due'), late_fee_amount__lt=F('charge'),
+        )
+        selected = StudentFee.objects.alias(charge=charge).filter(condition)
+        for rows in self._chunks(selected, 'late_fee_amount', 'student_id', 'student__roll_number', charge=charge):
+            ids = [row['pk'] for row in rows]
+            if not self.dry_run:
+                StudentFee.objects.alias(charge=charge).filter(condition, pk__in=ids).update(
+                    late_fee_amount=charge, updated_at=timezone.now()
+                )
+            for row in rows:
+                self.report.late_fees_charged += 1
+                self.report.late_fee_total += row['charge'] - row['late_fee_amount']
+                self._charged_students.add(row['student_id'])
+                self._log('fees.StudentFee', row, 'late_fee_amount', row['late_fee_amount'], row['charge'])
+
+    def _process_dues(self):
+        from exams.models import StudentDue
+
+        past_due = Q(due_date__lt=self.today)
+        self.report.dues_marked_overdue = self._transition(
+            StudentDue, past_due & Q(status='PENDING', paid_amount=0), 'OVERDUE',
+        )
+        self.report.dues_reopened = self._transition(StudentDue, ~past_due & Q(status='OVERDUE'), 'PENDING')
@@ -0,0 +1,102 @@
+"""
+Fee receipt PDF layout.
+
+Kept free of Django imports so the render functions can run in worker
+processes; they take plain dicts (see ``receipts.receipt_payload``) and
+return PDF bytes. ``layout`` carries the institution details, and optional
+paths to a logo and a TTF font.
+
+Everything that does not change between receipts is prepared once per
+process: the font is registered and the logo decoded on first use and then
+cached. Within a document, the static part of the page (header, logo,
+labels and rules) is drawn once into a form and every receipt page reuses
+it, so a batch only draws each receipt's values.
+"""
+from functools import lru_cache
+from io import BytesIO
+
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.pdfgen import canvas
+
+STATIC_FORM = 'receipt-static'
+
+# (label, payload key, y) of the receipt's value rows
+FIELDS = [
+    ('Receipt Number', 'receipt_number', 640),
+    ('Date', 'generated_date', 620),
+    ('Student', 'student_name', 580),
+    ('Roll Number', 'roll_number', 560),
+    ('Fee', 'fee_category', 540),
+    ('Academic Year', 'academic_year', 520),
+    ('Payment Method', 'payment_method', 480),
+    ('Transaction', 'transaction_id', 460),
+    ('Payment Date', 'payment_date', 440),
+    ('Amount Received', 'amount', 400),
+    ('Total Due', 'amount_due', 380),
+    ('Total Paid', 'amount_paid', 360),
+    ('Balance', 'balance', 340),
+]
+LABEL_X = 100
+VALUE_X = 260
+
+
+@lru_cache(maxsize=None)
+def _resources(font_path, logo_path):
+    """Register the font and decode the logo once per process. Returns (font, bold font, logo)."""
+    font, bold = 'Helvetica', 'Helvetica-Bold'
+    if font_path:
+        pdfmetrics.registerFont(TTFont('ReceiptFont', font_path))
+        font = bold = 'ReceiptFont'
+    logo = ImageReader(logo_path) if logo_path else None
+    return font, bold, logo
+
+
+def _prepare(p, layout):
+    """Draw the static part of the receipt page into a form on canvas ``p``."""
+    font, bold, logo = _resources(layout.get('font'), layout.get('logo'))
+    p.beginForm(STATIC_FORM)
+    if logo is not None:
+        p.drawImage(logo, LABEL_X, 700, width=60, height=60, preserveAspectRatio=True, mask='auto')
+    p.setFont(bold, 16)
+    p.drawString(LABEL_X + 80, 735, layout.get('institution_name', ''))
+    p.setFont(font, 10)
+    p.drawString(LABEL_X + 80, 718, layout.get('address', ''))
+    p.setFont(bold, 13)
+    p.drawString(LABEL_X, 670, "FEE RECEIPT")
+    p.line(LABEL_X, 662, 512, 662)
+    p.line(LABEL_X, 420, 512, 420)
+    p.setFont(font, 11)
+    for label, _, y in FIELDS:
+        p.drawString(LABEL_X, y, f"{label}:")
+    p.setFont(font, 9)
+    p.drawString(LABEL_X, 300, "This is a computer generated receipt.")
+    p.endForm()
+    return font
+
+
+def draw_receipt(p, receipt, font):
+    """Draw one receipt on the current page of a canvas prepared with ``_prepare``."""
+    p.doForm(STATIC_FORM)
+    p.setFont(font, 11)
+    for _, key, y in FIELDS:
+        p.drawString(VALUE_X, y, str(receipt.get(key) or '-'))
+    p.showPage()
+
+
+def render_receipts(receipts, layout):
+    """Render receipts into one PDF with a page per receipt and return its bytes."""
+    buffer = BytesIO()
+    p = canvas.Canvas(buffer, pagesize=letter)
+    font = _prepare(p, layout)
+    for receipt in receipts:
+        draw_receipt(p, receipt, font)
+    p.save()
+    return buffer.getvalue()
+
+
+def render_receipt(receipt, layout):
+    """Render a single receipt and return the PDF bytes."""
+    return render_receipts([receipt], layout)
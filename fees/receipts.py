@@ -0,0 +1,165 @@
+"""
+Fee receipt rendering.
+
+A single receipt is rendered in the request and streamed back. Printing a
+day's receipts happens in a ``ReceiptPrintJob``, run by a background worker
+(the ``fees.print_receipts`` task): the unprinted receipts of
+that day are loaded with one joined query, split into batches and rendered
+by a process pool (``receipt_pdf`` has no Django dependencies and is
+imported on first render, keeping ReportLab out of web worker startup). The parent
+process writes one PDF per batch to the default storage, marks the batch's
+receipts printed with one UPDATE and records progress on the job row.
+
+The institution details printed on every receipt come from the
+``FEE_RECEIPT_PDF`` setting (``institution_name``, ``address``, ``logo``
+and ``font``, the last two being file paths).
+"""
+import datetime
+import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.utils import timezone
+
+from campshub360.jobs import submit
+from campshub360.utils import use_primary_reads
+from .models import FeeReceipt, ReceiptPrintJob
+
+logger = logging.getLogger(__name__)
+
+STORAGE_ROOT = 'receipts'
+
+
+def receipt_layout():
+    options = getattr(settings, 'FEE_RECEIPT_PDF', {})
+    return {
+        'institution_name': options.get('institution_name', 'CampsHub360'),
+        'address': options.get('address', ''),
+        'logo': options.get('logo'),
+        'font': options.get('font'),
+    }
+
+
+def receipts_with_details():
+    return FeeReceipt.objects.select_related(
+        'student_fee__student', 'student_fee__fee_structure_detail__fee_category', 'payment',
+    )
+
+
+def receipt_payload(receipt):
+    fee = receipt.student_fee
+    payment = receipt.payment
+    return {
+        'receipt_number': receipt.receipt_number,
+        'generated_date': timezone.localtime(receipt.generated_date).strftime('%Y-%m-%d %H:%M'),
+        'student_name': fee.student.full_name,
+        'roll_number': fee.student.roll_number,
+        'fee_category': fee.fee_structure_detail.fee_category.name,
+        'academic_year': fee.academic_year,
+        'payment_method': payment.get_payment_method_display(),
+        'transaction_id': payment.transaction_id,
+        'payment_date': timezone.localtime(payment.payment_date).strftime('%Y-%m-%d'),
+        'amount': str(payment.amount),
+        'amount_due': str(fee.amount_due),
+        'amount_paid': str(fee.amount_paid),
+        'balance': str(fee.amount_due - fee.amount_paid),
+    }
+
+
+def render_receipt_pdf(receipt):
+    """PDF bytes of one receipt, rendered in this process."""
+    from .receipt_pdf import render_receipt
+    return render_receipt(receipt_payload(receipt), receipt_layout())
+
+
+def _day_bounds(day):
+    start = timezone.make_aware(datetime.datetime.combine(day, datetime.time.min))
+    return start, start + datetime.timedelta(days=1)
+
+
+def unprinted_receipts(day):
+    """Receipts generated on local day ``day`` that are not printed yet, in receipt number order."""
+    start, end = _day_bounds(day)
+    return receipts_with_details().filter(
+        is_printed=False, generated_date__gte=start, generated_date__lt=end,
+    ).order_by('receipt_number')
+
+
+class ReceiptPrinter:
+    """Render the unprinted receipts of one day into batch PDFs and mark them printed."""
+
+    def __init__(self, day, workers=None, batch_size=200, storage=None):
+        self.day = day
+        self.workers = workers
+        self.batch_size = batch_size
+        self.storage = storage or default_storage
+
+    def _batches(self):
+        with use_primary_reads():
+            receipts = list(unprinted_receipts(self.day))
+        for start in range(0, len(receipts), self.batch_size):
+            batch = receipts[start:start + self.batch_size]
+            yield [receipt.pk for receipt in batch], [receipt_payload(receipt) for receipt in batch]
+
+    def _write(self, path, content):
+        if self.storage.exists(path):
+            self.storage.delete(path)
+        return self.storage.save(path, ContentFile(content))
+
+    def print(self, job=None):
+        """Render every unprinted receipt of the day; returns the written file paths."""
+        from .receipt_pdf import render_receipts
+        batches = list(self._batches())
+        total = sum(len(ids) for ids, _ in batches)
+        if job is not None:
+            ReceiptPrintJob.objects.filter(pk=job.pk).update(total_receipts=total, rendered_receipts=0)
+
+        run = job.pk if job is not None else timezone.now().strftime('%H%M%S')
+        base = f"{STORAGE_ROOT}/{self.day.isoformat()}/{run}"
+        layout = receipt_layout()
+        files = []
+        rendered = 0
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            futures = {
+                pool.submit(render_receipts, payloads, layout): (index, ids)
+                for index, (ids, payloads) in enumerate(batches, start=1)
+            }
+            for future in as_completed(futures):
+                index, ids = futures[future]
+                files.append(self._write(f"{base}/part{index:03d}.pdf", future.result()))
+                FeeReceipt.objects.filter(pk__in=ids, is_printed=False).update(
+                    is_printed=True, printed_date=timezone.now(),
+                )
+                rendered += len(ids)
+                if job is not None:
+                    ReceiptPrintJob.objects.filter(pk=job.pk).update(rendered_receipts=rendered)
+        return sorted(files)
+
+
+def run_receipt_print_job(job_id, workers=None):
+    """Execute a pending ReceiptPrintJob, recording progress and outcome on the row."""
+    job = ReceiptPrintJob.objects.get(pk=job_id)
+    ReceiptPrintJob.objects.filter(pk=job.pk).update(status='RUNNING', started_at=timezone.now())
+    try:
+        files = ReceiptPrinter(job.print_date, workers=workers).print(job)
+    except Exception as exc:
+        logger.exception("Receipt print job %s failed", job_id)
+        ReceiptPrintJob.objects.filter(pk=job.pk).update(
+            status='FAILED', error=str(exc), finished_at=timezone.now()
+        )
+    else:
+        ReceiptPrintJob.objects.filter(pk=job.pk).update(
+            status='COMPLETED', files=files, finished_at=timezone.now()
+        )
+
+
+def start_receipt_print_job(job):
+    """Queue the job for a background worker (see ``fees.tasks``)."""
+    return submit(
+        'fees.print_receipts',
+        {'receipt_print_job_id': str(job.pk)},
+        user=job.requested_by,
+        label=f"Receipts of {job.print_date.isoformat()}",
+    )
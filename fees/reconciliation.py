@@ -0,0 +1,346 @@
+"""
+Settlement file reconciliation.
+
+Gateway and bank settlement CSVs are read as a stream and processed in
+chunks. Each row is matched in memory against two hash indexes, each built
+with a single query:
+
+* ``reference_number``: a PENDING ``Payment`` carrying the same reference
+  (a payment started online and not yet confirmed) is completed in place,
+  provided the amounts agree;
+* ``roll_number``: the amount is allocated to the student's open fees,
+  oldest due date first, creating one ``Payment`` per fee it touches. Any
+  excess stays on the last fee.
+
+A transaction id already recorded on a completed payment, or repeated
+within the file, is reported as a duplicate and skipped. New payments are
+inserted with ``bulk_create`` and confirmed ones with ``bulk_update``,
+which skips the per-payment ``Payment.save`` path. The paid amount and
+status of every affected fee are then recomputed in the database: per
+chunk of fees, one UPDATE sets ``amount_paid`` from a grouped ``SUM``
+subquery and two more realign statuses. The students' ledger balances and
+the analytics rollups of the touched dates and fee slices are refreshed
+last.
+"""
+import csv
+from collections import defaultdict
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+
+from django.db import transaction
+from django.db.models import F, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from campshub360.numbering import allocate
+from campshub360.utils import use_primary_reads
+from .analytics import rebuild_fee_rollups, rebuild_payment_rollups
+from .ledger import CLOSED_STATUSES, refresh_balances
+from .models import Payment, StudentFee
+
+CHUNK_SIZE = 5000
+
+# Accepted header names for each settlement column, compared lower-cased
+COLUMN_ALIASES = {
+    'transaction_id': ('transaction_id', 'utr', 'txn_id', 'bank_reference', 'rrn'),
+    'reference_number': ('reference_number', 'reference', 'order_id', 'merchant_reference'),
+    'roll_number': ('roll_number', 'roll_no', 'student_roll_number'),
+    'amount': ('amount', 'settled_amount', 'credit_amount'),
+    'payment_date': ('payment_date', 'settlement_date', 'transaction_date', 'date'),
+}
+
+MATCHED_COLUMNS = [
+    ('row', 'Row'),
+    ('transaction_id', 'Transaction ID'),
+    ('reference_number', 'Reference'),
+    ('roll_number', 'Roll Number'),
+    ('amount', 'Amount'),
+    ('matched_by', 'Matched By'),
+    ('payments', 'Payments'),
+    ('excess', 'Excess'),
+]
+UNMATCHED_COLUMNS = [
+    ('row', 'Row'),
+    ('transaction_id', 'Transaction ID'),
+    ('reference_number', 'Reference'),
+    ('roll_number', 'Roll Number'),
+    ('amount', 'Amount'),
+    ('reason', 'Reason'),
+]
+DUPLICATE_COLUMNS = UNMATCHED_COLUMNS
+
+
+def read_settlement(lines):
+    """Yield settlement rows from CSV ``lines`` with their headers mapped to canonical names."""
+    reader = csv.reader(lines)
+    header = [name.strip().lower() for name in next(reader, [])]
+    positions = {}
+    for column, aliases in COLUMN_ALIASES.items():
+        for alias in aliases:
+            if alias in header:
+                positions[column] = header.index(alias)
+                break
+    for values in reader:
+        if not any(value.strip() for value in values):
+            continue
+        yield {
+            column: values[index].strip() if index < len(values) else ''
+            for column, index in positions.items()
+        }
+
+
+def _parse_payment_date(value, default):
+    if not value:
+        return default
+    moment = parse_datetime(value)
+    if moment is None:
+        day = parse_date(value)
+        if day is None:
+            raise ValueError(value)
+        moment = timezone.datetime.combine(day, timezone.datetime.min.time())
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+@dataclass
+class ReconciliationReport:
+    rows: int = 0
+    matched: list = field(default_factory=list)
+    unmatched: list = field(default_factory=list)
+    duplicates: list = field(default_factory=list)
+    payments_created: int = 0
+    payments_completed: int = 0
+    fees_updated: int = 0
+    amount_matched: Decimal = Decimal('0.00')
+
+    def as_dict(self, limit=200):
+        return {
+            'rows': self.rows,
+            'matched': len(self.matched),
+            'unmatched': len(self.unmatched),
+            'duplicates': len(self.duplicates),
+            'payments_created': self.payments_created,
+            'payments_completed': self.payments_completed,
+            'fees_updated': self.fees_updated,
+            'amount_matched': str(self.amount_matched),
+            'unmatched_rows': self.unmatched[:limit],
+            'duplicate_rows': self.duplicates[:limit],
+            'truncated': len(self.unmatched) > limit or len(self.duplicates) > limit,
+        }
+
+
+class ReconciliationEngine:
+    """Record the payments of a settlement file against student fees."""
+
+    def __init__(self, payment_method='ONLINE', collected_by=None, academic_year=None, chunk_size=CHUNK_SIZE):
+        self.payment_method = payment_method
+        self.collected_by = collected_by
+        self.academic_year = academic_year
+        self.chunk_size = chunk_size
+        self.report = ReconciliationReport()
+        self._seen = set()
+        self._payment_dates = set()
+
+    def _build_indexes(self):
+        """Open fees by roll number and pending payments by reference, one query each."""
+        fees = StudentFee.objects.filter(amount_paid__lt=F('amount_due')).exclude(status__in=CLOSED_STATUSES)
+        if self.academic_year:
+            fees = fees.filter(academic_year=self.academic_year)
+        self.open_fees = defaultdict(list)
+        for fee_id, student_id, roll_number, amount_due, amount_paid in fees.values_list(
+            'id', 'student_id', 'student__roll_number', 'amount_due', 'amount_paid'
+        ).order_by('student__roll_number', 'due_date', 'created_at'):
+            # [fee id, student id, outstanding], outstanding is drawn down as rows are allocated
+            self.open_fees[roll_number].append([fee_id, student_id, amount_due - amount_paid])
+
+        self.pending = {
+            reference: (payment_id, amount, fee_id, student_id)
+            for payment_id, reference, amount, fee_id, student_id in Payment.objects.filter(
+                status='PENDING', reference_number__isnull=False,
+            ).exclude(reference_number='').values_list(
+                'id', 'reference_number', 'amount', 'student_fee_id', 'student_fee__student_id'
+            ).order_by('created_at')
+        }
+
+    def run(self, rows, dry_run=False, progress=None):
+        """Reconcile an iterable of settlement rows. Returns the ReconciliationReport.
+
+        ``progress(rows_read)`` is called after every chunk.
+        """
+        with transaction.atomic():
+            with use_primary_reads():
+                self._build_indexes()
+            affected_fees, affected_students = set(), set()
+            chunk = []
+            for row in rows:
+                self.report.rows += 1
+                row['row'] = self.report.rows
+                chunk.append(row)
+                if len(chunk) >= self.chunk_size:
+                    self._process_chunk(chunk, affected_fees, affected_students, dry_run)
+                    chunk = []
+                    if progress is not None:
+                        progress(self.report.rows)
+            if chunk:
+                self._process_chunk(chunk, affected_fees, affected_students, dry_run)
+            if not dry_run and affected_fees:
+                self.report.fees_updated = self._recompute_fees(affected_fees)
+                refresh_balances(list(affected_students))
+                self._refresh_rollups(affected_fees)
+        return self.report
+
+    def _process_chunk(self, chunk, affected_fees, affected_students, dry_run):
+        now = timezone.now()
+        transaction_ids = {row.get('transaction_id') for row in chunk if row.get('transaction_id')}
+        recorded = set(Payment.objects.filter(
+            transaction_id__in=transaction_ids, status='COMPLETED'
+        ).values_list('transaction_id', flat=True).order_by())
+
+        new_payments, completed = [], []
+        for row in chunk:
+            entry = {
+                'row': row['row'],
+                'transaction_id': row.get('transaction_id', ''),
+                'reference_number': row.get('reference_number', ''),
+                'roll_number': row.get('roll_number', ''),
+                'amount': row.get('amount', ''),
+            }
+            transaction_id = entry['transaction_id']
+            if not transaction_id:
+                self.report.unmatched.append({**entry, 'reason': 'Missing transaction id'})
+                continue
+            if transaction_id in recorded or transaction_id in self._seen:
+                reason = 'Repeated in file' if transaction_id in self._seen else 'Already recorded'
+                self.report.duplicates.append({**entry, 'reason': reason})
+                continue
+            try:
+                amount = Decimal(entry['amount'].replace(',', ''))
+                payment_date = _parse_payment_date(row.get('payment_date'), now)
+            except (InvalidOperation, ValueError):
+                self.report.unmatched.append({**entry, 'reason': 'Invalid amount or date'})
+                continue
+            if amount <= 0:
+                self.report.unmatched.append({**entry, 'reason': 'Amount must be positive'})
+                continue
+
+            pending = self.pending.get(entry['reference_number']) if entry['reference_number'] else None
+            if pending:
+                payment_id, pending_amount, fee_id, student_id = pending
+                if pending_amount != amount:
+                    self.report.unmatched.append({
+                        **entry, 'reason': f'Amount differs from pending payment ({pending_amount})'
+                    })
+                    continue
+                del self.pending[entry['reference_number']]
+                completed.append(Payment(
+                    id=payment_id, status='COMPLETED', transaction_id=transaction_id,
+                    payment_date=payment_date, updated_at=now,
+                ))
+                affected_fees.add(fee_id)
+                affected_students.add(student_id)
+                self._record_match(entry, amount, 'reference', 1, Decimal('0.00'))
+                continue
+
+            fees = self.open_fees.get(entry['roll_number'])
+            if not fees:
+                self.report.unmatched.append({**entry, 'reason': 'No open fee for this roll number'})
+                continue
+            affected_students.add(fees[0][1])
+            payments, excess = self._allocate(
+                fees, amount, transaction_id, entry['reference_number'], payment_date, now
+            )
+            new_payments.extend(payments)
+            affected_fees.update(payment.student_fee_id for payment in payments)
+            self._record_match(entry, amount, 'roll_number', len(payments), excess)
+
+        if not dry_run:
+            numbers = allocate('receipt', len(new_payments), scope=str(now.year))
+            for payment, number in zip(new_payments, numbers):
+                payment.receipt_number = number
+            Payment.objects.bulk_create(new_payments, batch_size=1000)
+            Payment.objects.bulk_update(
+                completed, ['status', 'transaction_id', 'payment_date', 'updated_at'], batch_size=1000
+            )
+            self._payment_dates.update(
+                timezone.localdate(payment.payment_date) for payment in new_payments + completed
+            )
+        self.report.payments_created += len(new_payments)
+        self.report.payments_completed += len(completed)
+
+    def _allocate(self, fees, amount, transaction_id, reference_number, payment_date, now):
+        """Split ``amount`` over one student's open ``fees``, oldest first. Returns (payments, excess)."""
+        payments = []
+        remaining = amount
+        for fee in fees:
+            if remaining <= 0:
+                break
+            if fee[2] <= 0:
+                continue
+            share = min(remaining, fee[2])
+            payments.append(self._payment(fee, share, transaction_id, reference_number, payment_date, now))
+            fee[2] -= share
+            remaining -= share
+        if remaining > 0:
+            # Overpayment: keep it on the last fee rather than dropping it
+            if payments:
+                payments[-1].amount += remaining
+            else:
+                payments.append(self._payment(fees[-1], remaining, transaction_id, reference_number, payment_date, now))
+        return payments, remaining
+
+    def _payment(self, fee, amount, transaction_id, reference_number, payment_date, now):
+        return Payment(
+            student_fee_id=fee[0],
+            amount=amount,
+            payment_method=self.payment_method,
+            payment_date=payment_date,
+            transaction_id=transaction_id,
+            reference_number=reference_number or None,
+            status='COMPLETED',
+            collected_by=self.collected_by,
+            created_at=now,
+            updated_at=now,
+        )
+
+    def _record_match(self, entry, amount, matched_by, payments, excess):
+        self._seen.add(entry['transaction_id'])
+        self.report.amount_matched += amount
+        self.report.matched.append({
+            **entry, 'matched_by': matched_by, 'payments': payments, 'excess': str(excess) if excess else '',
+        })
+
+    def _refresh_rollups(self, fee_ids):
+        """Rebuild the analytics rollups for the payment dates and fee slices this run touched."""
+        fee_ids = list(fee_ids)
+        categories = defaultdict(set)
+        for start in range(0, len(fee_ids), CHUNK_SIZE):
+            for year, category_id in StudentFee.objects.filter(pk__in=fee_ids[start:start + CHUNK_SIZE]).values_list(
+                'academic_year', 'fee_structure_detail__fee_category_id'
+            ).distinct().order_by():
+                categories[year].add(category_id)
+        for year, category_ids in categories.items():
+            rebuild_fee_rollups(academic_year=year, fee_category_ids=category_ids)
+        if self._payment_dates:
+            rebuild_payment_rollups(min(self._payment_dates), max(self._payment_dates))
+
+    @staticmethod
+    def _recompute_fees(fee_ids):
+        """Set amount_paid and status of ``fee_ids`` from their completed payments."""
+        fee_ids = list(fee_ids)
+        paid = Payment.objects.filter(
+            student_fee_id=OuterRef('pk'), status='COMPLETED'
+        ).values('student_fee_id').annotate(total=Sum('amount')).values('total')
+        now = timezone.now()
+        updated = 0
+        for start in range(0, len(fee_ids), CHUNK_SIZE):
+            fees = StudentFee.objects.filter(pk__in=fee_ids[start:start + CHUNK_SIZE])
+            updated += fees.update(
+                amount_paid=Coalesce(Subquery(paid), Value(Decimal('0.00'))), updated_at=now,
+            )
+            fees.filter(amount_paid__gte=F('amount_due')).exclude(status='PAID').update(status='PAID')
+            fees.filter(amount_paid__gt=0, amount_paid__lt=F('amount_due')).exclude(
+                status__in=('PARTIAL',) + CLOSED_STATUSES
+            ).update(status='PARTIAL')
+        return updated
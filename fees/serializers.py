@@ -27,8 +27,8 @@ class FeeStructureSerializer(serializers.ModelSerializer):
     class Meta:
         model = FeeStructure
         fields = [
-            'id', 'name', 'academic_year', 'grade_level', 'is_active',
-            'description', 'total_amount', 'fee_details_count',
+            'id', 'name', 'academic_year', 'grade_level', 'department', 'academic_program',
+            'quota', 'is_active', 'description', 'total_amount', 'fee_details_count',
             'created_at', 'updated_at'
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
@@ -39,6 +39,24 @@ class FeeStructureSerializer(serializers.ModelSerializer):
     
     def get_fee_details_count(self, obj):
         return obj.fee_details.count()
+    
+    def validate(self, data):
+        # DRF's unique-together check skips NULL scope fields; the constraint treats them as equal
+        scope = {}
+        for name in ['academic_year', 'grade_level', 'department', 'academic_program', 'quota']:
+            value = data[name] if name in data else getattr(self.instance, name, None)
+            if value is None:
+                scope[f'{name}__isnull'] = True
+            else:
+                scope[name] = value
+        duplicates = FeeStructure.objects.filter(**scope)
+        if self.instance is not None:
+            duplicates = duplicates.exclude(pk=self.instance.pk)
+        if duplicates.exists():
+            raise serializers.ValidationError(
+                "A fee structure for this academic year, grade and scope already exists"
+            )
+        return data
 
 
 class FeeStructureDetailSerializer(serializers.ModelSerializer):
@@ -261,9 +279,10 @@ class StudentFeeSummarySerializer(serializers.Serializer):
     student_id = serializers.UUIDField()
     roll_number = serializers.CharField()
     student_name = serializers.CharField()
-    total_fees_due = serializers.DecimalField(max_digits=10, decimal_places=2)
-    total_fees_paid = serializers.DecimalField(max_digits=10, decimal_places=2)
-    total_balance = serializers.DecimalField(max_digits=10, decimal_places=2)
-    overdue_amount = serializers.DecimalField(max_digits=10, decimal_places=2)
+    total_fees_due = serializers.DecimalField(max_digits=12, decimal_places=2)
+    total_fees_paid = serializers.DecimalField(max_digits=12, decimal_places=2)
+    total_balance = serializers.DecimalField(max_digits=12, decimal_places=2)
+    overdue_amount = serializers.DecimalField(max_digits=12, decimal_places=2)
     status = serializers.CharField()
     last_payment_date = serializers.DateTimeField(allow_null=True)
+    oldest_unpaid_due_date = serializers.DateField(allow_null=True)
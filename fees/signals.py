@@ -0,0 +1,38 @@
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from .analytics import fee_states, payment_state, record_fee, record_payment
+from .ledger import refresh_balances
+from .models import Payment, StudentFee
+
+
+@receiver([post_save, post_delete], sender=StudentFee)
+def refresh_student_balance(sender, instance, **kwargs):
+    """Keep the student's ledger balance in step with direct fee edits."""
+    refresh_balances([instance.student_id])
+
+
+@receiver([pre_save, pre_delete], sender=StudentFee)
+def remember_fee_state(sender, instance, **kwargs):
+    instance._rollup_state = None if instance._state.adding else fee_states([instance.pk]).get(instance.pk)
+
+
+@receiver(post_save, sender=StudentFee)
+def update_fee_rollup(sender, instance, **kwargs):
+    record_fee(getattr(instance, '_rollup_state', None), fee_states([instance.pk]).get(instance.pk))
+
+
+@receiver(post_delete, sender=StudentFee)
+def remove_fee_rollup(sender, instance, **kwargs):
+    record_fee(getattr(instance, '_rollup_state', None), None)
+
+
+@receiver(pre_delete, sender=Payment)
+def remember_payment_state(sender, instance, **kwargs):
+    fee_state = fee_states([instance.student_fee_id]).get(instance.student_fee_id)
+    instance._rollup_state = payment_state(instance, fee_state) if fee_state else None
+
+
+@receiver(post_delete, sender=Payment)
+def remove_payment_rollup(sender, instance, **kwargs):
+    record_payment(getattr(instance, '_rollup_state', None), None)
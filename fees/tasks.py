@@ -0,0 +1,53 @@
+"""Background tasks of the fees app."""
+import csv
+import io
+
+from django.core.files.storage import default_storage
+
+from campshub360.jobs import task
+from .models import ReceiptPrintJob
+from .receipts import run_receipt_print_job
+from .reconciliation import (
+    DUPLICATE_COLUMNS, MATCHED_COLUMNS, UNMATCHED_COLUMNS, ReconciliationEngine, read_settlement,
+)
+
+
+@task('fees.print_receipts')
+def print_receipts(context, receipt_print_job_id):
+    """Print a day's receipts for a ReceiptPrintJob; its own row keeps the detailed progress."""
+    run_receipt_print_job(receipt_print_job_id)
+    job = ReceiptPrintJob.objects.get(pk=receipt_print_job_id)
+    if job.status == 'FAILED':
+        raise RuntimeError(job.error)
+    return {'receipts': job.rendered_receipts, 'files': job.files}
+
+
+@task('fees.reconcile')
+def reconcile_settlement(context, path, payment_method='ONLINE', academic_year=None, dry_run=False):
+    """Reconcile the settlement CSV stored at ``path``; the full row lists are saved as CSV artifacts."""
+    engine = ReconciliationEngine(
+        payment_method=payment_method,
+        collected_by=context.job.requested_by,
+        academic_year=academic_year,
+    )
+    try:
+        with default_storage.open(path, 'rb') as upload:
+            lines = io.TextIOWrapper(upload, encoding='utf-8-sig', newline='')
+            report = engine.run(read_settlement(lines), dry_run=dry_run, progress=context.progress)
+    finally:
+        default_storage.delete(path)
+
+    for name, rows, columns in (
+        ('matched', report.matched, MATCHED_COLUMNS),
+        ('unmatched', report.unmatched, UNMATCHED_COLUMNS),
+        ('duplicates', report.duplicates, DUPLICATE_COLUMNS),
+    ):
+        if rows:
+            out = io.StringIO()
+            writer = csv.writer(out)
+            writer.writerow([label for _, label in columns])
+            writer.writerows([row[key] for key, _ in columns] for row in rows)
+            context.save_artifact(f'{name}.csv', out.getvalue())
+    result = report.as_dict()
+    result['dry_run'] = dry_run
+    return result
@@ -1,16 +1,31 @@
+import io
+import uuid
+
 from rest_framework import viewsets, status, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.pagination import CursorPagination
+from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.permissions import IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Sum, Q, Count
+from django.db.models import Q
 from django.utils import timezone
 from django.shortcuts import get_object_or_404
+from django.utils.dateparse import parse_date
+from django.core.files.storage import default_storage
+from django.http import FileResponse
+from django.urls import reverse
 
+from campshub360.jobs import submit
+from campshub360.utils import parse_bool
 from .models import (
     FeeCategory, FeeStructure, FeeStructureDetail, StudentFee,
-    Payment, FeeWaiver, FeeDiscount, FeeReceipt
+    Payment, FeeWaiver, FeeDiscount, FeeReceipt, StudentFeeBalance, ReceiptPrintJob
 )
+from .assignment import FeeAssignmentEngine
+from .analytics import fee_overview
+from .ledger import student_summaries
+from .receipts import receipts_with_details, render_receipt_pdf, start_receipt_print_job
 from .serializers import (
     FeeCategorySerializer, FeeStructureSerializer, FeeStructureDetailSerializer,
     StudentFeeSerializer, PaymentSerializer, FeeWaiverSerializer,
@@ -20,6 +35,18 @@ from .serializers import (
 )
 
 
+class StudentFeeSummaryPagination(CursorPagination):
+    """Keyset pagination over the unique roll number of ledger summary rows"""
+
+    ordering = 'roll_number'
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+
+    def get_ordering(self, request, queryset, view):
+        # Ignore the viewset's OrderingFilter, whose fields belong to StudentFee
+        return (self.ordering,)
+
+
 class FeeCategoryViewSet(viewsets.ModelViewSet):
     """ViewSet for FeeCategory model"""
     
@@ -80,6 +107,31 @@ class FeeStructureViewSet(viewsets.ModelViewSet):
         queryset = self.get_queryset().filter(academic_year=academic_year)
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
+    
+    @action(detail=True, methods=['post'])
+    def assign(self, request, pk=None):
+        """Create or refresh StudentFee rows for every student covered by this structure"""
+        fee_structure = self.get_object()
+        default_due_date = request.data.get('due_date')
+        if default_due_date:
+            default_due_date = parse_date(str(default_due_date))
+            if default_due_date is None:
+                return Response(
+                    {"error": "due_date must be YYYY-MM-DD"},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+        dry_run = parse_bool(request.data.get('dry_run'))
+        
+        engine = FeeAssignmentEngine(
+            fee_structure,
+            include_optional=parse_bool(request.data.get('include_optional')),
+            default_due_date=default_due_date,
+        )
+        report = engine.plan().as_dict()
+        report['dry_run'] = dry_run
+        if not dry_run:
+            report['written'] = engine.apply()
+        return Response(report)
 
 
 class FeeStructureDetailViewSet(viewsets.ModelViewSet):
@@ -122,11 +174,8 @@ class StudentFeeViewSet(viewsets.ModelViewSet):
     
     @action(detail=False, methods=['get'])
     def overdue(self, request):
-        """Get overdue fees"""
-        queryset = self.get_queryset().filter(
-            due_date__lt=timezone.now().date(),
-            status='PENDING'
-        )
+        """Get overdue fees, as marked by the nightly overdue run"""
+        queryset = self.get_queryset().filter(status='OVERDUE')
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
     
@@ -147,27 +196,15 @@ class StudentFeeViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def summary(self, request):
         """Get fee summary statistics"""
-        total_students = StudentFee.objects.values('student').distinct().count()
-        total_fees_due = StudentFee.objects.aggregate(total=Sum('amount_due'))['total'] or 0
-        total_fees_paid = StudentFee.objects.aggregate(total=Sum('amount_paid'))['total'] or 0
-        total_balance = total_fees_due - total_fees_paid
-        
-        overdue_count = StudentFee.objects.filter(
-            due_date__lt=timezone.now().date(),
-            status='PENDING'
-        ).count()
-        
-        pending_count = StudentFee.objects.filter(status='PENDING').count()
-        paid_count = StudentFee.objects.filter(status='PAID').count()
-        
+        overview = fee_overview()
         summary_data = {
-            'total_students': total_students,
-            'total_fees_due': total_fees_due,
-            'total_fees_paid': total_fees_paid,
-            'total_balance': total_balance,
-            'overdue_count': overdue_count,
-            'pending_count': pending_count,
-            'paid_count': paid_count,
+            'total_students': StudentFeeBalance.objects.count(),
+            'total_fees_due': overview['total_fees_due'],
+            'total_fees_paid': overview['total_fees_paid'],
+            'total_balance': overview['total_balance'],
+            'overdue_count': overview['overdue_count'],
+            'pending_count': overview['pending_count'],
+            'paid_count': overview['paid_count'],
         }
         
         serializer = FeeSummarySerializer(summary_data)
@@ -175,39 +212,20 @@ class StudentFeeViewSet(viewsets.ModelViewSet):
     
     @action(detail=False, methods=['get'])
     def student_summary(self, request):
-        """Get fee summary for all students"""
-        student_fees = StudentFee.objects.values('student').annotate(
-            total_fees_due=Sum('amount_due'),
-            total_fees_paid=Sum('amount_paid'),
-            overdue_amount=Sum('late_fee_amount')
+        """Get fee summary for all students, keyset-paginated by roll number.
+
+        Filters: ``department``, ``overdue`` (true/false) and ``status``
+        (PAID/PENDING).
+        """
+        summaries = student_summaries(
+            department=request.query_params.get('department'),
+            overdue=parse_bool(request.query_params.get('overdue'), default=None),
+            status=(request.query_params.get('status') or '').upper() or None,
         )
-        
-        summaries = []
-        for fee_data in student_fees:
-            student = fee_data['student']
-            total_balance = fee_data['total_fees_due'] - fee_data['total_fees_paid']
-            
-            # Get last payment date
-            last_payment = Payment.objects.filter(
-                student_fee__student=student,
-                status='COMPLETED'
-            ).order_by('-payment_date').first()
-            
-            summary = {
-                'student_id': student,
-                'roll_number': StudentFee.objects.filter(student=student).first().student.roll_number,
-                'student_name': f"{StudentFee.objects.filter(student=student).first().student.first_name} {StudentFee.objects.filter(student=student).first().student.last_name}",
-                'total_fees_due': fee_data['total_fees_due'],
-                'total_fees_paid': fee_data['total_fees_paid'],
-                'total_balance': total_balance,
-                'overdue_amount': fee_data['overdue_amount'],
-                'status': 'PAID' if total_balance <= 0 else 'PENDING',
-                'last_payment_date': last_payment.payment_date if last_payment else None
-            }
-            summaries.append(summary)
-        
-        serializer = StudentFeeSummarySerializer(summaries, many=True)
-        return Response(serializer.data)
+        paginator = StudentFeeSummaryPagination()
+        page = paginator.paginate_queryset(summaries, request, view=self)
+        serializer = StudentFeeSummarySerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
 
 
 class PaymentViewSet(viewsets.ModelViewSet):
@@ -262,6 +280,40 @@ class PaymentViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
     
+    @action(detail=False, methods=['post'], parser_classes=[MultiPartParser, FormParser])
+    def reconcile(self, request):
+        """Queue the payments of a bank/gateway settlement CSV for recording; poll the returned job"""
+        upload = request.FILES.get('file')
+        if not upload:
+            return Response(
+                {"error": "A settlement CSV file is required"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        payment_method = request.data.get('payment_method') or 'ONLINE'
+        if payment_method not in dict(Payment.PAYMENT_METHOD_CHOICES):
+            return Response(
+                {"error": f"Unknown payment_method {payment_method}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        dry_run = parse_bool(request.data.get('dry_run'))
+        # Large settlement files take minutes; the worker reads the stored copy
+        path = default_storage.save(f"settlements/{uuid.uuid4()}.csv", upload)
+        job = submit(
+            'fees.reconcile',
+            {
+                'path': path,
+                'payment_method': payment_method,
+                'academic_year': request.data.get('academic_year') or None,
+                'dry_run': dry_run,
+            },
+            user=request.user,
+            label=f"Settlement reconciliation {upload.name}",
+        )
+        return Response({
+            'job_id': str(job.pk),
+            'status_url': request.build_absolute_uri(reverse('jobs:job-detail', kwargs={'pk': job.pk})),
+        }, status=status.HTTP_202_ACCEPTED)
+    
     @action(detail=True, methods=['post'])
     def mark_completed(self, request, pk=None):
         """Mark payment as completed"""
@@ -356,6 +408,11 @@ class FeeReceiptViewSet(viewsets.ModelViewSet):
     ordering_fields = ['generated_date', 'printed_date', 'created_at']
     ordering = ['-generated_date']
     
+    def get_queryset(self):
+        if self.action == 'download':
+            return receipts_with_details()
+        return super().get_queryset()
+    
     @action(detail=False, methods=['get'])
     def unprinted(self, request):
         """Get unprinted receipts"""
@@ -369,17 +426,54 @@ class FeeReceiptViewSet(viewsets.ModelViewSet):
         receipt = self.get_object()
         receipt.is_printed = True
         receipt.printed_date = timezone.now()
-        receipt.save()
+        receipt.save(update_fields=['is_printed', 'printed_date', 'updated_at'])
         
         serializer = self.get_serializer(receipt)
         return Response(serializer.data)
     
     @action(detail=True, methods=['get'])
     def download(self, request, pk=None):
-        """Download receipt (placeholder for PDF generation)"""
+        """Stream the receipt PDF"""
         receipt = self.get_object()
-        # Here you would implement PDF generation logic
+        return FileResponse(
+            io.BytesIO(render_receipt_pdf(receipt)),
+            as_attachment=True,
+            filename=f"{receipt.receipt_number}.pdf",
+            content_type='application/pdf',
+        )
+    
+    @action(detail=False, methods=['post'])
+    def print_batch(self, request):
+        """Render all unprinted receipts generated on ``date`` in the background and mark them printed"""
+        print_date = parse_date(str(request.data.get('date', '')))
+        if print_date is None:
+            return Response(
+                {"error": "date (YYYY-MM-DD) is required"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        job = ReceiptPrintJob.objects.create(print_date=print_date, requested_by=request.user)
+        start_receipt_print_job(job)
+        return Response({
+            'id': str(job.id),
+            'status': job.status,
+            'status_url': request.build_absolute_uri(
+                reverse('fees:feereceipt-print-job', kwargs={'job_id': job.id})
+            ),
+        }, status=status.HTTP_202_ACCEPTED)
+    
+    @action(detail=False, methods=['get'], url_path=r'print-jobs/(?P<job_id>[^/.]+)')
+    def print_job(self, request, job_id=None):
+        """Progress of a batch receipt print job"""
+        job = get_object_or_404(ReceiptPrintJob, id=job_id)
         return Response({
-            "message": f"Receipt {receipt.receipt_number} download initiated",
-            "receipt_number": receipt.receipt_number
+            'id': str(job.id),
+            'print_date': job.print_date,
+            'status': job.status,
+            'total_receipts': job.total_receipts,
+            'rendered_receipts': job.rendered_receipts,
+            'progress': job.progress,
+            'files': [{'path': path, 'url': default_storage.url(path)} for path in job.files],
+            'error': job.error,
+            'started_at': job.started_at,
+            'finished_at': job.finished_at,
         })
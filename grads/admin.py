@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import GradeScale, Term, CourseResult, TermGPA, GraduateRecord
+from .models import GradeScale, Term, CourseResult, TermGPA, GraduateRecord, TranscriptBlock
 
 
 @admin.register(GradeScale)
@@ -37,4 +37,12 @@ class GraduateRecordAdmin(admin.ModelAdmin):
     list_filter = ('program__level',)
     search_fields = ('student__roll_number',)
 
+
+@admin.register(TranscriptBlock)
+class TranscriptBlockAdmin(admin.ModelAdmin):
+    list_display = ('student', 'term', 'version', 'created_at')
+    list_filter = ('term__academic_year', 'term__semester')
+    search_fields = ('student__roll_number',)
+    readonly_fields = ('student', 'term', 'version', 'data', 'checksum', 'pdf_file', 'created_at')
+
 # Register your models here.
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class GradsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'grads'
+
+    def ready(self):
+        import grads.signals
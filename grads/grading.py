@@ -0,0 +1,352 @@
+"""
+Grading engine for ``CourseResult``.
+
+``GradeScaleResolver`` keeps every active ``GradeScale`` band in memory,
+grouped by scope (department, program, global). Each process reloads the
+bands only when the version number in the shared cache changes, and
+``GradeScale`` writes bump that number.
+
+``GPALedger`` keeps ``TermGPA`` and ``GraduateRecord`` current from
+per-result deltas. A result contributes ``grade_points * credits`` quality
+points and ``credits`` credits, the same quantities the full ``recalculate``
+aggregates sum, so the stored totals only need the difference applied.
+Aggregate rows are locked while the deltas are applied. Rows that do not
+exist yet are seeded from a full aggregate instead.
+
+``SectionGrader`` grades a whole section in one batch, and ``rebuild_gpa``
+recomputes every aggregate from scratch for reconciliation.
+"""
+from collections import defaultdict, namedtuple
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F, Q, Sum
+from django.utils import timezone
+
+from students.models import Student
+from .models import CourseResult, GradeScale, GraduateRecord, TermGPA
+
+Band = namedtuple('Band', ['letter', 'min_score', 'max_score', 'grade_points'])
+
+
+class GradeScaleResolver:
+    """In-memory, scope-aware lookup of grade bands."""
+
+    VERSION_KEY = 'grads:grade_scale_version'
+    _current = None
+
+    def __init__(self, rows, version=0):
+        self.version = version
+        self.department = defaultdict(list)
+        self.program = defaultdict(list)
+        self.default = []
+        for row in rows:
+            band = Band(row['letter'], row['min_score'], row['max_score'], row['grade_points'])
+            if row['department_id']:
+                self.department[row['department_id']].append(band)
+            elif row['program_id']:
+                self.program[row['program_id']].append(band)
+            else:
+                self.default.append(band)
+        for bands in [*self.department.values(), *self.program.values(), self.default]:
+            bands.sort(key=lambda b: (-b.grade_points, b.min_score))
+
+    @classmethod
+    def load(cls, version=0):
+        return cls(GradeScale.objects.filter(is_active=True).values(
+            'letter', 'min_score', 'max_score', 'grade_points', 'department_id', 'program_id'
+        ).order_by(), version)
+
+    @classmethod
+    def current(cls):
+        """Process-wide resolver, reloaded when the grade scales change."""
+        version = cache.get(cls.VERSION_KEY, 0)
+        if cls._current is None or cls._current.version != version:
+            cls._current = cls.load(version)
+        return cls._current
+
+    @classmethod
+    def invalidate(cls):
+        try:
+            cache.incr(cls.VERSION_KEY)
+        except ValueError:
+            cache.set(cls.VERSION_KEY, 1, None)
+        cls._current = None
+
+    @staticmethod
+    def _match(bands, score):
+        # Bands are ordered by grade points, so the first hit is the best one
+        for band in bands:
+            if band.min_score <= score <= band.max_score:
+                return band
+        return None
+
+    def resolve(self, score, department_id=None, program_ids=()):
+        """
+        Band for ``score``: department scope first, then program, then global.
+
+        ``program_ids`` may be a callable so the course's programs are only
+        looked up when the department has no matching band.
+        """
+        if department_id:
+            band = self._match(self.department.get(department_id, ()), score)
+            if band:
+                return band
+        if self.program:
+            if callable(program_ids):
+                program_ids = program_ids()
+            candidates = [
+                band for program_id in program_ids
+                for band in [self._match(self.program.get(program_id, ()), score)] if band
+            ]
+            if candidates:
+                return max(candidates, key=lambda b: b.grade_points)
+        return self._match(self.default, score)
+
+
+def _quality_points(grade_points, credits):
+    return (grade_points * credits) if grade_points is not None else Decimal('0')
+
+
+class GPALedger:
+    """Accumulate result deltas and apply them to TermGPA/GraduateRecord in bulk."""
+
+    def __init__(self):
+        self.terms = defaultdict(lambda: [Decimal('0'), 0])
+        self.students = defaultdict(lambda: [Decimal('0'), 0])
+
+    @staticmethod
+    def contribution_of(result_id):
+        """(student_id, term_id, grade_points, credits) currently stored for a result."""
+        return CourseResult.objects.filter(pk=result_id).values_list(
+            'student_id', 'term_id', 'grade_points', 'course_section__course__credits'
+        ).first()
+
+    def add(self, student_id, term_id, grade_points, credits, sign=1):
+        quality_points = _quality_points(grade_points, credits) * sign
+        for bucket in (self.terms[(student_id, term_id)], self.students[student_id]):
+            bucket[0] += quality_points
+            bucket[1] += credits * sign
+
+    def remove(self, student_id, term_id, grade_points, credits):
+        self.add(student_id, term_id, grade_points, credits, sign=-1)
+
+    @transaction.atomic
+    def apply(self):
+        if self.terms:
+            self._apply_terms()
+        if self.students:
+            self._apply_students()
+
+    def _apply_terms(self):
+        student_ids = {student_id for student_id, _ in self.terms}
+        term_ids = {term_id for _, term_id in self.terms}
+        existing = {
+            (row.student_id, row.term_id): row
+            for row in TermGPA.objects.select_for_update().filter(
+                student_id__in=student_ids, term_id__in=term_ids
+            ).order_by('pk')
+            if (row.student_id, row.term_id) in self.terms
+        }
+        missing = [key for key in self.terms if key not in existing]
+        if missing:
+            totals = _term_totals(Q(student_id__in={s for s, _ in missing}, term_id__in={t for _, t in missing}))
+            rows = []
+            for student_id, term_id in missing:
+                row = TermGPA(student_id=student_id, term_id=term_id)
+                row.apply_totals(*totals.get((student_id, term_id), (0, 0)))
+                rows.append(row)
+            TermGPA.objects.bulk_create(rows, ignore_conflicts=True)
+
+        for key, row in existing.items():
+            quality_points, credits = self.terms[key]
+            row.apply_totals(row.quality_points + quality_points, row.total_credits + credits)
+        TermGPA.objects.bulk_update(existing.values(), ['quality_points', 'total_credits', 'gpa'])
+
+    def _apply_students(self):
+        existing = {
+            row.student_id: row
+            for row in GraduateRecord.objects.select_for_update().filter(
+                student_id__in=self.students.keys()
+            ).order_by('pk')
+        }
+        missing = [student_id for student_id in self.students if student_id not in existing]
+        if missing:
+            totals = _student_totals(Q(student_id__in=missing))
+            rows = []
+            for student_id in missing:
+                row = GraduateRecord(student_id=student_id)
+                row.apply_totals(*totals.get(student_id, (0, 0)))
+                rows.append(row)
+            GraduateRecord.objects.bulk_create(rows, ignore_conflicts=True)
+
+        now = timezone.now()
+        for student_id, row in existing.items():
+            quality_points, credits = self.students[student_id]
+            row.apply_totals(row.total_quality_points + quality_points, row.total_credits_earned + credits)
+            row.updated_at = now
+        GraduateRecord.objects.bulk_update(
+            existing.values(), ['total_quality_points', 'total_credits_earned', 'cgpa', 'updated_at']
+        )
+
+
+def _totals(condition, group_by):
+    rows = CourseResult.objects.filter(condition).values(*group_by).annotate(
+        quality_points=Sum(F('grade_points') * F('course_section__course__credits')),
+        credits=Sum('course_section__course__credits'),
+    ).order_by()
+    return {
+        tuple(row[field] for field in group_by) if len(group_by) > 1 else row[group_by[0]]:
+        (row['quality_points'] or Decimal('0'), row['credits'] or 0)
+        for row in rows
+    }
+
+
+def _term_totals(condition):
+    return _totals(condition, ['student_id', 'term_id'])
+
+
+def _student_totals(condition):
+    return _totals(condition, ['student_id'])
+
+
+class SectionGrader:
+    """Grade every student of a course section for a term in one batch."""
+
+    def __init__(self, course_section, term, evaluator=None):
+        self.course_section = course_section
+        self.term = term
+        self.evaluator = evaluator
+
+    def grade(self, entries):
+        """
+        Upsert results for ``entries`` (dicts with student, internal_marks, external_marks).
+
+        Returns ``{'created': n, 'updated': n, 'unknown_students': [...]}``.
+        """
+        course = self.course_section.course
+        credits = course.credits
+        program_ids = list(course.programs.values_list('id', flat=True))
+        resolver = GradeScaleResolver.current()
+
+        marks = {
+            str(entry['student']): (
+                Decimal(str(entry.get('internal_marks') or 0)),
+                Decimal(str(entry.get('external_marks') or 0)),
+            )
+            for entry in entries
+        }
+        # Map the submitted ids to real primary keys so ledger keys match stored rows
+        students = {
+            str(pk): pk for pk in Student.objects.filter(pk__in=marks.keys()).values_list('pk', flat=True)
+        }
+        unknown = [student_id for student_id in marks if student_id not in students]
+        now = timezone.now()
+        ledger = GPALedger()
+
+        with transaction.atomic():
+            existing = {
+                str(result.student_id): result
+                for result in CourseResult.objects.select_for_update().filter(
+                    term=self.term, course_section=self.course_section, student_id__in=marks.keys()
+                ).order_by('pk')
+            }
+            to_create, to_update = [], []
+            for student_id, (internal, external) in marks.items():
+                if student_id not in students:
+                    continue
+                result = existing.get(student_id)
+                if result is None:
+                    result = CourseResult(
+                        student_id=students[student_id], term=self.term, course_section=self.course_section
+                    )
+                    to_create.append(result)
+                else:
+                    ledger.remove(result.student_id, result.term_id, result.grade_points, credits)
+                    to_update.append(result)
+                result.internal_marks = internal
+                result.external_marks = external
+                result.total_marks = internal + external
+                band = resolver.resolve(result.total_marks, course.department_id, program_ids)
+                result.letter_grade = band.letter if band else ''
+                result.grade_points = band.grade_points if band else None
+                result.passed = bool(band and band.grade_points > 0)
+                result.evaluated_at = now
+                result.evaluator = self.evaluator
+                ledger.add(result.student_id, self.term.pk, result.grade_points, credits)
+
+            # Bulk writes bypass CourseResult.save(); the ledger applies the GPA deltas instead
+            CourseResult.objects.bulk_create(to_create, batch_size=500)
+            CourseResult.objects.bulk_update(
+                to_update,
+                ['internal_marks', 'external_marks', 'total_marks', 'letter_grade',
+                 'grade_points', 'passed', 'evaluated_at', 'evaluator'],
+                batch_size=500,
+            )
+            ledger.apply()
+            if self.term.is_locked:
+                # Bulk writes skip the post_save signal that refreshes transcript blocks
+                from .transcripts import snapshot_students
+                graded = [result.student_id for result in to_create + to_update]
+                transaction.on_commit(lambda: snapshot_students(self.term.pk, graded))
+
+        return {'created': len(to_create), 'updated': len(to_update), 'unknown_students': unknown}
+
+
+@transaction.atomic
+def rebuild_gpa(student_ids=None, dry_run=False):
+    """
+    Recompute TermGPA and GraduateRecord from CourseResult.
+
+    Returns counts of corrected and created rows; with ``dry_run`` the
+    changes are rolled back after counting.
+    """
+    condition = Q(student_id__in=student_ids) if student_ids else Q()
+    term_totals = _term_totals(condition)
+    student_totals = _student_totals(condition)
+    stats = {'term_gpas_fixed': 0, 'term_gpas_created': 0, 'graduate_records_fixed': 0, 'graduate_records_created': 0}
+
+    changed = []
+    seen = set()
+    for row in TermGPA.objects.select_for_update().filter(condition).order_by('pk'):
+        key = (row.student_id, row.term_id)
+        seen.add(key)
+        before = (row.quality_points, row.total_credits, row.gpa)
+        row.apply_totals(*term_totals.get(key, (0, 0)))
+        if (row.quality_points, row.total_credits, row.gpa) != before:
+            changed.append(row)
+    TermGPA.objects.bulk_update(changed, ['quality_points', 'total_credits', 'gpa'], batch_size=1000)
+    created = []
+    for (student_id, term_id), totals in term_totals.items():
+        if (student_id, term_id) not in seen:
+            row = TermGPA(student_id=student_id, term_id=term_id)
+            row.apply_totals(*totals)
+            created.append(row)
+    TermGPA.objects.bulk_create(created, batch_size=1000)
+    stats['term_gpas_fixed'], stats['term_gpas_created'] = len(changed), len(created)
+
+    changed = []
+    seen = set()
+    now = timezone.now()
+    for row in GraduateRecord.objects.select_for_update().filter(condition).order_by('pk'):
+        seen.add(row.student_id)
+        before = (row.total_quality_points, row.total_credits_earned, row.cgpa)
+        row.apply_totals(*student_totals.get(row.student_id, (0, 0)))
+        if (row.total_quality_points, row.total_credits_earned, row.cgpa) != before:
+            row.updated_at = now
+            changed.append(row)
+    GraduateRecord.objects.bulk_update(
+        changed, ['total_quality_points', 'total_credits_earned', 'cgpa', 'updated_at'], batch_size=1000
+    )
+    created = []
+    for student_id, totals in student_totals.items():
+        if student_id not in seen:
+            row = GraduateRecord(student_id=student_id)
+            row.apply_totals(*totals)
+            created.append(row)
+    GraduateRecord.objects.bulk_create(created, batch_size=1000)
+    stats['graduate_records_fixed'], stats['graduate_records_created'] = len(changed), len(created)
+    if dry_run:
+        transaction.set_rollback(True)
+    return stats
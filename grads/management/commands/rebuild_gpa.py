@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from grads.grading import rebuild_gpa
+
+
+class Command(BaseCommand):
+    help = 'Recompute TermGPA and GraduateRecord totals from course results and report drift.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--student', action='append', dest='students', help='Student ID (repeatable)')
+        parser.add_argument('--dry-run', action='store_true', help='Report drift without writing')
+
+    def handle(self, *args, **options):
+        stats = rebuild_gpa(options['students'], dry_run=options['dry_run'])
+        for key, value in stats.items():
+            self.stdout.write(f'{key}: {value}')
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING('Dry run, no changes written'))
+        else:
+            self.stdout.write(self.style.SUCCESS('GPA aggregates rebuilt'))
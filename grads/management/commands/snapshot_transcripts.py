@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from grads.models import Term
+from grads.transcripts import TranscriptService
+
+
+class Command(BaseCommand):
+    help = 'Freeze transcript blocks for a finalized term (new versions only where results changed).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--term', type=int, required=True, help='Term ID')
+        parser.add_argument('--workers', type=int, default=None, help='Worker processes for PDF rendering')
+
+    def handle(self, *args, **options):
+        term = Term.objects.filter(pk=options['term']).first()
+        if term is None:
+            raise CommandError(f"Term {options['term']} not found")
+        if not term.is_locked:
+            raise CommandError(f"Term {term} is not finalized")
+        created = TranscriptService(workers=options['workers']).snapshot(term)
+        self.stdout.write(self.style.SUCCESS(f'Created {created} transcript blocks for {term}'))
@@ -0,0 +1,50 @@
+# Generated by Django 5.1.4 on 2026-10-19 05:37
+
+from django.db import migrations, models
+from django.db.models import F, Sum
+
+
+def backfill_quality_points(apps, schema_editor):
+    CourseResult = apps.get_model('grads', 'CourseResult')
+    TermGPA = apps.get_model('grads', 'TermGPA')
+    GraduateRecord = apps.get_model('grads', 'GraduateRecord')
+    quality_points = Sum(F('grade_points') * F('course_section__course__credits'))
+
+    by_term = {
+        (row['student_id'], row['term_id']): row['qp'] or 0
+        for row in CourseResult.objects.values('student_id', 'term_id').annotate(qp=quality_points).order_by()
+    }
+    rows = list(TermGPA.objects.all())
+    for row in rows:
+        row.quality_points = by_term.get((row.student_id, row.term_id), 0)
+    TermGPA.objects.bulk_update(rows, ['quality_points'], batch_size=1000)
+
+    by_student = {
+        row['student_id']: row['qp'] or 0
+        for row in CourseResult.objects.values('student_id').annotate(qp=quality_points).order_by()
+    }
+    rows = list(GraduateRecord.objects.all())
+    for row in rows:
+        row.total_quality_points = by_student.get(row.student_id, 0)
+    GraduateRecord.objects.bulk_update(rows, ['total_quality_points'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('grads', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='graduaterecord',
+            name='total_quality_points',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=10),
+        ),
+        migrations.AddField(
+            model_name='termgpa',
+            name='quality_points',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=10),
+        ),
+        migrations.RunPython(backfill_quality_points, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.1.4 on 2026-10-19 05:42
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('grads', '0002_gpa_quality_points'),
+        ('students', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TranscriptBlock',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveIntegerField(default=1)),
+                ('data', models.JSONField(help_text='Term results and GPA as rendered on the transcript')),
+                ('checksum', models.CharField(max_length=64)),
+                ('pdf_file', models.CharField(blank=True, help_text='Storage path of the rendered PDF fragment', max_length=255)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='transcript_blocks', to='students.student')),
+                ('term', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='transcript_blocks', to='grads.term')),
+            ],
+            options={
+                'ordering': ['student', 'term__start_date', '-version'],
+                'unique_together': {('student', 'term', 'version')},
+            },
+        ),
+    ]
@@ -1,4 +1,6 @@
-from django.db import models
+from decimal import Decimal
+
+from django.db import models, transaction
 from django.conf import settings
 from django.db.models import Sum, F
 from django.utils import timezone
@@ -59,6 +61,7 @@ class GraduateRecord(models.Model):
     graduation_date = models.DateField(null=True, blank=True)
     cgpa = models.DecimalField(max_digits=4, decimal_places=2, null=True, blank=True)
     total_credits_earned = models.PositiveIntegerField(default=0)
+    total_quality_points = models.DecimalField(max_digits=10, decimal_places=2, default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -70,15 +73,13 @@ class GraduateRecord(models.Model):
             total_quality_points=Sum(F('grade_points') * F('course_section__course__credits')),
             total_credits=Sum('course_section__course__credits'),
         )
-        total_qp = aggregates['total_quality_points'] or 0
-        total_credits = aggregates['total_credits'] or 0
-        if total_credits:
-            self.cgpa = round(total_qp / total_credits, 2)
-            self.total_credits_earned = int(total_credits)
-        else:
-            self.cgpa = None
-            self.total_credits_earned = 0
-        self.save(update_fields=['cgpa', 'total_credits_earned', 'updated_at'])
+        self.apply_totals(aggregates['total_quality_points'] or 0, aggregates['total_credits'] or 0)
+        self.save(update_fields=['cgpa', 'total_credits_earned', 'total_quality_points', 'updated_at'])
+
+    def apply_totals(self, quality_points, credits):
+        self.total_quality_points = quality_points
+        self.total_credits_earned = int(credits)
+        self.cgpa = round(Decimal(quality_points) / credits, 2) if credits else None
 
 
 class TermGPA(models.Model):
@@ -87,6 +88,7 @@ class TermGPA(models.Model):
     term = models.ForeignKey(Term, on_delete=models.CASCADE, related_name='gpas')
     gpa = models.DecimalField(max_digits=4, decimal_places=2, null=True, blank=True)
     total_credits = models.PositiveIntegerField(default=0)
+    quality_points = models.DecimalField(max_digits=10, decimal_places=2, default=0)
 
     class Meta:
         unique_together = ['student', 'term']
@@ -100,15 +102,13 @@ class TermGPA(models.Model):
             total_quality_points=Sum(F('grade_points') * F('course_section__course__credits')),
             total_credits=Sum('course_section__course__credits'),
         )
-        total_qp = aggregates['total_quality_points'] or 0
-        total_credits = aggregates['total_credits'] or 0
-        if total_credits:
-            self.gpa = round(total_qp / total_credits, 2)
-            self.total_credits = int(total_credits)
-        else:
-            self.gpa = None
-            self.total_credits = 0
-        self.save(update_fields=['gpa', 'total_credits'])
+        self.apply_totals(aggregates['total_quality_points'] or 0, aggregates['total_credits'] or 0)
+        self.save(update_fields=['gpa', 'total_credits', 'quality_points'])
+
+    def apply_totals(self, quality_points, credits):
+        self.quality_points = quality_points
+        self.total_credits = int(credits)
+        self.gpa = round(Decimal(quality_points) / credits, 2) if credits else None
 
 
 class CourseResult(models.Model):
@@ -132,21 +132,17 @@ class CourseResult(models.Model):
     def __str__(self):
         return f"{self.student.roll_number} - {self.course_section}"
 
-    def compute_grade(self):
+    def compute_grade(self, resolver=None):
+        from .grading import GradeScaleResolver
         self.total_marks = (self.internal_marks or 0) + (self.external_marks or 0)
-        # Determine scoped grading policy: Department > Program > Global
+        # Scoped grading policy: Department > Program > Global
         course = self.course_section.course
-        dept = course.department_id
-        scale_qs = GradeScale.objects.filter(is_active=True, min_score__lte=self.total_marks, max_score__gte=self.total_marks)
-        scale = None
-        if dept:
-            scale = scale_qs.filter(department_id=dept).order_by('-grade_points').first()
-        if not scale:
-            program_ids = list(course.programs.values_list('id', flat=True))
-            if program_ids:
-                scale = scale_qs.filter(program_id__in=program_ids, department__isnull=True).order_by('-grade_points').first()
-        if not scale:
-            scale = scale_qs.filter(department__isnull=True, program__isnull=True).order_by('-grade_points').first()
+        resolver = resolver or GradeScaleResolver.current()
+        scale = resolver.resolve(
+            self.total_marks,
+            department_id=course.department_id,
+            program_ids=lambda: list(course.programs.values_list('id', flat=True)),
+        )
         if scale:
             self.letter_grade = scale.letter
             self.grade_points = scale.grade_points
@@ -157,23 +153,45 @@ class CourseResult(models.Model):
             self.passed = False
 
     def save(self, *args, **kwargs):
+        from .grading import GPALedger
         self.compute_grade()
-        super().save(*args, **kwargs)
-        # Update term GPA
-        term_gpa, _ = TermGPA.objects.get_or_create(student=self.student, term=self.term)
-        term_gpa.recalculate()
-        # Ensure graduate record exists and update CGPA
-        grad, _ = GraduateRecord.objects.get_or_create(student=self.student)
-        grad.recalculate_cgpa()
+        with transaction.atomic():
+            previous = GPALedger.contribution_of(self.pk) if self.pk else None
+            super().save(*args, **kwargs)
+            ledger = GPALedger()
+            if previous:
+                ledger.remove(*previous)
+            ledger.add(self.student_id, self.term_id, self.grade_points, self.course_section.course.credits)
+            ledger.apply()
 
     def delete(self, *args, **kwargs):
-        student = self.student
-        term = self.term
-        super().delete(*args, **kwargs)
-        term_gpa, _ = TermGPA.objects.get_or_create(student=student, term=term)
-        term_gpa.recalculate()
-        grad, _ = GraduateRecord.objects.get_or_create(student=student)
-        grad.recalculate_cgpa()
+        from .grading import GPALedger
+        with transaction.atomic():
+            previous = GPALedger.contribution_of(self.pk)
+            result = super().delete(*args, **kwargs)
+            if previous:
+                ledger = GPALedger()
+                ledger.remove(*previous)
+                ledger.apply()
+        return result
+
+
+class TranscriptBlock(models.Model):
+    """Immutable snapshot of a student's results for a finalized term."""
+    student = models.ForeignKey(Student, on_delete=models.CASCADE, related_name='transcript_blocks')
+    term = models.ForeignKey(Term, on_delete=models.CASCADE, related_name='transcript_blocks')
+    version = models.PositiveIntegerField(default=1)
+    data = models.JSONField(help_text="Term results and GPA as rendered on the transcript")
+    checksum = models.CharField(max_length=64)
+    pdf_file = models.CharField(max_length=255, blank=True, help_text="Storage path of the rendered PDF fragment")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ['student', 'term', 'version']
+        ordering = ['student', 'term__start_date', '-version']
+
+    def __str__(self):
+        return f"TranscriptBlock({self.student_id}, {self.term}, v{self.version})"
 
 
 # Create your models here.
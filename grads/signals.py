@@ -0,0 +1,34 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .grading import GradeScaleResolver
+from .models import CourseResult, GradeScale, Term
+from .transcripts import snapshot_students, start_term_snapshot
+
+
+@receiver([post_save, post_delete], sender=GradeScale)
+def invalidate_grade_scales(sender, **kwargs):
+    GradeScaleResolver.invalidate()
+
+
+@receiver(pre_save, sender=Term)
+def remember_term_lock(sender, instance, **kwargs):
+    instance._was_locked = bool(
+        instance.pk and Term.objects.filter(pk=instance.pk, is_locked=True).exists()
+    )
+
+
+@receiver(post_save, sender=Term)
+def snapshot_finalized_term(sender, instance, **kwargs):
+    """Freeze transcript blocks when a term is finalized."""
+    if instance.is_locked and not getattr(instance, '_was_locked', False):
+        start_term_snapshot(instance)
+
+
+@receiver([post_save, post_delete], sender=CourseResult)
+def refresh_transcript_block(sender, instance, **kwargs):
+    """A result changed in a finalized term gets a new transcript block version."""
+    if Term.objects.filter(pk=instance.term_id, is_locked=True).exists():
+        term_id, student_id = instance.term_id, instance.student_id
+        transaction.on_commit(lambda: snapshot_students(term_id, [student_id]))
@@ -0,0 +1,15 @@
+"""Background tasks of the grads app."""
+from campshub360.jobs import task
+from campshub360.utils import use_primary_reads
+from .models import Term
+from .transcripts import TranscriptService
+
+
+@task('grads.snapshot_term')
+def snapshot_term(context, term_id):
+    """Freeze the transcript blocks of a finalized term."""
+    with use_primary_reads():
+        term = Term.objects.filter(pk=term_id, is_locked=True).first()
+    if term is None:
+        return {'blocks': 0}
+    return {'blocks': TranscriptService().snapshot(term)}
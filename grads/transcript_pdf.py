@@ -0,0 +1,104 @@
+"""
+Transcript PDF layout.
+
+Kept free of Django imports so rendering and assembly can run in worker
+processes. Term blocks and headers are plain dicts (see
+``transcripts.build_block`` and ``TranscriptService.header``); every function
+returns PDF bytes.
+"""
+from io import BytesIO
+
+from pypdf import PdfReader, PdfWriter
+from reportlab.lib.pagesizes import letter
+from reportlab.pdfgen import canvas
+
+ROWS_PER_PAGE = 32
+COLUMNS = [(50, 'Code'), (130, 'Course'), (350, 'Credits'), (410, 'Total'), (470, 'Grade'), (520, 'Points')]
+
+
+def _course_header(p, y):
+    p.setFont('Helvetica-Bold', 10)
+    for x, label in COLUMNS:
+        p.drawString(x, y, label)
+    p.setFont('Helvetica', 10)
+
+
+def draw_term_block(p, block):
+    """Draw the pages of one term block on canvas ``p``."""
+    term = block['term']
+    courses = block['courses']
+    for start in range(0, max(len(courses), 1), ROWS_PER_PAGE):
+        p.setFont('Helvetica-Bold', 13)
+        p.drawString(50, 750, f"{term['academic_year']} {term['semester_display']} - {term['name']}")
+        _course_header(p, 720)
+        y = 700
+        for course in courses[start:start + ROWS_PER_PAGE]:
+            p.drawString(50, y, course['code'])
+            p.drawString(130, y, course['title'][:40])
+            p.drawString(350, y, str(course['credits']))
+            p.drawString(410, y, course['total'])
+            p.drawString(470, y, course['grade'] or '-')
+            p.drawString(520, y, course['points'] or '-')
+            y -= 20
+        if start + ROWS_PER_PAGE >= len(courses):
+            p.setFont('Helvetica-Bold', 11)
+            p.drawString(50, y - 10, f"Term GPA: {block['gpa'] or 'N/A'}    Credits: {block['credits']}")
+            p.setFont('Helvetica', 8)
+            p.drawString(50, 40, f"Finalized record, version {block['version']}")
+        p.showPage()
+
+
+def render_term_block(block):
+    """Render one term block and return the PDF bytes."""
+    buffer = BytesIO()
+    p = canvas.Canvas(buffer, pagesize=letter)
+    draw_term_block(p, block)
+    p.save()
+    return buffer.getvalue()
+
+
+def render_header(header):
+    """Render the transcript cover page (student details and cumulative totals)."""
+    buffer = BytesIO()
+    p = canvas.Canvas(buffer, pagesize=letter)
+    p.setFont('Helvetica-Bold', 16)
+    p.drawString(50, 750, "ACADEMIC TRANSCRIPT")
+    p.setFont('Helvetica', 11)
+    p.drawString(50, 710, f"Student: {header['student_name']}")
+    p.drawString(50, 690, f"Roll Number: {header['roll_number']}")
+    p.drawString(50, 670, f"Program: {header['program'] or '-'}")
+    p.drawString(50, 650, f"CGPA: {header['cgpa'] or 'N/A'}")
+    p.drawString(50, 630, f"Total Credits Earned: {header['credits']}")
+    if header.get('graduation_date'):
+        p.drawString(50, 610, f"Graduation Date: {header['graduation_date']}")
+    y = 570
+    p.setFont('Helvetica-Bold', 11)
+    p.drawString(50, y, "Term")
+    p.drawString(300, y, "GPA")
+    p.drawString(380, y, "Credits")
+    p.setFont('Helvetica', 11)
+    for term in header['terms']:
+        y -= 20
+        p.drawString(50, y, term['label'])
+        p.drawString(300, y, term['gpa'] or '-')
+        p.drawString(380, y, str(term['credits']))
+    p.setFont('Helvetica', 8)
+    p.drawString(50, 40, f"Generated {header['generated_at']}")
+    p.showPage()
+    p.save()
+    return buffer.getvalue()
+
+
+def merge(parts):
+    """Concatenate PDF documents (bytes) in order."""
+    writer = PdfWriter()
+    for part in parts:
+        writer.append(PdfReader(BytesIO(part)))
+    buffer = BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def assemble_transcript(header, blocks):
+    """Cover page followed by the pre-rendered term blocks."""
+    return merge([render_header(header), *blocks])
@@ -0,0 +1,277 @@
+"""
+Transcript generation.
+
+When a term is finalized (``Term.is_locked``), each student's results for it
+are frozen into a ``TranscriptBlock``. A block holds the JSON shown on the
+transcript and a PDF fragment rendered to the default storage. Blocks are
+never modified. If a finalized term's results change later, the checksum
+comparison in ``snapshot`` writes a new version, so transcripts issued
+earlier can still be reproduced.
+
+A transcript PDF is a cover page rendered fresh, followed by the latest
+block of every finalized term. Producing one costs a block query and
+storage reads instead of the result joins. ``generate_cohort`` does this for
+a whole graduating cohort and runs cover rendering and concatenation in
+worker processes (``transcript_pdf`` has no Django dependencies). It pulls
+in ReportLab and pypdf, so it is only imported when something is rendered:
+this module is loaded at startup through the grades signals.
+"""
+import hashlib
+import json
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from decimal import Decimal
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.utils import timezone
+from django.utils.text import slugify
+
+from campshub360.jobs import submit
+from campshub360.utils import use_primary_reads
+from .models import CourseResult, GraduateRecord, Term, TermGPA, TranscriptBlock
+
+STORAGE_ROOT = 'transcripts'
+# Below this many fragments the process pool costs more than it saves
+PARALLEL_THRESHOLD = 50
+
+RESULT_FIELDS = [
+    'student_id', 'course_section__course__code', 'course_section__course__title',
+    'course_section__course__credits', 'internal_marks', 'external_marks', 'total_marks',
+    'letter_grade', 'grade_points', 'passed',
+]
+
+
+def _decimal(value):
+    return None if value is None else str(value)
+
+
+def term_payload(term):
+    return {
+        'id': term.pk,
+        'name': term.name,
+        'academic_year': term.academic_year,
+        'semester': term.semester,
+        'semester_display': term.get_semester_display(),
+        'start_date': str(term.start_date),
+    }
+
+
+def build_blocks(term, student_ids=None):
+    """Transcript block data of ``term`` keyed by student id, from two queries."""
+    results = CourseResult.objects.filter(term=term)
+    gpas = TermGPA.objects.filter(term=term)
+    if student_ids is not None:
+        results = results.filter(student_id__in=student_ids)
+        gpas = gpas.filter(student_id__in=student_ids)
+
+    term_data = term_payload(term)
+    blocks = {}
+    for row in results.values_list(*RESULT_FIELDS).order_by('student_id', 'course_section__course__code'):
+        student_id, code, title, credits, internal, external, total, grade, points, passed = row
+        block = blocks.setdefault(student_id, {'term': term_data, 'courses': [], 'gpa': None, 'credits': 0})
+        block['courses'].append({
+            'code': code,
+            'title': title,
+            'credits': credits,
+            'internal': _decimal(internal),
+            'external': _decimal(external),
+            'total': _decimal(total),
+            'grade': grade,
+            'points': _decimal(points),
+            'passed': passed,
+        })
+    for student_id, gpa, credits in gpas.values_list('student_id', 'gpa', 'total_credits').order_by():
+        if student_id in blocks:
+            blocks[student_id]['gpa'] = _decimal(gpa)
+            blocks[student_id]['credits'] = credits
+    return blocks
+
+
+def checksum(data):
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+
+def _block_payload(block):
+    return {**block.data, 'version': block.version}
+
+
+class TranscriptService:
+    """Snapshot finalized terms and assemble transcript PDFs from the snapshots."""
+
+    def __init__(self, workers=None, storage=None):
+        self.workers = workers
+        self.storage = storage or default_storage
+
+    def _write(self, path, content):
+        if self.storage.exists(path):
+            self.storage.delete(path)
+        return self.storage.save(path, ContentFile(content))
+
+    def _read(self, block):
+        if block.pdf_file and self.storage.exists(block.pdf_file):
+            with self.storage.open(block.pdf_file, 'rb') as handle:
+                return handle.read()
+        # Fragment lost from storage; the JSON snapshot is authoritative
+        from .transcript_pdf import render_term_block
+        return render_term_block(_block_payload(block))
+
+    def _render(self, blocks):
+        from .transcript_pdf import render_term_block
+        payloads = [_block_payload(block) for block in blocks]
+        if len(payloads) >= PARALLEL_THRESHOLD and self.workers != 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                rendered = list(pool.map(render_term_block, payloads, chunksize=25))
+        else:
+            rendered = [render_term_block(payload) for payload in payloads]
+        for block, content in zip(blocks, rendered):
+            block.pdf_file = self._write(
+                f"{STORAGE_ROOT}/blocks/{block.term_id}/{block.student_id}/v{block.version}.pdf", content
+            )
+
+    def snapshot(self, term, student_ids=None):
+        """Freeze the results of a finalized term. Returns the number of new block versions."""
+        if not term.is_locked:
+            raise ValueError(f"Term {term} is not finalized")
+        with use_primary_reads():
+            blocks = build_blocks(term, student_ids)
+            existing = TranscriptBlock.objects.filter(term=term)
+            if student_ids is not None:
+                existing = existing.filter(student_id__in=student_ids)
+            latest = {}
+            for student_id, version, digest in existing.values_list(
+                'student_id', 'version', 'checksum'
+            ).order_by('student_id', '-version'):
+                latest.setdefault(student_id, (version, digest))
+
+        new_blocks = []
+        for student_id, data in blocks.items():
+            digest = checksum(data)
+            version, previous = latest.get(student_id, (0, None))
+            if digest != previous:
+                new_blocks.append(TranscriptBlock(
+                    student_id=student_id, term=term, version=version + 1, data=data, checksum=digest,
+                ))
+        if not new_blocks:
+            return 0
+        self._render(new_blocks)
+        TranscriptBlock.objects.bulk_create(new_blocks, batch_size=500, ignore_conflicts=True)
+        return len(new_blocks)
+
+    def _ensure_snapshots(self, student_ids):
+        """Snapshot finalized terms the students have results in but no block for yet."""
+        with use_primary_reads():
+            with_results = set(CourseResult.objects.filter(
+                student_id__in=student_ids, term__is_locked=True
+            ).values_list('student_id', 'term_id').distinct().order_by())
+            with_blocks = set(TranscriptBlock.objects.filter(
+                student_id__in=student_ids
+            ).values_list('student_id', 'term_id').distinct().order_by())
+        missing = defaultdict(list)
+        for student_id, term_id in with_results - with_blocks:
+            missing[term_id].append(student_id)
+        for term in Term.objects.filter(pk__in=missing.keys()):
+            self.snapshot(term, missing[term.pk])
+
+    def latest_blocks(self, student_ids):
+        """Latest block of every finalized term per student, in term order."""
+        blocks = defaultdict(list)
+        seen = set()
+        for block in TranscriptBlock.objects.filter(
+            student_id__in=student_ids, term__is_locked=True
+        ).select_related('term').order_by('student_id', 'term__start_date', 'term_id', '-version'):
+            key = (block.student_id, block.term_id)
+            if key not in seen:
+                seen.add(key)
+                blocks[block.student_id].append(block)
+        return blocks
+
+    @staticmethod
+    def header(student, grad, blocks):
+        """Cover page payload; cumulative totals cover the finalized terms on the transcript."""
+        quality_points, credits = Decimal('0'), 0
+        terms = []
+        for block in blocks:
+            data = block.data
+            for course in data['courses']:
+                credits += course['credits']
+                if course['points'] is not None:
+                    quality_points += Decimal(course['points']) * course['credits']
+            terms.append({
+                'label': f"{data['term']['academic_year']} {data['term']['semester_display']}",
+                'gpa': data['gpa'],
+                'credits': data['credits'],
+            })
+        return {
+            'student_name': student.full_name,
+            'roll_number': student.roll_number,
+            'program': grad.program.name if grad and grad.program_id else '',
+            'graduation_date': str(grad.graduation_date) if grad and grad.graduation_date else '',
+            'cgpa': str(round(quality_points / credits, 2)) if credits else None,
+            'credits': credits,
+            'terms': terms,
+            'generated_at': timezone.now().strftime('%Y-%m-%d %H:%M'),
+        }
+
+    def render(self, student):
+        """Transcript PDF bytes for one student."""
+        from .transcript_pdf import assemble_transcript
+        self._ensure_snapshots([student.pk])
+        blocks = self.latest_blocks([student.pk]).get(student.pk, [])
+        grad = GraduateRecord.objects.filter(student=student).select_related('program').first()
+        return assemble_transcript(self.header(student, grad, blocks), [self._read(b) for b in blocks])
+
+    def terms_for_display(self, student):
+        """
+        Term blocks for the dashboard: finalized terms from their snapshots,
+        open terms built live from the current results.
+        """
+        self._ensure_snapshots([student.pk])
+        terms = [
+            {**block.data, 'version': block.version, 'finalized': True}
+            for block in self.latest_blocks([student.pk]).get(student.pk, [])
+        ]
+        for term in Term.objects.filter(course_results__student=student, is_locked=False).distinct():
+            data = build_blocks(term, [student.pk]).get(student.pk)
+            if data:
+                terms.append({**data, 'version': None, 'finalized': False})
+        terms.sort(key=lambda block: block['term']['start_date'], reverse=True)
+        return terms
+
+    def generate_cohort(self, students, label):
+        """Write a transcript PDF per student under ``transcripts/cohorts/<label>/``; returns the paths."""
+        from .transcript_pdf import assemble_transcript
+        students = list(students)
+        student_ids = [student.pk for student in students]
+        self._ensure_snapshots(student_ids)
+        with use_primary_reads():
+            blocks = self.latest_blocks(student_ids)
+            grads = {
+                grad.student_id: grad
+                for grad in GraduateRecord.objects.filter(student_id__in=student_ids).select_related('program')
+            }
+
+        base = f"{STORAGE_ROOT}/cohorts/{slugify(label)}"
+        files = []
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            futures = {}
+            for student in students:
+                student_blocks = blocks.get(student.pk, [])
+                header = self.header(student, grads.get(student.pk), student_blocks)
+                future = pool.submit(assemble_transcript, header, [self._read(b) for b in student_blocks])
+                futures[future] = student
+            for future in as_completed(futures):
+                files.append(self._write(f"{base}/{futures[future].roll_number}.pdf", future.result()))
+        return sorted(files)
+
+
+def snapshot_students(term_id, student_ids):
+    """Re-snapshot a finalized term for the given students (no-op when unchanged)."""
+    term = Term.objects.filter(pk=term_id, is_locked=True).first()
+    if term is not None:
+        TranscriptService(workers=1).snapshot(term, list(student_ids))
+
+
+def start_term_snapshot(term):
+    """Queue the snapshot of a freshly finalized term for a background worker (see ``grads.tasks``)."""
+    return submit('grads.snapshot_term', {'term_id': term.pk}, label=f"Transcript snapshot of {term}")
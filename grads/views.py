@@ -1,7 +1,12 @@
+from decimal import InvalidOperation
+
+from django.core.exceptions import ValidationError
 from django.http import JsonResponse
-from rest_framework import viewsets, permissions
+from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.response import Response
+from academics.models import CourseSection
+from .grading import SectionGrader
 from .models import GradeScale, Term, CourseResult, TermGPA, GraduateRecord
 from .serializers import (
     GradeScaleSerializer,
@@ -74,6 +79,44 @@ class CourseResultViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(qs, many=True)
         return Response(serializer.data)
 
+    @action(detail=False, methods=['post'], url_path='bulk-grade')
+    def bulk_grade(self, request):
+        """
+        Grade a whole course section in one request.
+
+        Body: ``{"term": id, "course_section": id, "results": [{"student", "internal_marks", "external_marks"}]}``
+        """
+        term_id = request.data.get('term')
+        section_id = request.data.get('course_section')
+        entries = request.data.get('results') or []
+        if not term_id or not section_id or not entries:
+            return Response(
+                {'error': 'term, course_section and results are required'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            term = Term.objects.get(pk=term_id)
+            section = CourseSection.objects.select_related('course', 'faculty__user').get(pk=section_id)
+        except (Term.DoesNotExist, CourseSection.DoesNotExist):
+            return Response({'error': 'Term or course section not found'}, status=status.HTTP_404_NOT_FOUND)
+
+        user = request.user
+        if not (user.is_staff or user.is_superuser):
+            faculty_user = getattr(section.faculty, 'user', None)
+            if not (faculty_user and faculty_user_id_equals(faculty_user, user)):
+                return Response(
+                    {'error': 'Only the assigned faculty can grade this section'},
+                    status=status.HTTP_403_FORBIDDEN,
+                )
+        if any(not entry.get('student') for entry in entries):
+            return Response({'error': 'Every result needs a student'}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            summary = SectionGrader(section, term, evaluator=user).grade(entries)
+        except (ValidationError, InvalidOperation) as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(summary, status=status.HTTP_200_OK)
+
 
 class TermGPAViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = TermGPA.objects.select_related('student', 'term')
@@ -0,0 +1,61 @@
+"""Background tasks of the mentoring app."""
+from django.db import transaction
+
+from campshub360.jobs import task
+from faculty.models import Faculty
+from students.models import Student
+from .models import Mentorship
+
+CHUNK_SIZE = 500
+
+
+@task('mentoring.auto_assign')
+def auto_assign(context, start_date, department_id=None, academic_year=None, grade_level=None, section=None):
+    """Assign mentors round-robin to the matching students that have no active mentorship.
+
+    ``grade_level`` is matched against the students' year of study.
+    """
+    students_qs = Student.objects.all()
+    if grade_level:
+        students_qs = students_qs.filter(year_of_study=grade_level)
+    if section:
+        students_qs = students_qs.filter(section=section)
+    if academic_year:
+        students_qs = students_qs.filter(academic_year=academic_year)
+
+    mentors_qs = Faculty.objects.filter(status='ACTIVE', currently_associated=True)
+    if department_id:
+        mentors_qs = mentors_qs.filter(department_ref_id=department_id)
+
+    mentor_ids = list(mentors_qs.order_by('name').values_list('pk', flat=True))
+    # Students with an active mentorship are skipped; read them once instead of per student
+    mentored = set(Mentorship.objects.filter(is_active=True).values_list('student_id', flat=True))
+    students = [
+        student for student in students_qs.order_by('last_name', 'first_name').only('pk', 'year_of_study', 'section')
+        if student.pk not in mentored
+    ]
+    if not students or not mentor_ids:
+        return {'assigned': 0, 'detail': 'No students or mentors found'}
+
+    created = 0
+    for start in range(0, len(students), CHUNK_SIZE):
+        context.progress(start, len(students))
+        mentorships = [
+            Mentorship(
+                mentor_id=mentor_ids[(start + offset) % len(mentor_ids)],
+                student=student,
+                start_date=start_date,
+                is_active=True,
+                objective='Auto-assigned mentorship',
+                department_ref_id=department_id,
+                academic_year=academic_year,
+                grade_level=student.year_of_study,
+                section=student.section,
+            )
+            for offset, student in enumerate(students[start:start + CHUNK_SIZE])
+        ]
+        with transaction.atomic():
+            Mentorship.objects.bulk_create(mentorships)
+        created += len(mentorships)
+    context.progress(len(students), len(students))
+    return {'assigned': created}
@@ -6,10 +6,9 @@ from .serializers import (
     MeetingSerializer,
     FeedbackSerializer,
 )
-from django.db import transaction
+from django.urls import reverse
 from django.utils import timezone
-from students.models import Student
-from faculty.models import Faculty
+from campshub360.jobs import submit
 from departments.models import Department
 
 
@@ -39,59 +38,30 @@ class MentorshipViewSet(viewsets.ModelViewSet):
 
     @decorators.action(detail=False, methods=['post'], url_path='auto-assign', permission_classes=[permissions.IsAdminUser])
     def auto_assign(self, request):
-        """Bulk auto-assign mentors to students by department/year/section with simple round-robin."""
+        """Queue a bulk auto-assignment of mentors by department/year/section with simple round-robin."""
         department_id = request.data.get('department_id')
-        academic_year = request.data.get('academic_year')
-        grade_level = request.data.get('grade_level')
-        section = request.data.get('section')
-        start_date = request.data.get('start_date') or timezone.now().date()
+        start_date = request.data.get('start_date') or timezone.now().date().isoformat()
 
-        try:
-            department = Department.objects.get(id=department_id) if department_id else None
-        except Department.DoesNotExist:
+        if department_id and not Department.objects.filter(id=department_id).exists():
             return response.Response({'detail': 'Invalid department_id'}, status=status.HTTP_400_BAD_REQUEST)
 
-        students_qs = Student.objects.all()
-        if grade_level:
-            students_qs = students_qs.filter(grade_level=grade_level)
-        if section:
-            students_qs = students_qs.filter(section=section)
-        if academic_year:
-            students_qs = students_qs.filter(academic_year=academic_year)
-
-        mentors_qs = Faculty.objects.filter(status='ACTIVE', currently_associated=True)
-        if department:
-            mentors_qs = mentors_qs.filter(department_ref=department)
-
-        students = list(students_qs.order_by('last_name', 'first_name'))
-        mentors = list(mentors_qs.order_by('name'))
-
-        if not students or not mentors:
-            return response.Response({'assigned': 0, 'detail': 'No students or mentors found'}, status=status.HTTP_200_OK)
-
-        created = 0
-        with transaction.atomic():
-            mentor_idx = 0
-            for student in students:
-                # Skip if active mentorship already exists for same context
-                exists = Mentorship.objects.filter(student=student, is_active=True).exists()
-                if exists:
-                    continue
-                mentor = mentors[mentor_idx]
-                mentor_idx = (mentor_idx + 1) % len(mentors)
-                Mentorship.objects.create(
-                    mentor=mentor,
-                    student=student,
-                    start_date=start_date,
-                    is_active=True,
-                    objective='Auto-assigned mentorship',
-                    department_ref=department,
-                    academic_year=academic_year,
-                    grade_level=student.grade_level,
-                    section=student.section,
-                )
-                created += 1
-        return response.Response({'assigned': created}, status=status.HTTP_201_CREATED)
+        job = submit(
+            'mentoring.auto_assign',
+            {
+                'start_date': str(start_date),
+                'department_id': str(department_id) if department_id else None,
+                'academic_year': request.data.get('academic_year'),
+                'grade_level': request.data.get('grade_level'),
+                'section': request.data.get('section'),
+            },
+            user=request.user,
+            label='Mentor auto-assignment',
+        )
+        return response.Response({
+            'job_id': str(job.id),
+            'status': job.status,
+            'status_url': request.build_absolute_uri(reverse('jobs:job-detail', kwargs={'pk': job.id})),
+        }, status=status.HTTP_202_ACCEPTED)
 
 
 class ProjectViewSet(viewsets.ModelViewSet):
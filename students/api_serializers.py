@@ -155,7 +155,7 @@ class StudentImportSerializer(serializers.ModelSerializer):
     class Meta:
         model = StudentImport
         fields = [
-            'id', 'filename', 'file_size', 'total_rows', 'success_count',
+            'id', 'batch_number', 'filename', 'file_size', 'total_rows', 'success_count',
             'error_count', 'warning_count', 'skip_errors', 'create_login',
             'update_existing', 'status', 'errors', 'warnings', 'created_by',
             'created_by_name', 'success_rate', 'created_at', 'updated_at'
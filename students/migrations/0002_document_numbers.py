@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-19 06:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='studentimport',
+            name='batch_number',
+            field=models.CharField(blank=True, help_text='Import batch number, assigned on first save', max_length=30, null=True, unique=True),
+        ),
+    ]
@@ -596,6 +596,13 @@ class StudentCustomFieldValue(TimeStampedUUIDModel):
 class StudentImport(TimeStampedUUIDModel):
     """Model to track student import history"""
     
+    batch_number = models.CharField(
+        max_length=30,
+        unique=True,
+        null=True,
+        blank=True,
+        help_text="Import batch number, assigned on first save"
+    )
     filename = models.CharField(max_length=255)
     file_size = models.IntegerField(help_text="File size in bytes")
     total_rows = models.IntegerField(default=0)
@@ -637,6 +644,12 @@ class StudentImport(TimeStampedUUIDModel):
     def __str__(self):
         return f"{self.filename} - {self.status} ({self.success_count} imported)"
     
+    def save(self, *args, **kwargs):
+        if not self.batch_number:
+            from campshub360.numbering import next_number
+            self.batch_number = next_number('import_batch', scope=str(timezone.now().year))
+        super().save(*args, **kwargs)
+    
     @property
     def success_rate(self):
         """Calculate success rate percentage"""